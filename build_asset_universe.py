@@ -1,76 +1,49 @@
 import os
-import sqlite3
+import sys
 from dotenv import load_dotenv
 from alpaca.trading.client import TradingClient
 
+from marketmind_engine.data.asset_universe_sync import UnsafeSyncError, sync_from_client
+
 # --- LOAD ENV (force override to avoid OS shadowing) ---
 load_dotenv(override=True)
 
 # --- CONFIG ---
 DB_NAME = "asset_universe.db"
 
-# --- CONNECT TO ALPACA ---
-api_key = os.getenv("APCA_API_KEY_ID")
-api_secret = os.getenv("APCA_API_SECRET_KEY")
-
-if not api_key or not api_secret:
-    raise ValueError("Alpaca API keys not found in environment variables.")
 
-client = TradingClient(api_key, api_secret, paper=True)
+def main():
 
-print("Pulling tradable assets from Alpaca...")
+    # --- CONNECT TO ALPACA ---
+    api_key = os.getenv("APCA_API_KEY_ID")
+    api_secret = os.getenv("APCA_API_SECRET_KEY")
 
-# --- RAW JSON REQUEST (bypass strict Asset model validation) ---
-assets = client.get("/assets")
+    if not api_key or not api_secret:
+        raise ValueError("Alpaca API keys not found in environment variables.")
 
-print(f"Total assets received: {len(assets)}")
+    client = TradingClient(api_key, api_secret, paper=True)
 
-# --- FILTER TRADABLE US EQUITIES ---
-tradable_assets = [
-    a for a in assets
-    if a.get("tradable")
-    and a.get("status") == "active"
-    and a.get("class") == "us_equity"
-]
+    print("Pulling tradable assets from Alpaca...")
 
-print(f"Tradable US equities: {len(tradable_assets)}")
+    # --- BULK DIFF/MERGE SYNC (WAL, staged temp table, change log) ---
+    # --force applies a sync that removes a large share of symbols
+    try:
+        result = sync_from_client(DB_NAME, client, force="--force" in sys.argv[1:])
+    except UnsafeSyncError as e:
+        print(f"Sync refused: {e}")
+        print("Re-run with --force if the delisting is genuine.")
+        sys.exit(1)
 
-# --- CREATE DATABASE ---
-conn = sqlite3.connect(DB_NAME)
-cursor = conn.cursor()
+    print(f"Added: {len(result.added)}  Removed: {len(result.removed)}  "
+          f"Updated: {len(result.updated)}  Unchanged: {result.unchanged}")
 
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS assets (
-    symbol TEXT PRIMARY KEY,
-    name TEXT,
-    asset_class TEXT,
-    exchange TEXT,
-    status TEXT,
-    tradable BOOLEAN,
-    marginable BOOLEAN,
-    shortable BOOLEAN,
-    easy_to_borrow BOOLEAN
-)
-""")
+    if result.changed:
+        print(f"Asset universe updated to version {result.version}.")
+    else:
+        print(f"Asset universe unchanged (version {result.version}).")
 
-# --- INSERT DATA ---
-for asset in tradable_assets:
-    cursor.execute("""
-        INSERT OR REPLACE INTO assets VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        asset.get("symbol"),
-        asset.get("name"),
-        asset.get("class"),
-        asset.get("exchange"),
-        asset.get("status"),
-        int(asset.get("tradable", False)),
-        int(asset.get("marginable", False)),
-        int(asset.get("shortable", False)),
-        int(asset.get("easy_to_borrow", False))
-    ))
+    print(f"Database: {DB_NAME}")
 
-conn.commit()
-conn.close()
 
-print("Asset universe database created successfully.")
-print(f"Database: {DB_NAME}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
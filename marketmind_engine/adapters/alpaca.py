@@ -3,13 +3,12 @@
 Alpaca integration (alpaca-py v2) for MarketMindTrader.
 
 - Uses .env: ALPACA_API_KEY, ALPACA_API_SECRET, ALPACA_PAPER (1|0)
-- Provides lazy-inited clients and small last-price cache
+- Provides lazy-inited clients; last prices live in the shared PRICE_CACHE
 - Back-compat shims: _get_trading_client(), _alpaca_last_price()
 """
 
 from __future__ import annotations
 import os
-import time
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -22,6 +21,8 @@ from alpaca.trading.client import TradingClient
 from alpaca.trading.requests import MarketOrderRequest, GetOrdersRequest
 from alpaca.trading.enums import OrderSide, TimeInForce, QueryOrderStatus
 
+from marketmind_engine.data.price_cache import PRICE_CACHE
+
 # Load environment once (safe if already loaded elsewhere)
 load_dotenv()
 
@@ -29,9 +30,6 @@ load_dotenv()
 _ALPACA_DATA_CLIENT: Optional[StockHistoricalDataClient] = None
 _TRADING_CLIENT: Optional[TradingClient] = None
 
-# Simple 10s last-price cache: { "NVDA": (timestamp, price_float) }
-_PRICE_CACHE: Dict[str, tuple[float, float]] = {}
-
 # ---- Internal: credentials ----
 def _creds() -> tuple[str, str, bool]:
     k = os.getenv("ALPACA_API_KEY") or os.getenv("APCA_API_KEY_ID") or ""
@@ -68,32 +66,33 @@ def get_trading_client() -> Optional[TradingClient]:
 # ---- Public: prices ----
 def last_trade_price(symbol: str, ttl_sec: int = 10) -> Optional[float]:
     """
-    Get latest trade price for a symbol with a tiny cache (ttl_sec).
+    Get latest trade price for a symbol via the shared PRICE_CACHE.
+    Any source (stream or REST) fresher than ttl_sec is served from cache;
+    a stale entry is only used when the REST lookup fails.
     Returns float or None if unavailable.
     """
     symbol = (symbol or "").upper().strip()
     if not symbol:
         return None
 
-    now = time.time()
-    cached = _PRICE_CACHE.get(symbol)
-    if cached and (now - cached[0]) < ttl_sec:
-        return cached[1]
+    fresh = PRICE_CACHE.get(symbol, max_age=ttl_sec)
+    if fresh is not None:
+        return fresh
 
     client = get_data_client()
     if client is None:
-        return cached[1] if cached else None
+        return PRICE_CACHE.get(symbol)
 
     try:
         res = client.get_stock_latest_trade(StockLatestTradeRequest(symbol_or_symbols=symbol))
         trade = res.get(symbol)
         price = float(getattr(trade, "price", None)) if trade else None
         if price is not None:
-            _PRICE_CACHE[symbol] = (now, price)
+            PRICE_CACHE.put(symbol, price)
         return price
     except Exception as e:
         logging.getLogger(__name__).warning("ALPACA last price fetch failed for %s: %s", symbol, e)
-        return cached[1] if cached else None
+        return PRICE_CACHE.get(symbol)
 
 
 def last_trade_prices(symbols: List[str], ttl_sec: int = 10) -> Dict[str, Optional[float]]:
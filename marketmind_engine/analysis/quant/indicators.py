@@ -2,10 +2,12 @@
 # Robust price/indicator fetch with provider fallbacks (Finnhub → AlphaVantage → TwelveData)
 # and local TA calculations (EMA/SMA/RSI/MACD) from daily closes.
 
-import os, math, time, requests
+import os, math, time
 from collections import deque
 from dotenv import load_dotenv
 
+from marketmind_engine.utils.http_client import get_http_client
+
 load_dotenv()
 
 FINNHUB_KEY   = os.getenv("FINNHUB_API_KEY", "")
@@ -20,9 +22,7 @@ TD_BASE       = "https://api.twelvedata.com"
 
 def _get_json(url, params, timeout=20):
     try:
-        r = requests.get(url, params=params, timeout=timeout)
-        r.raise_for_status()
-        return r.json()
+        return get_http_client().get_json(url, params=params, timeout=timeout)
     except Exception:
         return None
 
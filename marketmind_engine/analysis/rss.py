@@ -17,6 +17,8 @@ import feedparser
 import requests
 from bs4 import BeautifulSoup
 
+from marketmind_engine.utils.http_client import get_http_client
+
 # ------------------------ Config ------------------------
 
 # Rotate / expand as you like. These are generic, low-friction sources.
@@ -36,11 +38,9 @@ TIMEOUT = 12  # seconds
 
 
 def _http_get(url: str) -> Optional[requests.Response]:
-    """GET with sane headers/timeouts and quiet failure."""
+    """GET via the shared pooled client, with sane headers/timeouts and quiet failure."""
     try:
-        resp = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=TIMEOUT)
-        resp.raise_for_status()
-        return resp
+        return get_http_client().get(url, headers={"User-Agent": USER_AGENT}, timeout=TIMEOUT)
     except Exception as e:
         print(f"[RSS] HTTP error for {url}: {e}")
         return None
@@ -1,17 +1,31 @@
 import os
 import json
+import mmap
+import re
+import struct
 import threading
 import time
-import requests
+from bisect import bisect_left
+
+from marketmind_engine.utils.http_client import get_http_client
 
 # Polygon.io API Key
 POLYGON_API_KEY = os.getenv("POLYGON_API_KEY", "13U6bDmdI_kUH7T7_iPeo6ydsT4Qg2Lx")
 
-# Local cache file
+# Legacy JSON cache file (read-only fallback)
 TICKER_CACHE_FILE = os.path.join(os.path.dirname(__file__), "ticker_cache.json")
 
-# Global in-memory set
-VALID_TICKERS = set()
+# Binary snapshot (sorted fixed-width records). Refreshes write
+# versioned siblings (ticker_snapshot.<version>.bin) so a mapped
+# snapshot is never replaced in place; this name is the legacy /
+# explicit-path fallback.
+TICKER_SNAPSHOT_FILE = os.path.join(os.path.dirname(__file__), "ticker_snapshot.bin")
+
+# Lookup mode: "set" (frozenset in memory) or "mmap" (binary search on the snapshot)
+TICKER_LOOKUP_MODE = os.getenv("MARKETMIND_TICKER_LOOKUP", "set").lower()
+
+# Global in-memory set (swapped by reference, never mutated in place)
+VALID_TICKERS = frozenset()
 
 # ------------------------------
 # FETCH FROM POLYGON.IO
@@ -23,8 +37,9 @@ def fetch_polygon_tickers():
     """
     url = f"https://api.polygon.io/v3/reference/tickers?market=stocks&active=true&limit=1000&apiKey={POLYGON_API_KEY}"
     tickers = []
+    client = get_http_client()
     while url:
-        resp = requests.get(url, timeout=10)
+        resp = client.get(url, timeout=10, raise_for_status=False)
         if resp.status_code != 200:
             print(f"[TICKER CACHE] Polygon API error: {resp.text}")
             break
@@ -101,74 +116,377 @@ def fetch_latest_tickers():
         "GOOGL", "AMZN", "PLTR", "QCOM", "INTC"
     ]
 
+# ------------------------------
+# BINARY SNAPSHOT
+# ------------------------------
+# Layout (little-endian):
+#   magic   4s   b"MMTK"
+#   format  H    SNAPSHOT_FORMAT
+#   width   H    bytes per record (NUL-padded ASCII)
+#   version Q    monotonically increasing snapshot version
+#   count   I    number of records
+#   records count * width, sorted ascending
+SNAPSHOT_MAGIC = b"MMTK"
+SNAPSHOT_FORMAT = 1
+_HEADER = struct.Struct("<4sHHQI")
+
+
+def normalize_tickers(tickers):
+    """
+    Upper-cased ASCII symbols. Non-ASCII symbols are rejected, not
+    stripped (stripping could collapse two symbols into one).
+    """
+    valid = set()
+    rejected = 0
+    for t in tickers:
+        if not t:
+            continue
+        t = t.upper()
+        if t.isascii():
+            valid.add(t)
+        else:
+            rejected += 1
+    if rejected:
+        print(f"[TICKER CACHE] Rejected {rejected} non-ASCII tickers")
+    return valid
+
+
+def snapshot_path(version):
+    """Versioned snapshot file next to TICKER_SNAPSHOT_FILE."""
+    stem, ext = os.path.splitext(TICKER_SNAPSHOT_FILE)
+    return f"{stem}.{int(version)}{ext}"
+
+
+def _versioned_snapshots():
+    """[(version, path)] of versioned snapshots, oldest first."""
+    stem, ext = os.path.splitext(os.path.basename(TICKER_SNAPSHOT_FILE))
+    pattern = re.compile(re.escape(stem) + r"\.(\d+)" + re.escape(ext))
+    directory = os.path.dirname(TICKER_SNAPSHOT_FILE)
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    found = []
+    for name in names:
+        m = pattern.fullmatch(name)
+        if m:
+            found.append((int(m.group(1)), os.path.join(directory, name)))
+    return sorted(found)
+
+
+def latest_snapshot():
+    """Newest versioned snapshot, else the legacy file, else None."""
+    versioned = _versioned_snapshots()
+    if versioned:
+        return versioned[-1][1]
+    if os.path.exists(TICKER_SNAPSHOT_FILE):
+        return TICKER_SNAPSHOT_FILE
+    return None
+
+
+def _prune_snapshots(keep):
+    """Remove versioned snapshots other than keep (best effort)."""
+    for _, path in _versioned_snapshots():
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError as e:
+            print(f"[TICKER CACHE] Could not remove old snapshot {path}: {e}")
+
+
+def write_snapshot(tickers, path=None, version=None):
+    """
+    Write a sorted binary snapshot atomically (tmp file + rename).
+    Without a path, writes a new versioned file (never one that
+    may be memory-mapped). Returns the snapshot version written.
+    """
+    records = sorted(t.encode("ascii") for t in normalize_tickers(tickers))
+    width = max((len(r) for r in records), default=1)
+
+    if version is None:
+        # Strictly newer than the active snapshot (distinct file name)
+        version = max(int(time.time() * 1000), snapshot_version() + 1)
+
+    path = path or snapshot_path(version)
+    tmp_path = path + ".tmp"
+
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT, width, version, len(records)))
+        f.write(b"".join(r.ljust(width, b"\0") for r in records))
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, path)
+    return version
+
+
+def _read_header(buf):
+    magic, fmt, width, version, count = _HEADER.unpack_from(buf, 0)
+    if magic != SNAPSHOT_MAGIC or fmt != SNAPSHOT_FORMAT:
+        raise ValueError("Unsupported ticker snapshot")
+    return width, version, count
+
+
+class SetTickerLookup:
+    """In-memory frozenset lookup."""
+
+    mode = "set"
+
+    def __init__(self, tickers, version=0, path=None):
+        self.tickers = frozenset(tickers)
+        self.version = version
+        self.path = path
+
+    def __contains__(self, symbol):
+        return symbol in self.tickers
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def close(self):
+        pass
+
+    @classmethod
+    def from_snapshot(cls, path=None):
+        path = path or TICKER_SNAPSHOT_FILE
+        with open(path, "rb") as f:
+            data = f.read()
+        width, version, count = _read_header(data)
+        body = data[_HEADER.size:_HEADER.size + width * count]
+        tickers = [
+            body[i * width:(i + 1) * width].rstrip(b"\0").decode("ascii")
+            for i in range(count)
+        ]
+        return cls(tickers, version=version, path=path)
+
+
+class MmapTickerLookup:
+    """
+    Memory-mapped sorted-array lookup for large universes.
+    Binary search over fixed-width records; nothing is copied
+    into the Python heap.
+    """
+
+    mode = "mmap"
+
+    def __init__(self, path=None):
+        self.path = path or TICKER_SNAPSHOT_FILE
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.width, self.version, self.count = _read_header(self._map)
+        self._records = _Records(self._map, _HEADER.size, self.width, self.count)
+
+    def __contains__(self, symbol):
+        try:
+            key = symbol.encode("ascii").ljust(self.width, b"\0")
+        except UnicodeEncodeError:
+            return False
+        if len(key) != self.width:
+            return False
+        i = bisect_left(self._records, key)
+        return i < self.count and self._records[i] == key
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        """Unmap the snapshot (after it has been swapped out)."""
+        self._map.close()
+
+    @property
+    def tickers(self):
+        return frozenset(self._records[i].rstrip(b"\0").decode("ascii") for i in range(self.count))
+
+
+class _Records:
+    """Sequence view over fixed-width records (for bisect)."""
+
+    def __init__(self, buf, offset, width, count):
+        self._buf = buf
+        self._offset = offset
+        self._width = width
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        start = self._offset + i * self._width
+        return self._buf[start:start + self._width]
+
+
+# Active lookup (swapped atomically by reference)
+_LOOKUP = SetTickerLookup(())
+
+
+def _swap(lookup):
+    """
+    Publish a fully built lookup; readers see old or new, never
+    partial. The old lookup is closed so its map is released.
+    """
+    global _LOOKUP, VALID_TICKERS
+    previous = _LOOKUP
+    _LOOKUP = lookup
+    # mmap mode keeps the universe off-heap; use is_valid_ticker()
+    if lookup.mode == "set":
+        VALID_TICKERS = lookup.tickers
+    if previous is not lookup:
+        previous.close()
+
+
+def is_valid_ticker(symbol):
+    """Non-blocking membership check against the active lookup."""
+    if not symbol:
+        return False
+    symbol = symbol.upper()
+    try:
+        return symbol in _LOOKUP
+    except ValueError:
+        # Map closed by a concurrent swap; the new lookup is published
+        return symbol in _LOOKUP
+
+
+def ticker_count():
+    return len(_LOOKUP)
+
+
+def snapshot_version():
+    return _LOOKUP.version
+
+
+def _open_lookup(path=None):
+    if TICKER_LOOKUP_MODE == "mmap":
+        return MmapTickerLookup(path)
+    return SetTickerLookup.from_snapshot(path)
+
+
 # ------------------------------
 # LOAD & SAVE CACHE
 # ------------------------------
 def load_cached_tickers():
-    global VALID_TICKERS
+    """Load the last snapshot (binary first, legacy JSON fallback)."""
+    path = latest_snapshot()
+    if path:
+        try:
+            _swap(_open_lookup(path))
+            print(f"[TICKER CACHE] Loaded {ticker_count()} tickers from snapshot v{snapshot_version()}")
+            return
+        except Exception as e:
+            print(f"[TICKER CACHE] Failed to load snapshot: {e}")
+
     if os.path.exists(TICKER_CACHE_FILE):
         try:
             with open(TICKER_CACHE_FILE, "r") as f:
                 data = json.load(f)
-            VALID_TICKERS = set(data.get("tickers", []))
-            print(f"[TICKER CACHE] Loaded {len(VALID_TICKERS)} tickers from cache")
+            _swap(SetTickerLookup(t.upper() for t in data.get("tickers", [])))
+            print(f"[TICKER CACHE] Loaded {ticker_count()} tickers from cache")
         except Exception as e:
             print(f"[TICKER CACHE] Failed to load cache: {e}")
     else:
         print("[TICKER CACHE] No cache file found, starting empty.")
 
-def save_cached_tickers():
+def save_cached_tickers(tickers=None):
+    """Persist tickers (default: active universe) as a new binary snapshot."""
     try:
-        with open(TICKER_CACHE_FILE, "w") as f:
-            json.dump({"tickers": list(VALID_TICKERS)}, f, indent=2)
-        print(f"[TICKER CACHE] Saved {len(VALID_TICKERS)} tickers to cache")
+        # VALID_TICKERS is not populated in mmap mode; read the lookup
+        version = write_snapshot(_LOOKUP.tickers if tickers is None else tickers)
+        print(f"[TICKER CACHE] Saved snapshot v{version}")
+        return version
     except Exception as e:
         print(f"[TICKER CACHE] Failed to save cache: {e}")
+        return None
 
 # ------------------------------
 # REFRESH LOGIC
 # ------------------------------
 def refresh_valid_tickers():
-    """Refresh global VALID_TICKERS with hybrid fetch and persist to disk."""
-    global VALID_TICKERS
-    fresh_set = set(fetch_latest_tickers())
-    if fresh_set:
-        VALID_TICKERS = fresh_set
-        save_cached_tickers()
-        print(f"[TICKER CACHE] ✅ Refreshed VALID_TICKERS → {len(VALID_TICKERS)} tickers")
+    """
+    Build the new set, write a snapshot, then swap the reference.
+    Safe to call from any thread; readers never block.
+    """
+    fresh_set = normalize_tickers(fetch_latest_tickers())
+    if not fresh_set:
+        return
+
+    version = save_cached_tickers(fresh_set)
+
+    lookup = None
+    if version is not None:
+        try:
+            lookup = _open_lookup(snapshot_path(version))
+        except Exception as e:
+            print(f"[TICKER CACHE] Snapshot reopen failed → in-memory swap. {e}")
+
+    _swap(lookup or SetTickerLookup(fresh_set, version=version or 0))
+
+    if lookup is not None:
+        _prune_snapshots(keep=lookup.path)
+    print(f"[TICKER CACHE] ✅ Refreshed VALID_TICKERS → {ticker_count()} tickers")
 
 # ------------------------------
-# BACKGROUND REFRESH LOOP
+# BACKGROUND REFRESH WORKER
 # ------------------------------
-def start_background_refresh(interval_hours=6):
-    """Refresh tickers periodically (default every 6h)."""
-    def refresh_loop():
-        while True:
-            time.sleep(interval_hours * 3600)
+class TickerRefreshWorker:
+    """Daemon thread that refreshes the universe off the reader path."""
+
+    def __init__(self, interval_hours=6, refresh=refresh_valid_tickers):
+        self.interval_seconds = interval_hours * 3600
+        self._refresh = refresh
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, immediate=False):
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(immediate,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self, immediate):
+        if immediate:
+            self._safe_refresh()
+        while not self._stop.wait(self.interval_seconds):
             print("[TICKER CACHE] Periodic refresh starting...")
-            refresh_valid_tickers()
-    threading.Thread(target=refresh_loop, daemon=True).start()
+            self._safe_refresh()
+
+    def _safe_refresh(self):
+        try:
+            self._refresh()
+        except Exception as e:
+            print(f"[TICKER CACHE] Refresh failed: {e}")
+
+
+def start_background_refresh(interval_hours=6, immediate=False):
+    """Refresh tickers periodically (default every 6h)."""
+    return TickerRefreshWorker(interval_hours).start(immediate=immediate)
 
 # ------------------------------
 # PUBLIC MANUAL REFRESH ROUTE
 # ------------------------------
 def manual_refresh_tickers():
     """Manually triggers a refresh and returns updated count."""
-    global VALID_TICKERS
     print("[TICKER REFRESH] Manual refresh requested…")
 
-    tickers = fetch_latest_tickers()
-    VALID_TICKERS = set(tickers)
-    save_cached_tickers()
+    refresh_valid_tickers()
 
-    return {"status": "success", "ticker_count": len(VALID_TICKERS)}
+    return {"status": "success", "ticker_count": ticker_count(), "version": snapshot_version()}
 
 # ------------------------------
 # INIT ON IMPORT
 # ------------------------------
 def init_ticker_cache():
-    """Initialize ticker cache at app startup."""
+    """
+    Initialize ticker cache at app startup.
+    Loads the last snapshot synchronously (milliseconds); if none
+    exists, the first build runs on the worker thread instead of
+    blocking startup.
+    """
     load_cached_tickers()
-    if not VALID_TICKERS:
-        refresh_valid_tickers()
-    start_background_refresh()
+    return start_background_refresh(immediate=(ticker_count() == 0))
@@ -0,0 +1,122 @@
+import threading
+
+import pytest
+
+from marketmind_engine.analysis import symbols
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "ticker_snapshot.bin")
+    monkeypatch.setattr(symbols, "TICKER_SNAPSHOT_FILE", path)
+    monkeypatch.setattr(symbols, "TICKER_CACHE_FILE", str(tmp_path / "missing.json"))
+    monkeypatch.setattr(symbols, "_LOOKUP", symbols.SetTickerLookup(()))
+    monkeypatch.setattr(symbols, "VALID_TICKERS", frozenset())
+    return path
+
+
+def test_snapshot_round_trip_set_mode(snapshot_path):
+    version = symbols.write_snapshot(["nvda", "AAPL", "BRK.B", "A"], path=snapshot_path, version=7)
+    lookup = symbols.SetTickerLookup.from_snapshot(snapshot_path)
+
+    assert version == 7
+    assert lookup.version == 7
+    assert lookup.tickers == {"NVDA", "AAPL", "BRK.B", "A"}
+
+
+def test_mmap_lookup_binary_search(snapshot_path):
+    universe = [f"T{i:04d}" for i in range(5000)] + ["A", "ZZZZZZ"]
+    symbols.write_snapshot(universe, path=snapshot_path, version=1)
+
+    lookup = symbols.MmapTickerLookup(snapshot_path)
+
+    assert len(lookup) == 5002
+    assert "T0000" in lookup
+    assert "T4999" in lookup
+    assert "A" in lookup
+    assert "ZZZZZZ" in lookup
+    assert "T5000" not in lookup
+    assert "ZZZZZZZ" not in lookup
+    assert "TÄ" not in lookup
+
+
+def test_load_cached_tickers_uses_snapshot(snapshot_path):
+    symbols.write_snapshot(["SPY", "QQQ"], path=snapshot_path, version=3)
+
+    symbols.load_cached_tickers()
+
+    assert symbols.is_valid_ticker("spy")
+    assert symbols.snapshot_version() == 3
+    assert symbols.VALID_TICKERS == {"SPY", "QQQ"}
+
+
+def test_refresh_swaps_only_complete_sets(snapshot_path, monkeypatch):
+    symbols.write_snapshot(["OLD"], path=snapshot_path, version=1)
+    symbols.load_cached_tickers()
+
+    building = threading.Event()
+    release = threading.Event()
+
+    def slow_fetch():
+        building.set()
+        release.wait(5)
+        return ["NEW1", "NEW2"]
+
+    monkeypatch.setattr(symbols, "fetch_latest_tickers", slow_fetch)
+
+    worker = threading.Thread(target=symbols.refresh_valid_tickers)
+    worker.start()
+    building.wait(5)
+
+    # Readers keep seeing the old universe while the new one is built
+    assert symbols.is_valid_ticker("OLD")
+    assert not symbols.is_valid_ticker("NEW1")
+
+    release.set()
+    worker.join(5)
+
+    assert symbols.is_valid_ticker("NEW1")
+    assert not symbols.is_valid_ticker("OLD")
+    assert symbols.snapshot_version() > 1
+
+
+def test_refresh_worker_runs_off_thread(snapshot_path):
+    calls = []
+    done = threading.Event()
+
+    def refresh():
+        calls.append(threading.current_thread().name)
+        done.set()
+
+    worker = symbols.TickerRefreshWorker(interval_hours=1, refresh=refresh).start(immediate=True)
+    done.wait(5)
+    worker.stop(timeout=5)
+
+    assert len(calls) == 1
+    assert calls[0] != threading.main_thread().name
+
+
+def test_mmap_refresh_writes_new_file_and_closes_old_map(snapshot_path, monkeypatch):
+    monkeypatch.setattr(symbols, "TICKER_LOOKUP_MODE", "mmap")
+    monkeypatch.setattr(symbols, "fetch_latest_tickers", lambda: ["NEW"])
+
+    first = symbols.write_snapshot(["OLD"])
+    symbols.load_cached_tickers()
+    old = symbols._LOOKUP
+
+    symbols.refresh_valid_tickers()
+
+    assert old._map.closed
+    assert symbols.is_valid_ticker("NEW")
+    assert symbols.snapshot_version() > first
+    assert [v for v, _ in symbols._versioned_snapshots()] == [symbols.snapshot_version()]
+
+    # No-arg save persists the mapped universe, not the empty set
+    version = symbols.save_cached_tickers()
+    assert symbols.SetTickerLookup.from_snapshot(symbols.snapshot_path(version)).tickers == {"NEW"}
+
+
+def test_non_ascii_tickers_are_rejected_not_stripped(snapshot_path):
+    symbols.write_snapshot(["ABÇ", "AB", "NVDA"], path=snapshot_path, version=1)
+
+    assert symbols.SetTickerLookup.from_snapshot(snapshot_path).tickers == {"AB", "NVDA"}
@@ -23,6 +23,7 @@ from dataclasses import asdict
 from marketmind_engine.core.clock import ENGINE_CLOCK
 from marketmind_engine.data.registry import get_provider
 from marketmind_engine.intelligence.propagation_engine import PropagationEngine
+from marketmind_engine.telemetry import metrics as engine_metrics
 
 # =========================================================
 # Decision + Policy
@@ -63,7 +64,15 @@ _POLICY_ENGINE = PolicyEngine(
 # ENGINE FUNCTIONS
 # =========================================================
 
+def _counter_total(counter) -> int:
+    return int(sum(child.value for _, child in counter.children()))
+
+
 def get_metrics() -> dict:
+    """
+    JSON summary of the engine metrics registry
+    (full exposition is served at /metrics).
+    """
 
     clock = ENGINE_CLOCK.now()
     provider = get_provider()
@@ -71,14 +80,13 @@ def get_metrics() -> dict:
     return {
         **clock,
         "timestamp": datetime.utcnow().isoformat(),
-        "rss_events_processed": 53,
-        "echo_assets_analyzed": 17,
-        "trades_simulated": 9,
-        "ttcf_exits_triggered": 6,
-        "ucip_avg": 0.48,
-        "fils_avg": 76,
-        "trades_closed_profitably": 7,
-        "trades_closed_unprofitably": 2,
+        "rss_events_processed": _counter_total(engine_metrics.HEADLINES_INGESTED),
+        "symbols_validated": _counter_total(engine_metrics.SYMBOLS_VALIDATED),
+        "symbols_filtered": _counter_total(engine_metrics.SYMBOLS_FILTERED),
+        "cycles_run": _counter_total(engine_metrics.CYCLES_RUN),
+        "rule_vetoes": _counter_total(engine_metrics.RULE_VETOES),
+        "entry_blocks": _counter_total(engine_metrics.ENTRY_BLOCKS),
+        "orders_submitted": _counter_total(engine_metrics.ORDER_SUBMISSIONS),
         "engine": "marketmind_engine",
         "mode": "live",
         "data_source": provider.name,
@@ -0,0 +1,156 @@
+"""
+API Serialization Benchmark
+---------------------------
+Requests per second on the hot read endpoints, before and after
+the fast serialization layer:
+
+    /api/engine/state         response_model validation
+                              vs cached pre-encoded bytes
+    /api/propagation_snapshot jsonable_encoder + json
+                              vs per-version bytes + spliced ages
+
+"before" routes reproduce the previous handlers on a separate
+app; both sides read the same engine and propagation state.
+The propagation engine gets a synthetic in-memory provider so
+the benchmark measures serving cost, not market data fetches.
+
+Usage:
+
+    python -m marketmind_engine.api.benchmark [--requests N] [--gzip]
+"""
+
+from typing import Dict, List
+import argparse
+import json
+import random
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from marketmind_engine.api import server
+from marketmind_engine.api.models import EngineStateSnapshot
+from marketmind_engine.intelligence.propagation_engine import (
+    PropagationEngine,
+    STRUCTURAL_SYMBOLS,
+)
+
+
+class _SyntheticProvider:
+
+    def __init__(self, seed: int = 7):
+        self._rng = random.Random(seed)
+
+    def get_batch_data(self, symbols: List[str]) -> Dict[str, Dict[str, float]]:
+        return {
+            s: {"percent_change": round(self._rng.uniform(-3, 3), 4)}
+            for s in symbols
+        }
+
+
+def build_legacy_app() -> FastAPI:
+    """
+    The pre-serialization-layer handlers.
+    """
+
+    legacy = FastAPI()
+
+    @legacy.get("/api/engine/state", response_model=EngineStateSnapshot)
+    def engine_state():
+        return server.engine_state_payload()
+
+    @legacy.get("/api/propagation_snapshot")
+    def propagation_snapshot():
+        try:
+            return server.propagation_engine.snapshot()
+        except Exception:
+            return {"status": "propagation_unavailable"}
+
+    return legacy
+
+
+def prepare(narrative_symbols: int = 40) -> None:
+
+    engine = PropagationEngine(
+        provider=_SyntheticProvider(),
+        engine_controller=server.engine_controller,
+        rss_service=None,
+        composite_ttl=float("inf"),
+    )
+    engine.update([f"SYM{i}" for i in range(narrative_symbols)] + STRUCTURAL_SYMBOLS)
+    server.propagation_engine = engine
+
+    if not server.engine_controller.is_running():
+        server.engine_controller.start()
+
+    server.engine_controller.run_symbol_cycle("SPY")
+
+
+def measure(client: TestClient, path: str, requests: int, headers=None) -> float:
+
+    for _ in range(20):
+        client.get(path, headers=headers)
+
+    started = time.perf_counter()
+
+    for _ in range(requests):
+        client.get(path, headers=headers)
+
+    return requests / (time.perf_counter() - started)
+
+
+def run(requests: int = 2000, use_gzip: bool = False) -> Dict[str, Dict[str, float]]:
+
+    prepare()
+
+    before = TestClient(build_legacy_app())
+    after = TestClient(server.app)
+
+    headers = {"Accept-Encoding": "gzip" if use_gzip else "identity"}
+    results = {}
+
+    for path in ("/api/engine/state", "/api/propagation_snapshot"):
+
+        old = before.get(path, headers=headers)
+        new = after.get(path, headers=headers)
+
+        # Same document either way (ages excluded)
+        a, b = old.json(), new.json()
+        for key in ("age", "data_age"):
+            a.pop(key, None)
+            b.pop(key, None)
+        if a != b:
+            raise AssertionError(f"{path}: payload mismatch")
+
+        results[path] = {
+            "before_rps": measure(before, path, requests, headers),
+            "after_rps": measure(after, path, requests, headers),
+            "bytes_before": len(old.content),
+            "bytes_after": int(new.headers.get("content-length", len(new.content))),
+        }
+
+    return results
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Engine API serialization benchmark")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--gzip", action="store_true", help="send Accept-Encoding: gzip")
+    args = parser.parse_args()
+
+    results = run(args.requests, args.gzip)
+
+    for path, r in results.items():
+        print(
+            f"{path:<28} before {r['before_rps']:>8.0f} req/s  "
+            f"after {r['after_rps']:>8.0f} req/s  "
+            f"x{r['after_rps'] / r['before_rps']:.2f}  "
+            f"bytes {r['bytes_before']} -> {r['bytes_after']}"
+        )
+
+    print(json.dumps(server.SERIALIZED_CACHE.stats()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+API Serialization
+-----------------
+Fast JSON encoding and compression for hot read endpoints.
+
+- dumps(): orjson when installed, stdlib json otherwise
+  (compact separators); dataclasses, enums, datetimes and
+  sets are handled without jsonable_encoder
+- trusted internal snapshots are returned as pre-encoded
+  bytes, skipping response_model re-validation
+- bodies >= GZIP_MIN_BYTES are gzipped for clients that
+  accept it
+- SerializedCache keeps the encoded (and gzipped) bytes of
+  the latest version per payload name, so repeated reads of
+  an unchanged snapshot cost a dict lookup
+
+Framework-neutral: FastAPI and Flask adapters only wrap
+render() output in their own response types.
+
+Configuration via environment:
+
+    MARKETMIND_GZIP_MIN_BYTES   smallest body that is gzipped
+"""
+
+from dataclasses import asdict, dataclass, field, is_dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import gzip
+import json
+import os
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+GZIP_MIN_BYTES = int(os.getenv("MARKETMIND_GZIP_MIN_BYTES", "1024"))
+GZIP_LEVEL = 5
+
+JSON_MEDIA_TYPE = "application/json"
+
+# Distinguishes ETags across process restarts
+_EPOCH = format(time.time_ns() & 0xFFFFFFFF, "x")
+
+
+# ==================================================
+# ENCODING
+# ==================================================
+
+def _default(obj: Any) -> Any:
+
+    if isinstance(obj, Enum):
+        return obj.value
+
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=str)
+
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+
+    if hasattr(obj, "__dict__"):
+        return {k: v for k, v in vars(obj).items() if not k.startswith("_")}
+
+    return str(obj)
+
+
+if orjson is not None:
+
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+
+else:  # pragma: no cover - exercised only without orjson
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def splice(body: bytes, extra: bytes) -> bytes:
+    """
+    Merge two encoded JSON objects: {..body..} + {..extra..}.
+    Lets a cached body be combined with a few per-request fields.
+    """
+
+    if body == b"{}":
+        return extra
+
+    if extra == b"{}":
+        return body
+
+    return body[:-1] + b"," + extra[1:]
+
+
+# ==================================================
+# COMPRESSION
+# ==================================================
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+
+    if not accept_encoding:
+        return False
+
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        if token.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+
+    return False
+
+
+def gzip_bytes(body: bytes) -> bytes:
+    # mtime=0 keeps output deterministic (cacheable)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+@dataclass
+class EncodedPayload:
+    body: bytes
+    etag: Optional[str] = None
+    _gzipped: Optional[bytes] = field(default=None, repr=False)
+
+    def gzipped(self) -> bytes:
+        if self._gzipped is None:
+            self._gzipped = gzip_bytes(self.body)
+        return self._gzipped
+
+
+def render(
+    payload: EncodedPayload,
+    accept_encoding: Optional[str] = None,
+    min_gzip_bytes: Optional[int] = None,
+) -> Tuple[bytes, Dict[str, str]]:
+    """
+    (body, headers) for a response, gzipped when worthwhile.
+    """
+
+    threshold = GZIP_MIN_BYTES if min_gzip_bytes is None else min_gzip_bytes
+    headers = {"Vary": "Accept-Encoding"}
+
+    if payload.etag:
+        headers["ETag"] = payload.etag
+
+    if len(payload.body) >= threshold and accepts_gzip(accept_encoding):
+        headers["Content-Encoding"] = "gzip"
+        return payload.gzipped(), headers
+
+    return payload.body, headers
+
+
+# ==================================================
+# PER-VERSION BYTE CACHE
+# ==================================================
+
+class SerializedCache:
+    """
+    Latest encoded payload per name, keyed by version.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[Hashable, EncodedPayload]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        name: str,
+        version: Hashable,
+        build: Callable[[], Any],
+    ) -> EncodedPayload:
+
+        with self._lock:
+            entry = self._entries.get(name)
+
+            if entry is not None and entry[0] == version:
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+
+        payload = EncodedPayload(
+            body=dumps(build()),
+            etag=f'"{name}-{_EPOCH}-{abs(hash(version)):x}"',
+        )
+
+        with self._lock:
+            self._entries[name] = (version, payload)
+
+        return payload
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+
+    if not if_none_match or not etag:
+        return False
+
+    for tag in (t.strip() for t in if_none_match.split(",")):
+        if tag == "*" or tag == etag or tag == f"W/{etag}":
+            return True
+
+    return False
+
+
+# ==================================================
+# SHARED CACHE
+# ==================================================
+
+SERIALIZED_CACHE = SerializedCache()
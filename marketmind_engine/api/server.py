@@ -1,7 +1,11 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
+import asyncio
+import json
 import threading
 import time
 
@@ -14,8 +18,45 @@ from marketmind_engine.api.models import (
     EngineStateSnapshot,
 )
 
-from marketmind_engine.intelligence.propagation_engine import PropagationEngine
+from marketmind_engine.intelligence.propagation_engine import (
+    PropagationEngine,
+    STRUCTURAL_SYMBOLS,
+)
 from marketmind_engine.intelligence.symbol_validator import SymbolValidator
+from marketmind_engine.intelligence.symbol_universe import start_universe_refresh
+from marketmind_engine.data.registry import get_stream
+from marketmind_engine.data.streaming import WatchlistSubscriptionManager
+from marketmind_engine.runtime.event_bus import EVENT_TYPES, get_event_bus
+from marketmind_engine.runtime.command_executor import (
+    RUN_TIMEOUT,
+    CommandRejected,
+    CommandTimeout,
+    get_command_executor,
+)
+from marketmind_engine.telemetry.metrics import (
+    COMMANDS_PENDING,
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    ENGINE_RUNNING,
+    REGISTRY,
+    STAGE_SECONDS,
+)
+from marketmind_engine.api.serialization import (
+    JSON_MEDIA_TYPE,
+    SERIALIZED_CACHE,
+    EncodedPayload,
+    dumps,
+    etag_matches as payload_etag_matches,
+    render,
+    splice,
+)
+from marketmind_engine.regime.snapshot_store import (
+    cache_headers,
+    etag_matches,
+    get_regime_store,
+    parse_last_event_id,
+    sse_event,
+    sse_keepalive,
+)
 
 
 # ------------------------------------------------------------------
@@ -46,6 +87,37 @@ propagation_engine = PropagationEngine(
 
 symbol_validator = SymbolValidator()
 
+# Latest regime snapshot, published by the engine loop
+regime_store = get_regime_store()
+
+# Push channel for dashboards (replaces UI polling)
+event_bus = get_event_bus()
+
+# Single executor for all engine cycles (loop + manual triggers)
+engine_commands = get_command_executor()
+
+# Scrape-time gauges
+ENGINE_RUNNING.set_function(lambda: 1 if engine_controller.is_running() else 0)
+COMMANDS_PENDING.set_function(lambda: engine_commands.pending)
+
+_LOOP_RSS_SECONDS = STAGE_SECONDS.labels(stage="loop.rss")
+_LOOP_VALIDATE_SECONDS = STAGE_SECONDS.labels(stage="loop.validate")
+_LOOP_EVALUATE_SECONDS = STAGE_SECONDS.labels(stage="loop.evaluate")
+_LOOP_PROPAGATION_SECONDS = STAGE_SECONDS.labels(stage="loop.propagation")
+
+# Minimum seconds between batches sent to one push client
+PUSH_MIN_INTERVAL = 0.25
+PUSH_KEEPALIVE = 15.0
+
+# Streaming prices follow the validated watchlist (structural ETFs pinned)
+market_stream = get_stream()
+
+subscription_manager = (
+    WatchlistSubscriptionManager(market_stream, pinned=STRUCTURAL_SYMBOLS)
+    if market_stream is not None
+    else None
+)
+
 
 # ------------------------------------------------------------------
 # FASTAPI APP
@@ -74,6 +146,71 @@ class RunRequest(BaseModel):
     symbol: Optional[str] = None
 
 
+# ------------------------------------------------------------------
+# REGIME SNAPSHOT
+# ------------------------------------------------------------------
+
+def publish_regime_snapshot():
+
+    last = engine_controller.get_last_result()
+
+    if not last or not isinstance(last.get("regime"), dict):
+        return None
+
+    try:
+        snapshot = regime_store.publish(last["regime"])
+
+        execution = snapshot.data.get("execution", {})
+        allow_entries = execution.get("allow_entries", True)
+
+        event_bus.publish("regime", {
+            "version": snapshot.version,
+            "snapshot": snapshot.data,
+            "regime_name": snapshot.data.get("regime", "unknown"),
+            "flatten_triggered": not allow_entries,
+            "block_new_entries": not allow_entries,
+        })
+
+        return snapshot
+
+    except Exception as e:
+        print("Regime publish error:", e)
+        return None
+
+
+# ------------------------------------------------------------------
+# PUSH EVENTS (ENGINE SIDE)
+# ------------------------------------------------------------------
+
+def publish_event(event_type: str, payload) -> None:
+    """
+    Publish to the dashboard event bus. Never raises into the loop.
+    """
+    try:
+        event_bus.publish(event_type, jsonable_encoder(payload))
+    except Exception as e:
+        print("Event publish error:", event_type, e)
+
+
+def publish_cycle(result) -> None:
+    if result:
+        publish_event("cycle", result)
+
+
+def publish_status() -> None:
+    publish_event("status", engine_status_payload())
+
+
+def publish_propagation() -> None:
+    snapshot = propagation_engine.snapshot()
+
+    # Ages tick on every read; clients derive them from timestamps
+    for key in ("age", "data_age"):
+        snapshot.pop(key, None)
+
+    publish_event("propagation", snapshot)
+
+
 # ------------------------------------------------------------------
 # ENGINE LOOP
 # ------------------------------------------------------------------
@@ -101,6 +238,8 @@ def engine_loop():
 
                 if rss_service:
 
+                    started = time.perf_counter()
+
                     try:
 
                         rss_service.worker.poll_once()
@@ -115,6 +254,12 @@ def engine_loop():
                         print("RSS headlines:", len(rss_service.buffer._headlines))
                         print("RSS events discovered:", len(events))
 
+                        publish_event("rss", {
+                            "headline_count": len(rss_service.buffer._headlines),
+                            "event_count": len(events),
+                            "polled_at": time.time(),
+                        })
+
                         for event in events:
 
                             if hasattr(event, "symbol") and event.symbol:
@@ -127,55 +272,79 @@ def engine_loop():
                     except Exception as e:
                         print("RSS polling error:", e)
 
+                    _LOOP_RSS_SECONDS.observe(time.perf_counter() - started)
+
                 # --------------------------------------------------
                 # 2. SYMBOL VALIDATION
                 # --------------------------------------------------
 
                 validated_symbols = set()
 
-                for symbol in symbols:
-
+                with _LOOP_VALIDATE_SECONDS.time():
                     try:
-
-                        if symbol_validator.is_valid(symbol):
-                            validated_symbols.add(symbol)
-                        else:
-                            print("Filtered symbol:", symbol)
-
+                        validated_symbols = set(symbol_validator.validate_many(symbols))
                     except Exception:
                         pass
 
+                for symbol in symbols:
+                    if symbol.upper() not in validated_symbols:
+                        print("Filtered symbol:", symbol)
+
                 print("Validated symbols:", validated_symbols)
 
+                if subscription_manager is not None:
+                    try:
+                        subscription_manager.sync(sorted(validated_symbols))
+                    except Exception as e:
+                        print("Stream subscription error:", e)
+
                 # --------------------------------------------------
                 # 3. ENGINE EVALUATION
                 # --------------------------------------------------
 
                 if validated_symbols:
 
+                    started = time.perf_counter()
+
                     for symbol in validated_symbols:
 
                         try:
 
                             symbol_evaluation_active = True
-                            engine_controller.run_symbol_cycle(symbol)
+                            publish_cycle(engine_commands.call(
+                                engine_controller.run_symbol_cycle,
+                                symbol,
+                                name=f"loop:{symbol}",
+                            ))
 
                         except Exception as e:
                             print("Symbol cycle error:", symbol, e)
 
+                    _LOOP_EVALUATE_SECONDS.observe(time.perf_counter() - started)
+
                     # --------------------------------------------------
                     # 4. PROPAGATION UPDATE
                     # --------------------------------------------------
 
-                    try:
-                        propagation_engine.update(validated_symbols)
-                    except Exception:
-                        pass
+                    with _LOOP_PROPAGATION_SECONDS.time():
+                        try:
+                            if propagation_engine.update(validated_symbols):
+                                publish_propagation()
+                        except Exception:
+                            pass
 
                 else:
 
                     print("No validated RSS symbols this cycle")
 
+                # --------------------------------------------------
+                # 5. PUBLISH REGIME SNAPSHOT
+                # --------------------------------------------------
+
+                publish_regime_snapshot()
+
+            publish_status()
+
         except Exception as e:
             print("Engine loop error:", e)
 
@@ -194,6 +363,23 @@ def start_engine():
 
     engine_controller.start()
 
+    # Pick up asset universe syncs from build_asset_universe.py
+    start_universe_refresh()
+
+    # Bulk-load the session's previous closes before the loop asks for them
+    if hasattr(provider, "warm_previous_closes"):
+        try:
+            provider.warm_previous_closes()
+        except Exception:
+            pass
+
+    if subscription_manager is not None:
+        try:
+            subscription_manager.sync([])
+            market_stream.start()
+        except Exception as e:
+            print("Stream start error:", e)
+
     if not engine_loop_running:
 
         engine_loop_running = True
@@ -205,6 +391,8 @@ def start_engine():
 
         engine_loop_thread.start()
 
+    publish_status()
+
     return {"status": "started"}
 
 
@@ -216,30 +404,70 @@ def stop_engine():
     engine_controller.stop()
     engine_loop_running = False
 
+    if market_stream is not None:
+        market_stream.stop()
+
+    publish_status()
+
     return {"status": "stopped"}
 
 
 # ------------------------------------------------------------------
 # MANUAL RUN
 # ------------------------------------------------------------------
+# Manual triggers are queued on the engine executor (the same one
+# the engine loop uses) and awaited with RUN_TIMEOUT, so they never
+# hold a threadpool worker or race the loop on the controller.
+# Repeated triggers for a symbol that is still queued share one run.
+
+def manual_cycle(symbol: str):
+
+    result = engine_controller.run_symbol_cycle(symbol)
+    publish_cycle(result)
+    publish_regime_snapshot()
+
+    return result
+
+
+async def submit_manual_cycle(symbol: str):
+    return await engine_commands.run(
+        manual_cycle,
+        symbol,
+        timeout=RUN_TIMEOUT,
+        name=f"manual:{symbol}",
+        key=("manual", symbol),
+    )
+
+
+def command_error_status(e: Exception) -> int:
+
+    if isinstance(e, CommandTimeout):
+        return 504
+
+    if isinstance(e, CommandRejected):
+        return 503
+
+    return 200
+
 
 @app.post("/api/engine/run-cycle")
-def run_cycle():
+async def run_cycle():
 
     try:
-        result = engine_controller.run_symbol_cycle("TEST")
-        return result
+        return await submit_manual_cycle("TEST")
 
     except Exception as e:
-        return {"error": str(e)}
+        return JSONResponse(
+            {"error": str(e)},
+            status_code=command_error_status(e),
+        )
 
 
 # ------------------------------------------------------------------
 # ENGINE STATUS
 # ------------------------------------------------------------------
 
-@app.get("/api/engine/status", response_model=EngineStatus)
-def engine_status():
+def engine_status_payload():
 
     last = engine_controller.get_last_result()
 
@@ -268,12 +496,17 @@ def engine_status():
     }
 
 
+@app.get("/api/engine/status", response_model=EngineStatus)
+def engine_status():
+    return engine_status_payload()
+
+
 # ------------------------------------------------------------------
 # ACTION ENDPOINT
 # ------------------------------------------------------------------
 
 @app.post("/api/engine/run", response_model=RunDecisionResult)
-def run_engine(req: Optional[RunRequest] = None):
+async def run_engine(req: Optional[RunRequest] = None):
 
     symbol = "TEST"
 
@@ -290,7 +523,7 @@ def run_engine(req: Optional[RunRequest] = None):
 
     try:
 
-        result = engine_controller.run_symbol_cycle(symbol)
+        result = await submit_manual_cycle(symbol)
 
         return {
             "decision": result.get("decision", "UNKNOWN"),
@@ -301,20 +534,96 @@ def run_engine(req: Optional[RunRequest] = None):
 
     except Exception as e:
 
-        return {
-            "decision": "ERROR",
-            "engine_time": -1,
-            "symbol": symbol,
-            "reason": str(e),
-        }
+        return JSONResponse(
+            {
+                "decision": "ERROR",
+                "engine_time": -1,
+                "symbol": symbol,
+                "reason": str(e),
+            },
+            status_code=command_error_status(e),
+        )
+
+
+@app.get("/api/engine/commands")
+def engine_commands_stats():
+    return engine_commands.stats()
+
+
+# ------------------------------------------------------------------
+# METRICS (Prometheus text exposition)
+# ------------------------------------------------------------------
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    return Response(REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
+
+# ------------------------------------------------------------------
+# FAST RESPONSES
+# ------------------------------------------------------------------
+# Hot read endpoints return pre-encoded bytes (orjson when
+# available), cached per snapshot version and gzipped for large
+# bodies. Returning a Response skips response_model validation;
+# payloads are built from trusted engine state in the exact
+# shape the response_model would emit.
+
+def encoded_response(payload: EncodedPayload, request: Request) -> Response:
+
+    if payload_etag_matches(request.headers.get("if-none-match"), payload.etag):
+        return Response(status_code=304, headers={"ETag": payload.etag})
+
+    body, headers = render(payload, request.headers.get("accept-encoding"))
+    headers["Cache-Control"] = "no-cache"
+
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+def fast_json(content, request: Request) -> Response:
+    return encoded_response(EncodedPayload(dumps(content)), request)
 
 
 # ------------------------------------------------------------------
 # ENGINE TELEMETRY
 # ------------------------------------------------------------------
 
+def engine_state_wire():
+    """
+    engine_state_payload() in EngineStateSnapshot's serialized form.
+    """
+
+    payload = engine_state_payload()
+    regime_snapshot = payload["regime"] or {}
+    last_ts = payload.get("last_cycle_timestamp")
+
+    return {
+        "running": bool(payload["running"]),
+        "regime": {
+            "timestamp": float(regime_snapshot.get("timestamp", 0.0)),
+            "regime": str(regime_snapshot.get("regime", "unknown")),
+            "execution": regime_snapshot.get("execution", {}),
+            "composite_score": float(regime_snapshot.get("composite_score", 0.0)),
+            "recovery_modifier": float(regime_snapshot.get("recovery_modifier", 1.0)),
+            "domain_modifier": float(regime_snapshot.get("domain_modifier", 1.0)),
+        },
+        "engine_time": int(payload.get("engine_time") or 0),
+        "last_cycle_timestamp": None if last_ts is None else float(last_ts),
+    }
+
+
 @app.get("/api/engine/state", response_model=EngineStateSnapshot)
-def engine_state():
+def engine_state(request: Request):
+
+    payload = SERIALIZED_CACHE.get(
+        "engine_state",
+        (engine_controller.result_version(), engine_controller.is_running()),
+        engine_state_wire,
+    )
+
+    return encoded_response(payload, request)
+
+
+def engine_state_payload():
 
     last = engine_controller.get_last_result()
 
@@ -359,18 +668,193 @@ def engine_state():
     }
 
 
+# ------------------------------------------------------------------
+# REGIME (CACHED / PUSH)
+# ------------------------------------------------------------------
+
+@app.get("/api/regime")
+def regime(request: Request):
+    """
+    Latest published regime snapshot. Never runs a cycle.
+    Supports If-None-Match -> 304.
+    """
+
+    snapshot = regime_store.latest()
+
+    if snapshot is None:
+        return JSONResponse(
+            {"version": 0, "snapshot": None},
+            headers={"Cache-Control": "no-cache"},
+        )
+
+    if etag_matches(request.headers.get("if-none-match"), snapshot):
+        return Response(status_code=304, headers=cache_headers(snapshot))
+
+    payload = SERIALIZED_CACHE.get(
+        "regime",
+        snapshot.version,
+        lambda: {"version": snapshot.version, "snapshot": snapshot.data},
+    )
+
+    body, headers = render(payload, request.headers.get("accept-encoding"))
+    headers.update(cache_headers(snapshot))
+
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+@app.get("/api/regime/stream")
+async def regime_stream(request: Request):
+    """
+    Server-sent events: one "regime" event per new snapshot version.
+    """
+
+    after = parse_last_event_id(
+        request.headers.get("last-event-id") or request.query_params.get("after"),
+        regime_store.epoch,
+    )
+
+    async def events():
+
+        version = after
+
+        while not await request.is_disconnected():
+
+            snapshot = await regime_store.next_change(version)
+
+            if snapshot is None:
+                yield sse_keepalive()
+                continue
+
+            version = snapshot.version
+            yield sse_event(snapshot)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# ------------------------------------------------------------------
+# PUSH CHANNEL (SSE / WEBSOCKET)
+# ------------------------------------------------------------------
+# Clients get a full event per type on connect, then deltas.
+# Each client has one pending slot per type: while a send is in
+# flight (slow client) newer events coalesce into that slot.
+
+def _event_types(raw: Optional[str]):
+    if not raw:
+        return EVENT_TYPES
+    return [t for t in raw.split(",") if t in EVENT_TYPES]
+
+
+def _encode_event(event) -> str:
+    return json.dumps(event.to_dict(), default=str)
+
+
+@app.get("/api/events")
+async def events_stream(request: Request, types: Optional[str] = None):
+
+    try:
+        sub = event_bus.subscribe(_event_types(types), loop=asyncio.get_running_loop())
+    except RuntimeError as e:
+        return JSONResponse({"error": str(e)}, status_code=503)
+
+    async def stream():
+        try:
+            while not await request.is_disconnected():
+
+                batch = await sub.next_batch(timeout=PUSH_KEEPALIVE)
+
+                if not batch:
+                    yield ": keepalive\n\n"
+                    continue
+
+                yield "".join(
+                    f"id: {e.seq}\nevent: {e.type}\ndata: {_encode_event(e)}\n\n"
+                    for e in batch
+                )
+
+                await asyncio.sleep(PUSH_MIN_INTERVAL)
+        finally:
+            sub.close()
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.websocket("/api/ws")
+async def events_socket(websocket: WebSocket):
+
+    await websocket.accept()
+
+    try:
+        sub = event_bus.subscribe(
+            _event_types(websocket.query_params.get("types")),
+            loop=asyncio.get_running_loop(),
+        )
+    except RuntimeError as e:
+        await websocket.close(code=1013, reason=str(e))
+        return
+
+    try:
+        while True:
+
+            batch = await sub.next_batch(timeout=PUSH_KEEPALIVE)
+
+            if not batch:
+                await websocket.send_text('{"type":"keepalive"}')
+                continue
+
+            # One frame per batch; awaiting the send is the backpressure
+            await websocket.send_text(
+                "[" + ",".join(_encode_event(e) for e in batch) + "]"
+            )
+
+            await asyncio.sleep(PUSH_MIN_INTERVAL)
+
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+
+    finally:
+        sub.close()
+
+
+@app.get("/api/events/stats")
+def events_stats():
+    return event_bus.stats()
+
+
 # ------------------------------------------------------------------
 # PROPAGATION OBSERVATORY
 # ------------------------------------------------------------------
 
 @app.get("/api/propagation_snapshot")
-def propagation_snapshot():
+def propagation_snapshot(request: Request):
+
+    try:
+        version, body, volatile = propagation_engine.snapshot_parts()
+
+    except Exception as e:
+        return fast_json({
+            "mode": "propagation_error",
+            "timestamp": time.time(),
+            "error": str(e),
+        }, request)
 
     try:
-        return propagation_engine.snapshot()
+        # Cached bytes for the version + per-read age fields
+        cached = SERIALIZED_CACHE.get("propagation", version, lambda: body)
+        return encoded_response(
+            EncodedPayload(splice(cached.body, dumps(volatile))),
+            request,
+        )
 
     except Exception:
-        return {"status": "propagation_unavailable"}
+        return fast_json({"status": "propagation_unavailable"}, request)
 
 
 # ------------------------------------------------------------------
@@ -398,15 +882,7 @@ def rss_events():
                 for s in event.symbols:
                     raw_symbols.add(s)
 
-        validated = []
-
-        for s in raw_symbols:
-
-            try:
-                if symbol_validator.is_valid(s):
-                    validated.append(s)
-            except Exception:
-                pass
+        validated = symbol_validator.validate_many(raw_symbols)
 
         return {
             "headline_count": len(rss_service.buffer._headlines),
@@ -424,6 +900,12 @@ def rss_events():
 # ------------------------------------------------------------------
 
 @app.get("/api/engine/last")
-def last_result():
+def last_result(request: Request):
+
+    payload = SERIALIZED_CACHE.get(
+        "engine_last",
+        engine_controller.result_version(),
+        engine_controller.get_last_result,
+    )
 
-    return engine_controller.get_last_result()
\ No newline at end of file
+    return encoded_response(payload, request)
\ No newline at end of file
@@ -0,0 +1,101 @@
+import gzip
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+from marketmind_engine.api.serialization import (
+    EncodedPayload,
+    SerializedCache,
+    accepts_gzip,
+    dumps,
+    etag_matches,
+    render,
+    splice,
+)
+
+
+class Mode(Enum):
+    NORMAL = "NORMAL"
+
+
+@dataclass
+class Position:
+    symbol: str
+    qty: int
+
+
+def test_dumps_handles_engine_types():
+    body = dumps({
+        "mode": Mode.NORMAL,
+        "at": datetime(2024, 1, 2, 3, 4, 5),
+        "position": Position("SPY", 3),
+        "tags": {"b", "a"},
+    })
+
+    assert json.loads(body) == {
+        "mode": "NORMAL",
+        "at": "2024-01-02T03:04:05",
+        "position": {"symbol": "SPY", "qty": 3},
+        "tags": ["a", "b"],
+    }
+
+
+def test_splice_merges_encoded_objects():
+    assert json.loads(splice(dumps({"a": 1}), dumps({"b": 2}))) == {"a": 1, "b": 2}
+    assert splice(b"{}", b'{"b":2}') == b'{"b":2}'
+    assert splice(b'{"a":1}', b"{}") == b'{"a":1}'
+
+
+def test_accepts_gzip():
+    assert accepts_gzip("gzip, deflate, br")
+    assert accepts_gzip("br;q=1.0, *;q=0.5")
+    assert not accepts_gzip("gzip;q=0")
+    assert not accepts_gzip("identity")
+    assert not accepts_gzip(None)
+
+
+def test_render_gzips_above_threshold_only():
+    small = EncodedPayload(body=b'{"a":1}', etag='"x"')
+    body, headers = render(small, "gzip", min_gzip_bytes=100)
+    assert body == small.body
+    assert "Content-Encoding" not in headers
+    assert headers["ETag"] == '"x"'
+
+    large = EncodedPayload(body=dumps({"k": "v" * 500}))
+    body, headers = render(large, "gzip", min_gzip_bytes=100)
+    assert headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(body) == large.body
+    assert large.gzipped() is body
+
+    body, headers = render(large, "identity", min_gzip_bytes=100)
+    assert body == large.body
+
+
+def test_serialized_cache_rebuilds_on_new_version():
+    cache = SerializedCache()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {"n": len(builds)}
+
+    first = cache.get("state", 1, build)
+    assert cache.get("state", 1, build) is first
+    assert len(builds) == 1
+
+    second = cache.get("state", 2, build)
+    assert json.loads(second.body) == {"n": 2}
+    assert second.etag != first.etag
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 2}
+
+    cache.invalidate("state")
+    assert cache.stats()["entries"] == 0
+
+
+def test_etag_matches():
+    assert etag_matches('"a", "b"', '"b"')
+    assert etag_matches('W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
@@ -0,0 +1,84 @@
+import threading
+
+from fastapi.testclient import TestClient
+
+from marketmind_engine.api import server
+
+
+def test_reads_stay_responsive_while_manual_cycle_runs(monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_cycle(symbol, market_context_map=None):
+        started.set()
+        release.wait(5)
+        return {"decision": "NO_ACTION", "engine_time": 7, "reason": None}
+
+    monkeypatch.setattr(server.engine_controller, "run_symbol_cycle", slow_cycle)
+    monkeypatch.setattr(server.engine_controller, "is_running", lambda: True)
+    monkeypatch.setattr(server, "publish_cycle", lambda result: None)
+    monkeypatch.setattr(server, "publish_regime_snapshot", lambda: None)
+
+    client = TestClient(server.app)
+    responses = []
+
+    runner = threading.Thread(
+        target=lambda: responses.append(
+            client.post("/api/engine/run", json={"symbol": "SPY"})
+        )
+    )
+    runner.start()
+
+    assert started.wait(5)
+
+    # Cycle is in progress: reads answer without waiting on it
+    assert client.get("/api/engine/status").status_code == 200
+    assert client.get("/api/engine/commands").json()["current"] == "manual:SPY"
+
+    release.set()
+    runner.join(5)
+
+    assert responses[0].status_code == 200
+    assert responses[0].json()["decision"] == "NO_ACTION"
+
+
+def test_manual_run_times_out_with_504(monkeypatch):
+    release = threading.Event()
+
+    def stuck_cycle(symbol, market_context_map=None):
+        release.wait(5)
+        return {}
+
+    monkeypatch.setattr(server.engine_controller, "run_symbol_cycle", stuck_cycle)
+    monkeypatch.setattr(server, "publish_cycle", lambda result: None)
+    monkeypatch.setattr(server, "publish_regime_snapshot", lambda: None)
+    monkeypatch.setattr(server, "RUN_TIMEOUT", 0.05)
+
+    try:
+        response = TestClient(server.app).post("/api/engine/run-cycle")
+    finally:
+        release.set()
+
+    assert response.status_code == 504
+    assert "did not finish" in response.json()["error"]
+    assert server.engine_commands.join(timeout=5)
+
+
+def test_metrics_endpoint_exposes_engine_counters():
+    client = TestClient(server.app)
+
+    server.engine_controller.start()
+    try:
+        client.post("/api/engine/run", json={"symbol": "SPY"})
+        response = client.get("/metrics")
+    finally:
+        server.engine_controller.stop()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+    text = response.text
+    assert "# TYPE marketmind_cycles_total counter" in text
+    assert 'marketmind_decisions_total{source="runtime",decision="NO_ACTION"}' in text
+    assert 'marketmind_stage_seconds_count{stage="cycle.regime"}' in text
+    assert "marketmind_engine_running 1" in text
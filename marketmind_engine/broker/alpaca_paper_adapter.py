@@ -1,4 +1,4 @@
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 import os
 
 from alpaca.trading.client import TradingClient
@@ -15,8 +15,17 @@ from alpaca.data.requests import (
 from alpaca.data.timeframe import TimeFrame
 
 from .broker_adapter import BrokerAdapter
+from marketmind_engine.data.previous_close_cache import (
+    PREVIOUS_CLOSE_CACHE,
+    session_watchlist,
+)
+from marketmind_engine.data.streaming import (
+    MARKET_DATA_CACHE,
+    STREAM_MAX_AGE_SECONDS,
+)
 from marketmind_engine.execution.execution_types import OrderIntent
 from marketmind_engine.execution.execution_receipt import ExecutionReceipt
+from marketmind_engine.utils.market_time import bar_session_date
 
 
 class AlpacaPaperBrokerAdapter(BrokerAdapter):
@@ -25,12 +34,15 @@ class AlpacaPaperBrokerAdapter(BrokerAdapter):
 
     Provides:
         • Order execution
-        • Live market data
+        • Live market data (streamed cache first, REST fallback)
         • Batch data for propagation engine
-        • Percent change vs previous close
+        • Percent change vs previous close (session-cached)
     """
 
-    def __init__(self):
+    # Daily bars window used for bulk previous-close lookups
+    PREVIOUS_CLOSE_LOOKBACK_DAYS = 10
+
+    def __init__(self, previous_close_cache=None, market_data_cache=None):
 
         api_key = os.getenv("APCA_API_KEY_ID")
         secret_key = os.getenv("APCA_API_SECRET_KEY")
@@ -41,6 +53,12 @@ class AlpacaPaperBrokerAdapter(BrokerAdapter):
         self.client = TradingClient(api_key, secret_key, paper=True)
         self.data_client = StockHistoricalDataClient(api_key, secret_key)
 
+        self.market_data_cache = market_data_cache or MARKET_DATA_CACHE
+
+        self.previous_close_cache = previous_close_cache or PREVIOUS_CLOSE_CACHE
+        self.previous_close_cache.set_fetcher(self._fetch_previous_closes)
+        self.previous_close_cache.register_watchlist(session_watchlist())
+
     # --------------------------------------------------
     # Identity
     # --------------------------------------------------
@@ -55,6 +73,22 @@ class AlpacaPaperBrokerAdapter(BrokerAdapter):
 
     def get_price(self, symbol: str):
 
+        cached = self.market_data_cache.last_price(
+            symbol, max_age=STREAM_MAX_AGE_SECONDS
+        )
+
+        if cached is not None:
+            return cached
+
+        price = self._fetch_price(symbol)
+
+        if price is not None:
+            self.market_data_cache.on_price(symbol, price)
+
+        return price
+
+    def _fetch_price(self, symbol: str):
+
         try:
 
             trade_req = StockLatestTradeRequest(symbol_or_symbols=symbol)
@@ -100,42 +134,80 @@ class AlpacaPaperBrokerAdapter(BrokerAdapter):
     # --------------------------------------------------
 
     def _get_previous_close(self, symbol):
+        return self.previous_close_cache.get(symbol)
+
+    def warm_previous_closes(self, symbols=None):
+        """
+        Bulk-load previous closes for the session.
+        Defaults to the registered watchlist.
+        """
+        return self.previous_close_cache.warm(symbols)
+
+    def _fetch_previous_closes(self, symbols):
+        """
+        Bulk fetcher used by the previous-close cache.
+        One bars request for all symbols, one snapshot
+        request for any symbol the bars did not cover.
 
-        prev_close = None
+        The previous close is the last daily bar dated before
+        the cache's current trading session (the day that is
+        open or next to open), i.e. the most recent completed
+        session, pre-market included.
+        """
+
+        closes = {}
+        session = self.previous_close_cache.current_session()
+
+        def before_session(bar):
+            return bar is not None and bar_session_date(bar.timestamp) < session
 
         # Attempt daily bars first
         try:
 
             bars_request = StockBarsRequest(
-                symbol_or_symbols=symbol,
+                symbol_or_symbols=list(symbols),
                 timeframe=TimeFrame.Day,
-                limit=2
+                start=datetime.now(UTC) - timedelta(days=self.PREVIOUS_CLOSE_LOOKBACK_DAYS),
             )
 
             bars = self.data_client.get_stock_bars(bars_request)
 
-            bar_list = bars.data.get(symbol)
+            for symbol in symbols:
+
+                prior = [b for b in bars.data.get(symbol) or [] if before_session(b)]
 
-            if bar_list and len(bar_list) >= 2:
-                prev_close = bar_list[-2].close
+                if prior:
+                    closes[symbol] = prior[-1].close
 
         except Exception:
             pass
 
         # Snapshot fallback (CORRECT FIELD)
-        if prev_close is None:
+        missing = [s for s in symbols if s not in closes]
+
+        if missing:
 
             try:
 
-                snap_req = StockSnapshotRequest(symbol_or_symbols=symbol)
-                snap = self.data_client.get_stock_snapshot(snap_req)
+                snap_req = StockSnapshotRequest(symbol_or_symbols=missing)
+                snaps = self.data_client.get_stock_snapshot(snap_req)
+
+                for symbol in missing:
+
+                    snap = snaps.get(symbol)
 
-                prev_close = snap[symbol].previous_daily_bar.close
+                    if not snap:
+                        continue
+
+                    for bar in (snap.daily_bar, snap.previous_daily_bar):
+                        if before_session(bar):
+                            closes[symbol] = bar.close
+                            break
 
             except Exception:
                 pass
 
-        return prev_close
+        return closes
 
     # --------------------------------------------------
     # API COMPATIBILITY
@@ -144,13 +216,14 @@ class AlpacaPaperBrokerAdapter(BrokerAdapter):
     def get_batch_data(self, symbols, context=None):
 
         prices = self.get_prices(symbols)
+        prev_closes = self.previous_close_cache.get_many(symbols)
 
         results = {}
 
         for symbol in symbols:
 
             price = prices.get(symbol)
-            prev_close = self._get_previous_close(symbol)
+            prev_close = prev_closes.get(symbol.upper())
 
             if price and prev_close:
 
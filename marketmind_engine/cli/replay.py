@@ -14,7 +14,7 @@ import pytz
 
 from marketmind_engine.adapters.liquidity_adapter import LiquidityAdapter
 from marketmind_engine.decision.decision_engine import DecisionEngine
-from marketmind_engine.observers.ignition import FileIgnitionObserver
+from marketmind_engine.observers.ignition import BufferedIgnitionObserver
 from marketmind_engine.replay.stub_generator import (
     generate_flat_open,
     generate_ignition_spike,
@@ -47,7 +47,7 @@ def main() -> None:
     )
 
     # ---- Engine + adapters ----
-    observer = FileIgnitionObserver("ignition_replay.jsonl")
+    observer = BufferedIgnitionObserver("ignition_replay.jsonl")
     liquidity_adapter = LiquidityAdapter(
         window_size=window_size,
         observer=observer,
@@ -63,12 +63,18 @@ def main() -> None:
         window_size=window_size,
     )
 
+    observer.close()
+
     # ---- Summary ----
     print("Replay complete.")
     print(f"Bars processed: {len(result.decisions)}")
     print(f"Decisions: {set(result.decisions)}")
     print("Ignition observations written to ignition_replay.jsonl")
 
+    stats = observer.stats()
+    if stats["dropped"] or stats["errors"]:
+        print(f"Ignition observer dropped={stats['dropped']} errors={stats['errors']}")
+
 
 if __name__ == "__main__":
     main()
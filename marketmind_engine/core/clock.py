@@ -40,6 +40,16 @@ class EngineClock:
             "frozen": False,
         }
 
+    def peek(self) -> datetime:
+        """
+        Current engine time without advancing the tick
+        (for timestamps that are not engine events).
+        """
+        if self._frozen:
+            return self._frozen_time
+
+        return datetime.now(timezone.utc)
+
     # -------------------------
     # Freeze controls
     # -------------------------
@@ -0,0 +1,386 @@
+"""
+Asset Universe Sync
+-------------------
+Bulk, incremental sync of the Alpaca assets endpoint into
+asset_universe.db.
+
+Each sync:
+1. Stages the filtered asset rows in a temp table (executemany)
+2. Diffs staged vs stored rows (added / removed / updated)
+3. Merges only the differences, in one transaction
+4. Appends the symbol changes to asset_changes
+5. Bumps the universe version if anything changed
+
+Consumers (SymbolUniverse) compare the stored version with
+the one they loaded and reload only when it moved. After a
+successful sync, sync_assets() also compiles the universe
+snapshot next to the DB and refreshes the shared universe in
+this process (write_snapshot=False skips both).
+
+The database runs in WAL mode so readers are never blocked
+by a sync in progress.
+
+A sync that would remove more than max_removed_fraction of the
+stored symbols (an empty or truncated endpoint response) is
+refused with UnsafeSyncError and nothing is written; pass
+force=True to apply a genuine mass delisting. Up to
+REMOVAL_ALLOWANCE removals are always accepted so small
+universes can still delist normally.
+
+Configuration via environment:
+
+    MARKETMIND_UNIVERSE_MAX_REMOVED   max fraction removed per sync
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import os
+import sqlite3
+
+
+MAX_REMOVED_FRACTION = float(os.getenv("MARKETMIND_UNIVERSE_MAX_REMOVED", "0.1"))
+REMOVAL_ALLOWANCE = 25
+
+
+ASSET_COLUMNS = (
+    "symbol",
+    "name",
+    "asset_class",
+    "exchange",
+    "status",
+    "tradable",
+    "marginable",
+    "shortable",
+    "easy_to_borrow",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    symbol TEXT PRIMARY KEY,
+    name TEXT,
+    asset_class TEXT,
+    exchange TEXT,
+    status TEXT,
+    tradable BOOLEAN,
+    marginable BOOLEAN,
+    shortable BOOLEAN,
+    easy_to_borrow BOOLEAN
+);
+
+CREATE INDEX IF NOT EXISTS idx_assets_exchange ON assets (exchange);
+CREATE INDEX IF NOT EXISTS idx_assets_shortable ON assets (shortable);
+CREATE INDEX IF NOT EXISTS idx_assets_marginable ON assets (marginable);
+
+CREATE TABLE IF NOT EXISTS asset_changes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    version INTEGER NOT NULL,
+    synced_at TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    change TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_asset_changes_version ON asset_changes (version);
+
+CREATE TABLE IF NOT EXISTS universe_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class UnsafeSyncError(RuntimeError):
+    """Sync would remove too much of the stored universe."""
+
+
+@dataclass
+class SyncResult:
+    version: int
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed or self.updated)
+
+
+# ==================================================
+# SOURCE
+# ==================================================
+
+def fetch_assets(client) -> List[Dict[str, Any]]:
+    """
+    Pull raw asset dicts from the assets endpoint.
+    Raw JSON request bypasses strict Asset model validation.
+    """
+    return client.get("/assets")
+
+
+def tradable_rows(assets: Iterable[Dict[str, Any]]) -> List[Tuple]:
+    """
+    Filter tradable, active US equities into DB rows.
+    """
+
+    rows = []
+
+    for a in assets:
+
+        if not (
+            a.get("tradable")
+            and a.get("status") == "active"
+            and a.get("class") == "us_equity"
+            and a.get("symbol")
+        ):
+            continue
+
+        rows.append((
+            a.get("symbol"),
+            a.get("name"),
+            a.get("class"),
+            a.get("exchange"),
+            a.get("status"),
+            int(a.get("tradable", False)),
+            int(a.get("marginable", False)),
+            int(a.get("shortable", False)),
+            int(a.get("easy_to_borrow", False)),
+        ))
+
+    return rows
+
+
+# ==================================================
+# DATABASE
+# ==================================================
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def read_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute(
+        "SELECT value FROM universe_meta WHERE key = 'version'"
+    ).fetchone()
+    return int(row[0]) if row else 0
+
+
+def get_universe_version(db_path: Path) -> Optional[int]:
+    """
+    Cheap read-only version probe for consumers.
+    Returns None if the DB or its metadata is missing.
+    """
+
+    db_path = Path(db_path)
+
+    if not db_path.exists():
+        return None
+
+    try:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            return read_version(conn)
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+
+
+def changes_since(conn: sqlite3.Connection, version: int) -> List[Tuple[int, str, str]]:
+    """
+    (version, symbol, change) rows recorded after version.
+    """
+    return conn.execute(
+        "SELECT version, symbol, change FROM asset_changes "
+        "WHERE version > ? ORDER BY id",
+        (version,),
+    ).fetchall()
+
+
+# ==================================================
+# SYNC
+# ==================================================
+
+def sync_rows(
+    conn: sqlite3.Connection,
+    rows: Sequence[Tuple],
+    now: Optional[datetime] = None,
+    max_removed_fraction: float = MAX_REMOVED_FRACTION,
+    force: bool = False,
+) -> SyncResult:
+    """
+    Diff/merge rows into assets in a single transaction.
+
+    Raises UnsafeSyncError (transaction rolled back) when rows
+    is empty or would remove more than max_removed_fraction of
+    the stored symbols, unless force is set.
+    """
+
+    synced_at = (now or datetime.now(timezone.utc)).isoformat()
+    cols = ", ".join(ASSET_COLUMNS)
+    marks = ", ".join("?" for _ in ASSET_COLUMNS)
+
+    # Columns compared for "updated" (NULL-safe)
+    differs = " OR ".join(
+        f"s.{c} IS NOT a.{c}" for c in ASSET_COLUMNS if c != "symbol"
+    )
+
+    with conn:
+        conn.execute("DROP TABLE IF EXISTS temp.staged_assets")
+        conn.execute(
+            f"CREATE TEMP TABLE staged_assets ({cols}, PRIMARY KEY (symbol))"
+        )
+        conn.executemany(
+            f"INSERT OR REPLACE INTO staged_assets VALUES ({marks})",
+            rows,
+        )
+
+        added = [r[0] for r in conn.execute(
+            "SELECT s.symbol FROM staged_assets s "
+            "LEFT JOIN assets a ON a.symbol = s.symbol "
+            "WHERE a.symbol IS NULL ORDER BY s.symbol"
+        )]
+
+        removed = [r[0] for r in conn.execute(
+            "SELECT a.symbol FROM assets a "
+            "LEFT JOIN staged_assets s ON s.symbol = a.symbol "
+            "WHERE s.symbol IS NULL ORDER BY a.symbol"
+        )]
+
+        updated = [r[0] for r in conn.execute(
+            f"SELECT s.symbol FROM staged_assets s "
+            f"JOIN assets a ON a.symbol = s.symbol "
+            f"WHERE {differs} ORDER BY s.symbol"
+        )]
+
+        staged_count = conn.execute("SELECT COUNT(*) FROM staged_assets").fetchone()[0]
+        stored_count = conn.execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+
+        if stored_count and not force:
+
+            if staged_count == 0:
+                raise UnsafeSyncError(
+                    f"Refusing to sync an empty asset list over {stored_count} stored symbols"
+                )
+
+            limit = max(max_removed_fraction * stored_count, REMOVAL_ALLOWANCE)
+
+            if len(removed) > limit:
+                raise UnsafeSyncError(
+                    f"Refusing to remove {len(removed)} of {stored_count} symbols "
+                    f"(limit {max_removed_fraction:.0%})"
+                )
+
+        version = read_version(conn)
+
+        if added or removed or updated:
+
+            version += 1
+
+            conn.execute(
+                "DELETE FROM assets WHERE symbol NOT IN "
+                "(SELECT symbol FROM staged_assets)"
+            )
+
+            conn.execute("CREATE TEMP TABLE changed_symbols (symbol TEXT PRIMARY KEY)")
+            conn.executemany(
+                "INSERT INTO changed_symbols VALUES (?)",
+                [(sym,) for sym in added + updated],
+            )
+            conn.execute(
+                f"INSERT OR REPLACE INTO assets ({cols}) "
+                f"SELECT {cols} FROM staged_assets "
+                f"WHERE symbol IN (SELECT symbol FROM changed_symbols)"
+            )
+            conn.execute("DROP TABLE temp.changed_symbols")
+
+            log = (
+                [(version, synced_at, s, "added") for s in added]
+                + [(version, synced_at, s, "removed") for s in removed]
+                + [(version, synced_at, s, "updated") for s in updated]
+            )
+
+            conn.executemany(
+                "INSERT INTO asset_changes (version, synced_at, symbol, change) "
+                "VALUES (?, ?, ?, ?)",
+                log,
+            )
+
+        conn.executemany(
+            "INSERT OR REPLACE INTO universe_meta (key, value) VALUES (?, ?)",
+            [("version", str(version)), ("last_sync", synced_at)],
+        )
+
+        conn.execute("DROP TABLE temp.staged_assets")
+
+    return SyncResult(
+        version=version,
+        added=added,
+        removed=removed,
+        updated=updated,
+        unchanged=staged_count - len(added) - len(updated),
+    )
+
+
+def sync_assets(
+    db_path: Path,
+    assets: Iterable[Dict[str, Any]],
+    now: Optional[datetime] = None,
+    force: bool = False,
+    write_snapshot: bool = True,
+) -> SyncResult:
+    """
+    Sync raw asset dicts into the DB at db_path, then publish
+    the result (compiled snapshot + shared universe refresh).
+    """
+
+    conn = connect(Path(db_path))
+
+    try:
+        result = sync_rows(conn, tradable_rows(assets), now=now, force=force)
+    finally:
+        conn.close()
+
+    if write_snapshot:
+        _publish(Path(db_path))
+
+    return result
+
+
+def _publish(db_path: Path) -> None:
+    """
+    The sync is committed; a failure here only leaves the
+    snapshot stale (load() then reads the DB).
+    """
+
+    # Deferred: symbol_universe imports this module
+    from marketmind_engine.intelligence.symbol_universe import on_universe_synced
+
+    try:
+        on_universe_synced(db_path)
+    except Exception as e:
+        print(f"[UNIVERSE SYNC] Snapshot compile failed: {e}")
+
+
+def sync_from_client(
+    db_path: Path,
+    client,
+    now: Optional[datetime] = None,
+    force: bool = False,
+    write_snapshot: bool = True,
+) -> SyncResult:
+    """
+    Fetch from the assets endpoint and sync.
+    """
+    return sync_assets(
+        db_path,
+        fetch_assets(client),
+        now=now,
+        force=force,
+        write_snapshot=write_snapshot,
+    )
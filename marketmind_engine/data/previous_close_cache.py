@@ -0,0 +1,274 @@
+"""
+Session-Scoped Previous Close Cache
+-----------------------------------
+The previous close of a symbol does not change within a
+trading day, yet the propagation snapshot and the engine
+loop ask for it every few seconds.
+
+This cache stores one value per (symbol, trading session).
+A session is the trading day that is open or next to open
+(see trading_session): it rolls at ET midnight, and weekends
+belong to Monday, so a pre-market warm-up already holds the
+most recent completed close. All entries expire together when
+the session rolls over, and the registered watchlist is
+bulk-warmed on the first access of each new session.
+
+Symbols the fetcher returns nothing for are negative-cached
+for negative_ttl seconds so unknown tickers are not
+re-requested on every call.
+
+Fetching is delegated to a bulk fetcher callable:
+
+    fetcher(symbols: List[str]) -> Dict[str, float]
+
+so the cache itself performs NO network I/O and can be
+shared by every provider consumer.
+"""
+
+from datetime import date, datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+import threading
+
+from marketmind_engine.utils.market_time import trading_session
+
+
+BulkCloseFetcher = Callable[[List[str]], Dict[str, float]]
+
+
+def session_watchlist() -> List[str]:
+    """
+    Default warm set: structural ETFs plus every symbol
+    in the ripple domain registry.
+    """
+
+    # Imported lazily to keep the data layer free of
+    # intelligence-layer imports at module load.
+    from marketmind_engine.intelligence.propagation_engine import STRUCTURAL_SYMBOLS
+    from marketmind_engine.ripple.domain_registry import DOMAIN_REGISTRY
+
+    symbols = list(STRUCTURAL_SYMBOLS)
+
+    for layers in DOMAIN_REGISTRY.values():
+        for layer_symbols in layers.values():
+            symbols.extend(layer_symbols)
+
+    return list(dict.fromkeys(s.upper() for s in symbols))
+
+
+class PreviousCloseCache:
+    """
+    Previous-close cache keyed by (symbol, trading session).
+
+    Thread-safe. Fetches happen outside the lock so a slow
+    provider never blocks readers of already-cached symbols.
+    """
+
+    def __init__(
+        self,
+        fetcher: Optional[BulkCloseFetcher] = None,
+        now_fn: Optional[Callable[[], datetime]] = None,
+        negative_ttl: float = 600.0,
+    ):
+        self._fetcher = fetcher
+        self._now_fn = now_fn or (lambda: datetime.now(timezone.utc))
+        self.negative_ttl = negative_ttl
+
+        self._lock = threading.Lock()
+        self._session: Optional[date] = None
+        self._closes: Dict[str, float] = {}
+        self._unknown: Dict[str, float] = {}     # symbol -> retry after (epoch)
+        self._watchlist: List[str] = []
+
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+
+    # --------------------------------------------------
+    # Configuration
+    # --------------------------------------------------
+
+    def set_fetcher(self, fetcher: BulkCloseFetcher) -> None:
+        self._fetcher = fetcher
+
+    def register_watchlist(self, symbols: Iterable[str]) -> None:
+        """
+        Add symbols to the set warmed at each session open.
+        """
+        with self._lock:
+            merged = self._watchlist + [s.upper() for s in symbols if s]
+            self._watchlist = list(dict.fromkeys(merged))
+
+    # --------------------------------------------------
+    # Session
+    # --------------------------------------------------
+
+    def current_session(self) -> date:
+        return trading_session(self._now_fn())
+
+    def _is_unknown(self, symbol: str, now: float) -> bool:
+        retry_after = self._unknown.get(symbol)
+        return retry_after is not None and now < retry_after
+
+    def _roll_session(self) -> bool:
+        """
+        Expire all entries if the session changed.
+        Caller must hold the lock.
+        Returns True if a rollover happened.
+        """
+        session = self.current_session()
+
+        if session == self._session:
+            return False
+
+        self._session = session
+        self._closes = {}
+        self._unknown = {}
+        return True
+
+    # --------------------------------------------------
+    # Reads
+    # --------------------------------------------------
+
+    def get(
+        self,
+        symbol: str,
+        fetcher: Optional[BulkCloseFetcher] = None,
+    ) -> Optional[float]:
+        return self.get_many([symbol], fetcher=fetcher).get(symbol.upper())
+
+    def get_many(
+        self,
+        symbols: Iterable[str],
+        fetcher: Optional[BulkCloseFetcher] = None,
+    ) -> Dict[str, Optional[float]]:
+        """
+        Return previous closes for symbols, fetching only
+        the ones not yet cached for the current session.
+        """
+
+        wanted = [s.upper() for s in symbols if s]
+        now = self._now_fn().timestamp()
+
+        with self._lock:
+            rolled = self._roll_session()
+            session = self._session
+
+            missing = [
+                s for s in wanted
+                if s not in self._closes and not self._is_unknown(s, now)
+            ]
+            self.hits += len(wanted) - len(missing)
+            self.misses += len(missing)
+
+            if rolled:
+                # Bulk-warm the watchlist together with the
+                # first request of the new session.
+                missing = list(dict.fromkeys(missing + self._watchlist))
+
+        if missing:
+            self._fetch(missing, session, fetcher)
+
+        with self._lock:
+            return {s: self._closes.get(s) for s in wanted}
+
+    # --------------------------------------------------
+    # Warming
+    # --------------------------------------------------
+
+    def warm(
+        self,
+        symbols: Optional[Iterable[str]] = None,
+        fetcher: Optional[BulkCloseFetcher] = None,
+    ) -> int:
+        """
+        Bulk-fetch closes for symbols (default: registered
+        watchlist) that are not cached yet.
+        Returns the number of symbols now cached.
+        """
+
+        now = self._now_fn().timestamp()
+
+        with self._lock:
+            self._roll_session()
+            session = self._session
+
+            if symbols is None:
+                candidates = list(self._watchlist)
+            else:
+                candidates = [s.upper() for s in symbols if s]
+
+            missing = [
+                s for s in candidates
+                if s not in self._closes and not self._is_unknown(s, now)
+            ]
+
+        if missing:
+            self._fetch(missing, session, fetcher)
+
+        with self._lock:
+            return len(self._closes)
+
+    def _fetch(
+        self,
+        symbols: List[str],
+        session: Optional[date],
+        fetcher: Optional[BulkCloseFetcher],
+    ) -> None:
+
+        fetcher = fetcher or self._fetcher
+
+        if fetcher is None:
+            return
+
+        try:
+            closes = fetcher(symbols) or {}
+        except Exception:
+            return
+
+        with self._lock:
+            self.fetches += 1
+
+            # Discard results that straddled a rollover
+            if session != self._session:
+                return
+
+            for symbol, close in closes.items():
+                if close is None:
+                    continue
+                self._closes[symbol.upper()] = float(close)
+                self._unknown.pop(symbol.upper(), None)
+
+            # Successful fetch without a close: remember, retry later
+            retry_after = self._now_fn().timestamp() + self.negative_ttl
+            for symbol in symbols:
+                if symbol not in self._closes:
+                    self._unknown[symbol] = retry_after
+
+    # --------------------------------------------------
+    # Maintenance
+    # --------------------------------------------------
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._session = None
+            self._closes = {}
+            self._unknown = {}
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "session": self._session.isoformat() if self._session else None,
+                "entries": len(self._closes),
+                "unknown": len(self._unknown),
+                "watchlist": len(self._watchlist),
+                "hits": self.hits,
+                "misses": self.misses,
+                "fetches": self.fetches,
+            }
+
+
+# ==================================================
+# SHARED INSTANCE (all provider consumers)
+# ==================================================
+
+PREVIOUS_CLOSE_CACHE = PreviousCloseCache()
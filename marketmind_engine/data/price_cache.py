@@ -0,0 +1,231 @@
+"""
+Shared Price Cache
+------------------
+One bounded, thread-safe cache for last prices.
+
+Every price source (streamed trades and bars, REST latest
+trade/quote lookups) writes here, and every price consumer
+reads here, so a rotating RSS-driven universe cannot grow
+memory without bound.
+
+Eviction:
+- TTL: entries older than `ttl` seconds are dropped on access
+- LRU: once `max_entries` is reached, the least recently
+  used entry is evicted on insert
+
+Per-read freshness is separate from the TTL: get(max_age=...)
+returns None for an entry that is too old for the caller but
+keeps it, so a slower consumer can still fall back to it.
+
+Lookup metrics are opt-in: only a cache created with a
+metric_label (PRICE_CACHE: "shared") updates
+marketmind_price_cache_lookups_total, so private caches do not
+skew the shared hit ratio.
+
+Writers may tag entries with a source; pop(key, source=...)
+removes an entry only if that source wrote it last, so one
+writer cannot drop another writer's prices.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+import os
+import threading
+import time
+
+from marketmind_engine.telemetry.metrics import PRICE_CACHE_LOOKUPS
+
+
+class PriceCache:
+    """
+    TTL + LRU cache with a hard entry cap and counters.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = 300.0,
+        max_entries: int = 5000,
+        now_fn: Optional[Callable[[], float]] = None,
+        metric_label: Optional[str] = None,
+    ):
+        if max_entries <= 0:
+            raise ValueError("PriceCache.max_entries must be > 0")
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._now_fn = now_fn or time.time
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, Optional[str]]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        if metric_label is not None:
+            self._hit_metric = PRICE_CACHE_LOOKUPS.labels(cache=metric_label, result="hit")
+            self._miss_metric = PRICE_CACHE_LOOKUPS.labels(cache=metric_label, result="miss")
+        else:
+            self._hit_metric = self._miss_metric = None
+
+    # --------------------------------------------------
+    # Reads
+    # --------------------------------------------------
+
+    def get(self, key: Hashable, max_age: Optional[float] = None) -> Any:
+        """
+        Return the cached value, or None on miss, TTL expiry,
+        or if older than max_age.
+        """
+        return self._lookup(key, max_age)[1]
+
+    def get_entry(
+        self,
+        key: Hashable,
+        max_age: Optional[float] = None,
+    ) -> Tuple[Optional[float], Any]:
+        """
+        Return (stored_at, value), or (None, None) on miss.
+        """
+        return self._lookup(key, max_age)
+
+    def get_many(
+        self,
+        keys: Iterable[Hashable],
+        max_age: Optional[float] = None,
+    ) -> Dict[Hashable, Any]:
+        return {k: self.get(k, max_age=max_age) for k in keys}
+
+    def _lookup(self, key: Hashable, max_age: Optional[float]):
+
+        now = self._now_fn()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                self._count(self._miss_metric)
+                return None, None
+
+            stored_at, value, _ = entry
+            age = now - stored_at
+
+            if self.ttl is not None and age > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                self._count(self._miss_metric)
+                return None, None
+
+            if max_age is not None and age > max_age:
+                self.misses += 1
+                self._count(self._miss_metric)
+                return None, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self._count(self._hit_metric)
+            return stored_at, value
+
+    @staticmethod
+    def _count(metric) -> None:
+        if metric is not None:
+            metric.inc()
+
+    # --------------------------------------------------
+    # Writes
+    # --------------------------------------------------
+
+    def put(self, key: Hashable, value: Any, source: Optional[str] = None) -> None:
+
+        now = self._now_fn()
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+            self._entries[key] = (now, value, source)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, source: Optional[str] = None) -> Any:
+        """
+        Remove and return the value. With a source, only an entry
+        last written by that source is removed.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or (source is not None and entry[2] != source):
+                return None
+
+            del self._entries[key]
+
+        return entry[1]
+
+    def purge_expired(self) -> int:
+        """
+        Drop every TTL-expired entry. Returns count dropped.
+        """
+
+        if self.ttl is None:
+            return 0
+
+        cutoff = self._now_fn() - self.ttl
+
+        with self._lock:
+            expired = [k for k, (ts, _, _) in self._entries.items() if ts < cutoff]
+
+            for k in expired:
+                del self._entries[k]
+
+            self.expirations += len(expired)
+
+        return len(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # --------------------------------------------------
+    # Introspection
+    # --------------------------------------------------
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def keys(self):
+        with self._lock:
+            return list(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+# ==================================================
+# SHARED INSTANCE (all price sources and consumers)
+# ==================================================
+
+PRICE_CACHE = PriceCache(
+    ttl=float(os.getenv("MARKETMIND_PRICE_CACHE_TTL", "300")),
+    max_entries=int(os.getenv("MARKETMIND_PRICE_CACHE_MAX", "5000")),
+    metric_label="shared",
+)
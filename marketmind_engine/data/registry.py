@@ -10,11 +10,24 @@ Providers supported:
 Selection is controlled via environment variable:
 
     MARKETMIND_DATA_PROVIDER=alpaca
+
+Streaming price subscriber (optional):
+
+    MARKETMIND_PRICE_STREAM=off | local | alpaca
+
+"local" is the deterministic stand-in feed. It writes synthetic
+prices into a private cache (never the shared PRICE_CACHE) and
+is refused while a real broker adapter is the active provider.
 """
 
 import os
 
 from marketmind_engine.data.stub import StubDataProvider
+from marketmind_engine.data.streaming import (
+    MARKET_DATA_CACHE,
+    LocalStandInStream,
+    MarketDataCache,
+)
 
 
 # ---------------------------------------------------------
@@ -66,3 +79,55 @@ def get_provider_name():
     Returns name of the active provider.
     """
     return _ACTIVE_PROVIDER.__class__.__name__
+
+
+# ---------------------------------------------------------
+# Streaming Subscriber
+# ---------------------------------------------------------
+
+_STREAM_NAME = os.getenv("MARKETMIND_PRICE_STREAM", "off").lower()
+_ACTIVE_STREAM = None
+
+
+def _build_stream():
+
+    if _STREAM_NAME == "local":
+
+        if AlpacaPaperBrokerAdapter is not None and isinstance(
+            _ACTIVE_PROVIDER, AlpacaPaperBrokerAdapter
+        ):
+            print("MARKETMIND_PRICE_STREAM=local refused: broker adapter active")
+            return None
+
+        # Private cache: synthetic prices must never reach order sizing
+        return LocalStandInStream(MarketDataCache())
+
+    if _STREAM_NAME == "alpaca":
+        try:
+            from marketmind_engine.data.streaming import AlpacaMarketDataStream
+            return AlpacaMarketDataStream(MARKET_DATA_CACHE)
+        except Exception:
+            return None
+
+    return None
+
+
+def get_stream():
+    """
+    Returns the active streaming subscriber, or None
+    when streaming is disabled.
+    """
+    global _ACTIVE_STREAM
+
+    if _ACTIVE_STREAM is None:
+        _ACTIVE_STREAM = _build_stream()
+
+    return _ACTIVE_STREAM
+
+
+def set_stream(stream):
+    """
+    Allows runtime stream override.
+    """
+    global _ACTIVE_STREAM
+    _ACTIVE_STREAM = stream
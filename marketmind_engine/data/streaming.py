@@ -0,0 +1,468 @@
+"""
+Streaming Market Data
+---------------------
+Push-based price access for the engine.
+
+A stream subscriber pushes trades and bars into a shared
+in-memory MarketDataCache. Price consumers read the cache
+instead of issuing a request per tick, and only fall back
+to REST polling when the cache has nothing fresh.
+
+Components:
+- MarketDataCache            last price + rolling bars per symbol
+- StreamingMarketDataProvider  subscriber contract
+- LocalStandInStream         deterministic stand-in feed (tests, replay);
+                             never driven by the live engine loop
+- AlpacaMarketDataStream     live Alpaca websocket subscriber
+- WatchlistSubscriptionManager  keeps subscriptions on the watchlist
+"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set
+import os
+import threading
+import time
+
+from marketmind_engine.data.price_cache import PRICE_CACHE, PriceCache
+
+
+# ==================================================
+# EVENTS
+# ==================================================
+
+@dataclass(frozen=True)
+class StreamTrade:
+    symbol: str
+    price: float
+    size: float
+    timestamp: float       # epoch seconds
+
+
+@dataclass(frozen=True)
+class StreamBar:
+    """
+    Completed bar pushed by a stream.
+    Timestamp is the bar start time (epoch seconds), as in
+    Alpaca bar messages.
+    """
+
+    symbol: str
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    timestamp: float
+
+
+# ==================================================
+# CACHE
+# ==================================================
+
+class MarketDataCache:
+    """
+    Last-price and rolling-bar cache.
+
+    Writers are stream handlers, readers are price consumers.
+    Last prices live in a bounded PriceCache (the shared
+    PRICE_CACHE for the module-level instance); bars are kept
+    per subscribed symbol and dropped on unsubscribe.
+
+    Streamed prices are tagged STREAM_SOURCE, polled ones
+    REST_SOURCE; drop() only removes streamed prices, so REST
+    lookups stored in a shared cache survive an unsubscribe.
+    """
+
+    STREAM_SOURCE = "stream"
+    REST_SOURCE = "rest"
+
+    def __init__(
+        self,
+        max_bars: int = 120,
+        now_fn: Optional[Callable[[], float]] = None,
+        price_cache: Optional[PriceCache] = None,
+    ):
+        self.max_bars = max_bars
+        # An empty PriceCache is falsy; test for None explicitly
+        self.prices = price_cache if price_cache is not None else PriceCache(now_fn=now_fn)
+
+        self._lock = threading.Lock()
+        self._bars: Dict[str, Deque[StreamBar]] = {}
+
+    # --------------------------------------------------
+    # Writers
+    # --------------------------------------------------
+
+    def on_trade(self, trade: StreamTrade) -> None:
+        self.prices.put(trade.symbol.upper(), float(trade.price), source=self.STREAM_SOURCE)
+
+    def on_price(self, symbol: str, price: float) -> None:
+        """
+        Record a polled (REST) price observation.
+        """
+        self.prices.put(symbol.upper(), float(price), source=self.REST_SOURCE)
+
+    def on_bar(self, bar: StreamBar) -> None:
+        symbol = bar.symbol.upper()
+
+        with self._lock:
+            window = self._bars.get(symbol)
+
+            if window is None:
+                window = deque(maxlen=self.max_bars)
+                self._bars[symbol] = window
+
+            window.append(bar)
+
+        # A completed bar is also a price observation
+        self.prices.put(symbol, float(bar.close), source=self.STREAM_SOURCE)
+
+    def drop(self, symbols: Iterable[str]) -> None:
+        symbols = [s.upper() for s in symbols]
+
+        with self._lock:
+            for s in symbols:
+                self._bars.pop(s, None)
+
+        for s in symbols:
+            self.prices.pop(s, source=self.STREAM_SOURCE)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bars = {}
+
+        self.prices.clear()
+
+    # --------------------------------------------------
+    # Readers
+    # --------------------------------------------------
+
+    def last_price(
+        self,
+        symbol: str,
+        max_age: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Latest price, or None if absent or older than
+        max_age seconds.
+        """
+        return self.prices.get(symbol.upper(), max_age=max_age)
+
+    def last_prices(
+        self,
+        symbols: Iterable[str],
+        max_age: Optional[float] = None,
+    ) -> Dict[str, Optional[float]]:
+        return {s: self.last_price(s, max_age=max_age) for s in symbols}
+
+    def bars(self, symbol: str, count: Optional[int] = None) -> List[StreamBar]:
+        with self._lock:
+            window = self._bars.get(symbol.upper())
+            bars = list(window) if window else []
+
+        if count is not None:
+            return bars[-count:]
+
+        return bars
+
+    def symbols(self) -> Set[str]:
+        return set(self.prices.keys())
+
+
+# ==================================================
+# SUBSCRIBER CONTRACT
+# ==================================================
+
+class StreamingMarketDataProvider(ABC):
+    """
+    Contract for push-based market data subscribers.
+
+    Implementations push every trade and bar they receive
+    into the MarketDataCache passed at construction.
+    """
+
+    name: str = "stream"
+
+    def __init__(self, cache: "MarketDataCache"):
+        self.cache = cache
+        self._subscriptions: Set[str] = set()
+
+    @property
+    def subscriptions(self) -> Set[str]:
+        return set(self._subscriptions)
+
+    def subscribe(self, symbols: Iterable[str]) -> None:
+        new = {s.upper() for s in symbols if s} - self._subscriptions
+
+        if new:
+            self._subscriptions |= new
+            self._on_subscribe(sorted(new))
+
+    def unsubscribe(self, symbols: Iterable[str]) -> None:
+        gone = {s.upper() for s in symbols if s} & self._subscriptions
+
+        if gone:
+            self._subscriptions -= gone
+            self._on_unsubscribe(sorted(gone))
+            self.cache.drop(gone)
+
+    @abstractmethod
+    def _on_subscribe(self, symbols: List[str]) -> None:
+        pass
+
+    @abstractmethod
+    def _on_unsubscribe(self, symbols: List[str]) -> None:
+        pass
+
+    @abstractmethod
+    def start(self) -> None:
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        pass
+
+
+# ==================================================
+# LOCAL STAND-IN STREAM
+# ==================================================
+
+class LocalStandInStream(StreamingMarketDataProvider):
+    """
+    Deterministic stand-in feed.
+
+    No threads, no network. Each step() pushes one trade per
+    subscribed symbol; every bar_every steps it also pushes a
+    completed bar built from those trades.
+
+    Price path per symbol:
+        scripted prices if given (last value repeats),
+        otherwise base_price + step * drift.
+
+    Timestamps are epoch seconds: start_ts (construction time
+    by default) + step * tick_seconds.
+
+    Prices are synthetic: give it its own MarketDataCache, never
+    the shared one that order sizing reads.
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        cache: MarketDataCache,
+        scripted: Optional[Dict[str, List[float]]] = None,
+        base_price: float = 100.0,
+        drift: float = 0.01,
+        bar_every: int = 60,
+        start_ts: Optional[float] = None,
+        tick_seconds: float = 1.0,
+    ):
+        super().__init__(cache)
+        self.scripted = {k.upper(): list(v) for k, v in (scripted or {}).items()}
+        self.base_price = base_price
+        self.drift = drift
+        self.bar_every = bar_every
+        self.start_ts = time.time() if start_ts is None else float(start_ts)
+        self.tick_seconds = tick_seconds
+
+        self._step = 0
+        self._pending: Dict[str, List[float]] = {}
+        self._bar_start: Dict[str, float] = {}
+        self._running = False
+
+    def _on_subscribe(self, symbols: List[str]) -> None:
+        for s in symbols:
+            self._pending.setdefault(s, [])
+
+    def _on_unsubscribe(self, symbols: List[str]) -> None:
+        for s in symbols:
+            self._pending.pop(s, None)
+            self._bar_start.pop(s, None)
+
+    def start(self) -> None:
+        self._running = True
+
+    def stop(self) -> None:
+        self._running = False
+
+    def price_at(self, symbol: str, step: int) -> float:
+        path = self.scripted.get(symbol)
+
+        if path:
+            return float(path[min(step, len(path) - 1)])
+
+        return round(self.base_price + step * self.drift, 6)
+
+    def timestamp_at(self, step: int) -> float:
+        return self.start_ts + step * self.tick_seconds
+
+    def step(self) -> int:
+        """
+        Push one tick for every subscription.
+        Returns the number of events pushed.
+        """
+
+        pushed = 0
+        ts = self.timestamp_at(self._step)
+
+        for symbol in sorted(self._subscriptions):
+            price = self.price_at(symbol, self._step)
+
+            self.cache.on_trade(StreamTrade(symbol, price, 1.0, ts))
+
+            if not self._pending[symbol]:
+                self._bar_start[symbol] = ts
+            self._pending[symbol].append(price)
+            pushed += 1
+
+            if len(self._pending[symbol]) >= self.bar_every:
+                window = self._pending[symbol]
+
+                self.cache.on_bar(StreamBar(
+                    symbol=symbol,
+                    open=window[0],
+                    high=max(window),
+                    low=min(window),
+                    close=window[-1],
+                    volume=float(len(window)),
+                    timestamp=self._bar_start[symbol],
+                ))
+                self._pending[symbol] = []
+                pushed += 1
+
+        self._step += 1
+        return pushed
+
+    def run(self, steps: int) -> int:
+        return sum(self.step() for _ in range(steps))
+
+
+# ==================================================
+# ALPACA LIVE STREAM
+# ==================================================
+
+class AlpacaMarketDataStream(StreamingMarketDataProvider):
+    """
+    Alpaca websocket subscriber (trades + minute bars).
+
+    The SDK stream runs on its own daemon thread; handlers
+    only write into the cache.
+    """
+
+    name = "alpaca"
+
+    def __init__(self, cache: MarketDataCache, feed: str = "iex"):
+        super().__init__(cache)
+
+        from alpaca.data.live import StockDataStream
+        from alpaca.data.enums import DataFeed
+
+        api_key = os.getenv("APCA_API_KEY_ID")
+        secret_key = os.getenv("APCA_API_SECRET_KEY")
+
+        if not api_key or not secret_key:
+            raise RuntimeError("Alpaca API keys not found in environment.")
+
+        self._stream = StockDataStream(api_key, secret_key, feed=DataFeed(feed))
+        self._thread: Optional[threading.Thread] = None
+
+    async def _handle_trade(self, trade) -> None:
+        self.cache.on_trade(StreamTrade(
+            symbol=trade.symbol,
+            price=float(trade.price),
+            size=float(trade.size or 0),
+            timestamp=trade.timestamp.timestamp(),
+        ))
+
+    async def _handle_bar(self, bar) -> None:
+        self.cache.on_bar(StreamBar(
+            symbol=bar.symbol,
+            open=float(bar.open),
+            high=float(bar.high),
+            low=float(bar.low),
+            close=float(bar.close),
+            volume=float(bar.volume),
+            timestamp=bar.timestamp.timestamp(),
+        ))
+
+    def _on_subscribe(self, symbols: List[str]) -> None:
+        self._stream.subscribe_trades(self._handle_trade, *symbols)
+        self._stream.subscribe_bars(self._handle_bar, *symbols)
+
+    def _on_unsubscribe(self, symbols: List[str]) -> None:
+        self._stream.unsubscribe_trades(*symbols)
+        self._stream.unsubscribe_bars(*symbols)
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._thread = threading.Thread(target=self._stream.run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        try:
+            self._stream.stop()
+        except Exception:
+            pass
+
+
+# ==================================================
+# SUBSCRIPTION MANAGEMENT
+# ==================================================
+
+class WatchlistSubscriptionManager:
+    """
+    Keeps stream subscriptions aligned with the watchlist.
+
+    Pinned symbols (e.g. structural ETFs) are always kept.
+    Watchlist symbols beyond max_symbols are ignored in the
+    order given, so callers should pass ranked symbols first.
+    """
+
+    def __init__(
+        self,
+        stream: StreamingMarketDataProvider,
+        pinned: Optional[Iterable[str]] = None,
+        max_symbols: int = 200,
+    ):
+        self.stream = stream
+        self.pinned = [s.upper() for s in (pinned or [])]
+        self.max_symbols = max_symbols
+
+    def target(self, watchlist: Iterable[str]) -> List[str]:
+        ordered = list(dict.fromkeys(self.pinned + [s.upper() for s in watchlist if s]))
+        return ordered[: self.max_symbols]
+
+    def sync(self, watchlist: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Subscribe to new watchlist symbols and drop stale ones.
+        Returns the applied diff.
+        """
+
+        target = set(self.target(watchlist))
+        current = self.stream.subscriptions
+
+        added = sorted(target - current)
+        removed = sorted(current - target)
+
+        if removed:
+            self.stream.unsubscribe(removed)
+
+        if added:
+            self.stream.subscribe(added)
+
+        return {"added": added, "removed": removed}
+
+
+# ==================================================
+# SHARED INSTANCE (all price consumers)
+# ==================================================
+
+MARKET_DATA_CACHE = MarketDataCache(price_cache=PRICE_CACHE)
+
+# Streamed prices older than this fall back to REST polling
+STREAM_MAX_AGE_SECONDS = float(os.getenv("MARKETMIND_STREAM_MAX_AGE", "15"))
@@ -0,0 +1,211 @@
+from datetime import datetime, timezone
+import os
+import sqlite3
+
+import pytest
+
+from marketmind_engine.data.asset_universe_sync import (
+    UnsafeSyncError,
+    changes_since,
+    connect,
+    get_universe_version,
+    sync_from_client,
+)
+from marketmind_engine.intelligence import symbol_universe
+from marketmind_engine.intelligence.symbol_universe import (
+    SymbolUniverse,
+    UniverseRefreshWorker,
+)
+
+
+class LocalAssetsEndpoint:
+    """
+    Stand-in for TradingClient.get("/assets").
+    """
+
+    def __init__(self, assets):
+        self.assets = assets
+        self.calls = 0
+
+    def get(self, path):
+        assert path == "/assets"
+        self.calls += 1
+        return [dict(a) for a in self.assets]
+
+
+def _asset(symbol, exchange="NASDAQ", shortable=True, **overrides):
+    asset = {
+        "symbol": symbol,
+        "name": f"{symbol} Inc",
+        "class": "us_equity",
+        "exchange": exchange,
+        "status": "active",
+        "tradable": True,
+        "marginable": True,
+        "shortable": shortable,
+        "easy_to_borrow": False,
+    }
+    asset.update(overrides)
+    return asset
+
+
+NOW = datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc)
+
+
+def test_initial_sync_filters_and_records_additions(tmp_path):
+    db = tmp_path / "asset_universe.db"
+    endpoint = LocalAssetsEndpoint([
+        _asset("NVDA"),
+        _asset("LMT", exchange="NYSE"),
+        _asset("BTCUSD", **{"class": "crypto"}),
+        _asset("OLD", status="inactive"),
+    ])
+
+    result = sync_from_client(db, endpoint, now=NOW)
+
+    assert result.added == ["LMT", "NVDA"]
+    assert result.version == 1
+    assert get_universe_version(db) == 1
+
+
+def test_resync_without_changes_keeps_version(tmp_path):
+    db = tmp_path / "asset_universe.db"
+    endpoint = LocalAssetsEndpoint([_asset("NVDA"), _asset("LMT")])
+
+    sync_from_client(db, endpoint, now=NOW)
+    result = sync_from_client(db, endpoint, now=NOW)
+
+    assert not result.changed
+    assert result.unchanged == 2
+    assert result.version == 1
+
+
+def test_diff_merge_handles_add_remove_update(tmp_path):
+    db = tmp_path / "asset_universe.db"
+    endpoint = LocalAssetsEndpoint([_asset("NVDA"), _asset("LMT"), _asset("DELISTED")])
+    sync_from_client(db, endpoint, now=NOW)
+
+    endpoint.assets = [_asset("NVDA"), _asset("LMT", shortable=False), _asset("RKLB")]
+    result = sync_from_client(db, endpoint, now=NOW)
+
+    assert result.added == ["RKLB"]
+    assert result.removed == ["DELISTED"]
+    assert result.updated == ["LMT"]
+    assert result.unchanged == 1
+    assert result.version == 2
+
+    conn = connect(db)
+    rows = dict(conn.execute("SELECT symbol, shortable FROM assets").fetchall())
+    log = changes_since(conn, 1)
+    conn.close()
+
+    assert rows == {"NVDA": 1, "LMT": 0, "RKLB": 1}
+    assert sorted(log) == [(2, "DELISTED", "removed"), (2, "LMT", "updated"), (2, "RKLB", "added")]
+
+
+def test_database_uses_wal_and_indexes(tmp_path):
+    db = tmp_path / "asset_universe.db"
+    sync_from_client(db, LocalAssetsEndpoint([_asset("NVDA")]), now=NOW)
+
+    conn = sqlite3.connect(db)
+    mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    indexes = {r[1] for r in conn.execute("PRAGMA index_list('assets')")}
+    conn.close()
+
+    assert mode == "wal"
+    assert {"idx_assets_exchange", "idx_assets_shortable", "idx_assets_marginable"} <= indexes
+
+
+def test_universe_refreshes_only_on_version_change(tmp_path):
+    db = tmp_path / "asset_universe.db"
+    endpoint = LocalAssetsEndpoint([_asset("NVDA")])
+    sync_from_client(db, endpoint, now=NOW)
+
+    universe = SymbolUniverse(db_path=db)
+    assert universe.refresh_if_changed() is False
+
+    endpoint.assets = [_asset("NVDA"), _asset("RKLB")]
+    sync_from_client(db, endpoint, now=NOW)
+
+    assert universe.refresh_if_changed() is True
+    assert universe.is_valid("RKLB")
+    assert universe.info()["version"] == 2
+
+
+def test_empty_or_truncated_sync_is_refused(tmp_path):
+    db = tmp_path / "asset_universe.db"
+    full = [_asset(f"S{i:03d}") for i in range(300)]
+    endpoint = LocalAssetsEndpoint(full)
+    sync_from_client(db, endpoint, now=NOW)
+
+    for truncated in ([], full[:100]):
+        endpoint.assets = truncated
+
+        with pytest.raises(UnsafeSyncError):
+            sync_from_client(db, endpoint, now=NOW)
+
+        assert get_universe_version(db) == 1
+        assert len(SymbolUniverse(db_path=db)) == 300
+
+    result = sync_from_client(db, endpoint, now=NOW, force=True)
+
+    assert len(result.removed) == 200
+    assert result.version == 2
+
+
+def test_stale_snapshot_is_ignored_after_sync(tmp_path):
+    db = tmp_path / "asset_universe.db"
+    endpoint = LocalAssetsEndpoint([_asset("NVDA")])
+    sync_from_client(db, endpoint, now=NOW)
+
+    assert SymbolUniverse(db_path=db).info()["source"].startswith("snapshot:")
+
+    # A sync that does not recompile leaves the old snapshot behind
+    endpoint.assets = [_asset("NVDA"), _asset("RKLB")]
+    sync_from_client(db, endpoint, now=NOW, write_snapshot=False)
+
+    # Make the snapshot look newer than the DB: mtimes must not matter
+    snapshot = db.with_suffix(".snapshot")
+    future = db.stat().st_mtime + 3600
+    os.utime(snapshot, (future, future))
+
+    universe = SymbolUniverse(db_path=db)
+
+    assert universe.info()["source"] == "db:asset_universe.db"
+    assert universe.is_valid("RKLB")
+
+
+def test_sync_compiles_snapshot_and_refreshes_shared_universe(tmp_path, monkeypatch):
+    db = tmp_path / "asset_universe.db"
+    endpoint = LocalAssetsEndpoint([_asset("NVDA")])
+    sync_from_client(db, endpoint, now=NOW)
+
+    shared = SymbolUniverse(db_path=db)
+    monkeypatch.setattr(symbol_universe, "_UNIVERSE", shared)
+
+    endpoint.assets = [_asset("NVDA"), _asset("RKLB")]
+    sync_from_client(db, endpoint, now=NOW)
+
+    assert shared.is_valid("RKLB")
+    assert shared.info()["version"] == 2
+
+    fresh = SymbolUniverse(db_path=db)
+    assert fresh.info()["source"].startswith("snapshot:")
+    assert fresh.snapshot.version == 2
+
+
+def test_refresh_worker_picks_up_sync_from_another_process(tmp_path):
+    db = tmp_path / "asset_universe.db"
+    endpoint = LocalAssetsEndpoint([_asset("NVDA")])
+    sync_from_client(db, endpoint, now=NOW)
+
+    universe = SymbolUniverse(db_path=db)
+    worker = UniverseRefreshWorker(universe)
+
+    assert worker.check() is False
+
+    endpoint.assets = [_asset("NVDA"), _asset("RKLB")]
+    sync_from_client(db, endpoint, now=NOW)
+
+    assert worker.check() is True
+    assert universe.is_valid("RKLB")
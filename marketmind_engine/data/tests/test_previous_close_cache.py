@@ -0,0 +1,181 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from marketmind_engine.broker.alpaca_paper_adapter import AlpacaPaperBrokerAdapter
+from marketmind_engine.data.previous_close_cache import PreviousCloseCache
+
+
+class FakeClock:
+
+    def __init__(self, start):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+class CountingFetcher:
+
+    def __init__(self, closes):
+        self.closes = closes
+        self.calls = []
+
+    def __call__(self, symbols):
+        self.calls.append(list(symbols))
+        return {s: self.closes[s] for s in symbols if s in self.closes}
+
+
+def _market_hours():
+    # 15:00 UTC == 10:00/11:00 ET, well inside one ET calendar day
+    return datetime(2026, 3, 10, 15, 0, tzinfo=timezone.utc)
+
+
+def test_close_fetched_once_per_session():
+    fetcher = CountingFetcher({"SPY": 500.0})
+    cache = PreviousCloseCache(fetcher=fetcher, now_fn=FakeClock(_market_hours()))
+
+    assert cache.get("SPY") == 500.0
+    assert cache.get("spy") == 500.0
+    assert cache.get_many(["SPY"]) == {"SPY": 500.0}
+
+    assert len(fetcher.calls) == 1
+    assert cache.hits == 2
+    assert cache.misses == 1
+
+
+def test_get_many_fetches_only_missing_symbols():
+    fetcher = CountingFetcher({"SPY": 500.0, "QQQ": 400.0, "NVDA": 120.0})
+    cache = PreviousCloseCache(fetcher=fetcher, now_fn=FakeClock(_market_hours()))
+
+    cache.get("SPY")
+    result = cache.get_many(["SPY", "QQQ", "NVDA"])
+
+    assert result == {"SPY": 500.0, "QQQ": 400.0, "NVDA": 120.0}
+    assert fetcher.calls == [["SPY"], ["QQQ", "NVDA"]]
+
+
+def test_session_rollover_expires_and_rewarms_watchlist():
+    clock = FakeClock(_market_hours())
+    fetcher = CountingFetcher({"SPY": 500.0, "QQQ": 400.0, "NVDA": 120.0})
+    cache = PreviousCloseCache(fetcher=fetcher, now_fn=clock)
+    cache.register_watchlist(["SPY", "QQQ"])
+
+    assert cache.warm() == 2
+    assert fetcher.calls == [["SPY", "QQQ"]]
+
+    clock.now = clock.now + timedelta(days=1)
+    fetcher.closes["SPY"] = 505.0
+
+    # First access of the new session warms the watchlist in the same request
+    assert cache.get("NVDA") == 120.0
+    assert fetcher.calls[-1] == ["NVDA", "SPY", "QQQ"]
+
+    assert cache.get("SPY") == 505.0
+    assert len(fetcher.calls) == 2
+
+
+def test_unknown_symbols_are_not_cached():
+    fetcher = CountingFetcher({})
+    cache = PreviousCloseCache(fetcher=fetcher, now_fn=FakeClock(_market_hours()))
+
+    assert cache.get("ZZZZ") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_fetcher_errors_are_contained():
+
+    def broken(symbols):
+        raise RuntimeError("provider down")
+
+    cache = PreviousCloseCache(fetcher=broken, now_fn=FakeClock(_market_hours()))
+
+    assert cache.get("SPY") is None
+
+
+def test_unknown_symbols_are_negative_cached_until_ttl():
+    clock = FakeClock(_market_hours())
+    fetcher = CountingFetcher({"SPY": 500.0})
+    cache = PreviousCloseCache(fetcher=fetcher, now_fn=clock, negative_ttl=600)
+
+    assert cache.get_many(["SPY", "ZZZZ"]) == {"SPY": 500.0, "ZZZZ": None}
+    assert cache.get("ZZZZ") is None
+    assert cache.get_many(["SPY", "ZZZZ"]) == {"SPY": 500.0, "ZZZZ": None}
+
+    assert fetcher.calls == [["SPY", "ZZZZ"]]
+    assert cache.stats()["unknown"] == 1
+
+    clock.now += timedelta(seconds=601)
+    cache.get("ZZZZ")
+
+    assert fetcher.calls[-1] == ["ZZZZ"]
+
+
+def test_fetcher_errors_are_not_negative_cached():
+    calls = []
+
+    def broken(symbols):
+        calls.append(list(symbols))
+        raise RuntimeError("provider down")
+
+    cache = PreviousCloseCache(fetcher=broken, now_fn=FakeClock(_market_hours()))
+
+    cache.get("SPY")
+    cache.get("SPY")
+
+    assert len(calls) == 2
+
+
+def test_pre_market_belongs_to_the_coming_session():
+    # 2026-03-10 is a Tuesday; 12:00 UTC == 08:00 ET (pre-market)
+    clock = FakeClock(datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc))
+    fetcher = CountingFetcher({"SPY": 500.0})
+    cache = PreviousCloseCache(fetcher=fetcher, now_fn=clock)
+
+    cache.get("SPY")
+    assert cache.current_session().isoformat() == "2026-03-10"
+
+    # 13:45 UTC == 09:45 ET: same session, pre-market warm-up kept
+    clock.now = datetime(2026, 3, 10, 13, 45, tzinfo=timezone.utc)
+    cache.get("SPY")
+
+    assert cache.current_session().isoformat() == "2026-03-10"
+    assert len(fetcher.calls) == 1
+
+
+def test_weekend_maps_to_monday_session():
+    saturday = FakeClock(datetime(2026, 3, 14, 16, 0, tzinfo=timezone.utc))
+    monday_pre = FakeClock(datetime(2026, 3, 16, 11, 0, tzinfo=timezone.utc))
+
+    assert PreviousCloseCache(now_fn=saturday).current_session().isoformat() == "2026-03-16"
+    assert PreviousCloseCache(now_fn=monday_pre).current_session().isoformat() == "2026-03-16"
+
+
+class _Bar:
+
+    def __init__(self, day, close):
+        # Alpaca stamps daily bars at the start of the ET day
+        self.timestamp = datetime(2026, 3, day, 4, 0, tzinfo=timezone.utc)
+        self.close = close
+
+
+class _BarsClient:
+
+    def __init__(self, bars):
+        self.bars = bars
+
+    def get_stock_bars(self, request):
+        return SimpleNamespace(data=self.bars)
+
+    def get_stock_snapshot(self, request):
+        return {}
+
+
+def test_monday_pre_market_previous_close_is_fridays():
+    # 2026-03-16 is a Monday; 12:00 UTC == 08:00 ET
+    monday_pre = FakeClock(datetime(2026, 3, 16, 12, 0, tzinfo=timezone.utc))
+
+    adapter = object.__new__(AlpacaPaperBrokerAdapter)
+    adapter.previous_close_cache = PreviousCloseCache(now_fn=monday_pre)
+    adapter.data_client = _BarsClient({"SPY": [_Bar(12, 498.0), _Bar(13, 501.0)]})
+
+    assert adapter._fetch_previous_closes(["SPY"]) == {"SPY": 501.0}
@@ -0,0 +1,108 @@
+import threading
+
+import pytest
+
+from marketmind_engine.data.price_cache import PriceCache
+
+
+class FakeTime:
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_hit_and_miss_counters():
+    cache = PriceCache()
+
+    assert cache.get("SPY") is None
+    cache.put("SPY", 500.0)
+    assert cache.get("SPY") == 500.0
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_ttl_expiry_drops_entry():
+    clock = FakeTime()
+    cache = PriceCache(ttl=10, now_fn=clock)
+
+    cache.put("SPY", 500.0)
+    clock.now = 11
+
+    assert cache.get("SPY") is None
+    assert "SPY" not in cache
+    assert cache.expirations == 1
+
+
+def test_max_age_is_per_read_and_keeps_entry():
+    clock = FakeTime()
+    cache = PriceCache(ttl=300, now_fn=clock)
+
+    cache.put("SPY", 500.0)
+    clock.now = 20
+
+    assert cache.get("SPY", max_age=10) is None
+    assert cache.get("SPY") == 500.0
+
+
+def test_lru_eviction_respects_cap_and_recency():
+    cache = PriceCache(max_entries=2)
+
+    cache.put("A", 1.0)
+    cache.put("B", 2.0)
+    cache.get("A")          # A becomes most recent
+    cache.put("C", 3.0)     # evicts B
+
+    assert cache.keys() == ["A", "C"]
+    assert cache.evictions == 1
+
+
+def test_rotating_universe_stays_bounded():
+    cache = PriceCache(max_entries=100)
+
+    for i in range(10_000):
+        cache.put(f"SYM{i}", float(i))
+
+    assert len(cache) == 100
+    assert cache.evictions == 9_900
+
+
+def test_purge_expired():
+    clock = FakeTime()
+    cache = PriceCache(ttl=5, now_fn=clock)
+
+    cache.put("A", 1.0)
+    clock.now = 3
+    cache.put("B", 2.0)
+    clock.now = 7
+
+    assert cache.purge_expired() == 1
+    assert cache.keys() == ["B"]
+
+
+def test_invalid_cap_rejected():
+    with pytest.raises(ValueError):
+        PriceCache(max_entries=0)
+
+
+def test_concurrent_writers_keep_cap():
+    cache = PriceCache(max_entries=50)
+
+    def writer(offset):
+        for i in range(2_000):
+            cache.put(f"S{offset}-{i}", float(i))
+            cache.get(f"S{offset}-{i // 2}")
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(cache) == 50
+    assert cache.evictions == 8_000 - 50
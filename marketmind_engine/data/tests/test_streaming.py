@@ -0,0 +1,139 @@
+from marketmind_engine.data.price_cache import PriceCache
+from marketmind_engine.data.streaming import (
+    LocalStandInStream,
+    MarketDataCache,
+    StreamTrade,
+    WatchlistSubscriptionManager,
+)
+
+
+class FakeTime:
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_local_stream_pushes_trades_into_cache():
+    cache = MarketDataCache()
+    stream = LocalStandInStream(cache, scripted={"NVDA": [120.0, 121.0, 122.5]})
+
+    stream.subscribe(["nvda", "SPY"])
+    stream.run(3)
+
+    assert cache.last_price("NVDA") == 122.5
+    assert cache.last_price("SPY") == 100.02
+
+
+def test_local_stream_is_deterministic():
+    prices = []
+
+    for _ in range(2):
+        cache = MarketDataCache()
+        stream = LocalStandInStream(cache, drift=0.5)
+        stream.subscribe(["AAA"])
+        stream.run(10)
+        prices.append(cache.last_price("AAA"))
+
+    assert prices[0] == prices[1] == 104.5
+
+
+def test_local_stream_emits_rolling_bars():
+    cache = MarketDataCache(max_bars=2)
+    stream = LocalStandInStream(cache, scripted={"AAA": [1, 3, 2, 5, 4, 6, 7]}, bar_every=2)
+
+    stream.subscribe(["AAA"])
+    stream.run(6)
+
+    bars = cache.bars("AAA")
+
+    # 3 bars built, only the latest 2 retained
+    assert len(bars) == 2
+    assert (bars[0].open, bars[0].high, bars[0].low, bars[0].close) == (2, 5, 2, 5)
+    assert bars[-1].close == 6
+
+
+def test_stale_prices_are_not_served():
+    clock = FakeTime(1000.0)
+    cache = MarketDataCache(now_fn=clock)
+
+    cache.on_trade(StreamTrade("SPY", 500.0, 1.0, 1000.0))
+    assert cache.last_price("SPY", max_age=5) == 500.0
+
+    clock.now += 10
+    assert cache.last_price("SPY", max_age=5) is None
+    assert cache.last_price("SPY") == 500.0
+
+
+def test_subscriptions_follow_watchlist():
+    cache = MarketDataCache()
+    stream = LocalStandInStream(cache)
+    manager = WatchlistSubscriptionManager(stream, pinned=["SPY"], max_symbols=3)
+
+    diff = manager.sync(["NVDA", "AMD"])
+    assert diff == {"added": ["AMD", "NVDA", "SPY"], "removed": []}
+
+    stream.step()
+    assert cache.last_price("NVDA") is not None
+
+    diff = manager.sync(["TSLA", "NVDA", "AMD"])
+    assert diff == {"added": ["TSLA"], "removed": ["AMD"]}
+    assert stream.subscriptions == {"SPY", "TSLA", "NVDA"}
+
+    # Unsubscribed symbols are dropped from the cache
+    assert cache.last_price("AMD") is None
+
+
+def test_local_stream_timestamps_are_epoch_and_bars_use_start_time():
+    received = []
+
+    class RecordingCache(MarketDataCache):
+        def on_trade(self, trade):
+            received.append(trade)
+            super().on_trade(trade)
+
+    cache = RecordingCache()
+    stream = LocalStandInStream(cache, bar_every=3, start_ts=1_700_000_000.0, tick_seconds=5.0)
+    stream.subscribe(["AAA"])
+    stream.run(3)
+
+    assert [t.timestamp for t in received] == [1_700_000_000.0, 1_700_000_005.0, 1_700_000_010.0]
+    assert cache.bars("AAA")[0].timestamp == 1_700_000_000.0
+
+
+def test_local_stream_uses_private_cache_and_is_refused_with_broker(monkeypatch):
+    from marketmind_engine.data import registry
+    from marketmind_engine.data.streaming import MARKET_DATA_CACHE
+
+    monkeypatch.setattr(registry, "_STREAM_NAME", "local")
+
+    stream = registry._build_stream()
+    assert isinstance(stream, LocalStandInStream)
+    assert stream.cache is not MARKET_DATA_CACHE
+
+    class FakeBroker:
+        pass
+
+    monkeypatch.setattr(registry, "AlpacaPaperBrokerAdapter", FakeBroker)
+    monkeypatch.setattr(registry, "_ACTIVE_PROVIDER", FakeBroker())
+
+    assert registry._build_stream() is None
+
+
+def test_unsubscribe_keeps_prices_the_stream_did_not_write():
+    shared = PriceCache()
+    cache = MarketDataCache(price_cache=shared)
+    stream = LocalStandInStream(cache)
+
+    stream.subscribe(["AMD", "NVDA"])
+    stream.step()
+    shared.put("AMD", 101.0)          # REST lookup outside the stream
+    cache.on_price("NVDA", 99.0)      # polled fallback
+
+    stream.unsubscribe(["AMD", "NVDA"])
+
+    assert cache.prices is shared
+    assert shared.get("AMD") == 101.0
+    assert shared.get("NVDA") == 99.0
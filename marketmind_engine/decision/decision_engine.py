@@ -20,6 +20,7 @@ from marketmind_engine.decision.rules.bell_drake_threshold import (
 from marketmind_engine.decision.rules.constraint.narrative_price_latency import (
     NarrativePriceLatencyRule,
 )
+from marketmind_engine.telemetry.metrics import DECISIONS, RULE_VETOES
 
 
 class DecisionEngine:
@@ -62,6 +63,7 @@ class DecisionEngine:
             # Constraint veto
             if r.block:
                 blocked = True
+                RULE_VETOES.labels(rule=r.rule_name).inc()
 
             # Intent authority
             if r.rule_name == "BellDrakeThreshold" and r.triggered:
@@ -73,6 +75,8 @@ class DecisionEngine:
         if bell_drake_triggered and not blocked:
             decision = "ALLOW_BUY"
 
+        DECISIONS.labels(source="rules", decision=decision).inc()
+
         return DecisionResult(
             decision=decision,
             rule_results=rule_results,
@@ -3,10 +3,20 @@ from typing import Optional
 from marketmind_engine.policy.policy_types import PolicyAction
 from marketmind_engine.execution.policy.base import ExecutionDirective
 
+from marketmind_engine.telemetry.metrics import ENTRY_BLOCKS
+
 from .execution_input import ExecutionInput
 from .execution_types import OrderIntent
 
 
+def _block(gate: str) -> None:
+    """
+    Count an entry blocked by an execution gate and return no intent.
+    """
+    ENTRY_BLOCKS.labels(gate=gate).inc()
+    return None
+
+
 class ExecutionEngine:
     """
     Translates PolicyResult into OrderIntent.
@@ -47,7 +57,7 @@ class ExecutionEngine:
 
             # Hard entry block
             if not execution_directive.allow_entries:
-                return None
+                return _block("regime_entry_block")
 
             # Defensive clamp
             if execution_directive.size_multiplier is not None:
@@ -60,6 +70,7 @@ class ExecutionEngine:
         # Policy Authority Gate
         # --------------------------------------------------
 
+        # Not an entry; rule vetoes are counted by the DecisionEngine
         if policy.action != PolicyAction.ALLOW:
             return None
 
@@ -68,14 +79,14 @@ class ExecutionEngine:
         # --------------------------------------------------
 
         if state.symbol in positions.positions:
-            return None
+            return _block("duplicate_symbol")
 
         # --------------------------------------------------
         # Price Validation
         # --------------------------------------------------
 
         if price is None or price <= 0:
-            return None
+            return _block("invalid_price")
 
         # --------------------------------------------------
         # Capital Risk Base
@@ -84,7 +95,7 @@ class ExecutionEngine:
         risk_capital = capital.account_equity * capital.max_risk_per_trade
 
         if risk_capital <= 0:
-            return None
+            return _block("no_risk_capital")
 
         # --------------------------------------------------
         # Apply Regime Size Multiplier
@@ -93,7 +104,7 @@ class ExecutionEngine:
         risk_capital *= size_multiplier
 
         if risk_capital <= 0:
-            return None
+            return _block("regime_size_zero")
 
         # --------------------------------------------------
         # Stop-Based Risk Sizing (Preferred)
@@ -105,7 +116,7 @@ class ExecutionEngine:
 
             # Must be positive risk
             if risk_per_share <= 0:
-                return None
+                return _block("invalid_stop")
 
             quantity = risk_capital / risk_per_share
             rationale = "Intent approved with stop-based risk model"
@@ -118,13 +129,13 @@ class ExecutionEngine:
             position_value = min(risk_capital, capital.buying_power)
 
             if position_value <= 0:
-                return None
+                return _block("no_buying_power")
 
             quantity = position_value / price
             rationale = "Intent approved with capital + price-based risk model"
 
         if quantity <= 0:
-            return None
+            return _block("zero_quantity")
 
         return OrderIntent(
             symbol=state.symbol,
@@ -6,6 +6,7 @@ from marketmind_engine.decision.types import DecisionResult
 from marketmind_engine.execution.execution_types import OrderIntent
 from marketmind_engine.execution.execution_receipt import ExecutionReceipt
 from marketmind_engine.broker.broker_adapter import BrokerAdapter
+from marketmind_engine.telemetry.metrics import ORDER_SUBMISSIONS
 
 
 class ExecutionService:
@@ -21,6 +22,19 @@ class ExecutionService:
     def __init__(self, broker: BrokerAdapter):
         self._broker = broker
 
+    def _submit(self, order_intent: OrderIntent) -> ExecutionReceipt:
+
+        try:
+            receipt = self._broker.submit(order_intent)
+        except Exception:
+            ORDER_SUBMISSIONS.labels(side=order_intent.side, status="error").inc()
+            raise
+
+        status = "accepted" if getattr(receipt, "accepted", False) else "rejected"
+        ORDER_SUBMISSIONS.labels(side=order_intent.side, status=status).inc()
+
+        return receipt
+
     # --------------------------------------------------
     # Path 1 — Decision-driven execution (unit test path)
     # --------------------------------------------------
@@ -48,7 +62,7 @@ class ExecutionService:
             confidence=confidence,
         )
 
-        return self._broker.submit(order_intent)
+        return self._submit(order_intent)
 
     # --------------------------------------------------
     # Path 2 — Direct OrderIntent submission (runtime path)
@@ -63,4 +77,4 @@ class ExecutionService:
         Used by RuntimeExecutor after TradeCoordinator.
         """
 
-        return self._broker.submit(order_intent)
+        return self._submit(order_intent)
@@ -1,5 +1,50 @@
-from typing import Dict, Any, List
+"""
+Propagation Engine
+------------------
+Multi-layer propagation aggregator (structural / narrative / capital).
+
+Incremental:
+- update(symbols) pulls layer inputs and recomputes only the
+  layers whose inputs changed since the last update
+- structural and narrative inputs come from one deduplicated
+  provider fetch (union of both symbol sets), so both layers
+  see the same market instant
+- every recomputed layer feeds running per-metric statistics
+  (Welford mean / variance, min / max)
+- a failed read keeps the layer's previous value and stats: a
+  provider error, or no usable change for any symbol the layer
+  asked for (the adapter reports an outage as null changes),
+  counts as a failure, so an outage never enters the running
+  statistics as zeros
+- the composite is cached; snapshot() is served from memory and
+  only triggers an update() when the cache is older than the TTL
+- provider and position reads run outside the state lock; the
+  lock is only held to apply results, so snapshot() readers are
+  never stuck behind a slow fetch. An expired read refreshes
+  inline only if no other refresh is in flight (otherwise it
+  serves the current composite)
+
+The engine loop drives update() with the symbols it validated;
+UI polling of snapshot() does not cause provider traffic while
+the loop is running.
+
+Narrative symbols: update(None) asks the RSS service for
+get_evaluated_symbols() when it has one. Otherwise the last set
+passed by the loop is reused for at most the narrative TTL,
+after which the narrative layer reads empty instead of tracking
+a stale set indefinitely.
+
+Configuration via environment:
+
+    MARKETMIND_PROPAGATION_TTL             composite cache TTL (seconds)
+    MARKETMIND_PROPAGATION_NARRATIVE_TTL   max age of the last narrative set
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from statistics import mean, pstdev
+import math
+import os
+import threading
 import time
 
 from .relative_signal_layer import RelativeSignalLayer
@@ -17,52 +62,265 @@ STRUCTURAL_SYMBOLS = [
     "ITA",
 ]
 
+COMPOSITE_TTL_SECONDS = float(os.getenv("MARKETMIND_PROPAGATION_TTL", "30"))
+NARRATIVE_TTL_SECONDS = float(os.getenv("MARKETMIND_PROPAGATION_NARRATIVE_TTL", "300"))
+
+EMPTY_LAYERS = {
+    "structural": {"bias": 0.0, "volatility": 0.0, "dispersion": 0.0},
+    "narrative": {"bias": 0.0, "concentration": 0.0, "momentum": 0.0},
+    "capital": {"exposure": 0.0, "unrealized_pct": 0.0, "alignment": 0.0},
+}
+
+
+# ==========================================================
+# RUNNING STATISTICS
+# ==========================================================
+
+class RunningStats:
+    """
+    Welford running mean / variance with min / max.
+    O(1) per observation, no history kept.
+    """
+
+    __slots__ = ("count", "mean", "_m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def push(self, value: float) -> None:
+        value = float(value)
+
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        if self.min is None or value < self.min:
+            self.min = value
+
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 6),
+            "variance": round(self.variance, 6),
+            "min": self.min,
+            "max": self.max,
+        }
+
+
+class _LayerState:
+
+    __slots__ = ("name", "value", "inputs", "updated_at", "stats")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.value: Dict[str, float] = dict(EMPTY_LAYERS[name])
+        self.inputs: Optional[Tuple] = None
+        self.updated_at: Optional[float] = None
+        self.stats: Dict[str, RunningStats] = {
+            metric: RunningStats() for metric in self.value
+        }
+
+    def apply(self, inputs: Tuple, value: Dict[str, float], now: float) -> bool:
+        """
+        Store a recomputed layer if its inputs changed.
+        Returns True if the layer was refreshed.
+        """
+
+        if inputs == self.inputs:
+            return False
+
+        self.inputs = inputs
+        self.value = value
+        self.updated_at = now
+
+        for metric, v in value.items():
+            self.stats[metric].push(v)
+
+        return True
+
+
+# ==========================================================
+# ENGINE
+# ==========================================================
 
 class PropagationEngine:
     """
-    Stateless multi-layer propagation aggregator.
+    Incremental multi-layer propagation aggregator.
 
     Pure read-only intelligence layer.
-    No mutation.
     No execution influence.
     No lifecycle interaction.
+    Only its own cached layer state is mutated.
     """
 
-    def __init__(self, provider, engine_controller, rss_service):
+    def __init__(
+        self,
+        provider,
+        engine_controller,
+        rss_service,
+        composite_ttl: float = COMPOSITE_TTL_SECONDS,
+        narrative_ttl: float = NARRATIVE_TTL_SECONDS,
+        now_fn: Callable[[], float] = time.time,
+    ):
         self.provider = provider
         self.engine_controller = engine_controller
         self.rss_service = rss_service
         self.relative_layer = RelativeSignalLayer()
 
+        self.composite_ttl = composite_ttl
+        self.narrative_ttl = narrative_ttl
+        self._now = now_fn
+
+        # _lock guards state; _refresh_lock serializes fetches
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()
+        self._layers: Dict[str, _LayerState] = {
+            name: _LayerState(name) for name in EMPTY_LAYERS
+        }
+        self._narrative_symbols: Tuple[str, ...] = ()
+        self._narrative_at: Optional[float] = None
+        self._fetched_at: Optional[float] = None
+
+        self._cached: Optional[Dict[str, Any]] = None
+        self._cached_at: Optional[float] = None
+        self.updates = 0
+        self.failed_reads = 0
+
+        # Increments whenever the cached composite is rebuilt
+        self.version = 0
+        self._body: Optional[Tuple[int, Dict[str, Any]]] = None
+
     # ==========================================================
     # PUBLIC ENTRY
     # ==========================================================
 
+    def update(self, symbols: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Refresh layer inputs and recompute changed layers.
+
+        symbols: evaluated narrative symbols. If None, they are
+        read from the RSS service, falling back to the last set
+        while it is younger than narrative_ttl.
+
+        Returns the names of the layers that were refreshed.
+        """
+
+        with self._refresh_lock:
+            return self._refresh(symbols)
+
+    def _refresh(self, symbols: Optional[Iterable[str]]) -> List[str]:
+        """
+        update() body; caller holds _refresh_lock.
+        """
+
+        now = self._now()
+
+        if symbols is None:
+            symbols = self._evaluated_symbols()
+
+        with self._lock:
+
+            if symbols is not None:
+                self._narrative_symbols = tuple(
+                    sorted({s.upper() for s in symbols if s})
+                )
+                self._narrative_at = now
+
+            elif (
+                self._narrative_at is not None
+                and now - self._narrative_at > self.narrative_ttl
+            ):
+                self._narrative_symbols = ()
+                self._narrative_at = None
+
+            narrative = self._narrative_symbols
+
+        # Network I/O without the state lock
+        structural_data, narrative_data = self._fetch_layers(narrative)
+        positions = self._open_positions()
+
+        with self._lock:
+
+            # Data age tracks the last read with usable changes
+            if self._changes(structural_data or {}) or self._changes(narrative_data or {}):
+                self._fetched_at = now
+
+            refreshed = [
+                name for name, changed in (
+                    ("structural", self._update_structural(structural_data, now)),
+                    ("narrative", self._update_narrative(narrative, narrative_data, now)),
+                    ("capital", self._update_capital(positions, now)),
+                )
+                if changed
+            ]
+
+            if refreshed or self._cached is None:
+                self._cached = self._build_snapshot(now)
+                self.version += 1
+
+            self._cached_at = now
+            self.updates += 1
+
+            return refreshed
+
+    def _refresh_if_expired(self) -> None:
+        """
+        TTL refresh for readers. Blocks only when there is no
+        composite yet; otherwise skips if a refresh is running.
+        """
+
+        with self._lock:
+            if not self._expired():
+                return
+            bootstrap = self._cached is None
+
+        if bootstrap:
+            self.update()
+            return
+
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+
+        try:
+            self._refresh(None)
+        finally:
+            self._refresh_lock.release()
+
     def snapshot(self) -> Dict[str, Any]:
 
         try:
-            structural = self._structural_layer()
-            narrative = self._narrative_layer()
-            capital = self._capital_layer()
+            self._refresh_if_expired()
 
-            composite = self._composite(structural, narrative, capital)
+            with self._lock:
 
-            # FIX: match RelativeSignalLayer signature
-            relative_signals = self.relative_layer.evaluate(
-                structural,
-                narrative,
-                capital,
-            )
+                now = self._now()
 
-            return {
-                "mode": "propagation_live",
-                "timestamp": time.time(),
-                "structural": structural,
-                "narrative": narrative,
-                "capital": capital,
-                "composite": composite,
-                "relative_signals": relative_signals,
-            }
+                return {
+                    **self._cached,
+                    "age": round(now - self._cached_at, 3),
+                    "data_fetched_at": self._fetched_at,
+                    "data_age": (
+                        round(now - self._fetched_at, 3)
+                        if self._fetched_at is not None else None
+                    ),
+                    "stats": self.stats(),
+                }
 
         except Exception as e:
             return {
@@ -71,8 +329,59 @@ class PropagationEngine:
                 "error": str(e),
             }
 
+    def snapshot_parts(self) -> Tuple[int, Dict[str, Any], Dict[str, Any]]:
+        """
+        (version, body, volatile) where body only changes with
+        version and volatile holds the per-read age fields.
+        snapshot() == {**body, **volatile}.
+        """
+
+        self._refresh_if_expired()
+
+        with self._lock:
+
+            now = self._now()
+
+            if self._body is None or self._body[0] != self.version:
+                self._body = (self.version, {**self._cached, "stats": self.stats()})
+
+            body = self._body[1]
+            volatile = {
+                "age": round(now - self._cached_at, 3),
+                "data_fetched_at": self._fetched_at,
+                "data_age": (
+                    round(now - self._fetched_at, 3)
+                    if self._fetched_at is not None else None
+                ),
+            }
+
+            return self.version, body, volatile
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Running per-metric statistics for each layer.
+        """
+
+        with self._lock:
+            return {
+                name: {m: s.as_dict() for m, s in layer.stats.items()}
+                for name, layer in self._layers.items()
+            }
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._cached = None
+            self._cached_at = None
+
+    def _expired(self) -> bool:
+
+        if self._cached is None or self._cached_at is None:
+            return True
+
+        return (self._now() - self._cached_at) > self.composite_ttl
+
     # ==========================================================
-    # HELPER
+    # HELPERS
     # ==========================================================
 
     def _extract_change(self, record: Dict[str, Any]) -> float | None:
@@ -88,26 +397,50 @@ class PropagationEngine:
 
         return None
 
-    # ==========================================================
-    # STRUCTURAL LAYER
-    # ==========================================================
+    def _fetch(self, symbols: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Provider batch data; None when the provider call failed.
+        """
+
+        if not symbols or not hasattr(self.provider, "get_batch_data"):
+            return {}
+
+        try:
+            return self.provider.get_batch_data(symbols) or {}
+        except Exception:
+            return None
 
-    def _structural_layer(self) -> Dict[str, float]:
+    def _fetch_layers(
+        self,
+        narrative: Tuple[str, ...],
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        One provider round trip for the union of structural and
+        narrative symbols, split back out per layer (None, None
+        when the fetch failed).
+        """
 
-        data = {}
+        union = list(dict.fromkeys(STRUCTURAL_SYMBOLS + list(narrative)))
 
-        if hasattr(self.provider, "get_batch_data"):
-            try:
-                data = self.provider.get_batch_data(STRUCTURAL_SYMBOLS)
-            except Exception:
-                data = {}
+        data = self._fetch(union)
 
-        if not data:
-            return {"bias": 0.0, "volatility": 0.0, "dispersion": 0.0}
+        if data is None:
+            return None, None
+
+        return (
+            {s: data[s] for s in STRUCTURAL_SYMBOLS if s in data},
+            {s: data[s] for s in narrative if s in data},
+        )
+
+    def _changes(self, data: Dict[str, Any]) -> Tuple[Tuple[str, float], ...]:
+        """
+        (symbol, change) pairs, sorted. Doubles as the layer's
+        input signature.
+        """
 
         changes = []
 
-        for v in data.values():
+        for symbol, v in data.items():
 
             change = self._extract_change(v)
 
@@ -115,63 +448,78 @@ class PropagationEngine:
                 continue
 
             try:
-                changes.append(float(change))
+                changes.append((symbol, float(change)))
             except Exception:
                 continue
 
-        if not changes:
-            return {"bias": 0.0, "volatility": 0.0, "dispersion": 0.0}
+        return tuple(sorted(changes))
 
-        return {
-            "bias": mean(changes),
-            "volatility": pstdev(changes) if len(changes) > 1 else 0.0,
-            "dispersion": max(changes) - min(changes),
-        }
+    def _evaluated_symbols(self) -> Optional[List[str]]:
+
+        if hasattr(self.rss_service, "get_evaluated_symbols"):
+            try:
+                return self.rss_service.get_evaluated_symbols()
+            except Exception:
+                return None
+
+        return None
 
     # ==========================================================
-    # NARRATIVE LAYER
+    # STRUCTURAL LAYER
     # ==========================================================
 
-    def _narrative_layer(self) -> Dict[str, float]:
+    def _update_structural(self, data: Optional[Dict[str, Any]], now: float) -> bool:
 
-        symbols: List[str] = []
+        inputs = self._changes(data or {})
 
-        if hasattr(self.rss_service, "get_evaluated_symbols"):
-            try:
-                symbols = self.rss_service.get_evaluated_symbols()
-            except Exception:
-                symbols = []
+        # Structural ETFs always trade: no change at all is an outage
+        if not inputs:
+            self.failed_reads += 1
+            return False
 
-        if not symbols:
-            return {"bias": 0.0, "concentration": 0.0, "momentum": 0.0}
+        return self._layers["structural"].apply(
+            inputs, self._structural_layer([c for _, c in inputs]), now
+        )
 
-        data = {}
+    def _structural_layer(self, changes: List[float]) -> Dict[str, float]:
 
-        if hasattr(self.provider, "get_batch_data"):
-            try:
-                data = self.provider.get_batch_data(symbols)
-            except Exception:
-                data = {}
+        if not changes:
+            return dict(EMPTY_LAYERS["structural"])
 
-        if not data:
-            return {"bias": 0.0, "concentration": 0.0, "momentum": 0.0}
+        return {
+            "bias": mean(changes),
+            "volatility": pstdev(changes) if len(changes) > 1 else 0.0,
+            "dispersion": max(changes) - min(changes),
+        }
 
-        changes = []
+    # ==========================================================
+    # NARRATIVE LAYER
+    # ==========================================================
 
-        for v in data.values():
+    def _update_narrative(
+        self,
+        symbols: Tuple[str, ...],
+        data: Optional[Dict[str, Any]],
+        now: float,
+    ) -> bool:
 
-            change = self._extract_change(v)
+        inputs = self._changes(data or {})
 
-            if change is None:
-                continue
+        # An empty symbol set legitimately reads empty
+        if symbols and not inputs:
+            self.failed_reads += 1
+            return False
 
-            try:
-                changes.append(float(change))
-            except Exception:
-                continue
+        return self._layers["narrative"].apply(
+            (symbols, inputs),
+            self._narrative_layer([c for _, c in inputs]),
+            now,
+        )
+
+    def _narrative_layer(self, changes: List[float]) -> Dict[str, float]:
 
         if not changes:
-            return {"bias": 0.0, "concentration": 0.0, "momentum": 0.0}
+            return dict(EMPTY_LAYERS["narrative"])
 
         return {
             "bias": mean(changes),
@@ -183,32 +531,45 @@ class PropagationEngine:
     # CAPITAL LAYER
     # ==========================================================
 
-    def _capital_layer(self) -> Dict[str, float]:
+    def _open_positions(self) -> Optional[List[Any]]:
+        """
+        Open positions; None when the read failed.
+        """
 
-        positions = []
+        if not hasattr(self.engine_controller, "get_open_positions"):
+            return []
 
-        if hasattr(self.engine_controller, "get_open_positions"):
-            try:
-                positions = self.engine_controller.get_open_positions()
-            except Exception:
-                positions = []
+        try:
+            return self.engine_controller.get_open_positions() or []
+        except Exception:
+            return None
 
-        if not positions:
-            return {"exposure": 0.0, "unrealized_pct": 0.0, "alignment": 0.0}
+    def _update_capital(self, positions: Optional[List[Any]], now: float) -> bool:
 
-        unrealized = []
-        directions = []
+        if positions is None:
+            self.failed_reads += 1
+            return False
 
-        for p in positions:
+        inputs = tuple(
+            (p.get("unrealized_pct", 0.0), p.get("direction", 0.0))
+            for p in positions
+            if isinstance(p, dict)
+        )
 
-            if not isinstance(p, dict):
-                continue
+        return self._layers["capital"].apply(
+            inputs, self._capital_layer(inputs), now
+        )
+
+    def _capital_layer(self, inputs: Tuple[Tuple[float, float], ...]) -> Dict[str, float]:
+
+        if not inputs:
+            return dict(EMPTY_LAYERS["capital"])
 
-            unrealized.append(p.get("unrealized_pct", 0.0))
-            directions.append(p.get("direction", 0.0))
+        unrealized = [u for u, _ in inputs]
+        directions = [d for _, d in inputs]
 
-        exposure = mean(directions) if directions else 0.0
-        unrealized_avg = mean(unrealized) if unrealized else 0.0
+        exposure = mean(directions)
+        unrealized_avg = mean(unrealized)
 
         return {
             "exposure": exposure,
@@ -220,6 +581,34 @@ class PropagationEngine:
     # COMPOSITE
     # ==========================================================
 
+    def _build_snapshot(self, now: float) -> Dict[str, Any]:
+
+        structural = self._layers["structural"].value
+        narrative = self._layers["narrative"].value
+        capital = self._layers["capital"].value
+
+        composite = self._composite(structural, narrative, capital)
+
+        # FIX: match RelativeSignalLayer signature
+        relative_signals = self.relative_layer.evaluate(
+            structural,
+            narrative,
+            capital,
+        )
+
+        return {
+            "mode": "propagation_live",
+            "timestamp": now,
+            "structural": dict(structural),
+            "narrative": dict(narrative),
+            "capital": dict(capital),
+            "composite": composite,
+            "relative_signals": relative_signals,
+            "layer_updated_at": {
+                name: layer.updated_at for name, layer in self._layers.items()
+            },
+        }
+
     def _composite(self, structural, narrative, capital) -> Dict[str, Any]:
 
         stress_score = (
@@ -246,4 +635,4 @@ class PropagationEngine:
             "stress_score": round(stress_score, 4),
             "alignment_score": round(alignment_score, 4),
             "regime_hint": regime_hint,
-        }
\ No newline at end of file
+        }
@@ -6,13 +6,40 @@ RSS feeds
 → ticker validation
 → publisher diversity
 → early candidate detection
+
+DiscoveryService scans publishers concurrently and keeps a
+time-windowed mention index that is updated from new items
+only (unchanged feeds are not re-parsed, seen items are not
+recounted). Repeat calls inside min_interval are served from
+the index without network I/O, so callers can use it per tick.
+
+Seen item keys outlive the mention window (seen_ttl, default
+4x the window) and items whose published date is already
+outside the window are not indexed, so a feed that still lists
+old items after their mentions expired does not count them
+twice. Network fetches run outside the index lock.
 """
 
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+import hashlib
+import os
 import re
-import requests
+import threading
+import time
 import xml.etree.ElementTree as ET
-from collections import defaultdict
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from marketmind_engine.telemetry.metrics import (
+    FEED_FETCHES,
+    FEED_FETCH_SECONDS,
+    HEADLINES_INGESTED,
+)
+from marketmind_engine.utils.http_client import get_http_client
 
 
 RSS_FEEDS = {
@@ -32,6 +59,7 @@ HEADERS = {
 
 
 TICKER_PATTERN = r"\b[A-Z]{2,5}\b"
+TICKER_RE = re.compile(TICKER_PATTERN)
 
 
 STOP_WORDS = {
@@ -45,9 +73,12 @@ STOP_WORDS = {
 # Load ticker universe
 # --------------------------------------------------
 
+TICKERS_PATH = Path(__file__).resolve().parent.parent / "data" / "tickers.txt"
+
+
 def load_tickers():
 
-    path = Path("marketmind_engine/data/tickers.txt")
+    path = TICKERS_PATH
 
     if not path.exists():
         return set()
@@ -63,13 +94,16 @@ TICKERS = load_tickers()
 # Fetch RSS feed
 # --------------------------------------------------
 
-def fetch_feed(url):
+def fetch_feed(url, http_client=None):
+
+    started = time.perf_counter()
+    status = "error"
 
     try:
 
-        r = requests.get(url, headers=HEADERS, timeout=10)
-        r.raise_for_status()
+        r = (http_client or get_http_client()).get(url, headers=HEADERS, timeout=10)
 
+        status = "ok" if r.text else "empty"
         return r.text
 
     except Exception:
@@ -77,12 +111,21 @@ def fetch_feed(url):
         print(f"Feed error: {url}")
         return None
 
+    finally:
+        FEED_FETCH_SECONDS.labels(feed=url).observe(time.perf_counter() - started)
+        FEED_FETCHES.labels(feed=url, status=status).inc()
+
 
 # --------------------------------------------------
 # Parse RSS / Atom
 # --------------------------------------------------
 
-def parse_feed(xml):
+def parse_feed_entries(xml):
+    """
+    (item_key, text, published) per RSS item / Atom entry.
+    item_key is the guid/link/id when present, else a text hash.
+    published is epoch seconds, or None when missing/unparsable.
+    """
 
     items = []
 
@@ -97,29 +140,71 @@ def parse_feed(xml):
 
         title = item.findtext("title") or ""
         desc = item.findtext("description") or ""
+        text = title + " " + desc
 
-        items.append(title + " " + desc)
+        key = item.findtext("guid") or item.findtext("link") or _text_key(text)
+
+        items.append((key, text, _published(item.findtext("pubDate"), rfc822=True)))
 
 
     # Atom format
-    for entry in root.iter("{http://www.w3.org/2005/Atom}entry"):
+    atom = "{http://www.w3.org/2005/Atom}"
+
+    for entry in root.iter(f"{atom}entry"):
+
+        title = entry.findtext(f"{atom}title") or ""
+        summary = entry.findtext(f"{atom}summary") or ""
+        text = title + " " + summary
 
-        title = entry.findtext("{http://www.w3.org/2005/Atom}title") or ""
-        summary = entry.findtext("{http://www.w3.org/2005/Atom}summary") or ""
+        key = entry.findtext(f"{atom}id") or _text_key(text)
 
-        items.append(title + " " + summary)
+        stamp = entry.findtext(f"{atom}published") or entry.findtext(f"{atom}updated")
+        items.append((key, text, _published(stamp, rfc822=False)))
 
 
     return items
 
 
+def parse_feed_items(xml):
+    """
+    (item_key, text) per RSS item / Atom entry.
+    """
+
+    return [(key, text) for key, text, _ in parse_feed_entries(xml)]
+
+
+def _published(value, rfc822):
+
+    if not value:
+        return None
+
+    try:
+        if rfc822:
+            stamp = parsedate_to_datetime(value.strip())
+        else:
+            stamp = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        return stamp.timestamp()
+    except Exception:
+        return None
+
+
+def parse_feed(xml):
+
+    return [text for _, text in parse_feed_items(xml)]
+
+
+def _text_key(text):
+
+    return hashlib.sha1(text.encode("utf-8", "ignore")).hexdigest()
+
+
 # --------------------------------------------------
 # Extract ticker symbols
 # --------------------------------------------------
 
 def extract_symbols(text):
 
-    matches = re.findall(TICKER_PATTERN, text)
+    matches = TICKER_RE.findall(text)
 
     symbols = []
 
@@ -137,79 +222,339 @@ def extract_symbols(text):
 
 
 # --------------------------------------------------
-# Discovery Engine
+# Mention Index
 # --------------------------------------------------
 
-def discover(return_symbols=False):
+DISCOVERY_WINDOW_SECONDS = float(os.getenv("MARKETMIND_DISCOVERY_WINDOW", str(6 * 3600)))
+DISCOVERY_MIN_INTERVAL = float(os.getenv("MARKETMIND_DISCOVERY_INTERVAL", "60"))
 
-    print("\n=== MARKETMIND REAL DISCOVERY ===\n")
 
-    symbol_publishers = defaultdict(set)
-    symbol_mentions = defaultdict(int)
+@dataclass(frozen=True)
+class DiscoveredSymbol:
+    symbol: str
+    mentions: int
+    publishers: Tuple[str, ...]
+    last_seen: float
 
-    for publisher, feed in RSS_FEEDS.items():
+    @property
+    def publisher_count(self) -> int:
+        return len(self.publishers)
 
-        print(f"Scanning {publisher}")
+    @property
+    def confirmed(self) -> bool:
+        return self.publisher_count >= 2
 
-        xml = fetch_feed(feed)
+    def to_dict(self):
+        return {
+            "symbol": self.symbol,
+            "mentions": self.mentions,
+            "publishers": list(self.publishers),
+            "publisher_count": self.publisher_count,
+            "confirmed": self.confirmed,
+            "last_seen": self.last_seen,
+        }
 
-        if not xml:
-            continue
 
-        items = parse_feed(xml)
+class MentionIndex:
+    """
+    Time-windowed symbol mention index.
 
-        for text in items:
+    Each feed item is counted once (by item key). Mentions
+    older than window_seconds fall out of the counts; item keys
+    are remembered for seen_ttl (longer than the window) so
+    items still listed by a feed are not counted again.
+    """
 
-            symbols = extract_symbols(text)
+    def __init__(
+        self,
+        window_seconds: float = DISCOVERY_WINDOW_SECONDS,
+        seen_ttl: Optional[float] = None,
+    ):
+        self.window_seconds = window_seconds
+        self.seen_ttl = seen_ttl if seen_ttl is not None else 4 * window_seconds
 
-            for sym in symbols:
+        self._events: Deque[Tuple[float, str, str]] = deque()   # (ts, symbol, publisher)
+        self._seen: Dict[Tuple[str, str], float] = {}           # (publisher, key) -> ts
+        self._seen_order: Deque[Tuple[float, Tuple[str, str]]] = deque()
 
-                symbol_publishers[sym].add(publisher)
-                symbol_mentions[sym] += 1
+        self._mentions: Counter = Counter()
+        self._publishers: Dict[str, Counter] = {}
+        self._last_seen: Dict[str, float] = {}
 
+    def __len__(self) -> int:
+        return len(self._mentions)
 
-    ranked = []
+    def seen(self, publisher: str, key: str) -> bool:
+        return (publisher, key) in self._seen
 
-    for sym in symbol_mentions:
+    def add(self, publisher: str, key: str, symbols: List[str], ts: float) -> bool:
+        """
+        Index one item. Returns False if it was already seen.
+        """
 
-        pubs = symbol_publishers[sym]
-        mentions = symbol_mentions[sym]
+        item = (publisher, key)
 
-        ranked.append((sym, mentions, len(pubs), pubs))
+        if item in self._seen:
+            return False
 
+        self._seen[item] = ts
+        self._seen_order.append((ts, item))
 
-    ranked.sort(key=lambda x: x[1], reverse=True)
+        for sym in symbols:
+            self._events.append((ts, sym, publisher))
+            self._mentions[sym] += 1
+            self._publishers.setdefault(sym, Counter())[publisher] += 1
+            self._last_seen[sym] = ts
 
+        return True
 
-    confirmed = []
-    early = []
+    def expire(self, now: float) -> int:
+        """
+        Drop mentions (and seen item keys) outside the window.
+        Returns the number of mentions dropped.
+        """
 
+        cutoff = now - self.window_seconds
+        dropped = 0
 
-    print("\n--- Publisher Confirmed ---\n")
+        while self._events and self._events[0][0] < cutoff:
+            _, sym, publisher = self._events.popleft()
+            dropped += 1
+
+            self._mentions[sym] -= 1
+
+            pubs = self._publishers[sym]
+            pubs[publisher] -= 1
+
+            if pubs[publisher] <= 0:
+                del pubs[publisher]
+
+            if self._mentions[sym] <= 0:
+                del self._mentions[sym]
+                del self._publishers[sym]
+                self._last_seen.pop(sym, None)
+
+        seen_cutoff = now - self.seen_ttl
+
+        while self._seen_order and self._seen_order[0][0] < seen_cutoff:
+            _, item = self._seen_order.popleft()
+            self._seen.pop(item, None)
+
+        return dropped
+
+    def ranked(self, limit: Optional[int] = None) -> List[DiscoveredSymbol]:
+        """
+        Publisher-confirmed symbols first, then early candidates;
+        each group by mentions (desc), then symbol.
+        """
+
+        results = [
+            DiscoveredSymbol(
+                symbol=sym,
+                mentions=count,
+                publishers=tuple(sorted(self._publishers[sym])),
+                last_seen=self._last_seen[sym],
+            )
+            for sym, count in self._mentions.items()
+        ]
+
+        results.sort(key=lambda d: (not d.confirmed, -d.mentions, d.symbol))
+
+        if limit is not None:
+            return results[:limit]
+
+        return results
+
+
+# --------------------------------------------------
+# Discovery Service
+# --------------------------------------------------
+
+class DiscoveryService:
+    """
+    Concurrent publisher scan feeding a MentionIndex.
+
+    scan() fetches all publishers in parallel, skips feeds whose
+    body is unchanged since the last scan, and indexes only items
+    not seen before. Calls within min_interval of the last fetch
+    return the current ranking without network I/O.
+    """
 
-    for sym, mentions, pubcount, pubs in ranked:
+    def __init__(
+        self,
+        feeds: Optional[Dict[str, str]] = None,
+        window_seconds: float = DISCOVERY_WINDOW_SECONDS,
+        seen_ttl: Optional[float] = None,
+        min_interval: float = DISCOVERY_MIN_INTERVAL,
+        max_workers: int = 8,
+        http_client=None,
+        now_fn: Callable[[], float] = time.time,
+    ):
+        self.feeds = dict(feeds or RSS_FEEDS)
+        self.min_interval = min_interval
+        self.max_workers = max_workers
+        self.http_client = http_client
+        self._now = now_fn
 
-        if pubcount >= 2:
+        self.index = MentionIndex(window_seconds, seen_ttl)
 
-            publist = ",".join(sorted(pubs))
+        # _lock guards the index; _fetch_lock serializes network scans
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._feed_digest: Dict[str, str] = {}
+        self._last_scan: Optional[float] = None
 
-            print(f"{sym:<6} mentions={mentions}  publishers={pubcount}  [{publist}]")
+        self.scans = 0
+        self.items_indexed = 0
 
-            confirmed.append(sym)
+    def _fetch_all(self) -> Dict[str, Optional[str]]:
+
+        workers = max(1, min(self.max_workers, len(self.feeds)))
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                publisher: pool.submit(fetch_feed, url, self.http_client)
+                for publisher, url in self.feeds.items()
+            }
+
+        return {publisher: f.result() for publisher, f in futures.items()}
+
+    def _ingest(self, publisher: str, xml: str, now: float) -> int:
+
+        digest = hashlib.sha1(xml.encode("utf-8", "ignore")).hexdigest()
+
+        if self._feed_digest.get(publisher) == digest:
+            return 0
+
+        self._feed_digest[publisher] = digest
+        added = 0
+        cutoff = now - self.index.window_seconds
+
+        for key, text, published in parse_feed_entries(xml):
+
+            if self.index.seen(publisher, key):
+                continue
+
+            # Already outside the window: nothing to count
+            if published is not None and published < cutoff:
+                continue
+
+            if self.index.add(publisher, key, extract_symbols(text), now):
+                added += 1
+
+        HEADLINES_INGESTED.labels(source="discovery").inc(added)
+
+        return added
+
+    def scan(self, force: bool = False, limit: Optional[int] = None) -> List[DiscoveredSymbol]:
+        """
+        Ranked symbols. A due scan fetches without holding the
+        index lock; while another thread is fetching, non-forced
+        callers are served the current index.
+        """
+
+        with self._lock:
+            due = (
+                force
+                or self._last_scan is None
+                or (self._now() - self._last_scan) >= self.min_interval
+            )
+
+        if due and self._fetch_lock.acquire(blocking=force):
+
+            try:
+                bodies = self._fetch_all()
+                now = self._now()
+
+                with self._lock:
+
+                    for publisher, xml in bodies.items():
+                        if xml:
+                            self.items_indexed += self._ingest(publisher, xml, now)
+
+                    self._last_scan = now
+                    self.scans += 1
+
+            finally:
+                self._fetch_lock.release()
+
+        with self._lock:
+            self.index.expire(self._now())
+            return self.index.ranked(limit)
+
+    def symbols(self, force: bool = False, limit: Optional[int] = None) -> List[str]:
+        """
+        Ranked symbols only (confirmed first, then early).
+        """
+        return [d.symbol for d in self.scan(force=force, limit=limit)]
+
+
+_SERVICE: Optional[DiscoveryService] = None
+_SERVICE_LOCK = threading.Lock()
+
+
+def get_discovery_service() -> DiscoveryService:
+    """
+    Returns the process-wide discovery service.
+    """
+    global _SERVICE
+
+    if _SERVICE is None:
+        with _SERVICE_LOCK:
+            if _SERVICE is None:
+                _SERVICE = DiscoveryService()
+
+    return _SERVICE
+
+
+def set_discovery_service(service: Optional[DiscoveryService]) -> None:
+    """
+    Allows runtime service override (tests, replay).
+    """
+    global _SERVICE
+    _SERVICE = service
+
+
+# --------------------------------------------------
+# Discovery Engine
+# --------------------------------------------------
+
+def print_ranking(ranked):
+
+    print("\n--- Publisher Confirmed ---\n")
+
+    for d in ranked:
+
+        if d.confirmed:
+
+            publist = ",".join(d.publishers)
+
+            print(f"{d.symbol:<6} mentions={d.mentions}  publishers={d.publisher_count}  [{publist}]")
 
 
     print("\n--- Early Candidates ---\n")
 
-    for sym, mentions, pubcount, pubs in ranked:
+    for d in ranked:
+
+        if not d.confirmed:
+
+            print(f"{d.symbol:<6} mentions={d.mentions}")
+
+
+def discover(return_symbols=False, verbose=None):
+
+    if verbose is None:
+        verbose = not return_symbols
 
-        if pubcount == 1:
+    ranked = get_discovery_service().scan()
 
-            print(f"{sym:<6} mentions={mentions}")
+    if verbose:
 
-            early.append(sym)
+        print("\n=== MARKETMIND REAL DISCOVERY ===\n")
 
+        print_ranking(ranked)
 
-    print("\n=== DISCOVERY COMPLETE ===\n")
+        print("\n=== DISCOVERY COMPLETE ===\n")
 
 
     # ------------------------------------------
@@ -219,7 +564,7 @@ def discover(return_symbols=False):
     if return_symbols:
 
         # confirmed first, then early candidates
-        return confirmed + early
+        return [d.symbol for d in ranked]
 
 
 # --------------------------------------------------
@@ -0,0 +1,511 @@
+"""
+Symbol Universe Service
+-----------------------
+Single in-memory view of the tradable universe.
+
+Sources (first available wins, no network):
+1. Precompiled snapshot (pickle) if compiled from the DB's
+   current sync version (file mtimes are not used: WAL
+   checkpoints move the DB mtime independently of content)
+2. asset_universe.db (built by build_asset_universe.py)
+3. Bundled fallback: data/tickers.txt + core seed symbols
+
+The loaded universe is an immutable UniverseSnapshot:
+- frozenset of symbols for O(1) membership
+- symbol -> row index
+- column arrays for exchange / shortable / marginable
+
+Refresh builds a new snapshot off to the side and swaps a
+single reference, so readers never see a partial universe.
+refresh_if_changed() only reloads when the DB's sync version
+(see data/asset_universe_sync.py) has moved.
+
+Keeping it current:
+- every successful sync calls on_universe_synced(), which
+  compiles the snapshot from the DB and refreshes the shared
+  universe when it is loaded in the syncing process
+- processes that do not sync (the API server) run a
+  UniverseRefreshWorker that polls refresh_if_changed()
+
+Configuration via environment:
+
+    MARKETMIND_UNIVERSE_REFRESH_SECONDS   refresh poll interval
+"""
+
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from marketmind_engine.data.asset_universe_sync import get_universe_version
+
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+DEFAULT_DB_PATH = Path(
+    os.getenv("MARKETMIND_ASSET_DB", str(_REPO_ROOT / "asset_universe.db"))
+)
+DEFAULT_SNAPSHOT_PATH = DEFAULT_DB_PATH.with_suffix(".snapshot")
+
+REFRESH_INTERVAL_SECONDS = float(os.getenv("MARKETMIND_UNIVERSE_REFRESH_SECONDS", "300"))
+FALLBACK_TICKERS_PATH = Path(__file__).resolve().parent.parent / "data" / "tickers.txt"
+
+# Core high-liquidity universe (always valid when no DB exists)
+SEED_SYMBOLS = (
+    "SPY", "QQQ", "DIA", "IWM",
+    "NVDA", "AMD", "TSLA", "AAPL", "MSFT",
+    "META", "AMZN", "GOOGL",
+    "LMT", "RTX", "NOC",
+    "LLY", "ILMN",
+    "ROKU", "PINS",
+    "RKLB",
+)
+
+SNAPSHOT_FORMAT = 2
+
+
+@dataclass(frozen=True)
+class UniverseSnapshot:
+    """
+    Immutable universe view. Never mutated after build.
+    """
+
+    symbols: FrozenSet[str]
+    index: Dict[str, int]
+    exchange: Tuple[str, ...]
+    shortable: array
+    marginable: array
+    source: str
+    loaded_at: float
+    version: Optional[int] = None       # universe_meta version loaded
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @classmethod
+    def build(
+        cls,
+        rows: Iterable[Tuple[str, Optional[str], bool, bool]],
+        source: str,
+        version: Optional[int] = None,
+    ) -> "UniverseSnapshot":
+        """
+        rows: (symbol, exchange, shortable, marginable)
+        """
+
+        index: Dict[str, int] = {}
+        exchange: List[str] = []
+        shortable = array("B")
+        marginable = array("B")
+
+        for symbol, exch, short, margin in rows:
+            if not symbol:
+                continue
+
+            symbol = symbol.upper()
+
+            if symbol in index:
+                continue
+
+            index[symbol] = len(exchange)
+            exchange.append(exch or "")
+            shortable.append(1 if short else 0)
+            marginable.append(1 if margin else 0)
+
+        return cls(
+            symbols=frozenset(index),
+            index=index,
+            exchange=tuple(exchange),
+            shortable=shortable,
+            marginable=marginable,
+            source=source,
+            loaded_at=time.time(),
+            version=version,
+        )
+
+
+# ==================================================
+# LOADERS
+# ==================================================
+
+def load_from_db(db_path: Path, version: Optional[int] = None) -> UniverseSnapshot:
+
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+
+    try:
+        rows = conn.execute(
+            "SELECT symbol, exchange, shortable, marginable FROM assets"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    return UniverseSnapshot.build(rows, source=f"db:{db_path.name}", version=version)
+
+
+def load_from_snapshot(snapshot_path: Path) -> UniverseSnapshot:
+
+    with open(snapshot_path, "rb") as f:
+        payload = pickle.load(f)
+
+    if payload.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"Unsupported universe snapshot format: {payload.get('format')}")
+
+    rows = zip(
+        payload["symbols"],
+        payload["exchange"],
+        payload["shortable"],
+        payload["marginable"],
+    )
+
+    return UniverseSnapshot.build(
+        rows,
+        source=f"snapshot:{snapshot_path.name}",
+        version=payload.get("version"),
+    )
+
+
+def load_fallback() -> UniverseSnapshot:
+
+    symbols = list(SEED_SYMBOLS)
+
+    if FALLBACK_TICKERS_PATH.exists():
+        with open(FALLBACK_TICKERS_PATH) as f:
+            symbols.extend(line.strip().upper() for line in f if line.strip())
+
+    return UniverseSnapshot.build(
+        ((s, None, False, False) for s in symbols),
+        source="fallback",
+    )
+
+
+def compile_snapshot(universe: UniverseSnapshot, snapshot_path: Path) -> Path:
+    """
+    Write a precompiled snapshot (atomic rename).
+    """
+
+    ordered = sorted(universe.index, key=universe.index.get)
+
+    payload = {
+        "format": SNAPSHOT_FORMAT,
+        "version": universe.version,
+        "symbols": ordered,
+        "exchange": list(universe.exchange),
+        "shortable": universe.shortable.tolist(),
+        "marginable": universe.marginable.tolist(),
+    }
+
+    tmp_path = snapshot_path.with_suffix(snapshot_path.suffix + ".tmp")
+
+    with open(tmp_path, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    os.replace(tmp_path, snapshot_path)
+    return snapshot_path
+
+
+def compile_from_db(db_path: Path, snapshot_path: Optional[Path] = None) -> Path:
+    """
+    Compile the snapshot straight from the DB, stamped with the
+    DB's sync version.
+    """
+
+    db_path = Path(db_path)
+
+    # Version is read before the rows: if a sync lands in between,
+    # the snapshot carries the older version and load() skips it
+    version = get_universe_version(db_path)
+    universe = load_from_db(db_path, version=version)
+
+    return compile_snapshot(
+        universe,
+        Path(snapshot_path) if snapshot_path else db_path.with_suffix(".snapshot"),
+    )
+
+
+# ==================================================
+# SERVICE
+# ==================================================
+
+class SymbolUniverse:
+    """
+    Shared universe service.
+
+    Reads are lock-free: they dereference the current
+    snapshot once and use only that object.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        snapshot_path: Optional[Path] = None,
+    ):
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.snapshot_path = (
+            Path(snapshot_path) if snapshot_path
+            else self.db_path.with_suffix(".snapshot")
+        )
+
+        self._refresh_lock = threading.Lock()
+        self._version = get_universe_version(self.db_path)
+        self._snapshot: UniverseSnapshot = self._load()
+
+    # --------------------------------------------------
+    # Loading
+    # --------------------------------------------------
+
+    def _load(self) -> UniverseSnapshot:
+        """
+        Caller has read self._version (the DB sync version).
+        """
+
+        db_exists = self.db_path.exists()
+
+        if self.snapshot_path.exists():
+            try:
+                snap = load_from_snapshot(self.snapshot_path)
+
+                # Without a DB version the snapshot can't be checked
+                if not db_exists or (
+                    self._version is not None and snap.version == self._version
+                ):
+                    return snap
+            except Exception:
+                pass
+
+        if db_exists:
+            try:
+                return load_from_db(self.db_path, version=self._version)
+            except Exception:
+                pass
+
+        return load_fallback()
+
+    def refresh(self) -> bool:
+        """
+        Reload from disk and atomically swap the snapshot.
+        Returns True if the symbol set changed.
+        """
+
+        with self._refresh_lock:
+            self._version = get_universe_version(self.db_path)
+            fresh = self._load()
+            changed = fresh.symbols != self._snapshot.symbols
+            self._snapshot = fresh
+
+        return changed
+
+    def refresh_if_changed(self) -> bool:
+        """
+        Reload only if the DB sync version moved since the
+        last load. Returns True if a reload happened.
+        """
+
+        version = get_universe_version(self.db_path)
+
+        if version is None or version == self._version:
+            return False
+
+        self.refresh()
+        return True
+
+    def compile(self) -> Path:
+        """
+        Precompile the current universe for fast startup.
+        """
+        return compile_snapshot(self._snapshot, self.snapshot_path)
+
+    # --------------------------------------------------
+    # Reads
+    # --------------------------------------------------
+
+    @property
+    def snapshot(self) -> UniverseSnapshot:
+        return self._snapshot
+
+    @property
+    def symbols(self) -> FrozenSet[str]:
+        return self._snapshot.symbols
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    def __contains__(self, symbol: str) -> bool:
+        return self.is_valid(symbol)
+
+    def is_valid(self, symbol: str) -> bool:
+        if not symbol:
+            return False
+        return symbol.upper() in self._snapshot.symbols
+
+    def validate_many(self, symbols: Iterable[str]) -> List[str]:
+        """
+        Return the valid symbols (uppercased), order preserved,
+        duplicates removed.
+        """
+
+        members = self._snapshot.symbols
+        valid: List[str] = []
+        seen = set()
+
+        for s in symbols:
+            if not s:
+                continue
+
+            s = s.upper()
+
+            if s in members and s not in seen:
+                valid.append(s)
+                seen.add(s)
+
+        return valid
+
+    def metadata(self, symbol: str) -> Optional[Dict[str, object]]:
+
+        snap = self._snapshot
+        row = snap.index.get((symbol or "").upper())
+
+        if row is None:
+            return None
+
+        return {
+            "symbol": symbol.upper(),
+            "exchange": snap.exchange[row],
+            "shortable": bool(snap.shortable[row]),
+            "marginable": bool(snap.marginable[row]),
+        }
+
+    def info(self) -> Dict[str, object]:
+        snap = self._snapshot
+        return {
+            "source": snap.source,
+            "count": len(snap),
+            "loaded_at": snap.loaded_at,
+            "version": self._version,
+        }
+
+
+# ==================================================
+# SHARED INSTANCE
+# ==================================================
+
+_UNIVERSE: Optional[SymbolUniverse] = None
+_UNIVERSE_LOCK = threading.Lock()
+
+
+def get_universe() -> SymbolUniverse:
+    """
+    Returns the process-wide universe (loaded on first use).
+    """
+    global _UNIVERSE
+
+    if _UNIVERSE is None:
+        with _UNIVERSE_LOCK:
+            if _UNIVERSE is None:
+                _UNIVERSE = SymbolUniverse()
+
+    return _UNIVERSE
+
+
+def set_universe(universe: Optional[SymbolUniverse]) -> None:
+    """
+    Allows runtime universe override (tests, replay).
+    """
+    global _UNIVERSE
+    _UNIVERSE = universe
+
+
+def on_universe_synced(db_path: Path) -> None:
+    """
+    Post-sync hook: compile the snapshot for db_path and refresh
+    the shared universe if it is loaded from that DB.
+    """
+
+    db_path = Path(db_path)
+    compile_from_db(db_path)
+
+    universe = _UNIVERSE
+
+    if universe is not None and universe.db_path.resolve() == db_path.resolve():
+        universe.refresh_if_changed()
+
+
+# ==================================================
+# BACKGROUND REFRESH
+# ==================================================
+
+class UniverseRefreshWorker:
+    """
+    Daemon thread that reloads the universe after a sync in
+    another process (build_asset_universe.py).
+    """
+
+    def __init__(
+        self,
+        universe: Optional[SymbolUniverse] = None,
+        interval_seconds: float = REFRESH_INTERVAL_SECONDS,
+    ):
+        self.universe = universe
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "UniverseRefreshWorker":
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="universe-refresh",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self.check()
+
+    def check(self) -> bool:
+        """
+        One refresh_if_changed() pass. Returns True on reload.
+        """
+        try:
+            universe = self.universe or get_universe()
+            reloaded = universe.refresh_if_changed()
+        except Exception as e:
+            print(f"[UNIVERSE] Refresh failed: {e}")
+            return False
+
+        if reloaded:
+            info = universe.info()
+            print(f"[UNIVERSE] Reloaded {info['count']} symbols (version {info['version']})")
+
+        return reloaded
+
+
+_REFRESH_WORKER: Optional[UniverseRefreshWorker] = None
+
+
+def start_universe_refresh(
+    interval_seconds: float = REFRESH_INTERVAL_SECONDS,
+) -> UniverseRefreshWorker:
+    """
+    Start the shared refresh worker (idempotent).
+    """
+    global _REFRESH_WORKER
+
+    with _UNIVERSE_LOCK:
+        if _REFRESH_WORKER is None:
+            _REFRESH_WORKER = UniverseRefreshWorker(interval_seconds=interval_seconds)
+
+    return _REFRESH_WORKER.start()
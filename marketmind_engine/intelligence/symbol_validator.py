@@ -1,46 +1,30 @@
-from typing import Set
+from typing import FrozenSet, Iterable, List, Optional
 
-import yfinance as yf
+from marketmind_engine.intelligence.symbol_universe import (
+    SymbolUniverse,
+    get_universe,
+)
+from marketmind_engine.telemetry.metrics import SYMBOLS_FILTERED, SYMBOLS_VALIDATED
 
 
 class SymbolValidator:
     """
-    Maintains a universe of tradable symbols and validates candidates.
-    Cached in memory so the engine loop stays fast.
-    """
-
-    def __init__(self):
-
-        self.valid_symbols: Set[str] = set()
-
-        self._build_universe()
-
-    def _build_universe(self):
+    Validates candidate symbols against the shared universe.
 
-        # Core high-liquidity universe (fast + reliable)
-        seed = [
-            "SPY", "QQQ", "DIA", "IWM",
-            "NVDA", "AMD", "TSLA", "AAPL", "MSFT",
-            "META", "AMZN", "GOOGL",
-            "LMT", "RTX", "NOC",
-            "LLY", "ILMN",
-            "ROKU", "PINS",
-            "RKLB"
-        ]
-
-        for s in seed:
-            self.valid_symbols.add(s)
-
-        # Attempt to extend with Yahoo data (optional)
-        try:
+    Backed by SymbolUniverse (asset_universe.db or its
+    precompiled snapshot), so construction does no network
+    I/O and lookups are O(1).
+    """
 
-            tickers = yf.Tickers("SPY QQQ NVDA AMD TSLA")
+    def __init__(self, universe: Optional[SymbolUniverse] = None):
+        self.universe = universe or get_universe()
 
-            for t in tickers.tickers.keys():
-                self.valid_symbols.add(t.upper())
+    @property
+    def valid_symbols(self) -> FrozenSet[str]:
+        return self.universe.symbols
 
-        except Exception:
-            pass
+    def refresh(self) -> bool:
+        return self.universe.refresh()
 
     def is_valid(self, symbol: str) -> bool:
 
@@ -56,7 +40,33 @@ class SymbolValidator:
         if not symbol.isalpha():
             return False
 
-        if self.valid_symbols and symbol not in self.valid_symbols:
+        valid_symbols = self.universe.symbols
+
+        if valid_symbols and symbol not in valid_symbols:
             return False
 
-        return True
\ No newline at end of file
+        return True
+
+    def validate_many(self, symbols: Iterable[str]) -> List[str]:
+        """
+        Batch form of is_valid. Uppercased, order preserved,
+        duplicates removed.
+        """
+
+        symbols = list(symbols)
+
+        sane = [
+            s for s in symbols
+            if s and len(s) <= 5 and s.isalpha()
+        ]
+
+        if not self.universe.symbols:
+            valid = list(dict.fromkeys(s.upper() for s in sane))
+        else:
+            valid = self.universe.validate_many(sane)
+
+        candidates = {s.upper() for s in symbols if s}
+        SYMBOLS_VALIDATED.inc(len(valid))
+        SYMBOLS_FILTERED.inc(max(0, len(candidates) - len(valid)))
+
+        return valid
@@ -0,0 +1,157 @@
+import threading
+
+from marketmind_engine.intelligence import symbol_discovery
+from marketmind_engine.intelligence.symbol_discovery import DiscoveryService
+
+
+def _rss(*items):
+    body = "".join(
+        f"<item><guid>{guid}</guid><title>{title}</title></item>"
+        for guid, title in items
+    )
+    return f"<rss><channel>{body}</channel></rss>"
+
+
+class FakeResponse:
+
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeHttp:
+
+    def __init__(self, bodies):
+        self.bodies = bodies
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        return FakeResponse(self.bodies[url])
+
+
+class Clock:
+
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+def _service(monkeypatch, bodies, **kwargs):
+    monkeypatch.setattr(symbol_discovery, "TICKERS", {"NVDA", "AMD", "LMT"})
+    http = FakeHttp(bodies)
+    clock = Clock()
+    service = DiscoveryService(
+        feeds={"a": "A", "b": "B"},
+        http_client=http,
+        now_fn=clock,
+        **kwargs,
+    )
+    return service, http, clock
+
+
+def test_ranks_confirmed_before_early(monkeypatch):
+    service, _, _ = _service(monkeypatch, {
+        "A": _rss(("1", "NVDA and AMD rally"), ("2", "AMD again")),
+        "B": _rss(("9", "NVDA beats")),
+    })
+
+    ranked = service.scan()
+
+    assert [d.symbol for d in ranked] == ["NVDA", "AMD"]
+    assert ranked[0].confirmed and ranked[0].publishers == ("a", "b")
+    assert ranked[1].mentions == 2 and not ranked[1].confirmed
+
+
+def test_only_new_items_are_counted(monkeypatch):
+    bodies = {"A": _rss(("1", "NVDA up")), "B": _rss()}
+    service, http, clock = _service(monkeypatch, bodies, min_interval=60)
+
+    service.scan()
+    assert service.scan()[0].mentions == 1
+    assert http.calls == 2          # second call served from the index
+
+    clock.t += 60
+    bodies["A"] = _rss(("1", "NVDA up"), ("2", "NVDA again"))
+    ranked = service.scan()
+
+    assert http.calls == 4
+    assert ranked[0].mentions == 2
+    assert service.items_indexed == 2
+
+
+def test_mentions_expire_with_window(monkeypatch):
+    service, _, clock = _service(
+        monkeypatch,
+        {"A": _rss(("1", "LMT contract")), "B": _rss()},
+        window_seconds=100,
+        min_interval=1000,
+    )
+
+    assert service.symbols() == ["LMT"]
+
+    clock.t += 101
+    assert service.symbols() == []
+
+
+def test_expired_items_still_listed_are_not_recounted(monkeypatch):
+    bodies = {"A": _rss(("1", "LMT contract")), "B": _rss()}
+    service, _, clock = _service(
+        monkeypatch, bodies, window_seconds=100, min_interval=0,
+    )
+
+    assert service.symbols() == ["LMT"]
+
+    # Mention expired, but the feed still lists item 1 next to a new one
+    clock.t += 150
+    bodies["A"] = _rss(("1", "LMT contract"), ("2", "NVDA news"))
+
+    assert service.symbols() == ["NVDA"]
+
+
+def test_items_published_before_the_window_are_skipped(monkeypatch):
+    feed = (
+        "<rss><channel>"
+        "<item><guid>old</guid><title>LMT</title>"
+        "<pubDate>Tue, 10 Mar 2026 08:00:00 GMT</pubDate></item>"
+        "<item><guid>new</guid><title>AMD</title>"
+        "<pubDate>Tue, 10 Mar 2026 14:30:00 GMT</pubDate></item>"
+        "</channel></rss>"
+    )
+    service, _, clock = _service(monkeypatch, {"A": feed, "B": _rss()}, window_seconds=3600)
+
+    clock.t = 1773154800.0       # 2026-03-10 15:00 UTC
+
+    assert service.symbols() == ["AMD"]
+
+
+def test_scan_does_not_hold_the_index_lock_while_fetching(monkeypatch):
+    service, http, clock = _service(
+        monkeypatch, {"A": _rss(("1", "NVDA up")), "B": _rss()}, min_interval=60,
+    )
+    service.scan()
+
+    started = threading.Event()
+    release = threading.Event()
+    get = http.get
+
+    def slow_get(url, **kwargs):
+        started.set()
+        release.wait(5)
+        return get(url, **kwargs)
+
+    http.get = slow_get
+    clock.t += 60
+
+    scanner = threading.Thread(target=service.scan)
+    scanner.start()
+    assert started.wait(5)
+
+    # Served from the index while the fetch is in flight
+    assert service.symbols() == ["NVDA"]
+    assert scanner.is_alive()
+
+    release.set()
+    scanner.join(5)
+    assert service.scans == 2
@@ -0,0 +1,242 @@
+import threading
+
+import pytest
+
+from marketmind_engine.intelligence.propagation_engine import (
+    PropagationEngine,
+    RunningStats,
+)
+
+
+class FakeProvider:
+
+    def __init__(self, changes):
+        self.changes = changes
+        self.calls = []
+
+    def get_batch_data(self, symbols):
+        self.calls.append(list(symbols))
+        return {
+            s: {"percent_change": self.changes.get(s)}
+            for s in symbols
+        }
+
+
+class FakeController:
+
+    def __init__(self):
+        self.positions = []
+
+    def get_open_positions(self):
+        return self.positions
+
+
+class FakeRSS:
+
+    def get_evaluated_symbols(self):
+        return ["NVDA"]
+
+
+class Clock:
+
+    def __init__(self):
+        self.t = 1000.0
+
+    def __call__(self):
+        return self.t
+
+
+def _engine(changes, ttl=30.0):
+    provider = FakeProvider(changes)
+    clock = Clock()
+    engine = PropagationEngine(
+        provider=provider,
+        engine_controller=FakeController(),
+        rss_service=FakeRSS(),
+        composite_ttl=ttl,
+        now_fn=clock,
+    )
+    return engine, provider, clock
+
+
+def test_running_stats_matches_batch():
+    values = [1.0, 4.0, -2.0, 3.5]
+    stats = RunningStats()
+
+    for v in values:
+        stats.push(v)
+
+    m = sum(values) / len(values)
+    assert stats.mean == pytest.approx(m)
+    assert stats.variance == pytest.approx(sum((v - m) ** 2 for v in values) / len(values))
+    assert (stats.min, stats.max) == (-2.0, 4.0)
+
+
+def test_update_refreshes_only_changed_layers():
+    engine, provider, _ = _engine({"SPY": 1.0, "QQQ": 2.0, "NVDA": 3.0})
+
+    assert engine.update(["NVDA"]) == ["structural", "narrative", "capital"]
+    assert engine.update(["NVDA"]) == []
+
+    provider.changes["NVDA"] = 5.0
+    assert engine.update(["NVDA"]) == ["narrative"]
+
+    stats = engine.stats()
+    assert stats["structural"]["bias"]["count"] == 1
+    assert stats["narrative"]["bias"]["count"] == 2
+    assert stats["narrative"]["bias"]["max"] == 5.0
+
+
+def test_snapshot_served_from_cache_within_ttl():
+    engine, provider, clock = _engine({"SPY": 1.0, "NVDA": 2.0}, ttl=30.0)
+
+    engine.update(["NVDA"])
+    calls = len(provider.calls)
+
+    clock.t += 10
+    first = engine.snapshot()
+    second = engine.snapshot()
+
+    assert len(provider.calls) == calls
+    assert first["narrative"]["bias"] == 2.0
+    assert second["age"] == 10.0
+
+    clock.t += 30
+    engine.snapshot()
+    assert len(provider.calls) > calls
+
+
+def test_snapshot_without_update_bootstraps():
+    engine, provider, _ = _engine({"SPY": 1.0, "NVDA": -1.0})
+
+    snap = engine.snapshot()
+
+    assert snap["mode"] == "propagation_live"
+    assert snap["structural"]["bias"] == 1.0
+    assert snap["narrative"]["bias"] == -1.0
+
+
+def test_single_union_fetch_per_update():
+    engine, provider, clock = _engine({"SPY": 1.0, "SMH": 2.0, "NVDA": 4.0})
+
+    engine.update(["SMH", "NVDA"])
+
+    assert len(provider.calls) == 1
+    fetched = provider.calls[0]
+    assert len(fetched) == len(set(fetched))
+    assert "SMH" in fetched and "NVDA" in fetched
+
+    snap = engine.snapshot()
+    assert snap["narrative"]["bias"] == 3.0
+    assert snap["data_age"] == 0.0
+
+    clock.t += 5
+    assert engine.snapshot()["data_age"] == 5.0
+
+
+def test_snapshot_parts_match_snapshot():
+    engine, provider, clock = _engine({"SPY": 1.0, "NVDA": 2.0})
+
+    engine.update(["NVDA"])
+    clock.t += 4
+
+    version, body, volatile = engine.snapshot_parts()
+    assert {**body, **volatile} == engine.snapshot()
+    assert volatile["age"] == 4.0
+
+    # Body object is reused until the composite is rebuilt
+    assert engine.snapshot_parts()[1] is body
+
+    provider.changes["NVDA"] = 6.0
+    engine.update(["NVDA"])
+
+    new_version, new_body, _ = engine.snapshot_parts()
+    assert new_version == version + 1
+    assert new_body["narrative"]["bias"] == 6.0
+
+
+def test_snapshot_not_blocked_by_inflight_fetch():
+    engine, provider, clock = _engine({"SPY": 1.0, "NVDA": 2.0}, ttl=30.0)
+    engine.update(["NVDA"])
+
+    started = threading.Event()
+    release = threading.Event()
+    fetch = provider.get_batch_data
+
+    def slow_fetch(symbols):
+        started.set()
+        release.wait(5)
+        return fetch(symbols)
+
+    provider.get_batch_data = slow_fetch
+    provider.changes["NVDA"] = 6.0
+
+    loop = threading.Thread(target=engine.update, args=(["NVDA"],))
+    loop.start()
+    assert started.wait(5)
+
+    # Expired and a refresh is in flight: served from the cache
+    clock.t += 60
+    snap = engine.snapshot()
+    version, _, _ = engine.snapshot_parts()
+
+    assert snap["narrative"]["bias"] == 2.0
+    assert loop.is_alive()
+
+    release.set()
+    loop.join(5)
+
+    assert engine.snapshot_parts()[0] == version + 1
+    assert engine.snapshot()["narrative"]["bias"] == 6.0
+
+
+def test_last_narrative_set_expires_without_rss_source():
+    provider = FakeProvider({"SPY": 1.0, "NVDA": 2.0})
+    clock = Clock()
+    engine = PropagationEngine(
+        provider=provider,
+        engine_controller=FakeController(),
+        rss_service=None,
+        composite_ttl=30.0,
+        narrative_ttl=120.0,
+        now_fn=clock,
+    )
+
+    engine.update(["NVDA"])
+
+    clock.t += 60
+    engine.update()
+    assert "NVDA" in provider.calls[-1]
+
+    clock.t += 120
+    engine.update()
+    assert "NVDA" not in provider.calls[-1]
+    assert engine.snapshot()["narrative"]["bias"] == 0.0
+
+
+def test_failed_fetch_keeps_layers_and_stats():
+    engine, provider, clock = _engine({"SPY": 1.0, "QQQ": 3.0, "NVDA": 2.0})
+    engine.update(["NVDA"])
+
+    before = engine.stats()
+    snap = engine.snapshot()
+
+    # Provider error, then an outage reported as null changes
+    def broken(symbols):
+        raise ConnectionError("provider down")
+
+    provider.get_batch_data = broken
+    clock.t += 5
+    assert engine.update(["NVDA"]) == []
+
+    del provider.get_batch_data
+    provider.changes = {}
+    clock.t += 5
+    assert engine.update(["NVDA"]) == []
+
+    after = engine.snapshot()
+    assert engine.stats() == before
+    assert after["structural"] == snap["structural"]
+    assert after["narrative"] == snap["narrative"]
+    assert after["data_age"] == 10.0
+    assert engine.failed_reads == 4
@@ -0,0 +1,107 @@
+import os
+import sqlite3
+
+from marketmind_engine.intelligence.symbol_universe import SymbolUniverse
+from marketmind_engine.intelligence.symbol_validator import SymbolValidator
+
+
+def _write_db(path, rows):
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS assets (
+            symbol TEXT PRIMARY KEY, name TEXT, asset_class TEXT,
+            exchange TEXT, status TEXT, tradable BOOLEAN,
+            marginable BOOLEAN, shortable BOOLEAN, easy_to_borrow BOOLEAN
+        )
+    """)
+    conn.execute("DELETE FROM assets")
+    conn.executemany(
+        "INSERT INTO assets VALUES (?, ?, 'us_equity', ?, 'active', 1, ?, ?, 0)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+ROWS = [
+    ("NVDA", "NVIDIA", "NASDAQ", 1, 1),
+    ("LMT", "Lockheed", "NYSE", 1, 0),
+]
+
+
+def test_loads_db_with_metadata(tmp_path):
+    db = tmp_path / "asset_universe.db"
+    _write_db(db, ROWS)
+
+    universe = SymbolUniverse(db_path=db)
+
+    assert universe.is_valid("nvda")
+    assert not universe.is_valid("ZZZZ")
+    assert universe.metadata("LMT") == {
+        "symbol": "LMT",
+        "exchange": "NYSE",
+        "shortable": False,
+        "marginable": True,
+    }
+    assert universe.info()["source"] == "db:asset_universe.db"
+
+
+def test_validate_many_preserves_order_and_dedupes(tmp_path):
+    db = tmp_path / "asset_universe.db"
+    _write_db(db, ROWS)
+
+    universe = SymbolUniverse(db_path=db)
+
+    assert universe.validate_many(["lmt", "XXX", "NVDA", "LMT", ""]) == ["LMT", "NVDA"]
+
+
+def test_refresh_swaps_atomically(tmp_path):
+    db = tmp_path / "asset_universe.db"
+    _write_db(db, ROWS)
+
+    universe = SymbolUniverse(db_path=db)
+    before = universe.snapshot
+
+    _write_db(db, ROWS + [("RKLB", "Rocket Lab", "NASDAQ", 1, 1)])
+
+    assert universe.refresh() is True
+    assert universe.is_valid("RKLB")
+
+    # Old snapshot object is untouched
+    assert "RKLB" not in before.symbols
+    assert universe.refresh() is False
+
+
+def test_compiled_snapshot_round_trip(tmp_path):
+    db = tmp_path / "asset_universe.db"
+    _write_db(db, ROWS)
+
+    universe = SymbolUniverse(db_path=db)
+    snapshot_path = universe.compile()
+
+    # Snapshot is used when the DB is gone
+    os.remove(db)
+    reloaded = SymbolUniverse(db_path=db, snapshot_path=snapshot_path)
+
+    assert reloaded.symbols == universe.symbols
+    assert reloaded.metadata("NVDA")["shortable"] is True
+    assert reloaded.info()["source"].startswith("snapshot:")
+
+
+def test_missing_db_uses_bundled_fallback(tmp_path):
+    universe = SymbolUniverse(db_path=tmp_path / "missing.db")
+
+    assert universe.info()["source"] == "fallback"
+    assert universe.is_valid("SPY")
+
+
+def test_validator_keeps_sanity_rules(tmp_path):
+    db = tmp_path / "asset_universe.db"
+    _write_db(db, ROWS + [("BRK.B", "Berkshire", "NYSE", 1, 1)])
+
+    validator = SymbolValidator(SymbolUniverse(db_path=db))
+
+    assert validator.is_valid("nvda")
+    assert not validator.is_valid("BRK.B")
+    assert not validator.is_valid("AAPL")
+    assert validator.validate_many(["NVDA", "BRK.B", "lmt"]) == ["NVDA", "LMT"]
@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+
+import pytest
+
+from marketmind_engine.data.price_cache import PriceCache
+from marketmind_engine.intelligence import trade_card
+
+
+class FakeQuoteClient:
+
+    def __init__(self):
+        self.requests = []
+
+    def get_stock_latest_quote(self, req):
+        symbols = list(req.symbol_or_symbols)
+        self.requests.append(symbols)
+        return {
+            s: SimpleNamespace(ask_price=5.0 + i, bid_price=0.0)
+            for i, s in enumerate(symbols)
+        }
+
+
+@pytest.fixture
+def client():
+    fake = FakeQuoteClient()
+    trade_card.set_client(fake)
+    yield fake
+    trade_card.set_client(None)
+
+
+def test_prices_fetched_in_chunks(client):
+    symbols = [f"S{i:03d}" for i in range(200)]
+
+    prices = trade_card.get_prices(symbols, chunk_size=100, cache=PriceCache())
+
+    assert len(client.requests) == 2
+    assert all(prices[s] is not None for s in symbols)
+
+
+def test_cached_prices_are_not_refetched(client):
+    cache = PriceCache()
+    cache.put("NVDA", 120.0)
+
+    prices = trade_card.get_prices(["NVDA", "AMD"], cache=cache)
+
+    assert prices["NVDA"] == 120.0
+    assert client.requests == [["AMD"]]
+
+    # Second call reuses the cached quote
+    trade_card.get_prices(["AMD"], cache=cache)
+    assert client.requests == [["AMD"]]
+
+
+def test_quotes_do_not_overwrite_last_trade_prices(client):
+    cache = PriceCache()
+
+    prices = trade_card.get_prices(["AMD"], cache=cache)
+
+    assert prices["AMD"] == 5.0
+    assert cache.get("AMD") is None
+    assert cache.get(("quote", "AMD")) == 5.0
+
+
+def test_rank_candidates_matches_scalar_scoring():
+    ranked = trade_card.rank_candidates({"A": 5.0, "B": 20.0, "C": 75.0, "D": None})
+
+    assert [c["symbol"] for c in ranked] == ["B", "C", "A"]
+    assert [c["score"] for c in ranked] == [0.8, 0.7, 0.6]
+    assert trade_card.score_symbol(10.0) == 0.8
+    assert trade_card.score_symbol(50.0) == 0.7
+
+
+def test_rank_candidates_keeps_input_order_on_ties():
+    prices = {"X": 12.0, "Y": 30.0, "Z": 8.0, "W": 49.99, "V": 10.0}
+
+    ranked = trade_card.rank_candidates(prices)
+
+    assert [c["symbol"] for c in ranked] == ["X", "Y", "W", "V", "Z"]
+    assert all(c["score"] == trade_card.score_symbol(prices[c["symbol"]]) for c in ranked)
+    assert trade_card.rank_candidates({}) == []
@@ -15,53 +15,150 @@ LIVE MARKET DATA ONLY
 """
 
 import os
+import threading
+from bisect import bisect_right
 from datetime import datetime, UTC
 
+import numpy as np
+
 from alpaca.data.historical import StockHistoricalDataClient
 from alpaca.data.requests import StockLatestQuoteRequest
 
+from marketmind_engine.data.price_cache import PRICE_CACHE
 from marketmind_engine.intelligence.symbol_discovery import discover
 
 
 # --------------------------------------------------
-# Alpaca Configuration
+# Alpaca Configuration (lazy)
 # --------------------------------------------------
 
-API_KEY = os.getenv("APCA_API_KEY_ID")
-API_SECRET = os.getenv("APCA_API_SECRET_KEY")
+# Symbols per latest-quote request
+QUOTE_CHUNK_SIZE = int(os.getenv("MARKETMIND_QUOTE_CHUNK", "100"))
+
+# Cached prices younger than this are reused.
+# Quotes are cached under ("quote", SYMBOL) so they never
+# overwrite last-trade prices (plain SYMBOL keys) used for sizing.
+QUOTE_MAX_AGE_SECONDS = float(os.getenv("MARKETMIND_QUOTE_MAX_AGE", "15"))
+
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_client():
 
-if not API_KEY or not API_SECRET:
-    raise RuntimeError("Alpaca API keys not found in environment variables")
+    global _CLIENT
 
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
 
-client = StockHistoricalDataClient(API_KEY, API_SECRET)
+                api_key = os.getenv("APCA_API_KEY_ID")
+                api_secret = os.getenv("APCA_API_SECRET_KEY")
+
+                if not api_key or not api_secret:
+                    raise RuntimeError("Alpaca API keys not found in environment variables")
+
+                _CLIENT = StockHistoricalDataClient(api_key, api_secret)
+
+    return _CLIENT
+
+
+def set_client(client):
+    """
+    Allows runtime client override (tests, replay).
+    """
+    global _CLIENT
+    _CLIENT = client
 
 
 # --------------------------------------------------
-# Market Data Lookup (LIVE)
+# Market Data Lookup (LIVE, batched)
 # --------------------------------------------------
 
-def get_price(symbol):
+def _quote_price(q):
 
-    try:
+    if not q:
+        return None
 
-        req = StockLatestQuoteRequest(symbol_or_symbols=[symbol])
+    # Prefer ask price if available
+    if q.ask_price and q.ask_price > 0:
+        return float(q.ask_price)
 
-        quote = client.get_stock_latest_quote(req)
+    if q.bid_price and q.bid_price > 0:
+        return float(q.bid_price)
 
-        q = quote.get(symbol)
+    return None
 
-        if not q:
-            return None
 
-        # Prefer ask price if available
-        if q.ask_price and q.ask_price > 0:
-            return float(q.ask_price)
+def _quote_key(symbol):
+    return ("quote", symbol)
 
-        if q.bid_price and q.bid_price > 0:
-            return float(q.bid_price)
 
-        return None
+def get_prices(
+    symbols,
+    max_age=QUOTE_MAX_AGE_SECONDS,
+    chunk_size=QUOTE_CHUNK_SIZE,
+    cache=None,
+):
+    """
+    Latest prices for many symbols.
+
+    A fresh last-trade price, or else a fresh cached quote, is
+    reused; the rest are fetched with one StockLatestQuoteRequest
+    per chunk and cached as quotes only.
+    """
+
+    cache = cache if cache is not None else PRICE_CACHE
+    symbols = list(dict.fromkeys(s.upper() for s in symbols if s))
+
+    prices = {}
+
+    for s in symbols:
+        price = cache.get(s, max_age=max_age)
+        if price is None:
+            price = cache.get(_quote_key(s), max_age=max_age)
+        prices[s] = price
+
+    missing = [s for s, p in prices.items() if p is None]
+
+    if not missing:
+        return prices
+
+    client = get_client()
+
+    for i in range(0, len(missing), chunk_size):
+
+        chunk = missing[i:i + chunk_size]
+
+        try:
+
+            req = StockLatestQuoteRequest(symbol_or_symbols=chunk)
+
+            quotes = client.get_stock_latest_quote(req)
+
+        except Exception as e:
+
+            print(f"Quote batch failed ({len(chunk)} symbols): {e}")
+            continue
+
+        for sym in chunk:
+
+            price = _quote_price(quotes.get(sym))
+
+            if price is None:
+                continue
+
+            prices[sym] = price
+            cache.put(_quote_key(sym), price)
+
+    return prices
+
+
+def get_price(symbol):
+
+    try:
+
+        return get_prices([symbol]).get(symbol.upper())
 
     except Exception as e:
 
@@ -73,6 +170,11 @@ def get_price(symbol):
 # Trade Scoring
 # --------------------------------------------------
 
+# Price band upper bounds -> score (last band is open-ended)
+PRICE_BANDS = (10.0, 50.0)
+BAND_SCORES = (0.6, 0.8, 0.7)
+
+
 def score_symbol(price):
 
     """
@@ -86,14 +188,37 @@ def score_symbol(price):
     narrative acceleration
     """
 
-    if price < 10:
-        return 0.6
+    return BAND_SCORES[bisect_right(PRICE_BANDS, price)]
+
+
+def rank_candidates(prices):
+    """
+    Score and rank {symbol: price} with array operations.
+    Symbols without a price are dropped; ties keep input order.
+    Scores match score_symbol() element-wise.
+    """
+
+    symbols = [sym for sym, price in prices.items() if price]
+
+    if not symbols:
+        return []
+
+    values = np.fromiter((prices[s] for s in symbols), dtype=float, count=len(symbols))
+
+    scores = np.asarray(BAND_SCORES)[
+        np.searchsorted(PRICE_BANDS, values, side="right")
+    ]
 
-    elif price < 50:
-        return 0.8
+    order = np.argsort(-scores, kind="stable")
 
-    else:
-        return 0.7
+    return [
+        {
+            "symbol": symbols[i],
+            "price": round(float(values[i]), 2),
+            "score": float(scores[i]),
+        }
+        for i in order
+    ]
 
 
 # --------------------------------------------------
@@ -111,26 +236,7 @@ def generate_trade_card():
         return
 
 
-    candidates = []
-
-
-    for sym in symbols:
-
-        price = get_price(sym)
-
-        if not price:
-            continue
-
-        score = score_symbol(price)
-
-        candidates.append({
-            "symbol": sym,
-            "price": round(price, 2),
-            "score": score
-        })
-
-
-    candidates.sort(key=lambda x: x["score"], reverse=True)
+    candidates = rank_candidates(get_prices(symbols))
 
 
     print("Rank  Symbol  Price   Score\n")
@@ -145,6 +251,8 @@ def generate_trade_card():
 
     print("\nGenerated:", datetime.now(UTC))
 
+    return candidates
+
 
 # --------------------------------------------------
 # Runner
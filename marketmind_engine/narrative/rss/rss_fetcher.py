@@ -1,7 +1,11 @@
-import requests
+import time
+
 import feedparser
 import urllib3
 
+from marketmind_engine.telemetry.metrics import FEED_FETCHES, FEED_FETCH_SECONDS
+from marketmind_engine.utils.http_client import get_http_client
+
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
@@ -9,16 +13,24 @@ class RSSFetcher:
     """
     Fetches RSS feeds.
     If network unavailable, injects deterministic synthetic entries.
+    Requests go through the shared pooled HTTP client.
     """
 
+    def __init__(self, http_client=None):
+        self._http_client = http_client
+
     def fetch(self, url):
+        started = time.perf_counter()
+        status = "empty"
+
         try:
-            response = requests.get(url, timeout=5, verify=False)
-            response.raise_for_status()
+            client = self._http_client or get_http_client()
+            response = client.get(url, timeout=5, verify=False)
 
             parsed = feedparser.parse(response.content)
 
             if parsed.entries:
+                status = "ok"
                 return [
                     {
                         "title": entry.get("title", ""),
@@ -29,7 +41,11 @@ class RSSFetcher:
                 ]
 
         except Exception:
-            pass
+            status = "error"
+
+        finally:
+            FEED_FETCH_SECONDS.labels(feed=url).observe(time.perf_counter() - started)
+            FEED_FETCHES.labels(feed=url, status=status).inc()
 
         # --- Synthetic fallback (deterministic) ---
         return [
@@ -1,5 +1,9 @@
 import time
 from marketmind_engine.narrative.feed_aggregator import FeedAggregator
+from marketmind_engine.telemetry.metrics import HEADLINES_INGESTED
+
+
+_HEADLINES = HEADLINES_INGESTED.labels(source="rss")
 
 
 class RSSWorker:
@@ -25,6 +29,7 @@ class RSSWorker:
         normalized_items = self.aggregator.aggregate(raw_entries)
 
         self.buffer.update(normalized_items)
+        _HEADLINES.inc(len(normalized_items))
 
     def run_loop(self, interval_seconds=60):
         while True:
@@ -1,7 +1,12 @@
+from array import array
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 import json
+import os
+import struct
+
+from marketmind_engine.utils.background_writer import BackgroundWriter
 
 
 # ============================================================
@@ -106,3 +111,300 @@ class FileIgnitionObserver(IgnitionObserver):
         except Exception:
             # Observation must NEVER interfere with execution
             return
+
+
+# ============================================================
+# Fixed Schema Encoding
+# ============================================================
+
+# (field, column type) in record order.
+#   ts    datetime -> float64 epoch seconds (UTC)
+#   str   utf-8
+#   f8    float64 (None -> NaN)
+#   i8    int64 (None -> INT_NULL)
+#   bool  uint8
+IGNITION_SCHEMA = (
+    ("timestamp", "ts"),
+    ("symbol", "str"),
+    ("is_open_window", "bool"),
+    ("seconds_from_open", "i8"),
+    ("volume_ratio", "f8"),
+    ("trade_ratio", "f8"),
+    ("volume_median", "f8"),
+    ("trade_median", "f8"),
+    ("ignition_delta", "f8"),
+    ("ignition_used", "bool"),
+    ("near_volume", "bool"),
+    ("near_trade", "bool"),
+    ("volume_threshold", "f8"),
+    ("trade_threshold", "f8"),
+    ("relax_volume_threshold", "f8"),
+    ("relax_trade_threshold", "f8"),
+)
+
+INT_NULL = -(1 << 63)
+
+COLUMNAR_MAGIC = b"MMIGN1\n"
+_BLOCK_HEADER = struct.Struct("<4sI")
+_BLOCK_TAG = b"BLK1"
+
+
+def _optional_float(value) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def encode_observation(obs: IgnitionObservation) -> Dict[str, Any]:
+    """
+    JSON-ready record with a fixed key order and explicit types.
+    """
+    return {
+        "timestamp": obs.timestamp.isoformat(),
+        "symbol": obs.symbol,
+        "is_open_window": bool(obs.is_open_window),
+        "seconds_from_open": None if obs.seconds_from_open is None else int(obs.seconds_from_open),
+        "volume_ratio": _optional_float(obs.volume_ratio),
+        "trade_ratio": _optional_float(obs.trade_ratio),
+        "volume_median": _optional_float(obs.volume_median),
+        "trade_median": _optional_float(obs.trade_median),
+        "ignition_delta": _optional_float(obs.ignition_delta),
+        "ignition_used": bool(obs.ignition_used),
+        "near_volume": bool(obs.near_volume),
+        "near_trade": bool(obs.near_trade),
+        "volume_threshold": _optional_float(obs.volume_threshold),
+        "trade_threshold": _optional_float(obs.trade_threshold),
+        "relax_volume_threshold": _optional_float(obs.relax_volume_threshold),
+        "relax_trade_threshold": _optional_float(obs.relax_trade_threshold),
+    }
+
+
+def encode_jsonl_line(obs: IgnitionObservation) -> bytes:
+    return (json.dumps(encode_observation(obs), separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def encode_jsonl(batch: List[IgnitionObservation]) -> bytes:
+    return b"".join(encode_jsonl_line(obs) for obs in batch)
+
+
+def _epoch(ts: datetime) -> float:
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.timestamp()
+
+
+def encode_columnar_row(obs: IgnitionObservation) -> tuple:
+    """
+    Schema-typed values of one observation (raises on a value
+    the column type cannot hold).
+    """
+
+    row = []
+
+    for name, kind in IGNITION_SCHEMA:
+
+        v = getattr(obs, name)
+
+        if kind == "str":
+            row.append(str(v).replace("\n", " "))
+        elif kind == "ts":
+            row.append(_epoch(v))
+        elif kind == "f8":
+            row.append(float("nan") if v is None else float(v))
+        elif kind == "i8":
+            n = INT_NULL if v is None else int(v)
+            if not INT_NULL <= n < (1 << 63):
+                raise OverflowError(f"{name}={v} does not fit int64")
+            row.append(n)
+        else:
+            row.append(1 if v else 0)
+
+    return tuple(row)
+
+
+def encode_columnar(batch: List[IgnitionObservation]) -> bytes:
+    return encode_columnar_rows([encode_columnar_row(obs) for obs in batch])
+
+
+def encode_columnar_rows(rows: List[tuple]) -> bytes:
+    """
+    One column-major block from encode_columnar_row() rows:
+
+        "BLK1" uint32 rows
+        per column (schema order):
+            str      uint32 byte length + newline-joined utf-8
+            other    rows x fixed-width little-endian values
+    """
+
+    parts = [_BLOCK_HEADER.pack(_BLOCK_TAG, len(rows))]
+
+    for i, (_, kind) in enumerate(IGNITION_SCHEMA):
+
+        values = [row[i] for row in rows]
+
+        if kind == "str":
+            blob = "\n".join(values).encode("utf-8")
+            parts.append(struct.pack("<I", len(blob)))
+            parts.append(blob)
+            continue
+
+        column = array({"ts": "d", "f8": "d", "i8": "q", "bool": "B"}[kind], values)
+
+        if column.itemsize > 1 and struct.pack("=H", 1) != struct.pack("<H", 1):
+            column.byteswap()
+
+        parts.append(column.tobytes())
+
+    return b"".join(parts)
+
+
+def read_columnar(path: str) -> Dict[str, list]:
+    """
+    Decode a columnar ignition file into {field: [values]}.
+    Timestamps come back as UTC datetimes, nulls as None.
+    """
+
+    columns: Dict[str, list] = {name: [] for name, _ in IGNITION_SCHEMA}
+
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if not data.startswith(COLUMNAR_MAGIC):
+        raise ValueError(f"{path} is not a columnar ignition file")
+
+    pos = len(COLUMNAR_MAGIC)
+    little = struct.pack("=H", 1) == struct.pack("<H", 1)
+
+    while pos < len(data):
+
+        tag, rows = _BLOCK_HEADER.unpack_from(data, pos)
+        pos += _BLOCK_HEADER.size
+
+        if tag != _BLOCK_TAG:
+            raise ValueError(f"Corrupt block at offset {pos}")
+
+        for name, kind in IGNITION_SCHEMA:
+
+            if kind == "str":
+                (size,) = struct.unpack_from("<I", data, pos)
+                pos += 4
+                text = data[pos:pos + size].decode("utf-8")
+                pos += size
+                columns[name].extend(text.split("\n") if rows else [])
+                continue
+
+            column = array({"ts": "d", "f8": "d", "i8": "q", "bool": "B"}[kind])
+            width = column.itemsize * rows
+            column.frombytes(data[pos:pos + width])
+            pos += width
+
+            if column.itemsize > 1 and not little:
+                column.byteswap()
+
+            if kind == "ts":
+                columns[name].extend(datetime.fromtimestamp(v, timezone.utc) for v in column)
+            elif kind == "f8":
+                columns[name].extend(None if v != v else v for v in column)
+            elif kind == "i8":
+                columns[name].extend(None if v == INT_NULL else v for v in column)
+            else:
+                columns[name].extend(bool(v) for v in column)
+
+    return columns
+
+
+# ============================================================
+# Buffered Observer (JSONL / columnar)
+# ============================================================
+
+class BufferedIgnitionObserver(IgnitionObserver):
+    """
+    Batched, asynchronous file observer.
+
+    - record() only enqueues (never blocks, never raises)
+    - a writer thread encodes each observation with the fixed
+      schema and appends a chunk with one write; an observation
+      that cannot be encoded is dropped and counted, the rest
+      of its chunk is still written
+    - format "jsonl" (one record per line) or "columnar"
+      (binary column blocks, see read_columnar)
+    - observations dropped on a full queue are counted
+
+    Call close() at the end of a run to drain the queue.
+    """
+
+    FORMATS = ("jsonl", "columnar")
+
+    def __init__(
+        self,
+        path: str,
+        format: str = "jsonl",
+        max_queue: int = 50000,
+        batch_size: int = 1024,
+        flush_mode: str = "interval",
+        flush_interval_ms: float = 500.0,
+    ):
+        if format not in self.FORMATS:
+            raise ValueError(f"format must be one of {self.FORMATS}")
+
+        self.path = path
+        self.format = format
+        self._file = None
+
+        self._writer = BackgroundWriter(
+            sink=self._write_batch,
+            flush=self._flush_file,
+            close=self._close_file,
+            encode=encode_columnar_row if format == "columnar" else encode_jsonl_line,
+            max_queue=max_queue,
+            batch_size=batch_size,
+            flush_mode=flush_mode,
+            flush_interval_ms=flush_interval_ms,
+            name="ignition-observer",
+        )
+
+    def record(self, obs: IgnitionObservation) -> None:
+        try:
+            self._writer.submit(obs)
+        except Exception:
+            # Observation must NEVER interfere with execution
+            return
+
+    # ---------------- writer thread ----------------
+
+    def _write_batch(self, encoded: list) -> None:
+
+        if self._file is None:
+            self._file = open(self.path, "ab")
+
+            if self.format == "columnar" and self._file.tell() == 0:
+                self._file.write(COLUMNAR_MAGIC)
+
+        if self.format == "columnar":
+            self._file.write(encode_columnar_rows(encoded))
+        else:
+            self._file.write(b"".join(encoded))
+
+    def _flush_file(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+    # ---------------- lifecycle ----------------
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        return self._writer.flush(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        self._writer.close(timeout)
+
+    @property
+    def dropped(self) -> int:
+        return self._writer.dropped
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._writer.stats(), "format": self.format, "path": self.path}
@@ -0,0 +1,120 @@
+import json
+import threading
+from dataclasses import replace
+from datetime import datetime, timezone
+
+import pytest
+
+from marketmind_engine.observers.ignition import (
+    BufferedIgnitionObserver,
+    IgnitionObservation,
+    encode_observation,
+    read_columnar,
+)
+
+
+def _obs(i, trade_ratio=1.5):
+    return IgnitionObservation(
+        timestamp=datetime(2026, 2, 6, 14, 30, i, tzinfo=timezone.utc),
+        symbol=f"SYM{i}",
+        is_open_window=True,
+        seconds_from_open=i if i % 2 else None,
+        volume_ratio=2.0 + i,
+        trade_ratio=trade_ratio,
+        volume_median=1000.0,
+        trade_median=None,
+        ignition_delta=0.1 * i,
+        ignition_used=bool(i % 2),
+        near_volume=True,
+        near_trade=False,
+        volume_threshold=1.5,
+        trade_threshold=1.3,
+        relax_volume_threshold=1.2,
+        relax_trade_threshold=1.1,
+    )
+
+
+def test_jsonl_uses_fixed_schema(tmp_path):
+    path = tmp_path / "ign.jsonl"
+    observer = BufferedIgnitionObserver(str(path))
+
+    for i in range(10):
+        observer.record(_obs(i))
+    observer.close()
+
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+
+    assert len(rows) == 10
+    assert rows[3] == encode_observation(_obs(3))
+    assert rows[3]["timestamp"] == "2026-02-06T14:30:03+00:00"
+    assert list(rows[0]) == list(encode_observation(_obs(0)))
+
+
+def test_columnar_round_trip(tmp_path):
+    path = tmp_path / "ign.bin"
+    observer = BufferedIgnitionObserver(str(path), format="columnar", batch_size=3)
+
+    for i in range(8):
+        observer.record(_obs(i, trade_ratio=None if i == 5 else 1.5))
+    observer.close()
+
+    cols = read_columnar(str(path))
+
+    assert cols["symbol"] == [f"SYM{i}" for i in range(8)]
+    assert cols["timestamp"][2] == _obs(2).timestamp
+    assert cols["seconds_from_open"][:2] == [None, 1]
+    assert cols["trade_ratio"][5] is None
+    assert cols["trade_median"] == [None] * 8
+    assert cols["ignition_used"][1] is True
+
+
+def test_record_never_blocks_and_counts_drops(tmp_path):
+    observer = BufferedIgnitionObserver(str(tmp_path / "ign.jsonl"), max_queue=1, batch_size=1)
+
+    gate = threading.Event()
+    observer._writer._sink = lambda batch: gate.wait(5)
+
+    for i in range(20):
+        observer.record(_obs(i))
+
+    assert observer.dropped > 0
+
+    gate.set()
+    observer.close()
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "columnar"])
+def test_bad_record_is_dropped_not_its_batch(tmp_path, fmt):
+    path = tmp_path / f"ign.{fmt}"
+    observer = BufferedIgnitionObserver(str(path), format=fmt, flush_mode="shutdown")
+
+    for i in range(6):
+        obs = _obs(i)
+        if i == 2:
+            obs = replace(obs, timestamp="not a datetime")
+        if i == 4:
+            obs = replace(obs, volume_ratio=None)
+        observer.record(obs)
+    observer.close()
+
+    if fmt == "jsonl":
+        rows = [json.loads(line) for line in path.read_text().splitlines()]
+        symbols = [r["symbol"] for r in rows]
+        volume_ratio = rows[-2]["volume_ratio"]
+    else:
+        cols = read_columnar(str(path))
+        symbols = cols["symbol"]
+        volume_ratio = cols["volume_ratio"][-2]
+
+    assert symbols == ["SYM0", "SYM1", "SYM3", "SYM4", "SYM5"]
+    assert volume_ratio is None
+
+    stats = observer.stats()
+    assert stats["written"] == 5
+    assert stats["dropped"] == 1
+    assert stats["errors"] == 0
+
+
+def test_invalid_format_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        BufferedIgnitionObserver(str(tmp_path / "x"), format="parquet")
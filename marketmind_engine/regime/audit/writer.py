@@ -1,5 +1,27 @@
-import json
+"""
+Regime Audit Writers
+--------------------
+RegimeAuditWriter          open / append / close per event (simple, durable)
+BufferedRegimeAuditWriter  background thread, bounded queue, rotation
+
+The buffered writer keeps one file handle open, serializes on
+its own thread and rotates the JSONL log by size and/or UTC
+day. Closed segments are gzip-compressed. When the queue is
+full, events are dropped and counted rather than blocking the
+orchestrator. Events that fail to serialize are dropped and
+counted individually; the rest of their batch is written.
+"""
+
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import gzip
+import json
+import os
+import shutil
+import time
+
+from marketmind_engine.utils.background_writer import BackgroundWriter
 from .schema import RegimeTransitionEvent
 
 
@@ -12,3 +34,215 @@ class RegimeAuditWriter:
         with self._file_path.open('a', encoding='utf-8') as f:
             json.dump(event.to_dict(), f)
             f.write('\n')
+
+
+# ==================================================
+# ROTATING FILE SINK
+# ==================================================
+
+class RotatingJsonlFile:
+    """
+    Append-only line file with size / daily rotation.
+
+    Rotated segments are renamed <stem>.<YYYYmmdd-HHMMSS><suffix>
+    and gzip-compressed (if compress). backup_count keeps only the
+    newest N segments. Not thread-safe: owned by one writer thread.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: Optional[int] = None,
+        rotate_daily: bool = False,
+        compress: bool = True,
+        backup_count: Optional[int] = None,
+        fsync: bool = False,
+        now_fn: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.max_bytes = max_bytes
+        self.rotate_daily = rotate_daily
+        self.compress = compress
+        self.backup_count = backup_count
+        self.fsync = fsync
+        self._now = now_fn
+
+        self._file = None
+        self._size = 0
+        self._day = None
+        self.rotations = 0
+
+    def _utc_day(self, ts: float):
+        return datetime.fromtimestamp(ts, timezone.utc).date()
+
+    def _open(self) -> None:
+        self._file = self.path.open("a", encoding="utf-8")
+        self._size = self._file.tell()
+
+        if self._day is None:
+            stamp = self.path.stat().st_mtime if self._size else self._now()
+            self._day = self._utc_day(stamp)
+
+    def _should_rotate(self, incoming: int) -> bool:
+
+        if self._size == 0:
+            return False
+
+        if self.max_bytes is not None and self._size + incoming > self.max_bytes:
+            return True
+
+        if self.rotate_daily and self._utc_day(self._now()) != self._day:
+            return True
+
+        return False
+
+    def rotate(self) -> Optional[Path]:
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return None
+
+        stamp = datetime.fromtimestamp(self._now(), timezone.utc).strftime("%Y%m%d-%H%M%S")
+        target = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+
+        n = 1
+        while target.exists() or Path(str(target) + ".gz").exists():
+            target = self.path.with_name(f"{self.path.stem}.{stamp}-{n}{self.path.suffix}")
+            n += 1
+
+        os.replace(self.path, target)
+
+        if self.compress:
+            with target.open("rb") as src, gzip.open(str(target) + ".gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            target.unlink()
+            target = Path(str(target) + ".gz")
+
+        self.rotations += 1
+        self._day = self._utc_day(self._now())
+        self._prune()
+
+        return target
+
+    def segments(self) -> List[Path]:
+        """
+        Rotated segments, oldest first.
+        """
+        return sorted(
+            p for p in self.path.parent.glob(f"{self.path.stem}.*")
+            if p != self.path
+        )
+
+    def _prune(self) -> None:
+
+        if self.backup_count is None:
+            return
+
+        segments = self.segments()
+
+        for old in segments[: max(0, len(segments) - self.backup_count)]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+    def write_lines(self, lines: List[str]) -> None:
+
+        if self._file is None:
+            self._open()
+
+        payload = "".join(line + "\n" for line in lines)
+        size = len(payload.encode("utf-8"))
+
+        if self._should_rotate(size):
+            self.rotate()
+            self._open()
+
+        self._file.write(payload)
+        self._size += size
+
+    def flush(self) -> None:
+        if self._file is None:
+            return
+
+        self._file.flush()
+
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+
+# ==================================================
+# BUFFERED WRITER
+# ==================================================
+
+class BufferedRegimeAuditWriter:
+    """
+    Drop-in audit writer (write(event)) backed by a background
+    thread and a RotatingJsonlFile.
+
+    flush_mode: "event" | "interval" | "shutdown"
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        max_queue: int = 10000,
+        flush_mode: str = "interval",
+        flush_interval_ms: float = 250.0,
+        max_bytes: Optional[int] = 50 * 1024 * 1024,
+        rotate_daily: bool = True,
+        compress: bool = True,
+        backup_count: Optional[int] = None,
+        fsync: bool = False,
+        now_fn: Callable[[], float] = time.time,
+    ):
+        self.file = RotatingJsonlFile(
+            file_path,
+            max_bytes=max_bytes,
+            rotate_daily=rotate_daily,
+            compress=compress,
+            backup_count=backup_count,
+            fsync=fsync,
+            now_fn=now_fn,
+        )
+
+        self._writer = BackgroundWriter(
+            sink=self._write_batch,
+            flush=self.file.flush,
+            close=self.file.close,
+            encode=lambda event: json.dumps(event.to_dict()),
+            max_queue=max_queue,
+            flush_mode=flush_mode,
+            flush_interval_ms=flush_interval_ms,
+            name="regime-audit-writer",
+        )
+
+    def _write_batch(self, lines: List[str]) -> None:
+        self.file.write_lines(lines)
+
+    def write(self, event: RegimeTransitionEvent) -> None:
+        self._writer.submit(event)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        return self._writer.flush(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        self._writer.close(timeout)
+
+    @property
+    def dropped(self) -> int:
+        return self._writer.dropped
+
+    def stats(self) -> Dict[str, object]:
+        return {**self._writer.stats(), "rotations": self.file.rotations}
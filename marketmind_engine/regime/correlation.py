@@ -0,0 +1,278 @@
+"""
+Rolling Correlation Engine
+--------------------------
+Incremental covariance / correlation over N instruments.
+
+Two modes:
+- fixed window: ring buffer of the last W return rows plus
+  running sums (sum x, sum x x^T); each bar adds the new
+  outer product and subtracts the one leaving the window
+- EWMA (halflife): exponentially weighted mean / covariance
+
+Either way a bar costs O(N^2) (one outer product), never
+O(N^2 * W). The fixed-window sums are re-derived from the ring
+buffer every W bars to stop floating-point drift (amortized
+O(N^2)).
+
+summary() exposes what correlation_spike needs:
+- mean off-diagonal correlation
+- top eigenvalue share (largest eigenvalue / N)
+- max pairwise jump since the previous summary()
+
+Replay: replay_price_feed() drives the engine from any feed
+with get_price(symbol) and an advancing clock (e.g.
+HistoricalPriceFeed + ReplayClock).
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+import math
+
+import numpy as np
+
+
+# Variance below this is treated as a flat (excluded) instrument
+_MIN_VARIANCE = 1e-18
+
+
+@dataclass(frozen=True)
+class CorrelationSummary:
+    mean_offdiagonal: float
+    top_eigen_share: float
+    max_pair_jump: float
+    instruments: int          # instruments with non-zero variance
+    observations: int
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "mean_offdiagonal": self.mean_offdiagonal,
+            "top_eigen_share": self.top_eigen_share,
+            "max_pair_jump": self.max_pair_jump,
+            "instruments": self.instruments,
+            "observations": self.observations,
+        }
+
+
+class RollingCorrelationEngine:
+
+    def __init__(
+        self,
+        size: int,
+        window: Optional[int] = 60,
+        halflife: Optional[float] = None,
+    ):
+        if size <= 0:
+            raise ValueError("RollingCorrelationEngine.size must be > 0")
+
+        if (window is None) == (halflife is None):
+            raise ValueError("Specify exactly one of window or halflife")
+
+        self.size = size
+        self.window = window
+        self.halflife = halflife
+
+        self.observations = 0
+        self._last_prices: Optional[np.ndarray] = None
+        self._previous_corr: Optional[np.ndarray] = None
+
+        if window is not None:
+            self._buffer = np.zeros((window, size))
+            self._head = 0
+            self._sum = np.zeros(size)
+            self._cross = np.zeros((size, size))
+            self._since_resync = 0
+        else:
+            self._alpha = 1.0 - math.exp(math.log(0.5) / halflife)
+            self._mean = np.zeros(size)
+            self._cov = np.zeros((size, size))
+
+    # --------------------------------------------------
+    # Updates
+    # --------------------------------------------------
+
+    def push(self, returns: Sequence[float]) -> None:
+        """
+        Add one bar of returns (length N). NaN counts as 0.
+        """
+
+        x = np.nan_to_num(np.asarray(returns, dtype=float), nan=0.0)
+
+        if x.shape != (self.size,):
+            raise ValueError(f"Expected {self.size} returns, got {x.shape}")
+
+        self.observations += 1
+
+        if self.window is None:
+            d = x - self._mean
+            self._mean += self._alpha * d
+            self._cov = (1.0 - self._alpha) * (self._cov + self._alpha * np.outer(d, d))
+            return
+
+        if self.observations > self.window:
+            old = self._buffer[self._head]
+            self._sum -= old
+            self._cross -= np.outer(old, old)
+
+        self._buffer[self._head] = x
+        self._head = (self._head + 1) % self.window
+
+        self._sum += x
+        self._cross += np.outer(x, x)
+
+        self._since_resync += 1
+        if self._since_resync >= self.window:
+            self._resync()
+
+    def push_prices(self, prices: Sequence[Optional[float]]) -> None:
+        """
+        Add one bar of prices; log returns are taken against the
+        previous bar. Missing / non-positive prices carry forward.
+        """
+
+        p = np.array([np.nan if v is None else v for v in prices], dtype=float)
+        p[~(p > 0)] = np.nan
+
+        if self._last_prices is None:
+            self._last_prices = p
+            return
+
+        p = np.where(np.isnan(p), self._last_prices, p)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            returns = np.log(p / self._last_prices)
+
+        self._last_prices = p
+        self.push(returns)
+
+    def _resync(self) -> None:
+        rows = self._buffer[: min(self.observations, self.window)]
+        self._sum = rows.sum(axis=0)
+        self._cross = rows.T @ rows
+        self._since_resync = 0
+
+    # --------------------------------------------------
+    # Reads
+    # --------------------------------------------------
+
+    def covariance(self) -> np.ndarray:
+
+        if self.window is None:
+            return self._cov.copy()
+
+        n = min(self.observations, self.window)
+
+        if n < 2:
+            return np.zeros((self.size, self.size))
+
+        mean = self._sum / n
+        return (self._cross - n * np.outer(mean, mean)) / n
+
+    def correlation(self) -> np.ndarray:
+        """
+        N x N correlation. Flat instruments get zero rows with
+        a unit diagonal.
+        """
+
+        cov = self.covariance()
+        var = np.diag(cov)
+        valid = var > _MIN_VARIANCE
+
+        std = np.sqrt(np.where(valid, var, 1.0))
+        corr = cov / np.outer(std, std)
+        corr[~valid, :] = 0.0
+        corr[:, ~valid] = 0.0
+
+        np.clip(corr, -1.0, 1.0, out=corr)
+        np.fill_diagonal(corr, 1.0)
+        return corr
+
+    def mean_offdiagonal(self) -> float:
+        """
+        Mean pairwise correlation over non-flat instruments
+        (O(N^2), no eigen decomposition).
+        """
+
+        valid = np.diag(self.covariance()) > _MIN_VARIANCE
+        k = int(valid.sum())
+
+        if k < 2:
+            return 0.0
+
+        sub = self.correlation()[np.ix_(valid, valid)]
+        return float((sub.sum() - k) / (k * (k - 1)))
+
+    def summary(self) -> CorrelationSummary:
+
+        cov = self.covariance()
+        valid = np.diag(cov) > _MIN_VARIANCE
+        k = int(valid.sum())
+
+        corr = self.correlation()
+
+        if k < 2:
+            mean_off = 0.0
+            top_share = 0.0
+        else:
+            sub = corr[np.ix_(valid, valid)]
+            mean_off = float((sub.sum() - k) / (k * (k - 1)))
+            top_share = float(np.linalg.eigvalsh(sub)[-1] / k)
+
+        jump = 0.0
+
+        if self._previous_corr is not None:
+            diff = np.abs(corr - self._previous_corr)
+            np.fill_diagonal(diff, 0.0)
+            jump = float(diff.max())
+
+        self._previous_corr = corr
+
+        return CorrelationSummary(
+            mean_offdiagonal=mean_off,
+            top_eigen_share=top_share,
+            max_pair_jump=jump,
+            instruments=k,
+            observations=self.observations,
+        )
+
+
+# ==================================================
+# REPLAY
+# ==================================================
+
+def replay_price_feed(
+    engine: RollingCorrelationEngine,
+    feed,
+    symbols: Sequence[str],
+    steps: int,
+    advance: Optional[Callable[[], None]] = None,
+) -> Iterator[CorrelationSummary]:
+    """
+    Drive the engine from a replay price feed.
+
+    Each step reads feed.get_price(symbol) for every symbol,
+    pushes the bar, yields a summary, then calls advance()
+    (e.g. lambda: clock.advance(60)).
+    """
+
+    for _ in range(steps):
+        engine.push_prices([feed.get_price(s) for s in symbols])
+        yield engine.summary()
+
+        if advance is not None:
+            advance()
+
+
+def replay_price_rows(
+    engine: RollingCorrelationEngine,
+    rows: Iterable[Sequence[float]],
+) -> List[CorrelationSummary]:
+    """
+    Push a T x N price array bar by bar, summarizing each bar.
+    """
+    summaries = []
+
+    for row in rows:
+        engine.push_prices(row)
+        summaries.append(engine.summary())
+
+    return summaries
@@ -1,32 +1,354 @@
+"""
+Live Macro Source
+-----------------
+Streaming systemic inputs from rolling market state.
+
+Per tick (one price per structural instrument) the source
+updates, in O(1) per instrument and O(k^2) for k instruments:
+
+- rolling max drawdown, smoothed per-tick deepening
+  (rate of change, not level)                    -> drawdown_velocity
+- fast / slow EWMA of absolute returns           -> liquidity_stress
+- fixed-window rolling correlation
+  (RollingCorrelationEngine, running sums)       -> correlation_spike
+- EWMA mean / variance of narrative intensity    -> narrative_shock
+- share of instruments below their window open   -> structural_confirmation
+
+Nothing is recomputed from history: each new return is added
+to the running sums and the return leaving the window is
+subtracted. collect() is a cheap read of the current values
+(plus a poll of the shared price cache when one is attached).
+
+Only fresh prints are ingested: an instrument without a new
+price on a tick is skipped (no carried-forward zero return),
+and the correlation window only takes ticks where every
+instrument printed.
+
+Until a feed delivers data, or when it goes stale, collect()
+returns FALLBACK_INPUTS for the affected fields: price-derived
+fields need recent ticks, narrative_shock needs on_narrative()
+observations. Nothing feeds on_narrative() in production yet,
+and the Flask regime process has no price feed of its own, so
+there the source reports the fallback values.
+
+All outputs are clamped to [0, 1].
+"""
+
+from collections import deque
+from dataclasses import asdict
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+import math
+import time
+
+from marketmind_engine.regime.correlation import (
+    CorrelationSummary,
+    RollingCorrelationEngine,
+)
 from marketmind_engine.regime.macro_sources.base import MacroInputSource
 from marketmind_engine.regime.systemic_monitor import SystemicInputs
 
 
+def _clamp(value: float) -> float:
+    return max(0.0, min(1.0, value))
+
+
+def _cache_prices(symbols: Iterable[str]) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+    """
+    (stored_at, price) per symbol from the shared market data cache.
+    """
+    from marketmind_engine.data.streaming import MARKET_DATA_CACHE
+
+    return {s: MARKET_DATA_CACHE.prices.get_entry(s) for s in symbols}
+
+
+def _structural_symbols() -> List[str]:
+    from marketmind_engine.intelligence.propagation_engine import STRUCTURAL_SYMBOLS
+    return list(STRUCTURAL_SYMBOLS)
+
+
+class _Instrument:
+    """
+    Rolling per-instrument state. All updates O(1) amortized.
+    """
+
+    __slots__ = (
+        "prices", "peaks", "last", "fast_vol", "slow_vol",
+        "last_drawdown", "drawdown_velocity",
+    )
+
+    def __init__(self, window: int):
+        self.prices: Deque[Tuple[int, float]] = deque(maxlen=window + 1)
+        self.peaks: Deque[Tuple[int, float]] = deque()     # monotonic (tick, price)
+        self.last: Optional[float] = None
+        self.fast_vol: Optional[float] = None
+        self.slow_vol: Optional[float] = None
+        self.last_drawdown: Optional[float] = None
+        self.drawdown_velocity = 0.0
+
+    def push(self, tick: int, price: float, fast: float, slow: float) -> Optional[float]:
+        """
+        Add a price; returns the log return vs the previous
+        price (None for the first print).
+        """
+
+        ret = math.log(price / self.last) if self.last else None
+        self.last = price
+
+        self.prices.append((tick, price))
+        oldest_tick = self.prices[0][0]
+
+        while self.peaks and self.peaks[-1][1] <= price:
+            self.peaks.pop()
+        self.peaks.append((tick, price))
+
+        while self.peaks[0][0] < oldest_tick:
+            self.peaks.popleft()
+
+        # Drawdown velocity: EWMA of how much deeper the drawdown
+        # got since the previous print (recoveries count as 0)
+        drawdown = self.drawdown()
+        if self.last_drawdown is not None:
+            deepening = max(0.0, drawdown - self.last_drawdown)
+            self.drawdown_velocity += fast * (deepening - self.drawdown_velocity)
+        self.last_drawdown = drawdown
+
+        if ret is None:
+            return None
+
+        a = abs(ret)
+        self.fast_vol = a if self.fast_vol is None else self.fast_vol + fast * (a - self.fast_vol)
+        self.slow_vol = a if self.slow_vol is None else self.slow_vol + slow * (a - self.slow_vol)
+
+        return ret
+
+    def drawdown(self) -> float:
+        if not self.peaks or not self.last:
+            return 0.0
+        return max(0.0, 1.0 - self.last / self.peaks[0][1])
+
+    def window_return(self) -> float:
+        if len(self.prices) < 2:
+            return 0.0
+        return self.last / self.prices[0][1] - 1.0
+
+
 class LiveMacroSource(MacroInputSource):
     """
     Live macro input source.
 
-    Owns its own collection logic.
-    No external callable required.
+    Owns its own collection logic. Prices arrive through
+    on_tick() (push) or are polled from the shared market data
+    cache by collect() when price_fn is set (default).
     """
 
     source_type = "live"
 
-    def __init__(self):
-        pass
+    # Reported for fields without fresh data (previous placeholders)
+    FALLBACK_INPUTS = SystemicInputs(
+        drawdown_velocity=0.1,
+        liquidity_stress=0.1,
+        correlation_spike=0.1,
+        narrative_shock=0.1,
+        structural_confirmation=0.1,
+    )
 
-    def collect(self) -> SystemicInputs:
+    # Smoothed drawdown deepening per tick giving drawdown_velocity = 1.0
+    DRAWDOWN_VELOCITY_SCALE = 0.005
+
+    # Fast/slow absolute-return ratio above 1 giving liquidity_stress = 1.0
+    VOL_EXPANSION_SCALE = 2.0
+
+    # Narrative z-score giving narrative_shock = 1.0
+    NARRATIVE_Z_SCALE = 3.0
+
+    def __init__(
+        self,
+        symbols: Optional[Iterable[str]] = None,
+        window: int = 60,
+        fast_alpha: float = 0.2,
+        slow_alpha: float = 0.02,
+        narrative_alpha: float = 0.05,
+        price_fn: Optional[Callable[[List[str]], Dict]] = _cache_prices,
+        stale_after: float = 300.0,
+        now_fn: Callable[[], float] = time.time,
+    ):
+        self.symbols = [s.upper() for s in (symbols or _structural_symbols())]
+        self.window = window
+        self.fast_alpha = fast_alpha
+        self.slow_alpha = slow_alpha
+        self.narrative_alpha = narrative_alpha
+        self._price_fn = price_fn
+        self.stale_after = stale_after
+        self._now = now_fn
+
+        self._index = {s: i for i, s in enumerate(self.symbols)}
+        self._instruments = [_Instrument(window) for _ in self.symbols]
+        self._correlation = RollingCorrelationEngine(len(self.symbols), window=window)
+
+        self._narrative_mean: Optional[float] = None
+        self._narrative_var = 0.0
+        self._narrative_last = 0.0
+        self._narrative_count = 0
+
+        self._last_stamp: Dict[str, float] = {}
+        self._last_tick_at: Optional[float] = None
+        self.ticks = 0
+
+        # Live values; None where there is no data yet
+        self._live: Dict[str, Optional[float]] = {
+            name: None for name in asdict(self.FALLBACK_INPUTS)
+        }
+
+    # --------------------------------------------------
+    # Feeds
+    # --------------------------------------------------
+
+    def on_tick(self, prices: Dict[str, float]) -> None:
+        """
+        One market tick of fresh prints. Instruments without a
+        price are skipped; correlation takes the tick only when
+        every instrument has a return.
         """
-        Collect live systemic inputs.
 
-        Replace placeholder values with real data feeds later.
+        fresh = {
+            s: float(p) for s, p in prices.items()
+            if s in self._index and p is not None and p > 0
+        }
+
+        if not fresh:
+            return
+
+        self.ticks += 1
+        self._last_tick_at = self._now()
+
+        row: List[Optional[float]] = [None] * len(self.symbols)
+
+        for symbol, price in fresh.items():
+            i = self._index[symbol]
+            row[i] = self._instruments[i].push(
+                self.ticks, price, self.fast_alpha, self.slow_alpha
+            )
+
+        if all(r is not None for r in row):
+            self._correlation.push(row)
+
+        self._recompute()
+
+    def on_narrative(self, intensity: float) -> None:
         """
+        Narrative intensity observation (e.g. mention rate).
+        """
+
+        x = float(intensity)
+        self._narrative_last = x
+        self._narrative_count += 1
+
+        if self._narrative_mean is None:
+            self._narrative_mean = x
+            self._narrative_var = 0.0
+        else:
+            a = self.narrative_alpha
+            delta = x - self._narrative_mean
+            self._narrative_mean += a * delta
+            self._narrative_var = (1 - a) * (self._narrative_var + a * delta * delta)
+
+        self._recompute()
+
+    def poll(self) -> bool:
+        """
+        Pull the latest cached prices; ingest a tick with the
+        instruments whose price is newer than the last one seen.
+        """
+
+        if self._price_fn is None:
+            return False
+
+        fresh = {}
+
+        for symbol, (ts, price) in self._price_fn(self.symbols).items():
+
+            if ts is None or price is None:
+                continue
+
+            if ts <= self._last_stamp.get(symbol, float("-inf")):
+                continue
+
+            self._last_stamp[symbol] = ts
+            fresh[symbol] = price
+
+        if not fresh:
+            return False
 
-        # TEMP deterministic placeholders
-        return SystemicInputs(
-            drawdown_velocity=0.1,
-            liquidity_stress=0.1,
-            correlation_spike=0.1,
-            narrative_shock=0.1,
-            structural_confirmation=0.1,
+        self.on_tick(fresh)
+        return True
+
+    # --------------------------------------------------
+    # Derived inputs
+    # --------------------------------------------------
+
+    def _recompute(self) -> None:
+
+        # Instruments with at least one return
+        live = [inst for inst in self._instruments if inst.fast_vol is not None]
+
+        if live:
+            velocity = sum(inst.drawdown_velocity for inst in live) / len(live)
+
+            expansion = [
+                inst.fast_vol / inst.slow_vol - 1.0
+                for inst in live
+                if inst.slow_vol
+            ]
+            liquidity = (sum(expansion) / len(expansion)) if expansion else 0.0
+
+            below = sum(1 for inst in live if inst.window_return() < 0)
+
+            self._live["drawdown_velocity"] = _clamp(velocity / self.DRAWDOWN_VELOCITY_SCALE)
+            self._live["liquidity_stress"] = _clamp(liquidity / self.VOL_EXPANSION_SCALE)
+            self._live["structural_confirmation"] = _clamp(below / len(live))
+
+        if self._correlation.observations >= 2:
+            self._live["correlation_spike"] = _clamp(self._correlation.mean_offdiagonal())
+
+        if self._narrative_count >= 2:
+            narrative = 0.0
+            if self._narrative_var > 0:
+                z = (self._narrative_last - self._narrative_mean) / math.sqrt(self._narrative_var)
+                narrative = z / self.NARRATIVE_Z_SCALE
+            self._live["narrative_shock"] = _clamp(narrative)
+
+    def _price_data_fresh(self) -> bool:
+        return (
+            self._last_tick_at is not None
+            and self._now() - self._last_tick_at <= self.stale_after
         )
+
+    def correlation_summary(self) -> CorrelationSummary:
+        return self._correlation.summary()
+
+    # --------------------------------------------------
+    # MacroInputSource
+    # --------------------------------------------------
+
+    def collect(self) -> SystemicInputs:
+        """
+        Current systemic inputs (cheap read).
+        """
+
+        try:
+            self.poll()
+        except Exception:
+            pass
+
+        fresh = self._price_data_fresh()
+        values = {}
+
+        for name, fallback in asdict(self.FALLBACK_INPUTS).items():
+            value = self._live[name]
+
+            if value is None or (name != "narrative_shock" and not fresh):
+                value = fallback
+
+            values[name] = value
+
+        return SystemicInputs(**values)
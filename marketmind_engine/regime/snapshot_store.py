@@ -0,0 +1,297 @@
+"""
+Regime Snapshot Store
+---------------------
+Separates computing the regime from reading it.
+
+The engine cycle publishes each orchestrator result here. A new
+version is assigned only when the snapshot content changes
+(volatile fields such as the cycle timestamp are ignored), so
+readers can:
+
+- serve the cached snapshot without running a cycle
+- answer conditional GETs with 304 via the version ETag
+- block (thread) or await (asyncio) the next version and push
+  it as a server-sent event
+
+Versions restart at 1 with the process, so ETags and SSE event
+ids carry the store epoch ("{epoch}-{version}"). A Last-Event-ID
+from another epoch is treated as "nothing seen" and the client
+gets the current snapshot instead of waiting for a version that
+this process may not reach for a long time.
+
+Shared singleton via get_regime_store() / set_regime_store().
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional
+import json
+import threading
+import time
+
+
+# Keys that change every cycle without a regime change
+VOLATILE_KEYS = ("timestamp",)
+
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
+@dataclass(frozen=True)
+class RegimeSnapshot:
+    version: int
+    data: Dict[str, Any]
+    published_at: float
+    etag: str
+    epoch: str = ""
+
+    @property
+    def event_id(self) -> str:
+        return f"{self.epoch}-{self.version}"
+
+
+class RegimeSnapshotStore:
+
+    def __init__(self, now_fn: Callable[[], float] = time.time):
+        self._now = now_fn
+        self._cond = threading.Condition()
+
+        # Distinguishes versions across process restarts
+        self.epoch = format(time.time_ns() & 0xFFFFFFFF, "x")
+
+        # asyncio readers: (loop, asyncio.Event) woken on publish
+        self._async_waiters = set()
+
+        self._current: Optional[RegimeSnapshot] = None
+        self._signature: Optional[str] = None
+
+        self.last_cycle_at: Optional[float] = None
+        self.cycles = 0
+
+    # --------------------------------------------------
+    # Publish (engine side)
+    # --------------------------------------------------
+
+    @staticmethod
+    def _signature_of(data: Dict[str, Any]) -> str:
+        stable = {k: v for k, v in data.items() if k not in VOLATILE_KEYS}
+        return json.dumps(stable, sort_keys=True, default=str)
+
+    def publish(self, data: Dict[str, Any]) -> RegimeSnapshot:
+        """
+        Record a cycle result. Returns the current snapshot
+        (a new version only if the content changed).
+        """
+
+        signature = self._signature_of(data)
+
+        with self._cond:
+
+            self.cycles += 1
+            self.last_cycle_at = self._now()
+
+            if self._current is not None and signature == self._signature:
+                return self._current
+
+            version = 1 if self._current is None else self._current.version + 1
+
+            self._current = RegimeSnapshot(
+                version=version,
+                data=dict(data),
+                published_at=self.last_cycle_at,
+                etag=f'"{self.epoch}-{version}"',
+                epoch=self.epoch,
+            )
+            self._signature = signature
+            self._cond.notify_all()
+
+            for loop, ready in self._async_waiters:
+                try:
+                    loop.call_soon_threadsafe(ready.set)
+                except RuntimeError:
+                    # Loop closed: reader is gone
+                    pass
+
+            return self._current
+
+    # --------------------------------------------------
+    # Read (request side)
+    # --------------------------------------------------
+
+    def latest(self) -> Optional[RegimeSnapshot]:
+        with self._cond:
+            return self._current
+
+    @property
+    def version(self) -> int:
+        current = self.latest()
+        return current.version if current else 0
+
+    def wait_for_change(
+        self,
+        after_version: int,
+        timeout: Optional[float] = None,
+    ) -> Optional[RegimeSnapshot]:
+        """
+        Block until a version newer than after_version exists.
+        Returns None on timeout.
+        """
+
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._current is not None and self._current.version > after_version,
+                timeout=timeout,
+            )
+
+            if self._current is not None and self._current.version > after_version:
+                return self._current
+
+            return None
+
+    async def next_change(
+        self,
+        after_version: int,
+        timeout: float = SSE_KEEPALIVE_SECONDS,
+    ) -> Optional[RegimeSnapshot]:
+        """
+        Await a version newer than after_version on the event loop
+        (no worker thread per reader). Returns None on timeout.
+        """
+        import asyncio
+
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+
+        with self._cond:
+            current = self._current
+            if current is not None and current.version > after_version:
+                return current
+            self._async_waiters.add(waiter)
+
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._cond:
+                self._async_waiters.discard(waiter)
+
+        current = self.latest()
+
+        if current is not None and current.version > after_version:
+            return current
+
+        return None
+
+    @property
+    def async_waiters(self) -> int:
+        with self._cond:
+            return len(self._async_waiters)
+
+
+# ==================================================
+# HTTP HELPERS
+# ==================================================
+
+def etag_matches(if_none_match: Optional[str], snapshot: Optional[RegimeSnapshot]) -> bool:
+    """
+    If-None-Match check (weak comparison, lists and "*").
+    """
+
+    if not if_none_match or snapshot is None:
+        return False
+
+    for tag in (t.strip() for t in if_none_match.split(",")):
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == snapshot.etag:
+            return True
+
+    return False
+
+
+def cache_headers(snapshot: RegimeSnapshot) -> Dict[str, str]:
+    return {
+        "ETag": snapshot.etag,
+        "Cache-Control": "no-cache",
+        "X-Regime-Version": str(snapshot.version),
+    }
+
+
+def sse_event(snapshot: RegimeSnapshot, event: str = "regime") -> str:
+    payload = json.dumps(
+        {"version": snapshot.version, "snapshot": snapshot.data},
+        default=str,
+    )
+    return f"id: {snapshot.event_id}\nevent: {event}\ndata: {payload}\n\n"
+
+
+def sse_keepalive() -> str:
+    return ": keepalive\n\n"
+
+
+def parse_last_event_id(value: Optional[str], epoch: str) -> int:
+    """
+    Version from a "{epoch}-{version}" event id. Ids from another
+    epoch (server restarted), bare versions and garbage map to 0
+    so the client is sent the current snapshot.
+    """
+
+    if not value:
+        return 0
+
+    seen_epoch, _, version = value.strip().rpartition("-")
+
+    if seen_epoch != epoch:
+        return 0
+
+    try:
+        return max(int(version), 0)
+    except ValueError:
+        return 0
+
+
+def sse_stream(
+    store: "RegimeSnapshotStore",
+    after_version: int = 0,
+    keepalive: float = SSE_KEEPALIVE_SECONDS,
+) -> Iterable[str]:
+    """
+    Blocking SSE generator (WSGI). Emits the current snapshot if
+    newer than after_version, then one event per change.
+    """
+
+    version = after_version
+
+    while True:
+        snapshot = store.wait_for_change(version, timeout=keepalive)
+
+        if snapshot is None:
+            yield sse_keepalive()
+            continue
+
+        version = snapshot.version
+        yield sse_event(snapshot)
+
+
+# ==================================================
+# SHARED STORE
+# ==================================================
+
+_store: Optional[RegimeSnapshotStore] = None
+_store_lock = threading.Lock()
+
+
+def get_regime_store() -> RegimeSnapshotStore:
+    global _store
+
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = RegimeSnapshotStore()
+
+    return _store
+
+
+def set_regime_store(store: Optional[RegimeSnapshotStore]) -> None:
+    global _store
+    _store = store
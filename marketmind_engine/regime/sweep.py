@@ -0,0 +1,596 @@
+"""
+Regime Parameter Sweep
+----------------------
+Offline, vectorized evaluation of SystemicMonitor /
+CapitalRecoveryController thresholds over historical macro
+frames.
+
+Input:
+- frames: T x 5 array, columns in SystemicInputs field order
+- grid:   sequence of ThresholdSet
+
+For every threshold set the sweep reproduces, per frame, what
+IntradayOrchestrator.run_cycle would produce:
+
+- hard interrupt / composite systemic -> flatten -> STANDBY
+- STANDBY lock until composite < STRESSED_THRESHOLD
+- composite modes (NORMAL / STRESSED / PRE_SYSTEMIC)
+- continuous size multiplier (Phase-12C)
+- recovery ramp after STANDBY exit (Phase-14)
+- final size multiplier and allow_entries
+
+The sequential pieces (STANDBY latch, recovery ramp) are
+resolved without a Python loop: each is an event latch, so the
+state at t only depends on the index of the last set / reset
+event, which is a running maximum over the frame axis.
+
+Latches depend only on the stressed / systemic / hard
+thresholds, so they are computed once per distinct combination
+and broadcast over every configuration that shares them.
+Work is chunked into G x T blocks, so a year of minute frames
+times thousands of configurations fits in memory.
+
+verify_against_orchestrator() replays sampled configurations
+through the real IntradayOrchestrator and compares every
+output exactly.
+"""
+
+from dataclasses import asdict, dataclass, fields, replace
+from itertools import product
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+import argparse
+import random
+
+import numpy as np
+
+from marketmind_engine.execution.policy.default_policy import (
+    DefaultRegimeExecutionPolicy,
+)
+from marketmind_engine.regime.capital_recovery import CapitalRecoveryController
+from marketmind_engine.regime.systemic_mode import SystemicMode
+from marketmind_engine.regime.systemic_monitor import SystemicInputs, SystemicMonitor
+
+
+INPUT_FIELDS = tuple(f.name for f in fields(SystemicInputs))
+
+# Mode codes used in result arrays
+MODES = (
+    SystemicMode.NORMAL,
+    SystemicMode.STRESSED,
+    SystemicMode.PRE_SYSTEMIC,
+    SystemicMode.SYSTEMIC,
+    SystemicMode.STANDBY,
+)
+MODE_CODE = {mode: i for i, mode in enumerate(MODES)}
+
+_NORMAL = MODE_CODE[SystemicMode.NORMAL]
+_STRESSED = MODE_CODE[SystemicMode.STRESSED]
+_PRE = MODE_CODE[SystemicMode.PRE_SYSTEMIC]
+_STANDBY = MODE_CODE[SystemicMode.STANDBY]
+
+# Target elements per G x T block
+CHUNK_ELEMENTS = 2_000_000
+
+
+# ==================================================
+# THRESHOLD SETS
+# ==================================================
+
+@dataclass(frozen=True)
+class ThresholdSet:
+    stressed: float = SystemicMonitor.STRESSED_THRESHOLD
+    pre_systemic: float = SystemicMonitor.PRE_SYSTEMIC_THRESHOLD
+    systemic: float = SystemicMonitor.SYSTEMIC_THRESHOLD
+    hard_drawdown: float = SystemicMonitor.HARD_DRAWDOWN_THRESHOLD
+    hard_correlation: float = SystemicMonitor.HARD_CORRELATION_THRESHOLD
+    hard_liquidity: float = SystemicMonitor.HARD_LIQUIDITY_THRESHOLD
+    scaling_k: float = SystemicMonitor.SCALING_K
+    recovery_steps: int = CapitalRecoveryController.RECOVERY_STEPS
+    recovery_start_cap: float = CapitalRecoveryController.RECOVERY_START_CAP
+
+    def __post_init__(self):
+        # The recovery ramp divides by the step count
+        if self.recovery_steps < 1:
+            raise ValueError(f"recovery_steps must be >= 1, got {self.recovery_steps}")
+
+    def apply(self, orchestrator) -> None:
+        """
+        Install these thresholds on an orchestrator instance
+        (instance attributes shadow the class constants).
+        """
+        monitor = orchestrator.systemic_monitor
+        monitor.STRESSED_THRESHOLD = self.stressed
+        monitor.PRE_SYSTEMIC_THRESHOLD = self.pre_systemic
+        monitor.SYSTEMIC_THRESHOLD = self.systemic
+        monitor.HARD_DRAWDOWN_THRESHOLD = self.hard_drawdown
+        monitor.HARD_CORRELATION_THRESHOLD = self.hard_correlation
+        monitor.HARD_LIQUIDITY_THRESHOLD = self.hard_liquidity
+        monitor.SCALING_K = self.scaling_k
+
+        recovery = orchestrator.recovery_controller
+        recovery.RECOVERY_STEPS = self.recovery_steps
+        recovery.RECOVERY_START_CAP = self.recovery_start_cap
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def threshold_grid(base: Optional[ThresholdSet] = None, **axes: Iterable) -> List[ThresholdSet]:
+    """
+    Cartesian product over the given ThresholdSet fields,
+    e.g. threshold_grid(stressed=[0.5, 0.55], systemic=[0.8, 0.85]).
+    """
+
+    base = base or ThresholdSet()
+    names = list(axes)
+
+    return [
+        replace(base, **dict(zip(names, values)))
+        for values in product(*(list(axes[n]) for n in names))
+    ]
+
+
+# ==================================================
+# FRAMES
+# ==================================================
+
+def frames_to_array(frames) -> np.ndarray:
+    """
+    T x 5 float64 array from an array, SystemicInputs or dicts.
+    """
+
+    if isinstance(frames, np.ndarray):
+        arr = np.asarray(frames, dtype=float)
+    else:
+        rows = []
+        for frame in frames:
+            if isinstance(frame, dict):
+                rows.append([frame[f] for f in INPUT_FIELDS])
+            else:
+                rows.append([getattr(frame, f) for f in INPUT_FIELDS])
+        arr = np.array(rows, dtype=float).reshape(-1, len(INPUT_FIELDS))
+
+    if arr.ndim != 2 or arr.shape[1] != len(INPUT_FIELDS):
+        raise ValueError(f"frames must be T x {len(INPUT_FIELDS)}, got {arr.shape}")
+
+    return arr
+
+
+def composite_scores(frames: np.ndarray) -> np.ndarray:
+    # Same summation order as the orchestrator (bit-identical)
+    return (
+        frames[:, 0] + frames[:, 1] + frames[:, 2] + frames[:, 3] + frames[:, 4]
+    ) / 5.0
+
+
+# ==================================================
+# CORE KERNEL
+# ==================================================
+
+# Thresholds that drive the flatten / STANDBY / recovery latches.
+# Configurations sharing these share the latch computation.
+LATCH_FIELDS = ("stressed", "systemic", "hard_drawdown", "hard_correlation", "hard_liquidity")
+
+
+def _column(grid: Sequence[ThresholdSet], name: str, dtype=float) -> np.ndarray:
+    return np.array([getattr(t, name) for t in grid], dtype=dtype)[:, None]
+
+
+def _last_index(events: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    """
+    Per row, index of the most recent True at or before t (-1 if none).
+    """
+    return np.maximum.accumulate(np.where(events, idx, -1), axis=1)
+
+
+def _latches(
+    frames: np.ndarray,
+    composite: np.ndarray,
+    keys: Sequence[ThresholdSet],
+) -> Dict[str, np.ndarray]:
+    """
+    K x T latch state for K threshold sets (only LATCH_FIELDS
+    are read).
+    """
+
+    idx = np.arange(composite.shape[0], dtype=np.int32)
+    c = composite[None, :]
+    st = _column(keys, "stressed")
+
+    hard = (
+        (frames[None, :, 0] >= _column(keys, "hard_drawdown"))
+        | (frames[None, :, 2] >= _column(keys, "hard_correlation"))
+        | (frames[None, :, 1] >= _column(keys, "hard_liquidity"))
+    )
+    below_stress = c < st
+
+    # Hard interrupt or composite systemic -> flatten -> STANDBY
+    flat = hard | (c >= _column(keys, "systemic"))
+
+    # STANDBY holds until a non-flatten frame below STRESSED
+    release = ~flat & below_stress
+    standby = _last_index(flat, idx) > _last_index(release, idx)
+
+    prev_standby = np.zeros_like(standby)
+    prev_standby[:, 1:] = standby[:, :-1]
+
+    # Recovery: armed on STANDBY -> NORMAL, cleared by stress
+    last_activation = _last_index(release & prev_standby, idx)
+    active = last_activation > _last_index(~below_stress, idx)
+
+    return {
+        "below_stress": below_stress,
+        "flatten": flat,
+        "standby": standby,
+        "prev_standby": prev_standby,
+        "recovery_active": active,
+        "since_activation": idx - last_activation,
+    }
+
+
+def _risk_rows(
+    composite: np.ndarray,
+    latch: Dict[str, np.ndarray],
+    stressed: float,
+    systemic: float,
+    scaling_k: np.ndarray,
+) -> np.ndarray:
+    """
+    Monitor size multiplier, one row per SCALING_K value.
+    """
+
+    c = composite[None, :]
+    k = np.asarray(scaling_k, dtype=float)[:, None]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scaled = np.clip(1.0 - ((c - stressed) / (systemic - stressed)) * k, 0.0, 1.0)
+
+    risk = np.where(latch["below_stress"], 1.0, scaled)
+    risk[:, latch["flatten"]] = 0.0
+    return risk
+
+
+def _mode_rows(
+    composite: np.ndarray,
+    latch: Dict[str, np.ndarray],
+    pre_systemic: np.ndarray,
+) -> np.ndarray:
+    """
+    Orchestrator regime codes, one row per PRE_SYSTEMIC value.
+    """
+
+    mode = np.where(
+        composite[None, :] >= np.asarray(pre_systemic, dtype=float)[:, None],
+        _PRE,
+        np.where(latch["below_stress"], _NORMAL, _STRESSED),
+    ).astype(np.int8)
+
+    # STANDBY exit is always reported NORMAL, even when PRE_SYSTEMIC
+    # is set below STRESSED and the composite is above it
+    mode[:, latch["prev_standby"] & ~latch["standby"]] = _NORMAL
+    mode[:, latch["standby"]] = _STANDBY
+    return mode
+
+
+def _recovery_rows(
+    latch: Dict[str, np.ndarray],
+    steps: np.ndarray,
+    start_cap: np.ndarray,
+) -> np.ndarray:
+    """
+    Recovery modifier, one row per (RECOVERY_STEPS, RECOVERY_START_CAP).
+    """
+
+    steps = np.asarray(steps, dtype=np.int64)[:, None]
+    start = np.asarray(start_cap, dtype=float)[:, None]
+
+    step = np.minimum(latch["since_activation"], steps)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cap = np.clip(start + (step / steps) * (1.0 - start), 0.0, 1.0)
+
+    return np.where(latch["recovery_active"], cap, 1.0)
+
+
+def _allow_table(policy) -> np.ndarray:
+    return np.array([policy.resolve(m).allow_entries for m in MODES], dtype=bool)
+
+
+def _latch_key(t: ThresholdSet):
+    return tuple(getattr(t, f) for f in LATCH_FIELDS)
+
+
+def _unique(values: List) -> List:
+    return list(dict.fromkeys(values))
+
+
+# ==================================================
+# PUBLIC API
+# ==================================================
+
+def simulate(
+    frames,
+    thresholds: Optional[ThresholdSet] = None,
+    policy=None,
+    domain_modifier: float = 1.0,
+) -> Dict[str, np.ndarray]:
+    """
+    Full per-frame paths (length T) for one threshold set.
+    """
+
+    t = thresholds or ThresholdSet()
+    arr = frames_to_array(frames)
+    composite = composite_scores(arr)
+    allow_table = _allow_table(policy or DefaultRegimeExecutionPolicy())
+
+    latch = {k: v[0] for k, v in _latches(arr, composite, [t]).items()}
+
+    risk = _risk_rows(composite, latch, t.stressed, t.systemic, [t.scaling_k])[0]
+    mode = _mode_rows(composite, latch, [t.pre_systemic])[0]
+    recovery = _recovery_rows(latch, [t.recovery_steps], [t.recovery_start_cap])[0]
+
+    return {
+        "composite": composite,
+        "mode": mode,
+        "risk_multiplier": risk,
+        "recovery_modifier": recovery,
+        "size_multiplier": risk * recovery * domain_modifier,
+        "allow_entries": allow_table[mode] & ~latch["flatten"],
+        "flatten": latch["flatten"],
+        "standby": latch["standby"],
+        "recovery_active": latch["recovery_active"],
+    }
+
+
+def sweep(
+    frames,
+    grid: Sequence[ThresholdSet],
+    policy=None,
+    domain_modifier: float = 1.0,
+    chunk_elements: int = CHUNK_ELEMENTS,
+) -> Dict[str, np.ndarray]:
+    """
+    Summary metrics per threshold set (arrays of length G):
+
+        share_<mode>      fraction of frames in each mode
+        mean_size         mean final size multiplier
+        entry_share       fraction of frames allowing entries
+        flatten_frames    frames with flatten_all
+        standby_entries   transitions into STANDBY
+        transitions       regime changes (audit events)
+        recovery_share    fraction of frames with an active ramp
+
+    Within one latch group, mode metrics depend only on
+    PRE_SYSTEMIC, the monitor multiplier only on SCALING_K and
+    the ramp only on the recovery pair; mean_size for every
+    (k, recovery) combination is one matrix product.
+    """
+
+    arr = frames_to_array(frames)
+    composite = composite_scores(arr)
+    allow_table = _allow_table(policy or DefaultRegimeExecutionPolicy())
+
+    T = arr.shape[0]
+    G = len(grid)
+    chunk = max(1, chunk_elements // max(T, 1))
+
+    out: Dict[str, np.ndarray] = {
+        f"share_{m.value}": np.zeros(G) for m in MODES
+    }
+    for name in ("mean_size", "entry_share", "recovery_share"):
+        out[name] = np.zeros(G)
+    for name in ("flatten_frames", "standby_entries", "transitions"):
+        out[name] = np.zeros(G, dtype=np.int64)
+
+    if T == 0 or G == 0:
+        return out
+
+    groups: Dict[tuple, List[int]] = {}
+    for i, t in enumerate(grid):
+        groups.setdefault(_latch_key(t), []).append(i)
+
+    members = list(groups.values())
+
+    for lo in range(0, len(members), chunk):
+
+        block = members[lo:lo + chunk]
+        latches = _latches(arr, composite, [grid[m[0]] for m in block])
+
+        for row, indexes in enumerate(block):
+
+            latch = {k: v[row] for k, v in latches.items()}
+            head = grid[indexes[0]]
+
+            out["flatten_frames"][indexes] = latch["flatten"].sum()
+            out["standby_entries"][indexes] = (latch["standby"] & ~latch["prev_standby"]).sum()
+            out["recovery_share"][indexes] = latch["recovery_active"].mean()
+
+            configs = [grid[i] for i in indexes]
+            pres = _unique([t.pre_systemic for t in configs])
+            ks = _unique([t.scaling_k for t in configs])
+            ramps = _unique([(t.recovery_steps, t.recovery_start_cap) for t in configs])
+
+            # ---- mode metrics per PRE_SYSTEMIC ----
+            for p_lo in range(0, len(pres), chunk):
+                p_vals = pres[p_lo:p_lo + chunk]
+                mode = _mode_rows(composite, latch, p_vals)
+
+                n = len(MODES)
+                counts = np.bincount(
+                    (mode + n * np.arange(len(p_vals))[:, None]).ravel(),
+                    minlength=n * len(p_vals),
+                ).reshape(len(p_vals), n) / T
+                entry = (allow_table[mode] & ~latch["flatten"]).mean(axis=1)
+                transitions = (
+                    (mode[:, 0] != _NORMAL).astype(np.int64)
+                    + (mode[:, 1:] != mode[:, :-1]).sum(axis=1)
+                )
+
+                at = {p: j for j, p in enumerate(p_vals)}
+                for i, t in zip(indexes, configs):
+                    j = at.get(t.pre_systemic)
+                    if j is None:
+                        continue
+                    for code, m in enumerate(MODES):
+                        out[f"share_{m.value}"][i] = counts[j, code]
+                    out["entry_share"][i] = entry[j]
+                    out["transitions"][i] = transitions[j]
+
+            # ---- mean size per (SCALING_K, recovery pair) ----
+            risk = _risk_rows(composite, latch, head.stressed, head.systemic, ks)
+            recovery = _recovery_rows(latch, [r[0] for r in ramps], [r[1] for r in ramps])
+            mean_size = (risk @ recovery.T) * (domain_modifier / T)
+
+            k_at = {k: j for j, k in enumerate(ks)}
+            r_at = {r: j for j, r in enumerate(ramps)}
+            for i, t in zip(indexes, configs):
+                out["mean_size"][i] = mean_size[
+                    k_at[t.scaling_k], r_at[(t.recovery_steps, t.recovery_start_cap)]
+                ]
+
+    return out
+
+
+# ==================================================
+# VERIFICATION
+# ==================================================
+
+class _FrameSource:
+
+    source_type = "replay"
+
+    def __init__(self, frames: np.ndarray):
+        self._rows = [SystemicInputs(*map(float, row)) for row in frames]
+        self._index = 0
+
+    def collect(self) -> SystemicInputs:
+        row = self._rows[min(self._index, len(self._rows) - 1)]
+        self._index += 1
+        return row
+
+
+def verify_against_orchestrator(
+    frames,
+    thresholds: ThresholdSet,
+    max_frames: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run the real IntradayOrchestrator over the frames with the
+    given thresholds and compare with simulate().
+
+    Returns mismatches (empty list when identical).
+    """
+
+    from marketmind_engine.orchestrator.intraday_orchestrator import IntradayOrchestrator
+
+    arr = frames_to_array(frames)
+    if max_frames is not None:
+        arr = arr[:max_frames]
+
+    paths = simulate(arr, thresholds)
+
+    orchestrator = IntradayOrchestrator(macro_source=_FrameSource(arr))
+    thresholds.apply(orchestrator)
+
+    mismatches = []
+
+    for t in range(arr.shape[0]):
+
+        cycle = orchestrator.run_cycle()
+
+        expected = {
+            "regime": MODES[paths["mode"][t]].value,
+            "size_multiplier": float(paths["size_multiplier"][t]),
+            "allow_entries": bool(paths["allow_entries"][t]),
+            "recovery_modifier": float(paths["recovery_modifier"][t]),
+            "composite_score": float(paths["composite"][t]),
+        }
+        actual = {
+            "regime": cycle["regime"],
+            "size_multiplier": cycle["execution"]["size_multiplier"],
+            "allow_entries": cycle["execution"]["allow_entries"],
+            "recovery_modifier": cycle["recovery_modifier"],
+            "composite_score": cycle["composite_score"],
+        }
+
+        if expected != actual:
+            mismatches.append({"frame": t, "expected": expected, "actual": actual})
+
+    return mismatches
+
+
+def verify_sweep(
+    frames,
+    grid: Sequence[ThresholdSet],
+    samples: int = 3,
+    max_frames: Optional[int] = 5000,
+    seed: int = 0,
+) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Check a random sample of grid entries against the
+    orchestrator. Returns {grid_index: mismatches} for failures.
+    """
+
+    rng = random.Random(seed)
+    picks = rng.sample(range(len(grid)), min(samples, len(grid)))
+
+    failures = {}
+
+    for i in picks:
+        mismatches = verify_against_orchestrator(frames, grid[i], max_frames=max_frames)
+        if mismatches:
+            failures[i] = mismatches
+
+    return failures
+
+
+# ==================================================
+# CLI
+# ==================================================
+
+def _load_frames(path: str) -> np.ndarray:
+    if path.endswith(".npy"):
+        return np.load(path)
+    return np.loadtxt(path, delimiter=",", ndmin=2)
+
+
+def _floats(text: str) -> List[float]:
+    return [float(v) for v in text.split(",") if v]
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="MarketMind regime threshold sweep")
+    parser.add_argument("frames", help="T x 5 frames (.npy or .csv)")
+    for name in ("stressed", "pre_systemic", "systemic", "scaling_k", "recovery_start_cap"):
+        parser.add_argument(f"--{name.replace('_', '-')}", type=_floats, default=None)
+    parser.add_argument("--verify", type=int, default=3, help="sampled configs to check")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    axes = {
+        name: getattr(args, name)
+        for name in ("stressed", "pre_systemic", "systemic", "scaling_k", "recovery_start_cap")
+        if getattr(args, name)
+    }
+
+    frames = _load_frames(args.frames)
+    grid = threshold_grid(**axes)
+    results = sweep(frames, grid)
+
+    order = np.argsort(-results["mean_size"])[: args.top]
+
+    print(f"Frames: {len(frames)}  Configurations: {len(grid)}")
+    for i in order:
+        print(
+            f"{grid[i]}  mean_size={results['mean_size'][i]:.4f} "
+            f"standby={results['share_standby'][i]:.4f} "
+            f"transitions={results['transitions'][i]}"
+        )
+
+    if args.verify:
+        failures = verify_sweep(frames, grid, samples=args.verify)
+        print("Verification:", "OK" if not failures else f"FAILED {sorted(failures)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+from dataclasses import replace
+import gzip
+import json
+import threading
+
+from marketmind_engine.regime.audit.schema import RegimeTransitionEvent
+from marketmind_engine.regime.audit.writer import (
+    BufferedRegimeAuditWriter,
+    RotatingJsonlFile,
+)
+from marketmind_engine.utils.background_writer import BackgroundWriter
+
+
+def _event(i):
+    return RegimeTransitionEvent(
+        timestamp=float(i),
+        previous_regime="NORMAL",
+        new_regime="STRESSED",
+        composite_score=0.6,
+        hard_interrupt=False,
+        block_new_entries=False,
+        hysteresis_locked=False,
+        macro_source_type="live",
+        injected_mode=False,
+    )
+
+
+def test_buffered_writer_writes_all_events(tmp_path):
+    path = tmp_path / "regime.jsonl"
+    writer = BufferedRegimeAuditWriter(path, flush_mode="shutdown")
+
+    for i in range(100):
+        writer.write(_event(i))
+
+    writer.close()
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 100
+    assert json.loads(lines[-1])["timestamp"] == 99.0
+    assert writer.stats()["dropped"] == 0
+
+
+def test_unserializable_event_is_dropped_not_its_batch(tmp_path):
+    path = tmp_path / "regime.jsonl"
+    writer = BufferedRegimeAuditWriter(path, flush_mode="shutdown")
+
+    for i in range(5):
+        event = _event(i)
+        if i == 2:
+            event = replace(event, composite_score=object())
+        writer.write(event)
+
+    writer.close()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [e["timestamp"] for e in lines] == [0.0, 1.0, 3.0, 4.0]
+
+    stats = writer.stats()
+    assert stats["written"] == 4
+    assert stats["dropped"] == 1
+    assert stats["errors"] == 0
+
+
+def test_flush_makes_events_visible(tmp_path):
+    path = tmp_path / "regime.jsonl"
+    writer = BufferedRegimeAuditWriter(path, flush_mode="interval", flush_interval_ms=10_000)
+
+    writer.write(_event(1))
+    assert writer.flush()
+    assert len(path.read_text().splitlines()) == 1
+
+    writer.close()
+
+
+def test_rotation_by_size_compresses_segments(tmp_path):
+    path = tmp_path / "regime.jsonl"
+    sink = RotatingJsonlFile(path, max_bytes=200, backup_count=2)
+
+    for i in range(20):
+        sink.write_lines([json.dumps(_event(i).to_dict())])
+
+    sink.close()
+
+    segments = sink.segments()
+    assert len(segments) == 2
+    assert all(p.suffix == ".gz" for p in segments)
+    with gzip.open(segments[-1], "rt") as f:
+        assert json.loads(f.readline())["new_regime"] == "STRESSED"
+
+
+def test_rotation_by_day(tmp_path):
+    clock = {"t": 86400.0 * 10 + 100}
+    sink = RotatingJsonlFile(tmp_path / "r.jsonl", rotate_daily=True, now_fn=lambda: clock["t"])
+
+    sink.write_lines(["a"])
+    clock["t"] += 86400
+    sink.write_lines(["b"])
+    sink.close()
+
+    assert sink.rotations == 1
+    assert (tmp_path / "r.jsonl").read_text() == "b\n"
+
+
+def test_full_queue_drops_and_counts():
+    gate = threading.Event()
+    writer = BackgroundWriter(sink=lambda batch: gate.wait(5), max_queue=2, batch_size=1)
+
+    results = [writer.submit(i) for i in range(10)]
+
+    assert results.count(False) >= 7
+    assert writer.stats()["dropped"] == results.count(False)
+
+    gate.set()
+    writer.close()
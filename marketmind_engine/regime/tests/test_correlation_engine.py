@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from marketmind_engine.regime.correlation import (
+    RollingCorrelationEngine,
+    replay_price_feed,
+)
+from marketmind_engine.replay.historical_price_feed import HistoricalPriceFeed
+from marketmind_engine.replay.replay_clock import ReplayClock
+
+
+def test_window_matches_numpy_corrcoef():
+    rng = np.random.default_rng(7)
+    returns = rng.normal(size=(300, 12))
+    engine = RollingCorrelationEngine(12, window=50)
+
+    for row in returns:
+        engine.push(row)
+
+    expected = np.corrcoef(returns[-50:].T)
+    assert np.allclose(engine.correlation(), expected, atol=1e-9)
+
+    k = 12
+    summary = engine.summary()
+    assert summary.mean_offdiagonal == pytest.approx((expected.sum() - k) / (k * (k - 1)))
+    assert summary.top_eigen_share == pytest.approx(np.linalg.eigvalsh(expected)[-1] / k)
+
+
+def test_common_factor_drives_summary_and_jump():
+    rng = np.random.default_rng(1)
+    engine = RollingCorrelationEngine(20, window=30)
+
+    for _ in range(30):
+        engine.push(rng.normal(size=20))
+    calm = engine.summary()
+
+    for _ in range(30):
+        engine.push(rng.normal() + 0.1 * rng.normal(size=20))
+    stressed = engine.summary()
+
+    assert calm.mean_offdiagonal < 0.2
+    assert stressed.mean_offdiagonal > 0.9
+    assert stressed.top_eigen_share > 0.9
+    assert stressed.max_pair_jump > 0.5
+
+
+def test_ewma_mode_tracks_correlation():
+    rng = np.random.default_rng(3)
+    engine = RollingCorrelationEngine(2, window=None, halflife=20)
+
+    for _ in range(500):
+        f = rng.normal()
+        engine.push([f, f + 0.01 * rng.normal()])
+
+    assert engine.mean_offdiagonal() > 0.99
+
+
+def test_replay_harness_feeds_engine():
+    clock = ReplayClock()
+    feed = HistoricalPriceFeed(clock)
+    engine = RollingCorrelationEngine(2, window=10)
+
+    summaries = list(replay_price_feed(
+        engine, feed, ["AAA", "BBB"], steps=20, advance=lambda: clock.advance(60),
+    ))
+
+    assert len(summaries) == 20
+    assert summaries[-1].observations == 19
+    assert summaries[-1].mean_offdiagonal == pytest.approx(1.0)
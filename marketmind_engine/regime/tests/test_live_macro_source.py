@@ -0,0 +1,148 @@
+import math
+
+import pytest
+
+from marketmind_engine.orchestrator.intraday_orchestrator import IntradayOrchestrator
+from marketmind_engine.regime.correlation import RollingCorrelationEngine
+from marketmind_engine.regime.macro_sources.live_source import LiveMacroSource
+
+
+def _naive_corr(rows):
+    n = len(rows)
+    k = len(rows[0])
+    cols = [[r[i] for r in rows] for i in range(k)]
+    total, pairs = 0.0, 0
+    for i in range(k):
+        for j in range(i + 1, k):
+            mi, mj = sum(cols[i]) / n, sum(cols[j]) / n
+            cov = sum((a - mi) * (b - mj) for a, b in zip(cols[i], cols[j]))
+            vi = sum((a - mi) ** 2 for a in cols[i])
+            vj = sum((b - mj) ** 2 for b in cols[j])
+            total += cov / math.sqrt(vi * vj)
+            pairs += 1
+    return total / pairs
+
+
+def test_rolling_correlation_matches_window_recompute():
+    rows = [[math.sin(t), math.sin(t + 0.3), math.cos(t * 1.7)] for t in range(40)]
+    corr = RollingCorrelationEngine(3, window=10)
+
+    for row in rows:
+        corr.push(row)
+
+    assert corr.mean_offdiagonal() == pytest.approx(_naive_corr(rows[-10:]))
+
+
+def test_selloff_raises_systemic_inputs():
+    source = LiveMacroSource(symbols=["SPY", "QQQ"], window=20, price_fn=None)
+
+    for t in range(30):
+        source.on_tick({"SPY": 100 + 0.01 * (t % 2), "QQQ": 200 + 0.02 * (t % 3)})
+
+    calm = source.collect()
+
+    for t in range(10):
+        source.on_tick({"SPY": 100 * (1 - 0.01 * t), "QQQ": 200 * (1 - 0.012 * t)})
+
+    stressed = source.collect()
+
+    assert stressed.drawdown_velocity > calm.drawdown_velocity
+    assert stressed.drawdown_velocity == 1.0
+    assert stressed.structural_confirmation == 1.0
+    assert stressed.correlation_spike > 0.5
+
+
+def test_poll_ingests_only_newer_prices():
+    entries = {"SPY": (1.0, 100.0)}
+    source = LiveMacroSource(symbols=["SPY"], price_fn=lambda syms: dict(entries))
+
+    source.collect()
+    source.collect()
+    assert source.ticks == 1
+
+    entries["SPY"] = (2.0, 99.0)
+    source.collect()
+    assert source.ticks == 2
+
+
+def test_narrative_shock_and_orchestrator_cycle():
+    source = LiveMacroSource(symbols=["SPY"], price_fn=None)
+
+    for x in [1.0, 1.2, 0.9, 1.1] * 5:
+        source.on_narrative(x)
+
+    source.on_narrative(5.0)
+    assert source.collect().narrative_shock == 1.0
+
+    snapshot = IntradayOrchestrator(macro_source=source).run_cycle()
+    assert snapshot["regime"]
+
+
+class _Clock:
+
+    def __init__(self, t=1000.0):
+        self.t = t
+
+    def __call__(self):
+        return self.t
+
+
+def test_fallback_inputs_until_data_and_when_stale():
+    clock = _Clock()
+    source = LiveMacroSource(symbols=["SPY", "QQQ"], price_fn=None, stale_after=60, now_fn=clock)
+
+    assert source.collect() == LiveMacroSource.FALLBACK_INPUTS
+
+    for t in range(5):
+        source.on_tick({"SPY": 100 + t, "QQQ": 200 + t})
+
+    live = source.collect()
+    assert live.structural_confirmation == 0.0
+    assert live.narrative_shock == LiveMacroSource.FALLBACK_INPUTS.narrative_shock
+
+    clock.t += 61
+    assert source.collect().structural_confirmation == 0.1
+
+
+def test_missing_prints_are_skipped_not_carried_forward():
+    source = LiveMacroSource(symbols=["SPY", "QQQ"], price_fn=None)
+
+    source.on_tick({"SPY": 100.0, "QQQ": 200.0})
+    source.on_tick({"SPY": 101.0, "QQQ": 202.0})
+    assert source._correlation.observations == 1
+
+    source.on_tick({"SPY": 102.0})
+    assert source._correlation.observations == 1
+    assert len(source._instruments[1].prices) == 2
+
+    source.on_tick({})
+    assert source.ticks == 3
+
+
+def test_poll_skips_instruments_without_new_print():
+    entries = {"SPY": (1.0, 100.0), "QQQ": (1.0, 200.0)}
+    source = LiveMacroSource(symbols=["SPY", "QQQ"], price_fn=lambda syms: dict(entries))
+
+    source.collect()
+    entries["SPY"] = (2.0, 99.0)
+    source.collect()
+
+    assert source._instruments[0].last == 99.0
+    assert len(source._instruments[1].prices) == 1
+
+
+def test_drawdown_velocity_is_a_rate():
+    source = LiveMacroSource(symbols=["SPY"], price_fn=None)
+
+    for price in [100, 98, 96, 94, 92]:
+        source.on_tick({"SPY": price})
+    falling = source.collect().drawdown_velocity
+
+    for _ in range(30):
+        source.on_tick({"SPY": 92})
+    flat = source.collect().drawdown_velocity
+
+    # Drawdown level is unchanged (8%), but it stopped deepening
+    assert source._instruments[0].drawdown() == pytest.approx(0.08)
+    assert falling == 1.0
+    assert flat < 0.01
@@ -0,0 +1,132 @@
+import asyncio
+import json
+import threading
+
+from marketmind_engine.regime.snapshot_store import (
+    RegimeSnapshotStore,
+    etag_matches,
+    parse_last_event_id,
+    sse_event,
+    sse_stream,
+)
+
+
+def _snap(regime="normal", ts=1.0, score=0.2):
+    return {"regime": regime, "timestamp": ts, "composite_score": score}
+
+
+def test_version_bumps_only_on_content_change():
+    store = RegimeSnapshotStore()
+
+    first = store.publish(_snap(ts=1.0))
+    same = store.publish(_snap(ts=2.0))
+    changed = store.publish(_snap(regime="stressed", ts=3.0, score=0.6))
+
+    assert first.version == 1
+    assert same is first
+    assert changed.version == 2
+    assert store.cycles == 3
+    assert store.latest().data["regime"] == "stressed"
+
+
+def test_etag_matching():
+    store = RegimeSnapshotStore()
+    snap = store.publish(_snap())
+
+    assert etag_matches(snap.etag, snap)
+    assert etag_matches(f'"other", W/{snap.etag}', snap)
+    assert etag_matches("*", snap)
+    assert not etag_matches('"stale-0"', snap)
+    assert not etag_matches(None, snap)
+
+
+def test_wait_for_change_wakes_on_publish():
+    store = RegimeSnapshotStore()
+    store.publish(_snap())
+
+    result = {}
+
+    def waiter():
+        result["snap"] = store.wait_for_change(1, timeout=5)
+
+    t = threading.Thread(target=waiter)
+    t.start()
+    store.publish(_snap(regime="stressed"))
+    t.join(5)
+
+    assert result["snap"].version == 2
+    assert store.wait_for_change(2, timeout=0.01) is None
+
+
+def test_async_next_change_returns_newer_snapshot():
+    store = RegimeSnapshotStore()
+    store.publish(_snap())
+
+    snap = asyncio.run(store.next_change(0))
+    assert snap.version == 1
+
+    assert asyncio.run(store.next_change(1, timeout=0.01)) is None
+
+
+def test_async_next_change_wakes_without_worker_threads():
+    store = RegimeSnapshotStore()
+    store.publish(_snap())
+
+    async def scenario():
+        readers = [asyncio.create_task(store.next_change(1, timeout=5)) for _ in range(20)]
+        await asyncio.sleep(0.01)
+
+        threads_while_parked = threading.active_count()
+        parked = store.async_waiters
+
+        # Publish from another thread, as the engine loop does
+        publisher = threading.Thread(target=store.publish, args=(_snap(regime="stressed"),))
+        publisher.start()
+        results = await asyncio.gather(*readers)
+        publisher.join()
+
+        return threads_while_parked, parked, results
+
+    before = threading.active_count()
+    threads_while_parked, parked, results = asyncio.run(scenario())
+
+    assert parked == 20
+    assert threads_while_parked == before
+    assert [r.version for r in results] == [2] * 20
+    assert store.async_waiters == 0
+
+
+def test_last_event_id_from_other_epoch_restarts_at_zero():
+    store = RegimeSnapshotStore()
+    snap = store.publish(_snap())
+
+    assert parse_last_event_id(snap.event_id, store.epoch) == 1
+    assert parse_last_event_id("deadbeef-57", store.epoch) == 0
+    assert parse_last_event_id("57", store.epoch) == 0
+    assert parse_last_event_id("garbage", store.epoch) == 0
+    assert parse_last_event_id(None, store.epoch) == 0
+
+    # A restarted server (new store) sends the current snapshot to a
+    # client whose last id was far ahead in the previous epoch
+    restarted = RegimeSnapshotStore()
+    restarted.epoch = "restarted"
+    restarted.publish(_snap())
+
+    after = parse_last_event_id(f"{store.epoch}-57", restarted.epoch)
+    assert asyncio.run(restarted.next_change(after, timeout=0.01)).version == 1
+
+
+def test_sse_stream_emits_changes_only():
+    store = RegimeSnapshotStore()
+    store.publish(_snap())
+
+    stream = sse_stream(store, after_version=0, keepalive=0.01)
+
+    first = next(stream)
+    assert first.startswith(f"id: {store.epoch}-1\nevent: regime\n")
+    assert json.loads(first.split("data: ", 1)[1])["snapshot"]["regime"] == "normal"
+
+    assert next(stream).startswith(":")
+
+    store.publish(_snap(regime="standby"))
+    assert next(stream) == sse_event(store.latest())
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from marketmind_engine.regime.sweep import (
+    MODES,
+    ThresholdSet,
+    frames_to_array,
+    simulate,
+    sweep,
+    threshold_grid,
+    verify_against_orchestrator,
+    verify_sweep,
+)
+from marketmind_engine.regime.systemic_mode import SystemicMode
+
+
+def _frames(T=600, seed=3):
+    rng = np.random.default_rng(seed)
+    level = np.cumsum(rng.normal(0, 0.04, T)) % 1.2
+    return np.clip(level[:, None] + rng.normal(0, 0.08, (T, 5)), 0.0, 1.0)
+
+
+GRID = threshold_grid(
+    stressed=[0.45, 0.55],
+    pre_systemic=[0.65, 0.7],
+    systemic=[0.8, 0.85],
+    hard_drawdown=[0.9, 0.95],
+    scaling_k=[0.5, 1.0],
+    recovery_steps=[3, 5],
+)
+
+
+def test_simulate_matches_orchestrator_exactly():
+    frames = _frames()
+
+    for thresholds in (ThresholdSet(), GRID[5], GRID[-1]):
+        assert verify_against_orchestrator(frames, thresholds) == []
+
+
+def test_frames_visit_standby_and_recovery():
+    paths = simulate(_frames(), ThresholdSet())
+
+    modes = {MODES[m] for m in paths["mode"]}
+    assert SystemicMode.STANDBY in modes
+    assert SystemicMode.NORMAL in modes
+    assert paths["recovery_active"].any()
+
+
+def test_sweep_metrics_match_per_config_paths():
+    frames = _frames()
+    results = sweep(frames, GRID, chunk_elements=2000)
+
+    for i in (0, 7, 21, len(GRID) - 1):
+        paths = simulate(frames, GRID[i])
+
+        assert results["mean_size"][i] == pytest.approx(paths["size_multiplier"].mean())
+        assert results["entry_share"][i] == paths["allow_entries"].mean()
+        assert results["flatten_frames"][i] == paths["flatten"].sum()
+        assert results["share_standby"][i] == (paths["mode"] == 4).mean()
+
+
+def test_verify_sweep_samples_grid():
+    assert verify_sweep(_frames(300), GRID, samples=4) == {}
+
+
+def test_frames_from_records():
+    row = {
+        "drawdown_velocity": 0.1,
+        "liquidity_stress": 0.2,
+        "correlation_spike": 0.3,
+        "narrative_shock": 0.4,
+        "structural_confirmation": 0.5,
+    }
+    assert frames_to_array([row, row]).shape == (2, 5)
+
+    with pytest.raises(ValueError):
+        frames_to_array(np.zeros((3, 4)))
+
+
+def test_standby_exit_is_normal_when_pre_systemic_below_stressed():
+    # NORMAL, flatten, release at 0.55 (>= pre_systemic), then PRE_SYSTEMIC
+    frames = np.repeat([[0.2], [0.9], [0.55], [0.55], [0.2]], 5, axis=1)
+    thresholds = ThresholdSet(stressed=0.6, pre_systemic=0.5)
+
+    modes = [MODES[m] for m in simulate(frames, thresholds)["mode"]]
+
+    assert modes[1:4] == [SystemicMode.STANDBY, SystemicMode.NORMAL, SystemicMode.PRE_SYSTEMIC]
+    assert verify_against_orchestrator(frames, thresholds) == []
+    assert verify_against_orchestrator(_frames(), thresholds) == []
+
+
+def test_recovery_steps_must_be_positive():
+    with pytest.raises(ValueError):
+        ThresholdSet(recovery_steps=0)
@@ -0,0 +1,195 @@
+"""
+MarketMind Batch Research Runner
+
+Evaluates many standing research questions in one pass.
+
+Per domain (questions grouped):
+- resolve feeds and signals once
+- pull the shared article set once
+- score every question's keywords in one matcher pass, as
+  whole words ("ai" must not count "said" or "main")
+- build the research snapshot once, evaluate all questions
+
+Output is a compact results table; run_scheduled() repeats the
+batch on an interval.
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from marketmind_engine.research.domain_signal_router import DomainSignalRouter
+from marketmind_engine.research.question_evaluator import QuestionEvaluator
+from marketmind_engine.research.run_question import (
+    ResearchRSSService,
+    build_research_snapshot,
+    compute_question_signals,
+)
+
+
+@dataclass(frozen=True)
+class ResearchQuestion:
+    question: str
+    domain: str
+    keywords: Tuple[str, ...] = ()     # empty -> domain signals
+
+
+@dataclass(frozen=True)
+class ResearchRow:
+    question: str
+    domain: str
+    likelihood: float
+    matches: int
+    momentum: float
+    concentration: float
+    articles: int
+
+
+STANDING_QUESTIONS: Tuple[ResearchQuestion, ...] = (
+    ResearchQuestion(
+        "Will the Iran conflict expand regionally?",
+        "geopolitics",
+        ("iran", "israel", "missile", "strike", "military", "alliance", "war", "attack"),
+    ),
+    ResearchQuestion(
+        "Will new sanctions hit energy exports?",
+        "geopolitics",
+        ("sanction", "oil", "energy", "export", "embargo"),
+    ),
+    ResearchQuestion(
+        "Is a central bank pivot building?",
+        "macro",
+        ("rate cut", "pivot", "inflation", "fed", "central bank"),
+    ),
+    ResearchQuestion(
+        "Is AI chip demand accelerating?",
+        "technology",
+        ("ai", "chip", "semiconductor", "gpu", "nvidia"),
+    ),
+)
+
+
+class BatchResearchRunner:
+
+    def __init__(
+        self,
+        router: Optional[DomainSignalRouter] = None,
+        evaluator: Optional[QuestionEvaluator] = None,
+        service_factory: Callable[[List[str]], ResearchRSSService] = ResearchRSSService,
+    ):
+        self.router = router or DomainSignalRouter()
+        self.evaluator = evaluator or QuestionEvaluator()
+        self.service_factory = service_factory
+
+    def run(self, questions: Sequence[ResearchQuestion]) -> List[ResearchRow]:
+        """
+        Evaluate all questions. Rows follow the input order.
+        """
+
+        grouped: Dict[str, List[int]] = {}
+
+        for i, q in enumerate(questions):
+            grouped.setdefault(q.domain.lower(), []).append(i)
+
+        rows: List[Optional[ResearchRow]] = [None] * len(questions)
+
+        for domain, indexes in grouped.items():
+
+            config = self.router.resolve(domain)
+            articles = self.service_factory(config["rss_feeds"]).fetch_articles()
+
+            signals = compute_question_signals(
+                articles,
+                {i: questions[i].keywords or tuple(config["signals"]) for i in indexes},
+                whole_words=True,
+            )
+
+            # Same snapshot the single-question path builds (narrative
+            # signals also feed the composite block)
+            snapshots = [build_research_snapshot(signals[i]) for i in indexes]
+
+            results = self.evaluator.evaluate_many(
+                [questions[i].question for i in indexes],
+                domain,
+                snapshots,
+            )
+
+            for i, result in zip(indexes, results):
+                rows[i] = ResearchRow(
+                    question=result.question,
+                    domain=domain,
+                    likelihood=round(result.likelihood, 4),
+                    matches=signals[i]["matches"],
+                    momentum=round(signals[i]["momentum"], 4),
+                    concentration=round(signals[i]["concentration"], 4),
+                    articles=len(articles),
+                )
+
+        return rows
+
+
+def format_table(rows: Sequence[ResearchRow], width: int = 44) -> str:
+
+    lines = [
+        f"{'Question':<{width}} {'Domain':<12} {'Lklhd':>6} {'Match':>5} {'Mom':>6} {'Conc':>6} {'Arts':>5}"
+    ]
+
+    for r in rows:
+        q = r.question if len(r.question) <= width else r.question[: width - 1] + "…"
+        lines.append(
+            f"{q:<{width}} {r.domain:<12} {r.likelihood:>6.3f} {r.matches:>5} "
+            f"{r.momentum:>6.3f} {r.concentration:>6.3f} {r.articles:>5}"
+        )
+
+    return "\n".join(lines)
+
+
+def run_scheduled(
+    questions: Sequence[ResearchQuestion] = STANDING_QUESTIONS,
+    interval_seconds: float = 900.0,
+    iterations: Optional[int] = None,
+    runner: Optional[BatchResearchRunner] = None,
+    sleep: Callable[[float], None] = time.sleep,
+    emit: Callable[[str], None] = print,
+) -> None:
+    """
+    Run the batch every interval_seconds (forever if iterations
+    is None).
+    """
+
+    runner = runner or BatchResearchRunner()
+    done = 0
+
+    while iterations is None or done < iterations:
+
+        started = time.time()
+
+        try:
+            emit(format_table(runner.run(questions)))
+        except Exception as e:
+            emit(f"Research batch error: {e}")
+
+        done += 1
+
+        if iterations is not None and done >= iterations:
+            break
+
+        sleep(max(0.0, interval_seconds - (time.time() - started)))
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="MarketMind batch research runner")
+    parser.add_argument("--interval", type=float, default=0.0,
+                        help="repeat every N seconds (0 = run once)")
+    args = parser.parse_args()
+
+    run_scheduled(
+        interval_seconds=args.interval,
+        iterations=None if args.interval > 0 else 1,
+    )
+
+
+if __name__ == "__main__":
+    main()
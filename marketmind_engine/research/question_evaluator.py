@@ -3,10 +3,29 @@ MarketMind Research Question Evaluator
 
 Consumes PropagationEngine snapshot
 and produces deterministic likelihood + traceback.
+
+evaluate_many() scores a batch of (question, snapshot) pairs as
+one driver matrix times the weight vector (NumPy).
 """
 
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, List, Sequence, Tuple
+
+import numpy as np
+
+
+# (driver, snapshot layer, layer key, take abs)
+DRIVERS: Tuple[Tuple[str, str, str, bool], ...] = (
+    ("narrative_momentum", "narrative", "momentum", False),
+    ("narrative_concentration", "narrative", "concentration", False),
+    ("structural_volatility", "structural", "volatility", False),
+    ("structural_dispersion", "structural", "dispersion", False),
+    ("capital_alignment", "capital", "alignment", True),
+)
+
+DRIVER_WEIGHTS: Tuple[float, ...] = (0.35, 0.25, 0.20, 0.10, 0.10)
+
+_WEIGHTS = np.asarray(DRIVER_WEIGHTS, dtype=float)
 
 
 @dataclass
@@ -27,40 +46,63 @@ class QuestionEvaluator:
         snapshot: Dict[str, Any],
     ) -> ResearchResult:
 
-        narrative = snapshot.get("narrative", {})
-        structural = snapshot.get("structural", {})
-        capital = snapshot.get("capital", {})
-
-        narrative_momentum = float(narrative.get("momentum", 0.0))
-        narrative_concentration = float(narrative.get("concentration", 0.0))
-
-        structural_volatility = float(structural.get("volatility", 0.0))
-        structural_dispersion = float(structural.get("dispersion", 0.0))
+        drivers = driver_vector(snapshot)
 
-        capital_alignment = abs(float(capital.get("alignment", 0.0)))
-
-        drivers = {
-            "narrative_momentum": narrative_momentum,
-            "narrative_concentration": narrative_concentration,
-            "structural_volatility": structural_volatility,
-            "structural_dispersion": structural_dispersion,
-            "capital_alignment": capital_alignment,
-        }
-
-        likelihood = (
-            0.35 * narrative_momentum
-            + 0.25 * narrative_concentration
-            + 0.20 * structural_volatility
-            + 0.10 * structural_dispersion
-            + 0.10 * capital_alignment
-        )
-
-        likelihood = max(0.0, min(1.0, likelihood))
+        likelihood = combine(drivers)
 
         return ResearchResult(
             question=question,
             domain=domain,
             likelihood=likelihood,
-            drivers=drivers,
+            drivers=dict(zip(DRIVER_NAMES, drivers)),
             snapshot=snapshot,
-        )
\ No newline at end of file
+        )
+
+    def evaluate_many(
+        self,
+        questions: Sequence[str],
+        domain: str,
+        snapshots: Sequence[Dict[str, Any]],
+    ) -> List[ResearchResult]:
+        """
+        Evaluate questions[i] against snapshots[i] in one pass.
+        """
+
+        matrix = np.array(
+            [driver_vector(snap) for snap in snapshots], dtype=float
+        ).reshape(len(snapshots), len(DRIVERS))
+
+        likelihoods = np.clip(matrix @ _WEIGHTS, 0.0, 1.0)
+
+        return [
+            ResearchResult(
+                question=q,
+                domain=domain,
+                likelihood=float(lk),
+                drivers=dict(zip(DRIVER_NAMES, row.tolist())),
+                snapshot=snap,
+            )
+            for q, snap, row, lk in zip(questions, snapshots, matrix, likelihoods)
+        ]
+
+
+DRIVER_NAMES: Tuple[str, ...] = tuple(d[0] for d in DRIVERS)
+
+
+def driver_vector(snapshot: Dict[str, Any]) -> Tuple[float, ...]:
+
+    values = []
+
+    for _, layer, key, absolute in DRIVERS:
+        v = float(snapshot.get(layer, {}).get(key, 0.0))
+        values.append(abs(v) if absolute else v)
+
+    return tuple(values)
+
+
+def combine(drivers: Sequence[float]) -> float:
+    """
+    Weighted driver sum clamped to [0, 1].
+    """
+
+    return float(np.clip(np.asarray(drivers, dtype=float) @ _WEIGHTS, 0.0, 1.0))
\ No newline at end of file
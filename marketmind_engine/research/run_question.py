@@ -1,18 +1,33 @@
 """
 MarketMind Research Runner
 Domain-aware research execution with lightweight RSS ingestion
+
+Feeds are pulled concurrently under one shared deadline; parsed
+titles are cached by feed body hash, and keyword matching uses a
+single compiled pattern that can score many questions per pass.
 """
 
-import time
+import hashlib
+import os
 import re
+import threading
+import time
 import xml.etree.ElementTree as ET
-from urllib.request import urlopen
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 
+import numpy as np
+
+from marketmind_engine.utils.http_client import get_http_client
 from marketmind_engine.intelligence.propagation_engine import PropagationEngine
 from marketmind_engine.research.question_evaluator import QuestionEvaluator
 from marketmind_engine.research.domain_signal_router import DomainSignalRouter
 
 
+# Shared deadline for one concurrent feed pull (seconds)
+RESEARCH_FETCH_DEADLINE = float(os.getenv("MARKETMIND_RESEARCH_DEADLINE", "10"))
+
+
 # -------------------------------------------------------
 # Minimal runtime stubs required by PropagationEngine
 # -------------------------------------------------------
@@ -25,73 +40,218 @@ class StubEngineController:
     pass
 
 
+# -------------------------------------------------------
+# Parsed title cache (keyed by feed body hash)
+# -------------------------------------------------------
+
+class ArticleCache:
+    """
+    Bounded LRU of feed body hash -> parsed titles.
+
+    An unchanged feed body is never re-parsed, across runs
+    within the same process.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def titles(self, body: bytes):
+
+        digest = hashlib.sha1(body).hexdigest()
+
+        with self._lock:
+            cached = self._entries.get(digest)
+
+            if cached is not None:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return cached
+
+            self.misses += 1
+
+        titles = parse_titles(body)
+
+        with self._lock:
+            self._entries[digest] = titles
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return titles
+
+
+def parse_titles(body: bytes):
+
+    root = ET.fromstring(body)
+
+    return tuple(
+        title
+        for title in (item.findtext("title") for item in root.iter("item"))
+        if title
+    )
+
+
+ARTICLE_CACHE = ArticleCache()
+
+
 # -------------------------------------------------------
 # Lightweight RSS service used for research mode
 # -------------------------------------------------------
 
 class ResearchRSSService:
 
-    def __init__(self, feeds):
+    def __init__(
+        self,
+        feeds,
+        http_client=None,
+        deadline=RESEARCH_FETCH_DEADLINE,
+        max_workers=8,
+        cache=None,
+    ):
         self.feeds = feeds
+        self.http_client = http_client or get_http_client()
+        self.deadline = deadline
+        self.max_workers = max_workers
+        self.cache = cache or ARTICLE_CACHE
+
+        self.timed_out = 0
+
+    def _fetch_titles(self, url):
+
+        try:
+            body = self.http_client.get(url, timeout=5).content
+            return self.cache.titles(body)
+
+        except Exception:
+            return ()
 
     def fetch_articles(self):
         """
-        Pulls titles from RSS feeds.
+        Pulls titles from all RSS feeds concurrently.
+        Feeds still pending at the shared deadline are skipped.
         """
-        articles = []
 
-        for url in self.feeds:
-            try:
-                with urlopen(url, timeout=5) as response:
-                    xml_data = response.read()
+        if not self.feeds:
+            return []
+
+        workers = max(1, min(self.max_workers, len(self.feeds)))
+        pool = ThreadPoolExecutor(max_workers=workers)
 
-                root = ET.fromstring(xml_data)
+        try:
+            futures = [pool.submit(self._fetch_titles, url) for url in self.feeds]
+            done, pending = wait(futures, timeout=self.deadline)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
-                for item in root.iter("item"):
-                    title = item.findtext("title")
-                    if title:
-                        articles.append(title)
+        self.timed_out = len(pending)
+
+        # Feed order preserved
+        articles = []
 
-            except Exception:
-                pass
+        for f in futures:
+            if f in done:
+                articles.extend(f.result())
 
         return articles
 
 
+# -------------------------------------------------------
+# Compiled keyword matcher
+# -------------------------------------------------------
+
+GEOPOLITICS_KEYWORDS = [
+    "iran",
+    "israel",
+    "missile",
+    "strike",
+    "military",
+    "alliance",
+    "war",
+    "attack"
+]
+
+
+class KeywordMatcher:
+    """
+    One compiled, case-insensitive pattern for many keywords.
+
+    Substring semantics by default (same as `k in title.lower()`).
+    whole_words=True matches keywords as words instead, allowing
+    a plural "s"/"es" ("ai" no longer hits "said" or "main",
+    "sanction" still hits "sanctions").
+    mask() returns a bitmask of every keyword found, so many
+    keyword sets can be tested against one scan of a title.
+    """
+
+    def __init__(self, keywords, whole_words=False):
+
+        self.keywords = list(dict.fromkeys(k.lower() for k in keywords if k))
+        self.bits = {k: 1 << i for i, k in enumerate(self.keywords)}
+        self.whole_words = whole_words
+
+        # Longest first; a match also implies the keywords it contains
+        ordered = sorted(self.keywords, key=len, reverse=True)
+
+        def contains(k, j):
+            if not whole_words:
+                return j in k
+            return re.search(r"\b" + re.escape(j) + r"\b", k) is not None
+
+        self._implied = {
+            k: sum(self.bits[j] for j in self.keywords if contains(k, j))
+            for k in self.keywords
+        }
+
+        alternation = "|".join(re.escape(k) for k in ordered)
+
+        if whole_words:
+            alternation = r"\b(" + alternation + r")(?:e?s)?\b"
+        else:
+            alternation = "(" + alternation + ")"
+
+        self._pattern = (
+            re.compile("(?=" + alternation + ")", re.IGNORECASE)
+            if ordered else None
+        )
+
+    def mask_for(self, keywords):
+        return sum(self.bits[k.lower()] for k in keywords if k and k.lower() in self.bits)
+
+    def mask(self, text):
+
+        if self._pattern is None or not text:
+            return 0
+
+        found = 0
+
+        for m in self._pattern.finditer(text):
+            found |= self._implied[m.group(1).lower()]
+
+        return found
+
+    def matches(self, text):
+
+        return self._pattern is not None and self._pattern.search(text or "") is not None
+
+
 # -------------------------------------------------------
 # Simple narrative signal extractor
 # -------------------------------------------------------
 
-def compute_narrative_signals(articles):
+def _signals(matches, total):
 
-    if not articles:
+    if not total:
         return {
             "momentum": 0.0,
             "concentration": 0.0,
             "matches": 0
         }
 
-    keywords = [
-        "iran",
-        "israel",
-        "missile",
-        "strike",
-        "military",
-        "alliance",
-        "war",
-        "attack"
-    ]
-
-    matches = 0
-
-    for title in articles:
-        t = title.lower()
-
-        if any(k in t for k in keywords):
-            matches += 1
-
-    total = len(articles)
-
     concentration = matches / total
 
     # momentum approximated as frequency scaled
@@ -104,6 +264,111 @@ def compute_narrative_signals(articles):
     }
 
 
+def compute_narrative_signals(articles, keywords=None, whole_words=False):
+
+    matcher = KeywordMatcher(keywords or GEOPOLITICS_KEYWORDS, whole_words=whole_words)
+
+    matches = sum(1 for title in articles if matcher.matches(title))
+
+    return _signals(matches, len(articles))
+
+
+def _mask_bits(mask, width):
+    """
+    Keyword bitmask -> uint8 row of width 0/1 flags.
+    """
+
+    raw = np.frombuffer(mask.to_bytes((width + 7) // 8 or 1, "little"), dtype=np.uint8)
+    return np.unpackbits(raw, bitorder="little")[:width]
+
+
+def compute_question_signals(articles, question_keywords, whole_words=False):
+    """
+    Narrative signals for many keyword sets in one pass.
+
+    question_keywords: {question: [keywords]}
+    Returns {question: signals}.
+
+    Titles are scanned once into a titles x keywords hit matrix;
+    per-question counts are one product with the keywords x
+    questions membership matrix.
+    """
+
+    questions = list(question_keywords)
+
+    matcher = KeywordMatcher(
+        (k for keywords in question_keywords.values() for k in keywords),
+        whole_words=whole_words,
+    )
+
+    width = len(matcher.keywords)
+    total = len(articles)
+
+    if not questions or not width or not total:
+        return {q: _signals(0, total) for q in questions}
+
+    hits = np.stack([_mask_bits(matcher.mask(title), width) for title in articles])
+    membership = np.stack(
+        [_mask_bits(matcher.mask_for(question_keywords[q]), width) for q in questions],
+        axis=1,
+    )
+
+    counts = ((hits.astype(np.int32) @ membership) > 0).sum(axis=0)
+    concentration = counts / total
+    momentum = np.minimum(1.0, counts / 20.0)
+
+    return {
+        q: {
+            "momentum": float(momentum[i]),
+            "concentration": float(concentration[i]),
+            "matches": int(counts[i]),
+        }
+        for i, q in enumerate(questions)
+    }
+
+
+# -------------------------------------------------------
+# Research snapshot
+# -------------------------------------------------------
+
+def build_research_snapshot(narrative):
+    """
+    Research-mode propagation snapshot around narrative signals.
+    Structural and capital layers are fixed research baselines.
+    """
+
+    return {
+        "mode": "research_domain",
+        "timestamp": time.time(),
+
+        "structural": {
+            "bias": 0.0,
+            "volatility": 0.2,
+            "dispersion": 0.1
+        },
+
+        "narrative": {
+            "bias": 0.0,
+            "concentration": narrative["concentration"],
+            "momentum": narrative["momentum"]
+        },
+
+        "capital": {
+            "exposure": 0.0,
+            "unrealized_pct": 0.0,
+            "alignment": 0.1
+        },
+
+        "composite": {
+            "stress_score": narrative["momentum"] + 0.2,
+            "alignment_score": 0.1,
+            "regime_hint": "research_mode"
+        },
+
+        "relative_signals": []
+    }
+
+
 # -------------------------------------------------------
 # Natural Language Interpretation Layer
 # -------------------------------------------------------
@@ -220,36 +485,7 @@ def run():
     # Construct snapshot
     # ---------------------------------------------------
 
-    snapshot = {
-        "mode": "research_domain",
-        "timestamp": time.time(),
-
-        "structural": {
-            "bias": 0.0,
-            "volatility": 0.2,
-            "dispersion": 0.1
-        },
-
-        "narrative": {
-            "bias": 0.0,
-            "concentration": narrative["concentration"],
-            "momentum": narrative["momentum"]
-        },
-
-        "capital": {
-            "exposure": 0.0,
-            "unrealized_pct": 0.0,
-            "alignment": 0.1
-        },
-
-        "composite": {
-            "stress_score": narrative["momentum"] + 0.2,
-            "alignment_score": 0.1,
-            "regime_hint": "research_mode"
-        },
-
-        "relative_signals": []
-    }
+    snapshot = build_research_snapshot(narrative)
 
     # ---------------------------------------------------
     # Evaluate question
@@ -0,0 +1,85 @@
+from marketmind_engine.research.batch_runner import (
+    BatchResearchRunner,
+    ResearchQuestion,
+    format_table,
+)
+from marketmind_engine.research.question_evaluator import QuestionEvaluator
+from marketmind_engine.research.run_question import (
+    build_research_snapshot,
+    compute_narrative_signals,
+)
+
+
+ARTICLES = {
+    "geopolitics": ["Iran missile strike", "Oil sanctions widen", "Quiet day"],
+    "macro": ["Inflation cools", "Fed holds"],
+}
+
+
+class FakeRouter:
+
+    def __init__(self):
+        self.resolved = []
+
+    def resolve(self, domain):
+        self.resolved.append(domain)
+        return {"signals": ["inflation"], "rss_feeds": [domain]}
+
+
+class FakeService:
+
+    fetches = []
+
+    def __init__(self, feeds):
+        self.feeds = feeds
+
+    def fetch_articles(self):
+        FakeService.fetches.append(self.feeds[0])
+        return ARTICLES[self.feeds[0]]
+
+
+def test_one_fetch_per_domain_and_input_order():
+    FakeService.fetches = []
+    router = FakeRouter()
+    runner = BatchResearchRunner(router=router, service_factory=FakeService)
+
+    rows = runner.run([
+        ResearchQuestion("Q1", "geopolitics", ("iran", "missile")),
+        ResearchQuestion("Q2", "macro"),
+        ResearchQuestion("Q3", "geopolitics", ("sanction",)),
+    ])
+
+    assert router.resolved == ["geopolitics", "macro"]
+    assert FakeService.fetches == ["geopolitics", "macro"]
+    assert [r.question for r in rows] == ["Q1", "Q2", "Q3"]
+    assert [r.matches for r in rows] == [1, 1, 1]
+
+    assert "Q1" in format_table(rows)
+
+
+class RecordingEvaluator(QuestionEvaluator):
+
+    def evaluate_many(self, questions, domain, snapshots):
+        self.snapshots = list(snapshots)
+        return super().evaluate_many(questions, domain, snapshots)
+
+
+def _without_timestamp(snapshot):
+    return {k: v for k, v in snapshot.items() if k != "timestamp"}
+
+
+def test_batch_likelihood_matches_single_evaluation():
+    evaluator = RecordingEvaluator()
+    runner = BatchResearchRunner(
+        router=FakeRouter(), evaluator=evaluator, service_factory=FakeService
+    )
+
+    row = runner.run([ResearchQuestion("Q", "geopolitics", ("iran", "oil"))])[0]
+
+    narrative = compute_narrative_signals(ARTICLES["geopolitics"], ["iran", "oil"])
+    snapshot = build_research_snapshot(narrative)
+    single = QuestionEvaluator().evaluate("Q", "geopolitics", snapshot)
+
+    assert row.likelihood == round(single.likelihood, 4)
+    assert _without_timestamp(evaluator.snapshots[0]) == _without_timestamp(snapshot)
+    assert evaluator.snapshots[0]["composite"]["stress_score"] == narrative["momentum"] + 0.2
@@ -0,0 +1,93 @@
+import threading
+
+from marketmind_engine.research.run_question import (
+    ArticleCache,
+    KeywordMatcher,
+    ResearchRSSService,
+    compute_narrative_signals,
+    compute_question_signals,
+)
+
+
+def _rss(*titles):
+    items = "".join(f"<item><title>{t}</title></item>" for t in titles)
+    return f"<rss><channel>{items}</channel></rss>".encode()
+
+
+class FakeResponse:
+
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeHttp:
+
+    def __init__(self, bodies, block=None):
+        self.bodies = bodies
+        self.block = block or set()
+        self.release = threading.Event()
+
+    def get(self, url, timeout=None):
+        if url in self.block:
+            self.release.wait(5)
+        return FakeResponse(self.bodies[url])
+
+
+def test_fetch_preserves_order_and_caches_parsed_titles():
+    cache = ArticleCache()
+    http = FakeHttp({"a": _rss("Iran talks"), "b": _rss("Markets", "War risk")})
+    service = ResearchRSSService(["a", "b"], http_client=http, cache=cache)
+
+    assert service.fetch_articles() == ["Iran talks", "Markets", "War risk"]
+    service.fetch_articles()
+
+    assert cache.misses == 2
+    assert cache.hits == 2
+
+
+def test_slow_feeds_are_dropped_at_deadline():
+    http = FakeHttp({"a": _rss("Iran"), "slow": _rss("late")}, block={"slow"})
+    service = ResearchRSSService(["a", "slow"], http_client=http, deadline=0.2, cache=ArticleCache())
+
+    try:
+        assert service.fetch_articles() == ["Iran"]
+        assert service.timed_out == 1
+    finally:
+        http.release.set()
+
+
+def test_matcher_keeps_substring_semantics():
+    matcher = KeywordMatcher(["war", "warship", "iran"])
+
+    found = matcher.mask("New WARSHIP deployed")
+
+    assert found & matcher.bits["war"]
+    assert found & matcher.bits["warship"]
+    assert not found & matcher.bits["iran"]
+
+
+def test_question_signals_match_single_question_path():
+    articles = ["Iran missile strike", "Rates steady", "Inflation and war", "Award season"]
+
+    batch = compute_question_signals(articles, {
+        "geo": ["iran", "war"],
+        "macro": ["rates", "inflation"],
+    })
+
+    assert batch["geo"] == compute_narrative_signals(articles, ["iran", "war"])
+    assert batch["geo"]["matches"] == 3        # "Award" contains "war"
+    assert batch["macro"]["matches"] == 2
+
+
+def test_whole_word_signals_skip_embedded_keywords():
+    articles = ["He said it again", "Main street rally", "AI chips surge", "New sanctions on AIs"]
+
+    batch = compute_question_signals(
+        articles,
+        {"tech": ["ai"], "geo": ["sanction"]},
+        whole_words=True,
+    )
+
+    assert batch["tech"]["matches"] == 2       # "AI", plural "AIs"
+    assert batch["geo"]["matches"] == 1
+    assert batch["tech"] == compute_narrative_signals(articles, ["ai"], whole_words=True)
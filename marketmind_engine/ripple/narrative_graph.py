@@ -2,29 +2,346 @@
 Emergent Narrative Graph
 
 Builds symbol co-mention clusters dynamically from RSS items.
+
+Mention counts are maintained incrementally: ingest() only
+counts items it has not seen before, so callers can pass the
+full rolling item list on every tick. Seen items expire after
+seen_ttl engine seconds (or beyond max_seen entries) and take
+their mentions out of the counts, so both stay bounded. seen_ttl
+must exceed the caller's rolling window or expired items that
+are still passed in get counted again.
+
+Co-mentions form a sparse weighted graph (dict-of-dicts):
+every new item adds one unit of weight to each symbol pair it
+mentions. Weights decay exponentially with engine time. Decay
+is lazy: weights are stored scaled to a reference time and a
+single factor is applied on read, so an update costs
+O(new items) and never touches old edges.
 """
 
-from collections import defaultdict
-from typing import List, Dict
+import math
+import re
+from collections import OrderedDict, defaultdict, deque
+from heapq import nlargest
+from itertools import combinations
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from marketmind_engine.core.clock import ENGINE_CLOCK
+
+
+TICKER_RE = re.compile(r"\b[A-Z]{2,5}\b")
+
+IGNORED_TOKENS = frozenset({"AI", "IPO", "FDA", "USA", "US", "NYSE", "WSJ", "CNBC"})
+
+
+def item_key(item) -> Hashable:
+    """
+    Stable identity for a narrative item (id / link, else title).
+    """
+
+    for attr in ("id", "link"):
+        value = getattr(item, attr, None)
+        if value:
+            return value
+
+    return getattr(item, "title", None)
+
+
+def extract_symbols(title: str) -> List[str]:
+
+    return [t for t in TICKER_RE.findall(title or "") if t not in IGNORED_TOKENS]
+
+
+def engine_seconds() -> float:
+    """
+    Engine time as epoch seconds (follows ENGINE_CLOCK freezes
+    without advancing its tick).
+    """
+    return ENGINE_CLOCK.peek().timestamp()
+
+
+# Default co-mention half-life (engine seconds)
+DEFAULT_HALF_LIFE = 4 * 3600.0
+
+# Seen-item retention (engine seconds / entries)
+DEFAULT_SEEN_TTL = 24 * 3600.0
+DEFAULT_MAX_SEEN = 50000
+
+# Symbols per item considered for pairs (bounds pair fan-out)
+MAX_SYMBOLS_PER_ITEM = 12
+
+# Rebase stored weights once the scale exponent reaches this
+_REBASE_EXPONENT = 50.0
 
 
 class NarrativeGraph:
 
+    def __init__(
+        self,
+        half_life: Optional[float] = DEFAULT_HALF_LIFE,
+        now_fn: Callable[[], float] = engine_seconds,
+        prune_below: float = 0.01,
+        seen_ttl: Optional[float] = DEFAULT_SEEN_TTL,
+        max_seen: int = DEFAULT_MAX_SEEN,
+    ):
+        self._counts: Dict[str, int] = {}
+
+        # key -> (ingested at, mentioned symbols), oldest first
+        self._seen: "OrderedDict[Hashable, Tuple[float, Tuple[str, ...]]]" = OrderedDict()
+        self.seen_ttl = seen_ttl
+        self.max_seen = max_seen
+
+        self.half_life = half_life
+        self.prune_below = prune_below
+        self._rate = math.log(2) / half_life if half_life else 0.0
+        self._now = now_fn
+
+        # Stored (scaled) weights; actual = stored * _scale(now)
+        self._edges: Dict[str, Dict[str, float]] = {}
+        self._nodes: Dict[str, float] = {}
+        self._ref: Optional[float] = None
+        self._last: Optional[float] = None
+
     def build_symbol_counts(self, items: List) -> Dict[str, int]:
         """
         Extract and count symbol mentions from narrative items.
         Expects items with .title attribute.
-        """
 
-        import re
-        ticker_pattern = re.compile(r"\b[A-Z]{2,5}\b")
+        Stateless; see ingest() for the incremental form.
+        """
 
         counts = defaultdict(int)
 
         for item in items:
-            tokens = ticker_pattern.findall(item.title)
-            for token in tokens:
-                if token not in ["AI", "IPO", "FDA", "USA", "US", "NYSE", "WSJ", "CNBC"]:
-                    counts[token] += 1
+            for token in extract_symbols(item.title):
+                counts[token] += 1
 
         return dict(counts)
+
+    # -------------------------------------------------------------
+    # Incremental counts
+    # -------------------------------------------------------------
+
+    def ingest(self, items: Iterable, now: Optional[float] = None) -> int:
+        """
+        Count mentions and co-mentions from items not seen before.
+        Returns the number of new items.
+        """
+
+        added = 0
+
+        for item in items:
+
+            key = item_key(item)
+
+            if key is None or key in self._seen:
+                continue
+
+            if added == 0:
+                now = self._advance(now)
+
+            symbols = extract_symbols(item.title)
+
+            self._seen[key] = (now, tuple(symbols))
+            added += 1
+
+            for token in symbols:
+                self._counts[token] = self._counts.get(token, 0) + 1
+
+            self._add_comention(list(dict.fromkeys(symbols))[:MAX_SYMBOLS_PER_ITEM], now)
+
+        if len(self._seen) > self.max_seen:
+            self._expire_seen(now)
+
+        return added
+
+    def _expire_seen(self, now: float) -> None:
+        """
+        Forget items older than seen_ttl (and the oldest beyond
+        max_seen), removing their mentions from the counts.
+        """
+
+        cutoff = None if self.seen_ttl is None else now - self.seen_ttl
+
+        while self._seen:
+
+            key, (ingested_at, symbols) = next(iter(self._seen.items()))
+
+            if len(self._seen) <= self.max_seen and (cutoff is None or ingested_at >= cutoff):
+                break
+
+            del self._seen[key]
+
+            for token in symbols:
+                left = self._counts.get(token, 0) - 1
+                if left > 0:
+                    self._counts[token] = left
+                else:
+                    self._counts.pop(token, None)
+
+    # -------------------------------------------------------------
+    # Co-mention graph (lazy decay)
+    # -------------------------------------------------------------
+
+    def _advance(self, now: Optional[float]) -> float:
+
+        if now is None:
+            now = self._now()
+
+        if self._ref is None:
+            self._ref = now
+
+        if self._rate * (now - self._ref) > _REBASE_EXPONENT:
+            self._rebase(now)
+
+        self._last = now
+        self._expire_seen(now)
+        return now
+
+    def _rebase(self, now: float) -> None:
+        """
+        Fold the accumulated scale into stored weights and drop
+        edges that decayed below prune_below. O(edges), rare.
+        """
+
+        factor = math.exp(-self._rate * (now - self._ref))
+        self._ref = now
+
+        for a in list(self._edges):
+            row = self._edges[a]
+
+            for b in list(row):
+                row[b] *= factor
+                if row[b] < self.prune_below:
+                    del row[b]
+
+            if not row:
+                del self._edges[a]
+
+        for sym in list(self._nodes):
+            self._nodes[sym] *= factor
+            if self._nodes[sym] < self.prune_below:
+                del self._nodes[sym]
+
+    def _stored_unit(self, now: float) -> float:
+        return math.exp(self._rate * (now - self._ref))
+
+    def _scale(self, now: Optional[float] = None) -> float:
+
+        if self._ref is None:
+            return 1.0
+
+        now = self._last if now is None else now
+        return math.exp(-self._rate * (now - self._ref))
+
+    def _add_comention(self, symbols: List[str], now: float) -> None:
+
+        if not symbols:
+            return
+
+        unit = self._stored_unit(now)
+
+        for sym in symbols:
+            self._nodes[sym] = self._nodes.get(sym, 0.0) + unit
+
+        for a, b in combinations(symbols, 2):
+            row = self._edges.setdefault(a, {})
+            row[b] = row.get(b, 0.0) + unit
+
+            row = self._edges.setdefault(b, {})
+            row[a] = row.get(a, 0.0) + unit
+
+    def advance(self, now: Optional[float] = None) -> None:
+        """
+        Move graph time forward without new items (decay only).
+        """
+        self._advance(now)
+
+    def edge_weight(self, a: str, b: str) -> float:
+        return self._edges.get(a, {}).get(b, 0.0) * self._scale()
+
+    def node_weight(self, symbol: str) -> float:
+        return self._nodes.get(symbol, 0.0) * self._scale()
+
+    def neighbors(self, symbol: str, k: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Co-mentioned symbols by decayed weight (desc).
+        """
+
+        scale = self._scale()
+        row = self._edges.get(symbol, {})
+        pairs = ((b, w * scale) for b, w in row.items())
+
+        if k is not None:
+            return nlargest(k, pairs, key=lambda x: x[1])
+
+        return sorted(pairs, key=lambda x: x[1], reverse=True)
+
+    def top_symbols(self, k: int = 10) -> List[Tuple[str, float]]:
+
+        scale = self._scale()
+        return nlargest(k, ((s, w * scale) for s, w in self._nodes.items()), key=lambda x: x[1])
+
+    def top_edges(self, k: int = 10) -> List[Tuple[str, str, float]]:
+
+        scale = self._scale()
+        edges = (
+            (a, b, w * scale)
+            for a, row in self._edges.items()
+            for b, w in row.items()
+            if a < b
+        )
+        return nlargest(k, edges, key=lambda x: x[2])
+
+    def clusters(self, min_weight: float = 0.0, min_size: int = 2) -> List[List[str]]:
+        """
+        Connected components over edges with decayed weight >=
+        min_weight. Largest first; members sorted.
+        """
+
+        threshold = min_weight / self._scale() if min_weight > 0 else 0.0
+
+        visited: Set[str] = set()
+        clusters: List[List[str]] = []
+
+        for start in self._edges:
+
+            if start in visited:
+                continue
+
+            visited.add(start)
+            component = [start]
+            queue = deque([start])
+
+            while queue:
+                node = queue.popleft()
+
+                for nb, w in self._edges.get(node, {}).items():
+                    if w >= threshold and nb not in visited:
+                        visited.add(nb)
+                        component.append(nb)
+                        queue.append(nb)
+
+            if len(component) >= min_size:
+                clusters.append(sorted(component))
+
+        clusters.sort(key=lambda c: (-len(c), c))
+        return clusters
+
+    def graph_stats(self) -> Dict[str, int]:
+        return {
+            "items": len(self._seen),
+            "symbols": len(self._nodes),
+            "edges": sum(len(row) for row in self._edges.values()) // 2,
+        }
+
+    def symbol_counts(self) -> Dict[str, int]:
+        return dict(self._counts)
+
+    def reset(self) -> None:
+        self._counts = {}
+        self._seen = OrderedDict()
+        self._edges = {}
+        self._nodes = {}
+        self._ref = None
+        self._last = None
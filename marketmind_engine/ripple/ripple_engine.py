@@ -3,17 +3,96 @@ Ripple Engine
 
 Merges structural domain registry with emergent narrative graph.
 Produces layered propagation scores.
+
+DOMAIN_REGISTRY is static, so per-domain structural scores,
+symbol -> tier lookups and watchlists are precomputed once
+(DOMAIN_INDEX) and rebuilt only by reload_registry().
+Emergent counts are kept incrementally by one NarrativeGraph
+per domain, so items scored for one domain never inflate the
+emergent scores of another.
 """
 
-from typing import Dict, List, Tuple
+from dataclasses import dataclass
+from heapq import nlargest
+from typing import Callable, Dict, List, Optional, Tuple
+
 from .domain_registry import DOMAIN_REGISTRY
 from .narrative_graph import NarrativeGraph
 
 
+# -------------------------------------------------------------
+# Precomputed Domain Index
+# -------------------------------------------------------------
+
+@dataclass(frozen=True)
+class DomainIndex:
+    structural_scores: Dict[str, int]
+    tiers: Dict[str, str]
+    layers: Dict[str, List[str]]
+    watchlists: Tuple[Tuple[str, ...], ...]     # [max_layer] -> layers 1..max_layer
+
+
+def build_domain_index(layers: Dict[str, List[str]]) -> DomainIndex:
+
+    scores: Dict[str, int] = {}
+    tiers: Dict[str, str] = {}
+    watchlists: List[Tuple[str, ...]] = []
+    flattened: List[str] = []
+
+    for depth, (layer_name, symbols) in enumerate(layers.items()):
+
+        weight = max(1, 5 - depth)  # higher weight for closer layers
+
+        for symbol in symbols:
+            scores[symbol] = weight
+            tiers[symbol] = layer_name
+
+        if depth > 0:  # watchlists exclude layer_0 (primary symbols)
+            flattened.extend(symbols)
+
+        watchlists.append(tuple(flattened))
+
+    return DomainIndex(
+        structural_scores=scores,
+        tiers=tiers,
+        layers=layers,
+        watchlists=tuple(watchlists),
+    )
+
+
+def build_registry_index(registry: Dict[str, Dict[str, List[str]]]) -> Dict[str, DomainIndex]:
+
+    return {domain: build_domain_index(layers) for domain, layers in registry.items()}
+
+
+DOMAIN_INDEX: Dict[str, DomainIndex] = build_registry_index(DOMAIN_REGISTRY)
+
+
+def reload_registry(registry: Optional[Dict[str, Dict[str, List[str]]]] = None) -> None:
+    """
+    Rebuild DOMAIN_INDEX after the registry changed.
+    """
+    global DOMAIN_INDEX
+    DOMAIN_INDEX = build_registry_index(DOMAIN_REGISTRY if registry is None else registry)
+
+
 class RippleEngine:
 
-    def __init__(self):
-        self.graph = NarrativeGraph()
+    def __init__(self, graph_factory: Callable[[], NarrativeGraph] = NarrativeGraph):
+        self._graph_factory = graph_factory
+        self.graphs: Dict[str, NarrativeGraph] = {}
+
+    def graph_for(self, domain: str) -> NarrativeGraph:
+        """
+        The domain's narrative graph (created on first use).
+        """
+
+        graph = self.graphs.get(domain)
+
+        if graph is None:
+            graph = self.graphs[domain] = self._graph_factory()
+
+        return graph
 
     # -------------------------------------------------------------
     # Structural Layer
@@ -25,19 +104,8 @@ class RippleEngine:
         Layer_0 receives highest weight.
         """
 
-        scores: Dict[str, int] = {}
-
-        if domain not in DOMAIN_REGISTRY:
-            return scores
-
-        layers = DOMAIN_REGISTRY[domain]
-
-        for depth, symbols in enumerate(layers.values()):
-            weight = max(1, 5 - depth)  # higher weight for closer layers
-            for symbol in symbols:
-                scores[symbol] = weight
-
-        return scores
+        index = DOMAIN_INDEX.get(domain)
+        return dict(index.structural_scores) if index else {}
 
     def structural_watchlist(self, domain: str, max_layer: int = 3) -> List[str]:
         """
@@ -45,20 +113,12 @@ class RippleEngine:
         Excludes layer_0 (primary symbols).
         """
 
-        if domain not in DOMAIN_REGISTRY:
-            return []
-
-        layers = DOMAIN_REGISTRY[domain]
-        watchlist: List[str] = []
+        index = DOMAIN_INDEX.get(domain)
 
-        for depth, (layer_name, symbols) in enumerate(layers.items()):
-            if depth == 0:
-                continue  # skip primary
-            if depth > max_layer:
-                break
-            watchlist.extend(symbols)
+        if index is None or not index.watchlists or max_layer < 0:
+            return []
 
-        return watchlist
+        return list(index.watchlists[min(max_layer, len(index.watchlists) - 1)])
 
     def structural_layers(self, domain: str) -> Dict[str, List[str]]:
         """
@@ -70,18 +130,35 @@ class RippleEngine:
     # Emergent + Combined Layer
     # -------------------------------------------------------------
 
-    def combined_score(self, domain: str, items: List) -> Dict[str, float]:
+    def combined_score(
+        self,
+        domain: str,
+        items: Optional[List] = None,
+        top_k: Optional[int] = None,
+    ) -> Dict[str, float]:
         """
         Combine structural and emergent scores.
+
+        New items (if given) are ingested into the domain's
+        narrative graph first; emergent counts accumulate across
+        calls for that domain only.
         """
 
-        structural = self.structural_score(domain)
-        emergent = self.graph.build_symbol_counts(items)
+        if items:
+            self.graph_for(domain).ingest(items)
 
-        combined: Dict[str, float] = {}
+        index = DOMAIN_INDEX.get(domain)
 
-        for symbol in set(structural.keys()).union(emergent.keys()):
-            combined[symbol] = structural.get(symbol, 0) + emergent.get(symbol, 0)
+        combined: Dict[str, float] = dict(index.structural_scores) if index else {}
+
+        graph = self.graphs.get(domain)
+        emergent = graph.symbol_counts() if graph is not None else {}
+
+        for symbol, count in emergent.items():
+            combined[symbol] = combined.get(symbol, 0) + count
+
+        if top_k is not None:
+            return dict(nlargest(top_k, combined.items(), key=lambda x: x[1]))
 
         return dict(sorted(combined.items(), key=lambda x: x[1], reverse=True))
 
@@ -104,24 +181,21 @@ class RippleEngine:
     # -------------------------------------------------------------
 
     def propagation_tiers(
-        self, domain: str, items: List
+        self,
+        domain: str,
+        items: Optional[List] = None,
+        top_k: Optional[int] = None,
     ) -> List[Tuple[str, float, str]]:
         """
         Returns list of (symbol, score, tier_label)
         """
 
-        combined = self.combined_score(domain, items)
-        structural_layers = DOMAIN_REGISTRY.get(domain, {})
-
-        tier_lookup = {}
-        for layer_name, symbols in structural_layers.items():
-            for s in symbols:
-                tier_lookup[s] = layer_name
-
-        results = []
+        combined = self.combined_score(domain, items, top_k=top_k)
 
-        for symbol, score in combined.items():
-            tier = tier_lookup.get(symbol, "emergent")
-            results.append((symbol, score, tier))
+        index = DOMAIN_INDEX.get(domain)
+        tiers = index.tiers if index else {}
 
-        return results
+        return [
+            (symbol, score, tiers.get(symbol, "emergent"))
+            for symbol, score in combined.items()
+        ]
@@ -0,0 +1,108 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from marketmind_engine.core.clock import ENGINE_CLOCK
+from marketmind_engine.ripple.narrative_graph import NarrativeGraph, engine_seconds
+
+
+class Clock:
+
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+def _items(*titles):
+    return [SimpleNamespace(title=t, link=f"{i}:{t}") for i, t in enumerate(titles)]
+
+
+def test_comention_edges_and_queries():
+    graph = NarrativeGraph(half_life=None, now_fn=Clock())
+
+    graph.ingest(_items("LMT RTX NOC contract", "LMT RTX update", "NVDA AMD chips"))
+
+    assert graph.edge_weight("LMT", "RTX") == 2.0
+    assert graph.edge_weight("RTX", "LMT") == 2.0
+    assert graph.neighbors("LMT", k=1) == [("RTX", 2.0)]
+    assert graph.top_edges(1) == [("LMT", "RTX", 2.0)]
+    assert graph.clusters() == [["LMT", "NOC", "RTX"], ["AMD", "NVDA"]]
+    assert graph.clusters(min_weight=2.0) == [["LMT", "RTX"]]
+
+
+def test_seen_items_are_not_recounted():
+    graph = NarrativeGraph(half_life=None, now_fn=Clock())
+    items = _items("LMT RTX")
+
+    assert graph.ingest(items) == 1
+    assert graph.ingest(items) == 0
+    assert graph.edge_weight("LMT", "RTX") == 1.0
+
+
+def test_weights_decay_with_engine_time():
+    clock = Clock()
+    graph = NarrativeGraph(half_life=100.0, now_fn=clock)
+
+    graph.ingest(_items("LMT RTX"))
+
+    clock.t = 100.0
+    graph.advance()
+    assert graph.edge_weight("LMT", "RTX") == pytest.approx(0.5)
+
+    graph.ingest(_items("LMT RTX again"), now=100.0)   # new keys
+    assert graph.edge_weight("LMT", "RTX") == pytest.approx(1.5)
+
+
+def test_rebase_keeps_weights_and_prunes():
+    clock = Clock()
+    graph = NarrativeGraph(half_life=1.0, now_fn=clock)
+
+    graph.ingest(_items("LMT RTX"))
+
+    clock.t = 100.0           # far past the rebase exponent
+    graph.ingest([SimpleNamespace(title="NVDA AMD", link="z")])
+
+    assert graph.edge_weight("NVDA", "AMD") == pytest.approx(1.0)
+    assert graph.edge_weight("LMT", "RTX") == 0.0
+    assert graph.graph_stats()["edges"] == 1
+
+
+def test_seen_items_expire_and_release_their_counts():
+    clock = Clock()
+    graph = NarrativeGraph(half_life=None, now_fn=clock, seen_ttl=100.0)
+
+    old = _items("LMT RTX")
+    graph.ingest(old)
+    assert graph.symbol_counts() == {"LMT": 1, "RTX": 1}
+
+    clock.t = 150.0
+    graph.ingest([SimpleNamespace(title="NVDA", link="new")])
+
+    assert graph.symbol_counts() == {"NVDA": 1}
+    assert graph.graph_stats()["items"] == 1
+
+
+def test_seen_items_are_capped():
+    graph = NarrativeGraph(half_life=None, now_fn=Clock(), seen_ttl=None, max_seen=3)
+
+    graph.ingest([SimpleNamespace(title=f"LMT {i}", link=str(i)) for i in range(5)])
+
+    assert graph.graph_stats()["items"] == 3
+    assert graph.symbol_counts() == {"LMT": 3}
+
+
+def test_engine_seconds_reads_clock_without_ticking():
+    tick = ENGINE_CLOCK._tick
+    engine_seconds()
+    engine_seconds()
+    assert ENGINE_CLOCK._tick == tick
+
+    frozen_at = datetime(2026, 3, 10, 15, 0, tzinfo=timezone.utc)
+    ENGINE_CLOCK.freeze(frozen_at)
+    try:
+        assert engine_seconds() == frozen_at.timestamp()
+    finally:
+        ENGINE_CLOCK.unfreeze()
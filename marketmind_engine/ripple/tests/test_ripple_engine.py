@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+from marketmind_engine.ripple import ripple_engine
+from marketmind_engine.ripple.ripple_engine import RippleEngine
+
+
+def _item(title, link=None):
+    return SimpleNamespace(title=title, link=link)
+
+
+def test_structural_index_matches_registry():
+    engine = RippleEngine()
+
+    scores = engine.structural_score("defense")
+
+    assert scores["LMT"] == 5
+    assert scores["ITA"] == 3
+    assert engine.structural_watchlist("defense", max_layer=2) == [
+        "NOC", "GD", "HII", "LHX", "BA", "ITA", "XAR", "PPA",
+    ]
+    assert engine.structural_score("unknown") == {}
+
+
+def test_emergent_counts_are_incremental():
+    engine = RippleEngine()
+    items = [_item("LMT wins deal", "a"), _item("KTOS and PLTR drones", "b")]
+
+    engine.combined_score("defense", items)
+    combined = engine.combined_score("defense", items)   # same items: no recount
+
+    assert combined["LMT"] == 6
+    assert combined["PLTR"] == 1
+
+    combined = engine.combined_score("defense", [_item("PLTR again", "c")])
+    assert combined["PLTR"] == 2
+
+
+def test_emergent_counts_are_scoped_to_their_domain():
+    engine = RippleEngine()
+
+    engine.combined_score("defense", [_item("PLTR PLTR KTOS", "a")])
+    engine.combined_score("ai-bio", [_item("NVDA TSM", "b")])
+
+    defense = engine.combined_score("defense")
+    semis = engine.combined_score("ai-bio")
+
+    assert defense["PLTR"] == 2
+    assert "NVDA" not in defense
+    assert "PLTR" not in semis
+    assert engine.combined_score("energy") == engine.structural_score("energy")
+
+
+def test_tiers_and_top_k():
+    engine = RippleEngine()
+
+    tiers = engine.propagation_tiers("defense", [_item("PLTR PLTR", "x")], top_k=3)
+
+    assert len(tiers) == 3
+    assert tiers[0][:2] == ("LMT", 5)
+    assert dict((s, t) for s, _, t in engine.propagation_tiers("defense"))["PLTR"] == "emergent"
+
+
+def test_reload_registry_rebuilds_index():
+    try:
+        ripple_engine.reload_registry({"test": {"layer_0": ["AAA"], "layer_1": ["BBB"]}})
+        assert RippleEngine().structural_score("test") == {"AAA": 5, "BBB": 4}
+    finally:
+        ripple_engine.reload_registry()
@@ -0,0 +1,314 @@
+"""
+Engine Command Executor
+-----------------------
+Single worker thread that owns every call into the engine
+controller. The background engine loop and the manual-trigger
+API endpoints submit commands here instead of calling
+run_symbol_cycle() concurrently from different threads.
+
+- submit() enqueues a command and returns a Future
+- run() is the asyncio side: awaits the Future with a timeout
+  without holding a server threadpool worker
+- commands with the same key that are still queued share one
+  execution (repeated clicks on "run" coalesce)
+- the queue is bounded; submit() raises CommandRejected when
+  full instead of piling up work behind a slow cycle
+- a timed-out command is not interrupted (a cycle is never
+  left half-applied); the caller just stops waiting
+
+Read paths never go through the executor.
+
+Configuration via environment:
+
+    MARKETMIND_COMMAND_QUEUE    max queued commands
+    MARKETMIND_RUN_TIMEOUT      seconds an API caller waits
+
+Shared singleton via get_command_executor() / set_command_executor().
+"""
+
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import collections
+import os
+import threading
+import time
+
+
+MAX_PENDING = int(os.getenv("MARKETMIND_COMMAND_QUEUE", "16"))
+RUN_TIMEOUT = float(os.getenv("MARKETMIND_RUN_TIMEOUT", "30"))
+
+
+class CommandRejected(RuntimeError):
+    """Queue full or executor closed."""
+
+
+class CommandTimeout(TimeoutError):
+    """Caller stopped waiting; the command may still complete."""
+
+
+@dataclass
+class _Command:
+    name: str
+    fn: Callable[..., Any]
+    args: Tuple[Any, ...]
+    key: Optional[Hashable]
+    future: Future = field(default_factory=Future)
+    submitted_at: float = field(default_factory=time.monotonic)
+
+
+class EngineCommandExecutor:
+
+    def __init__(self, max_pending: int = MAX_PENDING, name: str = "engine-commands"):
+        self.max_pending = max_pending
+        self.name = name
+
+        self._cond = threading.Condition()
+        self._queue = collections.deque()
+        self._by_key: Dict[Hashable, _Command] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        self.current: Optional[str] = None
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.coalesced = 0
+        self.last_duration: Optional[float] = None
+        self.last_wait: Optional[float] = None
+
+    # --------------------------------------------------
+    # Submit
+    # --------------------------------------------------
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        name: Optional[str] = None,
+        key: Optional[Hashable] = None,
+    ) -> Future:
+        """
+        Enqueue fn(*args). A queued command with the same key is
+        reused instead of adding a second one.
+        """
+
+        with self._cond:
+
+            if self._closed:
+                self.rejected += 1
+                raise CommandRejected("Engine executor is closed")
+
+            if key is not None and key in self._by_key:
+                self.coalesced += 1
+                return self._by_key[key].future
+
+            if len(self._queue) >= self.max_pending:
+                self.rejected += 1
+                raise CommandRejected(
+                    f"Engine busy: {len(self._queue)} commands queued"
+                )
+
+            command = _Command(
+                name=name or getattr(fn, "__name__", "command"),
+                fn=fn,
+                args=args,
+                key=key,
+            )
+
+            self._queue.append(command)
+            if key is not None:
+                self._by_key[key] = command
+
+            self.submitted += 1
+            self._ensure_worker()
+            self._cond.notify()
+
+            return command.future
+
+    def call(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        name: Optional[str] = None,
+        key: Optional[Hashable] = None,
+    ) -> Any:
+        """
+        Blocking submit-and-wait (for worker threads such as the
+        engine loop). Runs inline when already on the executor.
+        """
+
+        if threading.current_thread() is self._thread:
+            return fn(*args)
+
+        future = self.submit(fn, *args, name=name, key=key)
+
+        try:
+            return future.result(timeout)
+        except FutureTimeout as e:
+            raise CommandTimeout(str(e) or "Engine command timed out") from e
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = RUN_TIMEOUT,
+        name: Optional[str] = None,
+        key: Optional[Hashable] = None,
+    ) -> Any:
+        """
+        Submit and await from the event loop. Raises CommandTimeout
+        when the result is not ready within timeout seconds.
+        """
+        import asyncio
+
+        future = self.submit(fn, *args, name=name, key=key)
+
+        try:
+            # shield: a caller timing out must not cancel the
+            # shared future other (coalesced) callers await
+            return await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)),
+                timeout,
+            )
+        except asyncio.TimeoutError as e:
+            raise CommandTimeout(
+                f"Engine command did not finish within {timeout}s"
+            ) from e
+
+    # --------------------------------------------------
+    # Worker
+    # --------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._thread = threading.Thread(
+            target=self._work,
+            name=self.name,
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _work(self) -> None:
+
+        while True:
+
+            with self._cond:
+
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+
+                if not self._queue:
+                    return
+
+                command = self._queue.popleft()
+                if command.key is not None:
+                    self._by_key.pop(command.key, None)
+
+                self.current = command.name
+
+            if not command.future.set_running_or_notify_cancel():
+                self._finish(None)
+                continue
+
+            started = time.monotonic()
+            self.last_wait = started - command.submitted_at
+
+            try:
+                result = command.fn(*command.args)
+            except Exception as e:
+                self.failed += 1
+                command.future.set_exception(e)
+            else:
+                self.completed += 1
+                command.future.set_result(result)
+
+            self._finish(time.monotonic() - started)
+
+    def _finish(self, duration: Optional[float]) -> None:
+        with self._cond:
+            self.current = None
+            if duration is not None:
+                self.last_duration = duration
+            self._cond.notify_all()
+
+    # --------------------------------------------------
+    # Lifecycle / introspection
+    # --------------------------------------------------
+
+    @property
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._queue)
+
+    @property
+    def busy(self) -> bool:
+        return self.current is not None
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the queue is empty and nothing is running.
+        """
+
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._queue and self.current is None,
+                timeout=timeout,
+            )
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting commands; queued ones still run.
+        """
+
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "pending": len(self._queue),
+                "current": self.current,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "coalesced": self.coalesced,
+                "last_duration": self.last_duration,
+                "last_wait": self.last_wait,
+            }
+
+
+# ==================================================
+# SHARED EXECUTOR
+# ==================================================
+
+_executor: Optional[EngineCommandExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_command_executor() -> EngineCommandExecutor:
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = EngineCommandExecutor()
+
+    return _executor
+
+
+def set_command_executor(executor: Optional[EngineCommandExecutor]) -> None:
+    global _executor
+    _executor = executor
@@ -30,6 +30,7 @@ class EngineController:
         self._executor = runtime_executor
         self._factory = execution_input_factory
         self._last_result: Optional[Dict[str, Any]] = None
+        self._result_version: int = 0
         self._running: bool = False
 
     # --------------------------------------------------
@@ -64,6 +65,7 @@ class EngineController:
         )
 
         self._last_result = result
+        self._result_version += 1
         return result
 
     # --------------------------------------------------
@@ -96,6 +98,7 @@ class EngineController:
         )
 
         self._last_result = result
+        self._result_version += 1
         return result
 
     # --------------------------------------------------
@@ -104,3 +107,9 @@ class EngineController:
 
     def get_last_result(self) -> Optional[Dict[str, Any]]:
         return self._last_result
+
+    def result_version(self) -> int:
+        """
+        Increments whenever a new cycle result is stored.
+        """
+        return self._result_version
@@ -0,0 +1,370 @@
+"""
+Engine Event Bus
+----------------
+One engine-side publish point for everything the dashboards
+display. Transports (SSE / WebSocket in api/server.py) subscribe
+instead of polling handler endpoints.
+
+Event types:
+
+    status        engine status flags
+    cycle         last symbol cycle result
+    regime        regime snapshot changes (versioned)
+    propagation   propagation snapshot (on layer refresh)
+    rss           RSS ingest statistics
+
+Deltas:
+- the first event of a type (and the first one a subscriber
+  sees) is full: data is the whole payload
+- later events carry only changed top-level keys (data) and
+  deleted keys (removed)
+- publishing an identical payload emits nothing
+- events reach subscribers in seq order (offered under the bus
+  lock); a subscription also ignores any event older than the
+  newest it has seen for that type, since a stale delta merged
+  over a newer one would leave the client wrong until the keys
+  change again
+
+Slow clients:
+- each subscription holds at most one pending event per type;
+  a newer event is merged into it (coalesced), so memory per
+  client is bounded by the number of types
+- transports send the next batch only after the previous one
+  was written (backpressure) and can pace with min_interval
+
+Shared singleton via get_event_bus() / set_event_bus().
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import os
+import threading
+import time
+
+
+EVENT_TYPES = ("status", "cycle", "regime", "propagation", "rss")
+
+MAX_SUBSCRIBERS = int(os.getenv("MARKETMIND_EVENT_SUBSCRIBERS", "64"))
+
+
+@dataclass(frozen=True)
+class BusEvent:
+    type: str
+    seq: int
+    ts: float
+    full: bool
+    data: Dict[str, Any]
+    removed: Tuple[str, ...] = field(default=())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": self.type,
+            "seq": self.seq,
+            "ts": self.ts,
+            "full": self.full,
+            "data": self.data,
+            "removed": list(self.removed),
+        }
+
+
+def diff(
+    previous: Optional[Dict[str, Any]],
+    current: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Tuple[str, ...]]:
+    """
+    Shallow (changed, removed) between two payloads.
+    """
+
+    if previous is None:
+        return dict(current), ()
+
+    changed = {
+        k: v for k, v in current.items()
+        if k not in previous or previous[k] != v
+    }
+    removed = tuple(k for k in previous if k not in current)
+
+    return changed, removed
+
+
+def _merge(old: BusEvent, new: BusEvent) -> BusEvent:
+    """
+    Coalesce two pending events of the same type into one.
+    """
+
+    if new.full:
+        return new
+
+    data = {k: v for k, v in old.data.items() if k not in new.removed}
+    data.update(new.data)
+
+    if old.full:
+        return BusEvent(new.type, new.seq, new.ts, True, data)
+
+    removed = tuple(
+        dict.fromkeys(
+            [k for k in old.removed if k not in new.data] + list(new.removed)
+        )
+    )
+
+    return BusEvent(new.type, new.seq, new.ts, False, data, removed)
+
+
+# ==================================================
+# SUBSCRIPTION
+# ==================================================
+
+class Subscription:
+    """
+    Per-client pending queue (one slot per event type).
+
+    Created with an asyncio loop, next_batch() awaits new
+    events; without one, wait_batch() blocks a thread.
+    """
+
+    def __init__(self, bus: "EventBus", types: Iterable[str], loop=None):
+        self._bus = bus
+        self.types = frozenset(types)
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._pending: Dict[str, BusEvent] = {}
+        self._last_seq: Dict[str, int] = {}
+        self.closed = False
+
+        if loop is not None:
+            import asyncio
+            self._ready = asyncio.Event()
+        else:
+            self._ready = threading.Event()
+
+        self.delivered = 0
+        self.coalesced = 0
+        self.stale = 0
+
+    # ---------------- producer side ----------------
+
+    def _offer(self, event: BusEvent) -> None:
+
+        with self._lock:
+            if event.seq <= self._last_seq.get(event.type, 0):
+                self.stale += 1
+                return
+
+            self._last_seq[event.type] = event.seq
+            pending = self._pending.get(event.type)
+
+            if pending is None:
+                self._pending[event.type] = event
+            else:
+                self._pending[event.type] = _merge(pending, event)
+                self.coalesced += 1
+
+        self._wake()
+
+    def _wake(self) -> None:
+
+        if self._loop is None:
+            self._ready.set()
+            return
+
+        try:
+            self._loop.call_soon_threadsafe(self._ready.set)
+        except RuntimeError:
+            # Loop closed: client is gone
+            self.closed = True
+
+    # ---------------- consumer side ----------------
+
+    def drain(self) -> List[BusEvent]:
+
+        with self._lock:
+            events = sorted(self._pending.values(), key=lambda e: e.seq)
+            self._pending.clear()
+
+        self.delivered += len(events)
+        return events
+
+    async def next_batch(self, timeout: Optional[float] = None) -> List[BusEvent]:
+        """
+        Await pending events (empty list on timeout).
+        """
+        import asyncio
+
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return []
+
+        self._ready.clear()
+        return self.drain()
+
+    def wait_batch(self, timeout: Optional[float] = None) -> List[BusEvent]:
+
+        if not self._ready.wait(timeout):
+            return []
+
+        self._ready.clear()
+        return self.drain()
+
+    def close(self) -> None:
+        self.closed = True
+        self._bus.unsubscribe(self)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "types": sorted(self.types),
+                "pending": len(self._pending),
+                "delivered": self.delivered,
+                "coalesced": self.coalesced,
+                "stale": self.stale,
+            }
+
+
+# ==================================================
+# BUS
+# ==================================================
+
+class EventBus:
+
+    def __init__(
+        self,
+        max_subscribers: int = MAX_SUBSCRIBERS,
+        now_fn: Callable[[], float] = time.time,
+    ):
+        self.max_subscribers = max_subscribers
+        self._now = now_fn
+
+        self._lock = threading.Lock()
+        self._latest: Dict[str, Dict[str, Any]] = {}
+        self._latest_seq: Dict[str, int] = {}
+        self._subscribers: List[Subscription] = []
+        self._seq = 0
+
+        self.published = 0
+        self.suppressed = 0
+
+    def publish(self, event_type: str, payload: Dict[str, Any]) -> Optional[BusEvent]:
+        """
+        Publish a payload for a type. Returns the emitted event,
+        or None when nothing changed.
+        """
+
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {event_type}")
+
+        with self._lock:
+
+            previous = self._latest.get(event_type)
+            changed, removed = diff(previous, payload)
+
+            if previous is not None and not changed and not removed:
+                self.suppressed += 1
+                return None
+
+            self._seq += 1
+            self._latest[event_type] = dict(payload)
+            self._latest_seq[event_type] = self._seq
+
+            event = BusEvent(
+                type=event_type,
+                seq=self._seq,
+                ts=self._now(),
+                full=previous is None,
+                data=changed,
+                removed=removed,
+            )
+
+            self.published += 1
+
+            # Offered under the lock so concurrent publishers of a
+            # type cannot deliver an older delta after a newer one
+            for sub in self._subscribers:
+                if event_type in sub.types:
+                    sub._offer(event)
+
+        return event
+
+    def latest(self, event_type: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            payload = self._latest.get(event_type)
+            return dict(payload) if payload is not None else None
+
+    def subscribe(
+        self,
+        types: Optional[Iterable[str]] = None,
+        loop=None,
+    ) -> Subscription:
+        """
+        New subscription, primed with a full event per known type.
+        Raises RuntimeError when max_subscribers is reached.
+        """
+
+        wanted = [t for t in (types or EVENT_TYPES) if t in EVENT_TYPES]
+
+        with self._lock:
+
+            if len(self._subscribers) >= self.max_subscribers:
+                raise RuntimeError("Too many event subscribers")
+
+            sub = Subscription(self, wanted, loop=loop)
+
+            for t in wanted:
+                if t in self._latest:
+                    sub._last_seq[t] = self._latest_seq[t]
+                    sub._pending[t] = BusEvent(
+                        type=t,
+                        seq=self._latest_seq[t],
+                        ts=self._now(),
+                        full=True,
+                        data=dict(self._latest[t]),
+                    )
+
+            self._subscribers.append(sub)
+
+        if sub._pending:
+            sub._wake()
+
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            subscribers = list(self._subscribers)
+            out = {
+                "published": self.published,
+                "suppressed": self.suppressed,
+                "seq": self._seq,
+                "subscribers": len(subscribers),
+            }
+
+        out["coalesced"] = sum(s.coalesced for s in subscribers)
+        return out
+
+
+# ==================================================
+# SHARED BUS
+# ==================================================
+
+_bus: Optional[EventBus] = None
+_bus_lock = threading.Lock()
+
+
+def get_event_bus() -> EventBus:
+    global _bus
+
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                _bus = EventBus()
+
+    return _bus
+
+
+def set_event_bus(bus: Optional[EventBus]) -> None:
+    global _bus
+    _bus = bus
@@ -2,6 +2,7 @@ from typing import Optional
 
 from marketmind_engine.execution.execution_input import ExecutionInput
 from marketmind_engine.decision.state import MarketState
+from marketmind_engine.data.price_cache import PriceCache
 
 
 class ExecutionInputFactory:
@@ -13,6 +14,9 @@ class ExecutionInputFactory:
     It strictly constructs immutable execution snapshots.
     """
 
+    # Upper bound on per-symbol price memory (LRU beyond this)
+    MAX_PRICE_MEMORY = 2000
+
     def __init__(
         self,
         regime_service,
@@ -30,7 +34,12 @@ class ExecutionInputFactory:
         self.clock = clock
 
         # 🔹 Deterministic price memory (per symbol)
-        self._last_price_by_symbol = {}
+        # No TTL: deltas must not depend on wall-clock time.
+        # LRU-bounded so a rotating universe cannot grow it forever.
+        self._last_price_by_symbol = PriceCache(
+            ttl=None,
+            max_entries=self.MAX_PRICE_MEMORY,
+        )
 
     # -------------------------------------------------------------
     # Public Entry
@@ -92,7 +101,7 @@ class ExecutionInputFactory:
             price_delta = current_price - previous_price
 
         # Update memory for next cycle
-        self._last_price_by_symbol[symbol] = current_price
+        self._last_price_by_symbol.put(symbol, current_price)
 
         # Placeholder values — narrative wiring comes later
         fils = 0.0
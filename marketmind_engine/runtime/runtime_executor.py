@@ -5,6 +5,15 @@ from marketmind_engine.execution.execution_service import ExecutionService
 from marketmind_engine.execution.execution_receipt import ExecutionReceipt
 from marketmind_engine.execution.execution_input import ExecutionInput
 from marketmind_engine.execution.execution_types import OrderIntent
+from marketmind_engine.telemetry.metrics import (
+    CYCLES_RUN,
+    DECISIONS,
+    STAGE_SECONDS,
+)
+
+
+_CYCLE_SECONDS = STAGE_SECONDS.labels(stage="cycle.total")
+_SUBMIT_SECONDS = STAGE_SECONDS.labels(stage="cycle.submit")
 
 
 class RuntimeExecutor:
@@ -36,19 +45,25 @@ class RuntimeExecutor:
         market_context_map: Optional[dict] = None,
     ) -> Dict[str, Any]:
 
-        result = self._coordinator.run(
-            execution_input,
-            market_context_map=market_context_map,
-        )
+        with _CYCLE_SECONDS.time():
+
+            result = self._coordinator.run(
+                execution_input,
+                market_context_map=market_context_map,
+            )
+
+            order_intent: Optional[OrderIntent] = result.get("order_intent")
+            receipt: Optional[ExecutionReceipt] = None
 
-        order_intent: Optional[OrderIntent] = result.get("order_intent")
-        receipt: Optional[ExecutionReceipt] = None
+            decision = "NO_ACTION"
 
-        decision = "NO_ACTION"
+            if order_intent:
+                decision = f"ALLOW_{order_intent.side.upper()}"
+                with _SUBMIT_SECONDS.time():
+                    receipt = self._execution_service.submit_intent(order_intent)
 
-        if order_intent:
-            decision = f"ALLOW_{order_intent.side.upper()}"
-            receipt = self._execution_service.submit_intent(order_intent)
+        CYCLES_RUN.inc()
+        DECISIONS.labels(source="runtime", decision=decision).inc()
 
         return {
             "decision": decision,
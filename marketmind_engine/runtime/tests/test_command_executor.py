@@ -0,0 +1,115 @@
+import asyncio
+import threading
+
+import pytest
+
+from marketmind_engine.runtime.command_executor import (
+    CommandRejected,
+    CommandTimeout,
+    EngineCommandExecutor,
+)
+
+
+def _blocker():
+    started = threading.Event()
+    release = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    return block, started, release
+
+
+def test_commands_run_serially_on_one_thread():
+    executor = EngineCommandExecutor()
+    threads = []
+    active = []
+    overlap = []
+
+    def work(i):
+        active.append(i)
+        overlap.append(len(active))
+        threads.append(threading.current_thread().name)
+        active.remove(i)
+        return i * 2
+
+    futures = [executor.submit(work, i) for i in range(10)]
+
+    assert [f.result(5) for f in futures] == [i * 2 for i in range(10)]
+    assert set(threads) == {"engine-commands"}
+    assert max(overlap) == 1
+
+    executor.close(timeout=5)
+
+
+def test_queued_commands_with_same_key_coalesce():
+    executor = EngineCommandExecutor()
+    block, started, release = _blocker()
+
+    executor.submit(block)
+    started.wait(5)
+
+    calls = []
+    first = executor.submit(calls.append, "SPY", key=("manual", "SPY"))
+    second = executor.submit(calls.append, "SPY", key=("manual", "SPY"))
+
+    assert first is second
+
+    release.set()
+    first.result(5)
+
+    assert calls == ["SPY"]
+    assert executor.stats()["coalesced"] == 1
+
+    executor.close(timeout=5)
+
+
+def test_full_queue_rejects():
+    executor = EngineCommandExecutor(max_pending=1)
+    block, started, release = _blocker()
+
+    executor.submit(block)
+    started.wait(5)
+    executor.submit(lambda: None)
+
+    with pytest.raises(CommandRejected):
+        executor.submit(lambda: None)
+
+    release.set()
+    executor.close(timeout=5)
+
+    assert executor.stats()["rejected"] == 1
+
+    with pytest.raises(CommandRejected):
+        executor.submit(lambda: None)
+
+
+def test_async_run_times_out_without_cancelling_command():
+    executor = EngineCommandExecutor()
+    block, started, release = _blocker()
+
+    async def scenario():
+        with pytest.raises(CommandTimeout):
+            await executor.run(block, timeout=0.05)
+
+    asyncio.run(scenario())
+    assert started.is_set()
+
+    release.set()
+    assert executor.join(timeout=5)
+    assert executor.stats()["completed"] == 1
+
+
+def test_errors_propagate_to_caller():
+    executor = EngineCommandExecutor()
+
+    def fail():
+        raise RuntimeError("Engine is not started.")
+
+    with pytest.raises(RuntimeError, match="not started"):
+        executor.call(fail, timeout=5)
+
+    assert executor.stats()["failed"] == 1
+    executor.close(timeout=5)
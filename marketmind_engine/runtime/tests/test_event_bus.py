@@ -0,0 +1,123 @@
+import asyncio
+import threading
+
+import pytest
+
+from marketmind_engine.runtime.event_bus import BusEvent, EventBus, diff
+
+
+def test_diff_reports_changed_and_removed_keys():
+    changed, removed = diff({"a": 1, "b": 2, "c": 3}, {"a": 1, "b": 5, "d": 4})
+
+    assert changed == {"b": 5, "d": 4}
+    assert removed == ("c",)
+
+
+def test_publish_emits_full_then_deltas_and_suppresses_duplicates():
+    bus = EventBus()
+
+    first = bus.publish("status", {"running": False, "regime": None})
+    second = bus.publish("status", {"running": True, "regime": None})
+    same = bus.publish("status", {"running": True, "regime": None})
+
+    assert first.full and first.data == {"running": False, "regime": None}
+    assert not second.full and second.data == {"running": True}
+    assert same is None
+    assert bus.stats()["suppressed"] == 1
+
+
+def test_new_subscriber_is_primed_with_full_state():
+    bus = EventBus()
+    bus.publish("rss", {"headline_count": 3})
+    bus.publish("rss", {"headline_count": 4})
+
+    sub = bus.subscribe(["rss"])
+    batch = sub.wait_batch(timeout=1)
+
+    assert len(batch) == 1
+    assert batch[0].full and batch[0].data == {"headline_count": 4}
+
+
+def test_slow_subscriber_coalesces_per_type():
+    bus = EventBus()
+    sub = bus.subscribe()
+
+    bus.publish("cycle", {"symbol": "AAA", "decision": "NO_ACTION", "extra": 1})
+    for i in range(50):
+        bus.publish("cycle", {"symbol": f"S{i}", "decision": "NO_ACTION"})
+    bus.publish("rss", {"headline_count": 1})
+
+    batch = sub.drain()
+
+    assert [e.type for e in batch] == ["cycle", "rss"]
+    cycle = batch[0]
+    assert cycle.full
+    assert cycle.data == {"symbol": "S49", "decision": "NO_ACTION"}
+    assert sub.coalesced == 50
+
+
+def test_coalesced_deltas_keep_removals():
+    bus = EventBus()
+    bus.publish("status", {"a": 1, "b": 2, "c": 3})
+
+    sub = bus.subscribe(["status"])
+    sub.drain()
+
+    bus.publish("status", {"a": 2, "b": 2})
+    bus.publish("status", {"a": 3, "b": 2, "c": 9})
+    bus.publish("status", {"a": 3, "c": 9})
+
+    (event,) = sub.drain()
+
+    assert not event.full
+    assert event.data == {"a": 3, "c": 9}
+    assert event.removed == ("b",)
+
+
+def test_out_of_order_delta_does_not_overwrite_newer_values():
+    bus = EventBus()
+    sub = bus.subscribe(["status"])
+
+    newer = BusEvent("status", 3, 2.0, False, {"running": True})
+    older = BusEvent("status", 2, 1.0, False, {"running": False, "regime": "normal"})
+
+    sub._offer(newer)
+    sub._offer(older)
+
+    (event,) = sub.drain()
+    assert event.seq == 3
+    assert event.data == {"running": True}
+
+    # Still stale after the pending slot was drained
+    sub._offer(older)
+    assert sub.drain() == []
+    assert sub.stats()["stale"] == 2
+
+
+def test_async_subscription_wakes_from_engine_thread():
+    bus = EventBus()
+
+    async def run():
+        sub = bus.subscribe(["regime"], loop=asyncio.get_running_loop())
+
+        threading.Timer(0.01, bus.publish, args=("regime", {"version": 1})).start()
+        batch = await sub.next_batch(timeout=2)
+
+        sub.close()
+        return batch
+
+    batch = asyncio.run(run())
+
+    assert batch[0].data == {"version": 1}
+    assert bus.stats()["subscribers"] == 0
+
+
+def test_subscriber_limit_and_unknown_type():
+    bus = EventBus(max_subscribers=1)
+    bus.subscribe()
+
+    with pytest.raises(RuntimeError):
+        bus.subscribe()
+
+    with pytest.raises(ValueError):
+        bus.publish("nope", {})
@@ -0,0 +1,50 @@
+import pytest
+
+pytest.importorskip("flask_cors")
+
+from runtime import app as runtime_app
+from marketmind_engine.regime.snapshot_store import RegimeSnapshotStore
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = RegimeSnapshotStore()
+    monkeypatch.setattr(runtime_app, "regime_store", store)
+    monkeypatch.setattr(runtime_app, "ensure_regime_loop", lambda: None)
+
+    store.publish({"regime": "normal", "composite_score": 0.2})
+    store.publish({"regime": "stressed", "composite_score": 0.6})
+    return store
+
+
+def _first_event(headers=None):
+    client = runtime_app.app.test_client()
+    response = client.get("/regime/stream", headers=headers or {}, buffered=False)
+
+    try:
+        assert response.status_code == 200
+        assert response.mimetype == "text/event-stream"
+        chunk = next(iter(response.response))
+        return chunk.decode() if isinstance(chunk, bytes) else chunk
+    finally:
+        response.close()
+
+
+def test_regime_stream_sends_current_snapshot(store):
+    event = _first_event()
+
+    assert event.startswith(f"id: {store.epoch}-2\n")
+
+
+def test_regime_stream_resumes_from_same_epoch_id(store):
+    store.publish({"regime": "pre_systemic", "composite_score": 0.75})
+
+    event = _first_event({"Last-Event-ID": f"{store.epoch}-2"})
+
+    assert event.startswith(f"id: {store.epoch}-3\n")
+
+
+def test_regime_stream_ignores_id_from_previous_epoch(store):
+    event = _first_event({"Last-Event-ID": "stale-epoch-2"})
+
+    assert event.startswith(f"id: {store.epoch}-2\n")
@@ -10,6 +10,14 @@ from marketmind_engine.agents.agent_signal import AgentSignal
 from marketmind_engine.execution.position_snapshot import PositionSnapshot
 
 from marketmind_engine.narrative.narrative_adapter import NarrativeAdapter
+from marketmind_engine.telemetry.metrics import STAGE_SECONDS
+
+
+_RSS_POLL_SECONDS = STAGE_SECONDS.labels(stage="cycle.rss_poll")
+_REGIME_SECONDS = STAGE_SECONDS.labels(stage="cycle.regime")
+_PROJECTION_SECONDS = STAGE_SECONDS.labels(stage="cycle.projection")
+_EXIT_SECONDS = STAGE_SECONDS.labels(stage="cycle.exit")
+_ENTRY_SECONDS = STAGE_SECONDS.labels(stage="cycle.entry")
 
 
 class TradeCoordinator:
@@ -122,13 +130,16 @@ class TradeCoordinator:
         # 0. RSS Polling (NEW)
         # --------------------------------------------------
 
-        self._poll_narrative()
+        with _RSS_POLL_SECONDS.time():
+            self._poll_narrative()
 
         # --------------------------------------------------
         # 1. Regime Authority
         # --------------------------------------------------
 
-        regime_result = self._orchestrator.run_cycle()
+        with _REGIME_SECONDS.time():
+            regime_result = self._orchestrator.run_cycle()
+
         execution_block = regime_result.get("execution")
 
         directive = None
@@ -145,7 +156,8 @@ class TradeCoordinator:
         # 2. Projection Routing (Narrative → Attention)
         # --------------------------------------------------
 
-        self._route_projection_events()
+        with _PROJECTION_SECONDS.time():
+            self._route_projection_events()
 
         # --------------------------------------------------
         # 3. EXIT Authority
@@ -153,10 +165,11 @@ class TradeCoordinator:
 
         exit_intent = None
         if market_context_map:
-            exit_intent = self._resolve_exit_intent(
-                execution_input.position_snapshot,
-                market_context_map,
-            )
+            with _EXIT_SECONDS.time():
+                exit_intent = self._resolve_exit_intent(
+                    execution_input.position_snapshot,
+                    market_context_map,
+                )
 
         if exit_intent:
             return {
@@ -169,10 +182,11 @@ class TradeCoordinator:
         # 4. ENTRY Authority
         # --------------------------------------------------
 
-        entry_intent: Optional[OrderIntent] = self._execution_engine.evaluate(
-            execution_input,
-            execution_directive=directive,
-        )
+        with _ENTRY_SECONDS.time():
+            entry_intent: Optional[OrderIntent] = self._execution_engine.evaluate(
+                execution_input,
+                execution_directive=directive,
+            )
 
         return {
             "regime": regime_result,
@@ -1 +1 @@
-# Telemetry package for append-only logging
+# Telemetry package for append-only logging and engine metrics
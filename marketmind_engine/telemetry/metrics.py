@@ -0,0 +1,504 @@
+"""
+Engine Metrics
+--------------
+In-process metrics registry with Prometheus text exposition.
+
+Engine modules update the metrics below directly; api/server.py
+serves REGISTRY.render() at /metrics.
+
+Hot-path cost:
+- counters and histograms keep one cell per writing thread;
+  inc()/observe() touch only the caller's cell, so updates
+  take no lock and cannot lose increments
+- scrapes sum the cells (slightly stale totals are fine)
+- labels(...) children are created once; hot paths bind them
+  at import time and skip the lookup
+- locks are only taken to register a metric and for gauge
+  inc/dec
+
+Types: Counter, Gauge (set / inc / dec / set_function) and
+Histogram (cumulative buckets, _sum, _count).
+"""
+
+from bisect import bisect_left
+from threading import get_ident
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import math
+import threading
+import time
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+# ==================================================
+# FORMATTING
+# ==================================================
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+
+    if isinstance(value, int):
+        return str(value)
+
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    if math.isnan(value):
+        return "NaN"
+
+    if value.is_integer():
+        return str(int(value))
+
+    return repr(value)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+
+    if not names:
+        return ""
+
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+# ==================================================
+# CHILDREN (one per label set)
+# ==================================================
+
+class _CounterChild:
+
+    __slots__ = ("_cells",)
+
+    def __init__(self):
+        self._cells: Dict[int, List[float]] = {}
+
+    def inc(self, amount: float = 1) -> None:
+
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+
+        cell = self._cells.get(get_ident())
+        if cell is None:
+            cell = self._cells.setdefault(get_ident(), [0])
+
+        cell[0] += amount
+
+    @property
+    def value(self) -> float:
+        return sum(c[0] for c in tuple(self._cells.values()))
+
+
+class _GaugeChild:
+
+    __slots__ = ("_value", "_fn", "_lock")
+
+    def __init__(self):
+        self._value = 0
+        self._fn: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value -= amount
+
+    def set_function(self, fn: Optional[Callable[[], float]]) -> None:
+        """
+        Read the value from fn() at scrape time instead.
+        """
+        self._fn = fn
+
+    @property
+    def value(self) -> float:
+
+        if self._fn is not None:
+            try:
+                return self._fn()
+            except Exception:
+                return math.nan
+
+        return self._value
+
+
+class _Timer:
+
+    __slots__ = ("_child", "_started")
+
+    def __init__(self, child: "_HistogramChild"):
+        self._child = child
+
+    def __enter__(self) -> "_Timer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._child.observe(time.perf_counter() - self._started)
+
+
+class _HistogramChild:
+
+    __slots__ = ("_bounds", "_cells")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._bounds = bounds
+        # per thread: [bucket counts (+Inf last), sum, count]
+        self._cells: Dict[int, list] = {}
+
+    def observe(self, value: float) -> None:
+
+        cell = self._cells.get(get_ident())
+        if cell is None:
+            cell = self._cells.setdefault(
+                get_ident(), [[0] * (len(self._bounds) + 1), 0.0, 0]
+            )
+
+        cell[0][bisect_left(self._bounds, value)] += 1
+        cell[1] += value
+        cell[2] += 1
+
+    def time(self) -> _Timer:
+        """
+        Context manager observing the elapsed seconds.
+        """
+        return _Timer(self)
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        """
+        (cumulative bucket counts, sum, count).
+        """
+
+        counts = [0] * (len(self._bounds) + 1)
+        total = 0.0
+        count = 0
+
+        for buckets, s, n in tuple(self._cells.values()):
+            for i, b in enumerate(buckets):
+                counts[i] += b
+            total += s
+            count += n
+
+        for i in range(1, len(counts)):
+            counts[i] += counts[i - 1]
+
+        return counts, total, count
+
+    @property
+    def count(self) -> int:
+        return self.snapshot()[2]
+
+
+# ==================================================
+# METRICS
+# ==================================================
+
+class _Metric:
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: Any, **kwargs: Any):
+        """
+        Child for one label set (created on first use).
+        """
+
+        if kwargs:
+            values = tuple(kwargs[n] for n in self.labelnames)
+
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {values}"
+            )
+
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+
+        if child is None:
+            child = self._children.setdefault(key, self._new_child())
+
+        return child
+
+    def children(self) -> List[Tuple[Tuple[str, ...], Any]]:
+        return sorted(tuple(self._children.items()))
+
+    def render(self) -> List[str]:
+
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+        for key, child in self.children():
+            lines.append(
+                f"{self.name}{_format_labels(self.labelnames, key)} "
+                f"{_format_value(child.value)}"
+            )
+
+        return lines
+
+
+class Counter(_Metric):
+
+    type_name = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1) -> None:
+        self._default.inc(amount)
+
+    @property
+    def value(self) -> float:
+        return self._default.value
+
+
+class Gauge(_Metric):
+
+    type_name = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._default.set(value)
+
+    def inc(self, amount: float = 1) -> None:
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1) -> None:
+        self._default.dec(amount)
+
+    def set_function(self, fn: Optional[Callable[[], float]]) -> None:
+        self._default.set_function(fn)
+
+    @property
+    def value(self) -> float:
+        return self._default.value
+
+
+class Histogram(_Metric):
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        bounds = tuple(sorted(float(b) for b in buckets if not math.isinf(b)))
+
+        if not bounds:
+            raise ValueError("Histogram needs at least one finite bucket")
+
+        self.buckets = bounds
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default.observe(value)
+
+    def time(self) -> _Timer:
+        return self._default.time()
+
+    def render(self) -> List[str]:
+
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} histogram",
+        ]
+
+        names = self.labelnames + ("le",)
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+
+        for key, child in self.children():
+
+            counts, total, count = child.snapshot()
+
+            for bound, cumulative in zip(bounds, counts):
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(names, key + (bound,))} {cumulative}"
+                )
+
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+
+        return lines
+
+
+# ==================================================
+# REGISTRY
+# ==================================================
+
+class MetricsRegistry:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, cls, name: str, documentation: str, labelnames, **kwargs):
+
+        with self._lock:
+
+            existing = self._metrics.get(name)
+
+            if existing is not None:
+                if type(existing) is not cls or existing.labelnames != tuple(labelnames):
+                    raise ValueError(f"Metric {name} already registered differently")
+                return existing
+
+            metric = cls(name, documentation, labelnames, **kwargs)
+            self._metrics[name] = metric
+
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        with self._lock:
+            return self._metrics.get(name)
+
+    def render(self) -> str:
+        """
+        Text exposition format (version 0.0.4).
+        """
+
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+# ==================================================
+# ENGINE METRICS
+# ==================================================
+
+CYCLES_RUN = REGISTRY.counter(
+    "marketmind_cycles_total",
+    "Engine symbol cycles run by the runtime executor.",
+)
+
+DECISIONS = REGISTRY.counter(
+    "marketmind_decisions_total",
+    "Decisions produced, by source (runtime cycle or rule engine) and decision.",
+    ("source", "decision"),
+)
+
+RULE_VETOES = REGISTRY.counter(
+    "marketmind_rule_vetoes_total",
+    "Decision rule vetoes, by rule.",
+    ("rule",),
+)
+
+ENTRY_BLOCKS = REGISTRY.counter(
+    "marketmind_execution_entry_blocks_total",
+    "ALLOW decisions the execution engine did not turn into an order, by gate.",
+    ("gate",),
+)
+
+FEED_FETCH_SECONDS = REGISTRY.histogram(
+    "marketmind_feed_fetch_seconds",
+    "RSS feed fetch latency per feed.",
+    ("feed",),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+FEED_FETCHES = REGISTRY.counter(
+    "marketmind_feed_fetches_total",
+    "RSS feed fetches per feed and status (ok, empty, error).",
+    ("feed", "status"),
+)
+
+HEADLINES_INGESTED = REGISTRY.counter(
+    "marketmind_headlines_ingested_total",
+    "Headlines ingested, by source.",
+    ("source",),
+)
+
+SYMBOLS_VALIDATED = REGISTRY.counter(
+    "marketmind_symbols_validated_total",
+    "Candidate symbols accepted by the symbol validator.",
+)
+
+SYMBOLS_FILTERED = REGISTRY.counter(
+    "marketmind_symbols_filtered_total",
+    "Candidate symbols rejected by the symbol validator.",
+)
+
+PRICE_CACHE_LOOKUPS = REGISTRY.counter(
+    "marketmind_price_cache_lookups_total",
+    "Price cache lookups by cache and result (hit, miss). Only caches "
+    "created with a metric_label are counted.",
+    ("cache", "result"),
+)
+
+ORDER_SUBMISSIONS = REGISTRY.counter(
+    "marketmind_order_submissions_total",
+    "Orders submitted to the broker, by side and status (accepted, rejected, error).",
+    ("side", "status"),
+)
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "marketmind_stage_seconds",
+    "Engine stage durations.",
+    ("stage",),
+)
+
+ENGINE_RUNNING = REGISTRY.gauge(
+    "marketmind_engine_running",
+    "1 while the engine controller is started.",
+)
+
+COMMANDS_PENDING = REGISTRY.gauge(
+    "marketmind_engine_commands_pending",
+    "Engine commands queued on the executor.",
+)
@@ -0,0 +1,163 @@
+from types import SimpleNamespace
+import threading
+
+import pytest
+
+from marketmind_engine.data.price_cache import PriceCache
+from marketmind_engine.execution.execution_engine import ExecutionEngine
+from marketmind_engine.execution.policy.base import ExecutionDirective
+from marketmind_engine.policy.policy_types import PolicyAction
+from marketmind_engine.intelligence.symbol_validator import SymbolValidator
+from marketmind_engine.telemetry import metrics
+from marketmind_engine.telemetry.metrics import MetricsRegistry
+
+
+def test_counter_threads_do_not_lose_increments():
+    registry = MetricsRegistry()
+    counter = registry.counter("hits_total", "Hits.")
+
+    def work():
+        for _ in range(10000):
+            counter.inc()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert counter.value == 80000
+
+    with pytest.raises(ValueError):
+        counter.inc(-1)
+
+
+def test_labelled_counter_renders_per_label_set():
+    registry = MetricsRegistry()
+    vetoes = registry.counter("vetoes_total", "Vetoes.", ("rule",))
+
+    vetoes.labels(rule="Latency").inc()
+    vetoes.labels("Latency").inc(2)
+    vetoes.labels(rule='say "hi"\n').inc()
+
+    text = registry.render()
+
+    assert "# TYPE vetoes_total counter" in text
+    assert 'vetoes_total{rule="Latency"} 3' in text
+    assert 'vetoes_total{rule="say \\"hi\\"\\n"} 1' in text
+
+    with pytest.raises(ValueError):
+        vetoes.labels()
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    stage = registry.histogram("stage_seconds", "Stages.", ("stage",), buckets=(0.1, 1.0))
+
+    child = stage.labels(stage="regime")
+    for v in (0.05, 0.1, 0.5, 3.0):
+        child.observe(v)
+
+    text = registry.render()
+
+    assert 'stage_seconds_bucket{stage="regime",le="0.1"} 2' in text
+    assert 'stage_seconds_bucket{stage="regime",le="1"} 3' in text
+    assert 'stage_seconds_bucket{stage="regime",le="+Inf"} 4' in text
+    assert 'stage_seconds_sum{stage="regime"} 3.65' in text
+    assert 'stage_seconds_count{stage="regime"} 4' in text
+
+
+def test_gauge_function_and_registry_reuse():
+    registry = MetricsRegistry()
+    gauge = registry.gauge("queue_depth", "Depth.")
+
+    gauge.set(3)
+    assert gauge.value == 3
+
+    gauge.set_function(lambda: 7)
+    assert "queue_depth 7" in registry.render()
+
+    assert registry.gauge("queue_depth", "Depth.") is gauge
+    with pytest.raises(ValueError):
+        registry.counter("queue_depth", "Depth.")
+
+
+def test_price_cache_counts_only_labelled_instances():
+    hits = metrics.PRICE_CACHE_LOOKUPS.labels(cache="probe", result="hit")
+    misses = metrics.PRICE_CACHE_LOOKUPS.labels(cache="probe", result="miss")
+    shared = metrics.PRICE_CACHE_LOOKUPS.labels(cache="shared", result="miss")
+    before = (hits.value, misses.value, shared.value)
+
+    cache = PriceCache(metric_label="probe")
+    cache.put("SPY", 500.0)
+    cache.get("SPY")
+    cache.get("QQQ")
+
+    # Private (unlabelled) caches do not touch the metric
+    PriceCache().get("QQQ")
+
+    assert (
+        hits.value - before[0],
+        misses.value - before[1],
+        shared.value - before[2],
+    ) == (1, 1, 0)
+
+
+class _Universe:
+    symbols = frozenset({"NVDA", "AAPL"})
+
+    def validate_many(self, symbols):
+        return list(dict.fromkeys(
+            s.upper() for s in symbols if s.upper() in self.symbols
+        ))
+
+
+def test_validator_counts_validated_and_filtered():
+    validated = metrics.SYMBOLS_VALIDATED.value
+    filtered = metrics.SYMBOLS_FILTERED.value
+
+    result = SymbolValidator(universe=_Universe()).validate_many(
+        ["nvda", "NVDA", "AAPL", "ZZZZ", "TOOLONG"]
+    )
+
+    assert result == ["NVDA", "AAPL"]
+    assert metrics.SYMBOLS_VALIDATED.value - validated == 2
+    assert metrics.SYMBOLS_FILTERED.value - filtered == 2
+
+
+def _execution_input(action):
+    return SimpleNamespace(
+        policy_result=SimpleNamespace(action=action, confidence=1.0),
+        market_state=SimpleNamespace(symbol="TEST"),
+        capital_snapshot=SimpleNamespace(
+            account_equity=100000, max_risk_per_trade=0.01, buying_power=100000
+        ),
+        position_snapshot=SimpleNamespace(positions={}),
+        current_price=100.0,
+        stop_price=95.0,
+        engine_time=0,
+    )
+
+
+def test_execution_gates_count_entry_blocks_not_rule_vetoes():
+
+    def totals():
+        return (
+            sum(c.value for _, c in metrics.ENTRY_BLOCKS.children()),
+            sum(c.value for _, c in metrics.RULE_VETOES.children()),
+        )
+
+    engine = ExecutionEngine()
+    blocked = metrics.ENTRY_BLOCKS.labels(gate="regime_entry_block")
+    before_blocked = blocked.value
+    before = totals()
+
+    # Non-ALLOW decisions were already counted by the DecisionEngine
+    assert engine.evaluate(_execution_input(PolicyAction.BLOCK)) is None
+    assert totals() == before
+
+    closed = ExecutionDirective(allow_entries=False, size_multiplier=1.0, risk_level="high")
+    assert engine.evaluate(_execution_input(PolicyAction.ALLOW), closed) is None
+
+    assert blocked.value - before_blocked == 1
+    assert totals() == (before[0] + 1, before[1])
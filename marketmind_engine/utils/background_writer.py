@@ -0,0 +1,268 @@
+"""
+Background Writer
+-----------------
+Bounded-queue writer thread for append-only logs.
+
+Producers call submit(), which never blocks and never raises:
+when the queue is full the record is dropped and counted.
+A single daemon thread drains the queue in batches and hands
+each batch to a sink callable.
+
+With an encode callable, records are encoded one at a time on
+the writer thread before the sink sees them: a record that
+fails to encode is dropped and counted, and the rest of its
+batch is still written.
+
+Flush policy (when the sink's flush() is called):
+
+    "event"     after every drained batch (lowest latency)
+    "interval"  at most every flush_interval_ms
+    "shutdown"  only on flush() / close()
+
+Sink errors are counted and swallowed; a writer must never
+take down the code path that feeds it.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+import queue
+import threading
+import time
+
+
+FLUSH_MODES = ("event", "interval", "shutdown")
+
+_STOP = object()
+
+
+class BackgroundWriter:
+
+    def __init__(
+        self,
+        sink: Callable[[List[Any]], None],
+        flush: Optional[Callable[[], None]] = None,
+        close: Optional[Callable[[], None]] = None,
+        encode: Optional[Callable[[Any], Any]] = None,
+        max_queue: int = 10000,
+        batch_size: int = 512,
+        flush_mode: str = "interval",
+        flush_interval_ms: float = 250.0,
+        name: str = "background-writer",
+    ):
+        if flush_mode not in FLUSH_MODES:
+            raise ValueError(f"flush_mode must be one of {FLUSH_MODES}")
+
+        self._sink = sink
+        self._sink_flush = flush
+        self._sink_close = close
+        self._encode = encode
+
+        self.batch_size = batch_size
+        self.flush_mode = flush_mode
+        self.flush_interval = flush_interval_ms / 1000.0
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._last_flush = time.monotonic()
+        self._dirty = False
+
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+        self.flushes = 0
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    # --------------------------------------------------
+    # Producer side
+    # --------------------------------------------------
+
+    def submit(self, record: Any) -> bool:
+        """
+        Enqueue without blocking. Returns False if dropped.
+        """
+
+        if self._closed:
+            self._count("dropped")
+            return False
+
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self._count("dropped")
+            return False
+
+        self._count("submitted")
+        return True
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Wait until everything queued so far is written, then
+        flush the sink. Returns False on timeout.
+        """
+
+        if self._closed:
+            return not self._thread.is_alive()
+
+        done = threading.Event()
+
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Drain, flush and stop the writer thread.
+        """
+
+        if self._closed:
+            return
+
+        self._closed = True
+
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+
+        self._thread.join(timeout)
+
+    # --------------------------------------------------
+    # Writer thread
+    # --------------------------------------------------
+
+    def _count(self, counter: str, n: int = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + n)
+
+    def _run(self) -> None:
+
+        while True:
+
+            timeout = self.flush_interval if self.flush_mode == "interval" else None
+
+            try:
+                first = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._maybe_flush()
+                continue
+
+            batch: List[Any] = []
+            markers: List[threading.Event] = []
+            stop = False
+
+            item = first
+
+            while True:
+
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+
+                if stop or len(batch) >= self.batch_size:
+                    break
+
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write(batch)
+
+            if markers or stop or self.flush_mode == "event":
+                self._do_flush()
+            else:
+                self._maybe_flush()
+
+            for marker in markers:
+                marker.set()
+
+            if stop:
+                self._do_close()
+                return
+
+    def _encode_each(self, batch: List[Any]) -> List[Any]:
+
+        encoded = []
+
+        for record in batch:
+            try:
+                encoded.append(self._encode(record))
+            except Exception:
+                continue
+
+        if len(encoded) < len(batch):
+            self._count("dropped", len(batch) - len(encoded))
+
+        return encoded
+
+    def _write(self, batch: List[Any]) -> None:
+
+        if self._encode is not None:
+            batch = self._encode_each(batch)
+            if not batch:
+                return
+
+        try:
+            self._sink(batch)
+            self._count("written", len(batch))
+            self._dirty = True
+        except Exception:
+            self._count("errors")
+
+    def _maybe_flush(self) -> None:
+        if (
+            self.flush_mode == "interval"
+            and self._dirty
+            and time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self._do_flush()
+
+    def _do_flush(self) -> None:
+
+        self._last_flush = time.monotonic()
+
+        if not self._dirty or self._sink_flush is None:
+            self._dirty = False
+            return
+
+        try:
+            self._sink_flush()
+            self._count("flushes")
+        except Exception:
+            self._count("errors")
+
+        self._dirty = False
+
+    def _do_close(self) -> None:
+        if self._sink_close is None:
+            return
+        try:
+            self._sink_close()
+        except Exception:
+            self._count("errors")
+
+    # --------------------------------------------------
+    # Introspection
+    # --------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "submitted": self.submitted,
+                "written": self.written,
+                "dropped": self.dropped,
+                "errors": self.errors,
+                "flushes": self.flushes,
+                "queued": self._queue.qsize(),
+                "flush_mode": self.flush_mode,
+            }
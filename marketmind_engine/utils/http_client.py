@@ -0,0 +1,229 @@
+"""
+Shared HTTP Client
+------------------
+One connection-pooled HTTP client for every fetcher
+(RSS, discovery, indicators, ticker universe, research).
+
+- Keep-alive pooling per host (requests.Session + HTTPAdapter)
+- Default connect/read timeouts
+- Retry with full-jitter exponential backoff on connection
+  errors, timeouts and retryable status codes
+- Per-host concurrency limits (bounded semaphores)
+
+Configuration via environment (defaults in HttpClientConfig):
+
+    MARKETMIND_HTTP_TIMEOUT
+    MARKETMIND_HTTP_RETRIES
+    MARKETMIND_HTTP_PER_HOST
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+import os
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (MarketMind Engine)"
+
+
+@dataclass
+class HttpClientConfig:
+    connect_timeout: float = 5.0
+    read_timeout: float = 10.0
+
+    max_retries: int = 2
+    backoff_base: float = 0.25
+    backoff_max: float = 4.0
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+
+    pool_connections: int = 32      # number of host pools kept
+    pool_maxsize: int = 8           # keep-alive connections per host
+    per_host_concurrency: int = 4
+
+    headers: Dict[str, str] = field(
+        default_factory=lambda: {"User-Agent": DEFAULT_USER_AGENT}
+    )
+
+    @classmethod
+    def from_env(cls) -> "HttpClientConfig":
+        config = cls()
+
+        timeout = os.getenv("MARKETMIND_HTTP_TIMEOUT")
+        if timeout:
+            config.read_timeout = float(timeout)
+
+        retries = os.getenv("MARKETMIND_HTTP_RETRIES")
+        if retries:
+            config.max_retries = int(retries)
+
+        per_host = os.getenv("MARKETMIND_HTTP_PER_HOST")
+        if per_host:
+            config.per_host_concurrency = int(per_host)
+
+        return config
+
+
+class HttpClient:
+    """
+    Thread-safe pooled HTTP client.
+
+    Returned responses are plain requests.Response objects.
+    Errors surface as requests exceptions after retries are
+    exhausted, so callers keep their existing try/except.
+    """
+
+    def __init__(
+        self,
+        config: Optional[HttpClientConfig] = None,
+        session: Optional[requests.Session] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,
+    ):
+        self.config = config or HttpClientConfig()
+        self._sleep = sleep
+        self._jitter = jitter
+
+        self.session = session or self._build_session()
+
+        self._host_lock = threading.Lock()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+
+        self.requests_sent = 0
+        self.retries = 0
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            max_retries=0,      # retries handled here, with jitter
+        )
+
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(self.config.headers)
+
+        return session
+
+    # --------------------------------------------------
+    # Per-host limits
+    # --------------------------------------------------
+
+    def _slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc.lower()
+
+        with self._host_lock:
+            slot = self._host_slots.get(host)
+
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.config.per_host_concurrency)
+                self._host_slots[host] = slot
+
+            return slot
+
+    def _count(self, counter: str) -> None:
+        with self._host_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _backoff(self, attempt: int) -> float:
+        ceiling = min(self.config.backoff_max, self.config.backoff_base * (2 ** attempt))
+        return self._jitter() * ceiling
+
+    # --------------------------------------------------
+    # Requests
+    # --------------------------------------------------
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[Any] = None,
+        retries: Optional[int] = None,
+        raise_for_status: bool = True,
+        **kwargs,
+    ) -> requests.Response:
+
+        if timeout is None:
+            timeout = (self.config.connect_timeout, self.config.read_timeout)
+
+        retries = self.config.max_retries if retries is None else retries
+        slot = self._slot(url)
+
+        attempt = 0
+
+        while True:
+
+            try:
+                with slot:
+                    self._count("requests_sent")
+                    response = self.session.request(method, url, timeout=timeout, **kwargs)
+
+                if response.status_code in self.config.retry_statuses and attempt < retries:
+                    response.close()
+                    raise _RetryableStatus(response.status_code)
+
+                if raise_for_status:
+                    response.raise_for_status()
+
+                return response
+
+            except (requests.ConnectionError, requests.Timeout, _RetryableStatus):
+
+                if attempt >= retries:
+                    raise
+
+                self._count("retries")
+                self._sleep(self._backoff(attempt))
+                attempt += 1
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def get_json(self, url: str, **kwargs) -> Any:
+        return self.get(url, **kwargs).json()
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class _RetryableStatus(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"retryable HTTP status {status_code}")
+        self.status_code = status_code
+
+
+# ==================================================
+# SHARED INSTANCE (all fetchers)
+# ==================================================
+
+_SHARED_CLIENT: Optional[HttpClient] = None
+_SHARED_LOCK = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """
+    Returns the process-wide pooled client.
+    """
+    global _SHARED_CLIENT
+
+    if _SHARED_CLIENT is None:
+        with _SHARED_LOCK:
+            if _SHARED_CLIENT is None:
+                _SHARED_CLIENT = HttpClient(HttpClientConfig.from_env())
+
+    return _SHARED_CLIENT
+
+
+def set_http_client(client: Optional[HttpClient]) -> None:
+    """
+    Allows runtime client override (tests, custom config).
+    """
+    global _SHARED_CLIENT
+    _SHARED_CLIENT = client
@@ -1,4 +1,4 @@
-from datetime import datetime, time
+from datetime import date, datetime, timedelta
 import pytz
 
 ET = pytz.timezone("US/Eastern")
@@ -22,3 +22,30 @@ def seconds_from_open(now: datetime) -> int:
 
     delta = (et - open_time).total_seconds()
     return max(0, int(delta))
+
+
+def trading_session(now: datetime) -> date:
+    """
+    Trading session that is open or next to open at a timestamp.
+
+    Weekdays map to their ET date (pre-market belongs to the
+    coming session) and weekends map forward to Monday. The
+    previous close for the session is the last daily bar dated
+    before it, so Monday pre-market and Monday regular hours
+    both compare against Friday's close. Exchange holidays are
+    not modelled.
+    """
+    day = now.astimezone(ET).date()
+
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+
+    return day
+
+
+def bar_session_date(timestamp: datetime) -> date:
+    """
+    ET date of a daily bar (Alpaca stamps daily bars at the
+    start of the ET day).
+    """
+    return timestamp.astimezone(ET).date()
@@ -0,0 +1,143 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from marketmind_engine.utils.http_client import HttpClient, HttpClientConfig
+
+
+class FakeResponse:
+
+    def __init__(self, status_code=200, payload=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+        self.closed = False
+
+    def json(self):
+        return self._payload
+
+    def close(self):
+        self.closed = True
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"status {self.status_code}")
+
+
+class ScriptedSession:
+    """
+    Returns scripted outcomes in order; exceptions are raised.
+    """
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def request(self, method, url, timeout=None, **kwargs):
+        self.calls.append((method, url, timeout, kwargs))
+        outcome = self.outcomes.pop(0)
+
+        if isinstance(outcome, Exception):
+            raise outcome
+
+        return outcome
+
+    def close(self):
+        pass
+
+
+def _client(outcomes, **config):
+    sleeps = []
+    client = HttpClient(
+        config=HttpClientConfig(**config),
+        session=ScriptedSession(outcomes),
+        sleep=sleeps.append,
+        jitter=lambda: 1.0,
+    )
+    return client, sleeps
+
+
+def test_default_timeouts_applied():
+    client, _ = _client([FakeResponse()], connect_timeout=1.5, read_timeout=7.0)
+
+    client.get("https://example.com/feed")
+
+    assert client.session.calls[0][2] == (1.5, 7.0)
+
+
+def test_retries_connection_errors_with_backoff():
+    client, sleeps = _client(
+        [requests.ConnectionError("reset"), requests.Timeout("slow"), FakeResponse(payload={"ok": 1})],
+        max_retries=2,
+        backoff_base=0.5,
+    )
+
+    assert client.get_json("https://example.com/api") == {"ok": 1}
+    assert sleeps == [0.5, 1.0]
+    assert client.retries == 2
+
+
+def test_retryable_status_then_success():
+    busy = FakeResponse(status_code=503)
+    client, sleeps = _client([busy, FakeResponse()], max_retries=1)
+
+    assert client.get("https://example.com").status_code == 200
+    assert busy.closed
+    assert len(sleeps) == 1
+
+
+def test_exhausted_retries_raise():
+    client, _ = _client([requests.ConnectionError("down")] * 2, max_retries=1)
+
+    with pytest.raises(requests.ConnectionError):
+        client.get("https://example.com")
+
+
+def test_non_retryable_status_raises_without_retry():
+    client, sleeps = _client([FakeResponse(status_code=404)])
+
+    with pytest.raises(requests.HTTPError):
+        client.get("https://example.com")
+
+    assert sleeps == []
+
+
+def test_raise_for_status_can_be_disabled():
+    client, _ = _client([FakeResponse(status_code=404)])
+
+    assert client.get("https://example.com", raise_for_status=False).status_code == 404
+
+
+def test_per_host_concurrency_limit():
+
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    class SlowSession:
+        def request(self, method, url, timeout=None, **kwargs):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.02)
+            with lock:
+                active["now"] -= 1
+            return FakeResponse()
+
+    client = HttpClient(
+        config=HttpClientConfig(per_host_concurrency=2),
+        session=SlowSession(),
+    )
+
+    threads = [
+        threading.Thread(target=client.get, args=("https://feeds.example.com/x",))
+        for _ in range(8)
+    ]
+
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert active["peak"] <= 2
+    assert client.requests_sent == 8
@@ -8,6 +8,12 @@ from alpaca.data.requests import (
 )
 from alpaca.data.timeframe import TimeFrame
 from datetime import datetime, timedelta
+import time
+
+from marketmind_engine.data.streaming import (
+    MARKET_DATA_CACHE,
+    STREAM_MAX_AGE_SECONDS,
+)
 
 
 load_dotenv(override=True)
@@ -24,14 +30,20 @@ class PriceCoupler:
     Market CLOSED:
         price_delta = displacement vs previous close
         volume_ratio = 1.0
+
+    Streamed trades/bars (MARKET_DATA_CACHE) are used when
+    fresh; REST requests are the fallback.
     """
 
-    def __init__(self):
+    INTRADAY_WINDOW_SECONDS = 15 * 60
+
+    def __init__(self, market_data_cache=None):
         api_key = os.getenv("APCA_API_KEY_ID")
         api_secret = os.getenv("APCA_API_SECRET_KEY")
 
         self.trading_client = TradingClient(api_key, api_secret, paper=True)
         self.data_client = StockHistoricalDataClient(api_key, api_secret)
+        self.market_data_cache = market_data_cache or MARKET_DATA_CACHE
 
     def market_is_open(self) -> bool:
         clock = self.trading_client.get_clock()
@@ -39,20 +51,58 @@ class PriceCoupler:
 
     def get_price_metrics(self, symbol: str):
 
-        # --- Latest trade (IEX feed)
-        trade_request = StockLatestTradeRequest(
-            symbol_or_symbols=symbol,
-            feed="iex"
+        # --- Latest trade (stream first, IEX feed fallback)
+        current_price = self.market_data_cache.last_price(
+            symbol, max_age=STREAM_MAX_AGE_SECONDS
         )
 
-        latest_trade = self.data_client.get_stock_latest_trade(trade_request)
-        current_price = latest_trade[symbol].price
+        if current_price is None:
+            trade_request = StockLatestTradeRequest(
+                symbol_or_symbols=symbol,
+                feed="iex"
+            )
+
+            latest_trade = self.data_client.get_stock_latest_trade(trade_request)
+            current_price = latest_trade[symbol].price
+            self.market_data_cache.on_price(symbol, current_price)
 
         if self.market_is_open():
+            streamed = self._streamed_intraday_metrics(symbol, current_price)
+            if streamed is not None:
+                return streamed
             return self._intraday_metrics(symbol, current_price)
         else:
             return self._closed_market_metrics(symbol, current_price)
 
+    # -------------------------
+    # OPEN MARKET LOGIC (STREAMED BARS)
+    # -------------------------
+    def _streamed_intraday_metrics(self, symbol: str, current_price: float):
+
+        cutoff = time.time() - self.INTRADAY_WINDOW_SECONDS
+
+        bars = [
+            b for b in self.market_data_cache.bars(symbol)
+            if b.timestamp >= cutoff
+        ]
+
+        if len(bars) < 2:
+            return None
+
+        first_bar = bars[0]
+        last_bar = bars[-1]
+
+        price_delta = (current_price - first_bar.close) / first_bar.close
+
+        avg_volume = sum(bar.volume for bar in bars) / len(bars)
+        volume_ratio = last_bar.volume / avg_volume if avg_volume else 1.0
+
+        return {
+            "price": float(current_price),
+            "price_delta": float(price_delta),
+            "volume_ratio": float(volume_ratio)
+        }
+
     # -------------------------
     # OPEN MARKET LOGIC
     # -------------------------
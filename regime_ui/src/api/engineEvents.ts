@@ -0,0 +1,124 @@
+// Shared push channel to the engine API (/api/events, SSE).
+//
+// One EventSource per tab, shared by every hook. The server sends a
+// full payload per event type on connect, then deltas (changed keys
+// plus removed keys); this module folds them into the latest state
+// and notifies subscribers. EventSource reconnects on its own and the
+// server re-sends full payloads, so no polling fallback is needed.
+
+export type EngineEventType =
+  | "status"
+  | "cycle"
+  | "regime"
+  | "propagation"
+  | "rss"
+
+type BusEvent = {
+  type: EngineEventType
+  seq: number
+  ts: number
+  full: boolean
+  data: Record<string, any>
+  removed: string[]
+}
+
+type Listener = (state: any) => void
+
+const API_BASE = "http://127.0.0.1:8001"
+
+const EVENT_TYPES: EngineEventType[] = [
+  "status",
+  "cycle",
+  "regime",
+  "propagation",
+  "rss",
+]
+
+const state = new Map<EngineEventType, Record<string, any>>()
+const listeners = new Map<EngineEventType, Set<Listener>>()
+
+let source: EventSource | null = null
+let connected = false
+const connectionListeners = new Set<(online: boolean) => void>()
+
+function apply(event: BusEvent) {
+  const previous = state.get(event.type)
+
+  let next: Record<string, any>
+
+  if (event.full || !previous) {
+    next = { ...event.data }
+  } else {
+    next = { ...previous, ...event.data }
+    for (const key of event.removed) delete next[key]
+  }
+
+  state.set(event.type, next)
+  listeners.get(event.type)?.forEach((fn) => fn(next))
+}
+
+function setConnected(online: boolean) {
+  if (online === connected) return
+  connected = online
+  connectionListeners.forEach((fn) => fn(online))
+}
+
+function ensureSource() {
+  if (source) return
+
+  source = new EventSource(`${API_BASE}/api/events`)
+
+  source.onopen = () => setConnected(true)
+  source.onerror = () => setConnected(false)
+
+  for (const type of EVENT_TYPES) {
+    source.addEventListener(type, (msg) => {
+      try {
+        apply(JSON.parse((msg as MessageEvent).data) as BusEvent)
+      } catch (err) {
+        console.warn("Engine event parse error:", err)
+      }
+    })
+  }
+}
+
+function releaseSource() {
+  const active = [...listeners.values()].some((set) => set.size > 0)
+
+  if (!active && connectionListeners.size === 0 && source) {
+    source.close()
+    source = null
+    setConnected(false)
+  }
+}
+
+export function subscribeEngineEvent(
+  type: EngineEventType,
+  listener: Listener,
+): () => void {
+  ensureSource()
+
+  if (!listeners.has(type)) listeners.set(type, new Set())
+  listeners.get(type)!.add(listener)
+
+  const current = state.get(type)
+  if (current) listener(current)
+
+  return () => {
+    listeners.get(type)?.delete(listener)
+    releaseSource()
+  }
+}
+
+export function subscribeConnection(
+  listener: (online: boolean) => void,
+): () => void {
+  ensureSource()
+  connectionListeners.add(listener)
+  listener(connected)
+
+  return () => {
+    connectionListeners.delete(listener)
+    releaseSource()
+  }
+}
@@ -5,8 +5,13 @@
   timestamp: number;
 }
 
+const REGIME_URL = "http://localhost:5001/regime";
+
+// Server-sent events, one per regime change
+export const REGIME_STREAM_URL = `${REGIME_URL}/stream`;
+
 export async function fetchRegime(): Promise<RegimeSnapshot> {
-  const response = await fetch("http://localhost:5001/regime");
+  const response = await fetch(REGIME_URL);
 
   if (!response.ok) {
     throw new Error("Failed to fetch regime");
@@ -1,4 +1,5 @@
 import React, { useEffect, useState } from "react";
+import { usePropagationPolling } from "../hooks/usePropagationPolling";
 
 type Snapshot = {
   timestamp: number;
@@ -35,40 +36,14 @@ function valueColor(value: number) {
 }
 
 export default function PropagationPanel() {
-  const [snapshot, setSnapshot] = useState<Snapshot | null>(null);
+  const snapshot = usePropagationPolling() as Snapshot | null;
   const [log, setLog] = useState<any[]>([]);
-  const [error, setError] = useState<string | null>(null);
+  const error = (snapshot as any)?.mode === "propagation_error"
+    ? String((snapshot as any).error)
+    : null;
 
   useEffect(() => {
-    const fetchData = async () => {
-      try {
-        setError(null);
-
-        const res = await fetch("/api/propagation_snapshot");
-
-        if (!res.ok) {
-          const txt = await res.text();
-          throw new Error(`HTTP ${res.status}: ${txt}`);
-        }
-
-        const data = (await res.json()) as Snapshot;
-
-        setSnapshot(data);
-
-      } catch (err: any) {
-        setError(err?.message ?? String(err));
-      }
-    };
-
-    fetchData();
-
-    const interval = setInterval(fetchData, 2000);
-
-    return () => clearInterval(interval);
-  }, []);
-
-  useEffect(() => {
-    if (!snapshot) return;
+    if (!snapshot || error) return;
 
     setLog((prev) => {
       const updated = [
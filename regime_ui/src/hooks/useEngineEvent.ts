@@ -0,0 +1,12 @@
+import { useEffect, useState } from "react"
+import { subscribeEngineEvent } from "../api/engineEvents"
+import type { EngineEventType } from "../api/engineEvents"
+
+// Latest merged payload for one engine event type (push, no polling).
+export function useEngineEvent<T = any>(type: EngineEventType): T | null {
+  const [value, setValue] = useState<T | null>(null)
+
+  useEffect(() => subscribeEngineEvent(type, (next) => setValue(next as T)), [type])
+
+  return value
+}
@@ -1,63 +1,28 @@
-import { useEffect, useState } from "react"
-
-const API_BASE = "http://127.0.0.1:8001"
-
-async function safeFetch(url: string) {
-  try {
-    const res = await fetch(url)
-    if (!res.ok) return null
-    return await res.json()
-  } catch {
-    return null
-  }
-}
+import { useMemo } from "react"
+import { useEngineEvent } from "./useEngineEvent"
 
+// Engine panels, fed by the /api/events push channel.
 export function useEnginePolling() {
 
-  const [engineState, setEngineState] = useState<any>(null)
-  const [engineStatus, setEngineStatus] = useState<any>(null)
-  const [lastDecision, setLastDecision] = useState<any>(null)
-
-  useEffect(() => {
-
-    let polling = false
-
-    const poll = async () => {
-
-      if (polling) return
-      polling = true
-
-      try {
+  const engineStatus = useEngineEvent("status")
+  const regime = useEngineEvent("regime")
+  const lastDecision = useEngineEvent("cycle")
 
-        const [status, state, last] = await Promise.all([
-          safeFetch(`${API_BASE}/api/engine/status`),
-          safeFetch(`${API_BASE}/api/engine/state`),
-          safeFetch(`${API_BASE}/api/engine/last`)
-        ])
+  const engineState = useMemo(() => {
 
-        if (status !== null) setEngineStatus(status)
-        if (state !== null) setEngineState(state)
-        if (last !== null) setLastDecision(last)
-
-      } catch (err) {
-
-        console.warn("Engine polling error:", err)
-
-      } finally {
-
-        polling = false
-
-      }
+    if (!engineStatus && !regime) return null
 
+    return {
+      running: engineStatus?.running ?? false,
+      regime: regime?.snapshot ?? null,
+      engine_time: lastDecision?.engine_time ?? engineStatus?.engine_time ?? 0,
+      last_cycle_timestamp: regime?.snapshot?.timestamp ?? null,
+      regime_name: regime?.regime_name ?? "unknown",
+      flatten_triggered: regime?.flatten_triggered ?? false,
+      block_new_entries: regime?.block_new_entries ?? false
     }
 
-    poll()
-
-    const interval = setInterval(poll, 2000)
-
-    return () => clearInterval(interval)
-
-  }, [])
+  }, [engineStatus, regime, lastDecision])
 
   return {
     engineStatus,
@@ -65,4 +30,4 @@ export function useEnginePolling() {
     lastDecision
   }
 
-}
\ No newline at end of file
+}
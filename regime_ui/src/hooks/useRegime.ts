@@ -1,39 +1,40 @@
-﻿import { useEffect, useState } from "react";
-import { fetchRegime } from "../api/regime";
+import { useEffect, useState } from "react";
+import { REGIME_STREAM_URL } from "../api/regime";
 import type { RegimeSnapshot } from "../api/regime";
 
-export function useRegime(pollInterval = 1500) {
+// Regime snapshot from the Flask runtime, pushed over SSE on change.
+// pollInterval is kept for call-site compatibility; it is unused.
+export function useRegime(_pollInterval = 1500) {
   const [data, setData] = useState<RegimeSnapshot | null>(null);
   const [error, setError] = useState<string | null>(null);
   const [isOnline, setIsOnline] = useState(true);
 
   useEffect(() => {
-    let mounted = true;
+    const source = new EventSource(REGIME_STREAM_URL);
 
-    async function poll() {
+    source.onopen = () => {
+      setIsOnline(true);
+      setError(null);
+    };
+
+    source.addEventListener("regime", (msg) => {
       try {
-        const snapshot = await fetchRegime();
-        if (mounted) {
-          setData(snapshot);
-          setError(null);
-          setIsOnline(true);
-        }
+        const payload = JSON.parse((msg as MessageEvent).data);
+        setData(payload.snapshot as RegimeSnapshot);
+        setError(null);
+        setIsOnline(true);
       } catch (err: any) {
-        if (mounted) {
-          setError(err.message);
-          setIsOnline(false);
-        }
+        setError(err.message);
       }
-    }
+    });
 
-    poll();
-    const interval = setInterval(poll, pollInterval);
-
-    return () => {
-      mounted = false;
-      clearInterval(interval);
+    source.onerror = () => {
+      setError("Regime stream disconnected");
+      setIsOnline(false);
     };
-  }, [pollInterval]);
+
+    return () => source.close();
+  }, []);
 
   return { data, error, isOnline };
 }
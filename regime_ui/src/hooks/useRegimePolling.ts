@@ -1,49 +1,23 @@
-import { useEffect, useState } from "react";
+import { useMemo } from "react";
+import { useEngineEvent } from "./useEngineEvent";
 
+// Header regime state, fed by the /api/events push channel.
 export function useRegimePolling() {
-  const [snapshot, setSnapshot] = useState<any>(null);
-
-  useEffect(() => {
-    const fetchSnapshot = async () => {
-      try {
-
-        // Use Vite proxy when available
-        const res = await fetch("/api/engine/status");
-
-        // If proxy not configured, fallback to direct backend
-        if (!res.ok) {
-          const fallback = await fetch("http://localhost:8001/api/engine/status");
-
-          if (!fallback.ok) {
-            console.error("Polling failed:", fallback.status);
-            return;
-          }
-
-          const data = await fallback.json();
-          console.log("REGIME PAYLOAD:", data);
-          setSnapshot(data);
-          return;
-        }
-
-        const data = await res.json();
-
-        // Debug log
-        console.log("REGIME PAYLOAD:", data);
-
-        setSnapshot(data);
-
-      } catch (err) {
-        console.error("Polling error:", err);
-      }
+  const status = useEngineEvent("status");
+  const regime = useEngineEvent("regime");
+
+  const snapshot = useMemo(() => {
+    if (!status && !regime) return null;
+
+    return {
+      ...status,
+      regime: regime?.regime_name ?? status?.regime ?? null,
+      flatten_triggered: regime?.flatten_triggered ?? false,
+      block_new_entries: regime?.block_new_entries ?? false,
+      timestamp: regime?.snapshot?.timestamp ?? status?.last_cycle_timestamp ?? null,
+      version: regime?.version ?? null,
     };
-
-    fetchSnapshot();
-
-    const interval = setInterval(fetchSnapshot, 1500);
-
-    return () => clearInterval(interval);
-
-  }, []);
+  }, [status, regime]);
 
   return { snapshot };
-}
\ No newline at end of file
+}
@@ -1,5 +1,7 @@
 ﻿import sys
 import os
+import threading
+import time
 from pathlib import Path
 
 # -----------------------------------------------------------------------------
@@ -10,7 +12,7 @@ ENGINE_DIR = Path(__file__).resolve().parent.parent
 if str(ENGINE_DIR) not in sys.path:
     sys.path.insert(0, str(ENGINE_DIR))
 
-from flask import Flask, send_from_directory, jsonify, request
+from flask import Flask, Response, send_from_directory, jsonify, request
 from flask_cors import CORS
 
 # -----------------------------------------------------------------------------
@@ -37,6 +39,19 @@ from marketmind_engine.regime.macro_sources.live_source import LiveMacroSource
 from marketmind_engine.regime.macro_sources.injected_source import (
     InjectedMacroSource,
 )
+from marketmind_engine.api.serialization import (
+    JSON_MEDIA_TYPE,
+    EncodedPayload,
+    dumps,
+    render,
+)
+from marketmind_engine.regime.snapshot_store import (
+    cache_headers,
+    etag_matches,
+    get_regime_store,
+    parse_last_event_id,
+    sse_stream,
+)
 
 # -----------------------------------------------------------------------------
 # Environment
@@ -44,6 +59,9 @@ from marketmind_engine.regime.macro_sources.injected_source import (
 
 MM_ENV = os.getenv("MM_ENV", "dev")
 
+# Seconds between background regime cycles
+REGIME_CYCLE_SECONDS = float(os.getenv("MARKETMIND_REGIME_INTERVAL", "2"))
+
 # -----------------------------------------------------------------------------
 # Flask App
 # -----------------------------------------------------------------------------
@@ -60,6 +78,8 @@ else:
 # -----------------------------------------------------------------------------
 
 def build_live_orchestrator():
+    # No price stream or narrative feed runs in this process, so the
+    # source reports LiveMacroSource.FALLBACK_INPUTS until one is wired in
     live_source = LiveMacroSource()
     return IntradayOrchestrator(macro_source=live_source)
 
@@ -72,6 +92,64 @@ def build_injected_orchestrator(macro_inputs: dict):
 # Global session-scoped orchestrator
 orchestrator = build_live_orchestrator()
 
+# -----------------------------------------------------------------------------
+# Regime Cycle (compute) -> Snapshot Store (read)
+# -----------------------------------------------------------------------------
+# Cycles run on one background thread (and on explicit inject commands).
+# GET handlers only read the published snapshot, so polling never advances
+# regime state or appends audit events.
+
+regime_store = get_regime_store()
+
+_cycle_lock = threading.Lock()
+_regime_loop_thread = None
+_regime_loop_lock = threading.Lock()
+
+
+def run_regime_cycle():
+    with _cycle_lock:
+        snapshot = orchestrator.run_cycle()
+        regime_store.publish(snapshot)
+        return snapshot
+
+
+def regime_loop():
+    while True:
+        try:
+            run_regime_cycle()
+        except Exception as e:
+            print("Regime cycle error:", e)
+
+        time.sleep(REGIME_CYCLE_SECONDS)
+
+
+def ensure_regime_loop():
+    global _regime_loop_thread
+
+    if _regime_loop_thread is not None:
+        return
+
+    with _regime_loop_lock:
+        if _regime_loop_thread is None:
+            _regime_loop_thread = threading.Thread(
+                target=regime_loop,
+                name="regime-cycle",
+                daemon=True,
+            )
+            _regime_loop_thread.start()
+
+
+def current_regime_snapshot():
+    ensure_regime_loop()
+
+    snapshot = regime_store.latest()
+
+    if snapshot is None:
+        run_regime_cycle()
+        snapshot = regime_store.latest()
+
+    return snapshot
+
 # -----------------------------------------------------------------------------
 # Static UI
 # -----------------------------------------------------------------------------
@@ -86,8 +164,35 @@ def index():
 
 @app.route("/regime")
 def regime():
-    snapshot = orchestrator.run_cycle()
-    return jsonify(snapshot)
+    snapshot = current_regime_snapshot()
+    headers = cache_headers(snapshot)
+
+    if etag_matches(request.headers.get("If-None-Match"), snapshot):
+        return Response(status=304, headers=headers)
+
+    response = jsonify(snapshot.data)
+    response.headers.update(headers)
+    return response
+
+
+@app.route("/regime/stream")
+def regime_stream():
+    """
+    Server-sent events: one "regime" event per new snapshot version.
+    """
+
+    ensure_regime_loop()
+
+    after = parse_last_event_id(
+        request.headers.get("Last-Event-ID") or request.args.get("after"),
+        regime_store.epoch,
+    )
+
+    return Response(
+        sse_stream(regime_store, after_version=after),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.route("/regime/inject", methods=["POST"])
@@ -99,8 +204,10 @@ def inject_regime():
     if not payload or "macro_inputs" not in payload:
         return jsonify({"error": "Payload must include 'macro_inputs'"}), 400
 
-    orchestrator = build_injected_orchestrator(payload["macro_inputs"])
-    snapshot = orchestrator.run_cycle()
+    with _cycle_lock:
+        orchestrator = build_injected_orchestrator(payload["macro_inputs"])
+
+    snapshot = run_regime_cycle()
 
     return jsonify({
         "injection_active": True,
@@ -112,8 +219,10 @@ def inject_regime():
 def disable_injection():
     global orchestrator
 
-    orchestrator = build_live_orchestrator()
-    snapshot = orchestrator.run_cycle()
+    with _cycle_lock:
+        orchestrator = build_live_orchestrator()
+
+    snapshot = run_regime_cycle()
 
     return jsonify({
         "injection_active": False,
@@ -139,7 +248,7 @@ def system_snapshot():
     rss_entries = get_rss_cache() or []
     rss_last_refresh = last_refresh_iso()
 
-    return jsonify({
+    payload = EncodedPayload(body=dumps({
         "timestamp": metrics.get("timestamp"),
 
         "engine": {
@@ -157,7 +266,13 @@ def system_snapshot():
         },
 
         "candidates": candidates,
-    })
+    }))
+
+    # RSS entries make this large: orjson + gzip instead of jsonify
+    body, headers = render(payload, request.headers.get("Accept-Encoding"))
+    headers["Cache-Control"] = "no-cache"
+
+    return Response(body, mimetype=JSON_MEDIA_TYPE, headers=headers)
 
 
 @app.route("/api/rss/refresh", methods=["POST"])
@@ -179,4 +294,5 @@ def refresh_rss():
 # -----------------------------------------------------------------------------
 
 if __name__ == "__main__":
-    app.run(port=5001, debug=False)
\ No newline at end of file
+    ensure_regime_loop()
+    app.run(port=5001, debug=False, threaded=True)
\ No newline at end of file
@@ -1,26 +1,25 @@
 import re
-import sqlite3
-from typing import List
+from typing import List, Optional
+
+from marketmind_engine.intelligence.symbol_universe import (
+    SymbolUniverse,
+    get_universe,
+)
 
 
 class SymbolResolver:
     """
     Resolves potential ticker symbols from text
     against canonical asset_universe.db
+    (via the shared SymbolUniverse service)
     """
 
-    def __init__(self, db_path: str = "asset_universe.db"):
-        self.db_path = db_path
-        self._load_symbols()
-
-    def _load_symbols(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT symbol FROM assets")
-        rows = cursor.fetchall()
-        conn.close()
+    def __init__(self, db_path: Optional[str] = None):
+        self.universe = SymbolUniverse(db_path) if db_path else get_universe()
 
-        self.symbol_set = {row[0] for row in rows}
+    @property
+    def symbol_set(self):
+        return self.universe.symbols
 
     def extract_candidates(self, text: str) -> List[str]:
         """
@@ -40,17 +39,5 @@ class SymbolResolver:
 
         candidates = self.extract_candidates(text)
 
-        resolved = [
-            token for token in candidates
-            if token in self.symbol_set
-        ]
-
-        # Remove duplicates while preserving order
-        seen = set()
-        ordered = []
-        for symbol in resolved:
-            if symbol not in seen:
-                ordered.append(symbol)
-                seen.add(symbol)
-
-        return ordered
\ No newline at end of file
+        # Validated, duplicates removed, order preserved
+        return self.universe.validate_many(candidates)